@@ -187,6 +187,7 @@ django-dev      : Start a normal Baserow backend django development server, perf
 lint-shell      : Run the linting interactively (only available if using dev target)
 lint            : Run the linting and exit (only available if using dev target)
 ci-test         : Run the tests for CI with coverage/splits (dev only)
+ci-test-benchmarks: Check the query counts of the benchmarks for CI (dev only)
 ci-check-startup: Start up a single gunicorn and timeout after 10 seconds for CI (dev)
 watch-py CMD    : Auto reruns the provided CMD whenever python files change
 install-plugin  : Installs a baserow plugin.
@@ -208,6 +209,7 @@ run_setup_commands_if_configured(){
 
 start_celery_worker(){
   startup_plugin_setup
+  export BASEROW_PROCESS_TYPE="${BASEROW_PROCESS_TYPE:-celery}"
   if [[ -n "$BASEROW_RUN_MINIMAL" ]]; then
     EXTRA_CELERY_ARGS=(--without-heartbeat --without-gossip --without-mingle)
   else
@@ -230,6 +232,7 @@ attachable_exec(){
 run_backend_server(){
   wait_for_postgres
   run_setup_commands_if_configured
+  export BASEROW_PROCESS_TYPE="${BASEROW_PROCESS_TYPE:-web}"
 
   if [[ -n "$BASEROW_ENABLE_SECURE_PROXY_SSL_HEADER" ]]; then
     EXTRA_GUNICORN_ARGS=(--forwarded-allow-ips='*')
@@ -369,6 +372,9 @@ case "$1" in
     ci-check-migrations)
         exec just check-migrations
     ;;
+    ci-test-benchmarks)
+        exec just ci-test-benchmarks
+    ;;
     celery-worker)
       if [[ -n "${BASEROW_RUN_MINIMAL}" && $BASEROW_AMOUNT_OF_WORKERS == "1" ]]; then
         export OTEL_SERVICE_NAME="celery-worker-combined"
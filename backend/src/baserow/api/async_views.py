@@ -0,0 +1,104 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import close_old_connections
+from django.http import HttpRequest, HttpResponse
+
+from asgiref.sync import sync_to_async
+
+_read_executor: Optional[ThreadPoolExecutor] = None
+_read_executor_lock = threading.Lock()
+
+
+def get_read_executor() -> Optional[ThreadPoolExecutor]:
+    """
+    Returns the bounded thread pool that runs the hot read endpoints, or None if it
+    has been disabled with the `BASEROW_ASYNC_READ_THREADS` setting.
+    """
+
+    global _read_executor
+
+    max_workers = settings.BASEROW_ASYNC_READ_THREADS
+    if max_workers <= 0:
+        return None
+
+    with _read_executor_lock:
+        if _read_executor is None:
+            _read_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="baserow-read"
+            )
+    return _read_executor
+
+
+def shutdown_read_executor():
+    """
+    Waits for the running requests and stops the threads of the read thread pool. A
+    new pool is created when it's needed again.
+    """
+
+    global _read_executor
+
+    with _read_executor_lock:
+        if _read_executor is not None:
+            _read_executor.shutdown(wait=True)
+            _read_executor = None
+
+
+def _run_view_with_connection_checks(
+    view: Callable[..., HttpResponse], request: HttpRequest, *args, **kwargs
+) -> HttpResponse:
+    # The `request_started` and `request_finished` signals, which normally close
+    # the obsolete database connections, are not sent in the threads of the pool.
+    # The connections are checked here instead, so that every thread reuses its
+    # connection across requests if `CONN_MAX_AGE` allows it.
+    close_old_connections()
+    try:
+        return view(request, *args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+def async_read_view(
+    view: Callable[..., HttpResponse], methods: Iterable[str] = ("GET", "HEAD")
+) -> Callable:
+    """
+    Turns a synchronous view, like the one returned by `APIView.as_view()`, into an
+    asynchronous one. When Baserow is served with ASGI, the requests with one of the
+    provided methods are handled on a dedicated bounded thread pool, instead of on
+    a new thread per request, so that a burst of concurrent reads doesn't saturate
+    the threads and the database connections of the worker. The other requests, and
+    all the requests when served with WSGI, are handled in the same way as Django
+    handles synchronous views.
+
+    The provided methods must only read data, because the requests are handled in
+    another thread than the one of the request and its middlewares.
+
+    :param view: The synchronous view to wrap.
+    :param methods: The HTTP methods that are handled on the read thread pool.
+    :return: The asynchronous view.
+    """
+
+    methods = {method.upper() for method in methods}
+    sync_view = sync_to_async(view, thread_sensitive=True)
+
+    @wraps(view)
+    async def async_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        executor = get_read_executor()
+        if (
+            executor is None
+            or request.method not in methods
+            or not isinstance(request, ASGIRequest)
+        ):
+            return await sync_view(request, *args, **kwargs)
+
+        return await sync_to_async(
+            _run_view_with_connection_checks,
+            thread_sensitive=False,
+            executor=executor,
+        )(view, request, *args, **kwargs)
+
+    return async_view
@@ -20,6 +20,13 @@ class FullHealthCheckSerializer(serializers.Serializer):
     celery_export_queue_size = serializers.IntegerField(
         help_text="The number of enqueued celery export worker tasks."
     )
+    database_pools = serializers.DictField(
+        read_only=True,
+        child=serializers.DictField(child=serializers.IntegerField()),
+        help_text="The statistics of the database connection pools of the process "
+        "that handled the request, keyed by database alias. Empty if "
+        "`BASEROW_DB_POOL_ENABLED` isn't set.",
+    )
 
 
 class EmailTesterResponseSerializer(serializers.Serializer):
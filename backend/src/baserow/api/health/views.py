@@ -22,6 +22,7 @@ from baserow.api.health.serializers import (
     FullHealthCheckSerializer,
 )
 from baserow.api.schemas import get_error_schema
+from baserow.core.db import get_database_pool_stats
 from baserow.core.health.handler import HealthCheckHandler
 from baserow.core.health.utils import get_celery_queue_size
 
@@ -51,6 +52,7 @@ class FullHealthCheckView(APIView):
                     "passing": result.passing,
                     "celery_queue_size": celery_queue_size,
                     "celery_export_queue_size": celery_export_queue_size,
+                    "database_pools": get_database_pool_stats(),
                 }
             ).data
         )
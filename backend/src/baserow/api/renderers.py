@@ -0,0 +1,41 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    Renders the exact same JSON as the `JSONRenderer`, but uses orjson to do so
+    because that is many times faster for big responses like pages of rows. Values
+    that the standard library can't serialize either, like dates and decimals, are
+    still converted by the encoder of the `JSONRenderer`, so that they're formatted in
+    the same way. If an indented response is requested, or if orjson can't serialize
+    the data, like integers wider than 64 bits, then the regular renderer is used.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            data is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=(
+                    orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                ),
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like the `JSONRenderer`, escape the line and paragraph separators because
+        # they're valid in JSON, but not in JavaScript.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -26,6 +26,15 @@ class WorkspaceSearchSerializer(serializers.Serializer):
     offset = serializers.IntegerField(
         default=0, min_value=0, help_text="Number of results to skip"
     )
+    search_mode = serializers.ChoiceField(
+        required=False,
+        default=None,
+        choices=ALL_SEARCH_MODES,
+        help_text=(
+            "The search mode used to search the rows. If `semantic`, the rows with "
+            "a meaning closest to the query are returned."
+        ),
+    )
 
 
 class SearchResultSerializer(serializers.Serializer):
@@ -68,6 +68,7 @@ class WorkspaceSearchView(APIView):
             query=query_params["query"],
             limit=query_params["limit"],
             offset=query_params["offset"],
+            search_mode=query_params["search_mode"],
         )
         serializer = WorkspaceSearchResponseSerializer(data=result_data)
         serializer.is_valid(raise_exception=True)
@@ -28,9 +28,16 @@ class UserFileURLAndThumbnailsSerializerMixin(serializers.Serializer):
         url = storage.url(path)
         return url
 
+    def are_thumbnails_queued(self, instance):
+        # Only the user file itself knows whether its thumbnails are still being
+        # generated in the background, the serialized copies don't.
+        return getattr(instance, "thumbnails_queued", False)
+
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_thumbnails(self, instance):
-        if not self.get_instance_attr(instance, "is_image"):
+        if not self.get_instance_attr(
+            instance, "is_image"
+        ) or self.are_thumbnails_queued(instance):
             return None
 
         name = self.get_instance_attr(instance, "name")
@@ -47,10 +47,24 @@ def close_old_db_connections(sender, **kwargs):
     close_old_connections()
 
 
+def start_broadcast_buffer(sender, **kwargs):
+    from baserow.ws.broadcast import broadcast_buffer
+
+    broadcast_buffer.start()
+
+
+def flush_broadcast_buffer(sender, **kwargs):
+    from baserow.ws.broadcast import broadcast_buffer
+
+    broadcast_buffer.flush()
+
+
 signals.task_prerun.connect(clear_local)
 signals.task_prerun.connect(close_old_db_connections)
 signals.task_postrun.connect(clear_local)
 signals.task_postrun.connect(close_old_db_connections)
+signals.task_prerun.connect(start_broadcast_buffer)
+signals.task_postrun.connect(flush_broadcast_buffer)
 
 
 @signals.worker_process_init.connect
@@ -58,6 +72,12 @@ def on_worker_init(**kwargs):
     # This is only needed in asgi.py
     settings.BASEROW_LAZY_LOADED_LIBRARIES.append("mcp")
 
+    # The database connection pools of the parent process can't be used after the
+    # fork, the worker creates its own when it connects.
+    from baserow.core.db import discard_inherited_database_pools
+
+    discard_inherited_database_pools()
+
     # Check that libraries meant to be lazy-loaded haven't been imported at startup.
     # This runs after Django is fully loaded, so it catches imports from all apps.
     check_lazy_loaded_libraries()
@@ -2,6 +2,7 @@ import importlib
 import json
 import os
 import re
+import sys
 from datetime import timedelta
 from decimal import Decimal
 from ipaddress import ip_network
@@ -15,6 +16,7 @@ from corsheaders.defaults import default_headers
 
 from baserow.config.settings.utils import (
     Setting,
+    configure_db_connection_pool,
     crontab,
     get_crontab_from_env,
     read_file,
@@ -111,6 +113,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "baserow.core.cache.LocalCacheMiddleware",
+    "baserow.ws.broadcast.BroadcastBufferMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "baserow.api.user_sources.middleware.AddUserSourceUserMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -153,6 +156,12 @@ ASGI_HTTP_MAX_CONCURRENCY = (
     int(os.getenv("BASEROW_ASGI_HTTP_MAX_CONCURRENCY") or 0) or None
 )
 
+# The hot read endpoints, like listing rows, are asynchronous when served with ASGI
+# and run the database work on a dedicated pool of threads instead of a thread per
+# request. Every thread keeps its own database connection, so this also limits the
+# number of connections used by those endpoints per process. 0 disables the pool.
+BASEROW_ASYNC_READ_THREADS = int(os.getenv("BASEROW_ASYNC_READ_THREADS", 16))
+
 REDIS_HOST = os.getenv("REDIS_HOST", "redis")
 REDIS_PORT = os.getenv("REDIS_PORT", "6379")
 REDIS_USERNAME = os.getenv("REDIS_USER", "")
@@ -177,6 +186,9 @@ BASEROW_GROUP_STORAGE_USAGE_QUEUE = os.getenv(
     "BASEROW_GROUP_STORAGE_USAGE_QUEUE", "export"
 )
 BASEROW_ROLE_USAGE_QUEUE = os.getenv("BASEROW_GROUP_STORAGE_USAGE_QUEUE", "export")
+BASEROW_USER_FILE_THUMBNAILS_QUEUE = os.getenv(
+    "BASEROW_USER_FILE_THUMBNAILS_QUEUE", "export"
+)
 
 CELERY_BROKER_URL = REDIS_URL
 CELERY_TASK_ROUTES = {
@@ -187,6 +199,7 @@ CELERY_TASK_ROUTES = {
     },
     "baserow.core.trash.tasks.permanently_delete_marked_trash": {"queue": "export"},
     "baserow.core.usage.tasks": {"queue": BASEROW_GROUP_STORAGE_USAGE_QUEUE},
+    "baserow.core.user_files.tasks": {"queue": BASEROW_USER_FILE_THUMBNAILS_QUEUE},
     "baserow.contrib.database.table.tasks.run_row_count_job": {"queue": "export"},
     "baserow.core.jobs.tasks.clean_up_jobs": {"queue": "export"},
 }
@@ -232,6 +245,24 @@ CHANNEL_LAYERS = {
         },
     },
 }
+# When enabled, the realtime page payloads are published to the channel layer by
+# the process that made the change at the end of the request or celery task, instead
+# of via a celery task per event. Consecutive payloads to the same page are merged
+# where possible.
+BASEROW_WS_BROADCAST_DIRECTLY = str_to_bool(
+    os.getenv("BASEROW_WS_BROADCAST_DIRECTLY", "false")
+)
+# Directly broadcast payloads larger than this number of bytes are replaced by a
+# message that makes the clients refetch the data, if the page supports it. 0
+# disables the limit.
+BASEROW_WS_BROADCAST_MAX_PAYLOAD_SIZE = int(
+    os.getenv("BASEROW_WS_BROADCAST_MAX_PAYLOAD_SIZE", "") or 1024 * 1024
+)
+# The buffered payloads are sent as soon as this many are waiting, so that a long
+# running celery task doesn't hold back its realtime events until it finishes.
+BASEROW_WS_BROADCAST_BUFFER_MAX_MESSAGES = int(
+    os.getenv("BASEROW_WS_BROADCAST_BUFFER_MAX_MESSAGES", "") or 20
+)
 
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
@@ -297,6 +328,53 @@ for _db_key in DATABASES:
     DATABASES[_db_key]["CONN_MAX_AGE"] = BASEROW_CONN_MAX_AGE
     DATABASES[_db_key].setdefault("CONN_HEALTH_CHECKS", True)
 
+# The type of the process, `web` or `celery`, used to pick the database connection
+# pool settings. It's set by the docker entrypoint, and otherwise derived from the
+# command that started the process.
+BASEROW_PROCESS_TYPE = os.getenv("BASEROW_PROCESS_TYPE", "") or (
+    "celery" if "celery" in os.path.basename(sys.argv[0]) else "web"
+)
+
+
+def _get_db_pool_setting(name: str, default: str) -> str:
+    """
+    Returns the value of the `BASEROW_DB_POOL_{name}` environment variable, which can
+    be overridden for one process type with `BASEROW_{WEB|CELERY}_DB_POOL_{name}`.
+    """
+
+    process_type = BASEROW_PROCESS_TYPE.upper()
+    return (
+        os.getenv(f"BASEROW_{process_type}_DB_POOL_{name}", "")
+        or os.getenv(f"BASEROW_DB_POOL_{name}", "")
+        or default
+    )
+
+
+# When enabled, every process keeps a pool of open database connections per
+# database, shared by all its threads, instead of opening a new connection for every
+# request or task. Requires psycopg 3 with the `pool` extra to be installed.
+BASEROW_DB_POOL_ENABLED = str_to_bool(_get_db_pool_setting("ENABLED", "false"))
+BASEROW_DB_POOL_MIN_SIZE = int(_get_db_pool_setting("MIN_SIZE", "2"))
+BASEROW_DB_POOL_MAX_SIZE = int(_get_db_pool_setting("MAX_SIZE", "10"))
+# The number of seconds a request or task waits for a free connection before failing.
+BASEROW_DB_POOL_TIMEOUT = float(_get_db_pool_setting("TIMEOUT", "30"))
+# Idle connections above the minimum size are closed after this number of seconds.
+BASEROW_DB_POOL_MAX_IDLE = float(_get_db_pool_setting("MAX_IDLE", "600"))
+# Connections are replaced after this number of seconds.
+BASEROW_DB_POOL_MAX_LIFETIME = float(_get_db_pool_setting("MAX_LIFETIME", "3600"))
+
+if BASEROW_DB_POOL_ENABLED:
+    configure_db_connection_pool(
+        DATABASES,
+        {
+            "min_size": BASEROW_DB_POOL_MIN_SIZE,
+            "max_size": BASEROW_DB_POOL_MAX_SIZE,
+            "timeout": BASEROW_DB_POOL_TIMEOUT,
+            "max_idle": BASEROW_DB_POOL_MAX_IDLE,
+            "max_lifetime": BASEROW_DB_POOL_MAX_LIFETIME,
+        },
+    )
+
 DATABASE_ROUTERS = ["baserow.config.db_routers.ReadReplicaRouter"]
 
 
@@ -327,6 +405,16 @@ BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = int(
     # Default TTL is 5 minutes
     os.getenv("BASEROW_BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS") or 300
 )
+DASHBOARD_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS = int(
+    # Default TTL is 5 minutes, the results are invalidated when the rows, fields or
+    # view of the aggregated table change anyway.
+    os.getenv("BASEROW_DASHBOARD_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS") or 300
+)
+BASEROW_PUBLIC_VIEW_ROWS_CACHE_TTL_SECONDS = int(
+    # The responses are invalidated when the rows, fields or views of the table
+    # change, but relative date filters can change the result over time.
+    os.getenv("BASEROW_PUBLIC_VIEW_ROWS_CACHE_TTL_SECONDS") or 60
+)
 
 
 CELERY_SINGLETON_BACKEND_CLASS = (
@@ -850,6 +938,17 @@ BATCH_ROWS_SIZE_LIMIT = int(
     os.getenv("BATCH_ROWS_SIZE_LIMIT", 200)
 )  # How many rows can be modified at once.
 
+# Single row updates made with the `coalesce` query parameter are buffered per table
+# for this window, and then applied together as one bulk update.
+BASEROW_COALESCED_ROW_UPDATES_WINDOW_MS = int(
+    os.getenv("BASEROW_COALESCED_ROW_UPDATES_WINDOW_MS", 200)
+)
+# How long a request with `coalesce=applied` waits for the buffered update to be
+# applied, before responding that it has only been accepted.
+BASEROW_COALESCED_ROW_UPDATES_WAIT_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_COALESCED_ROW_UPDATES_WAIT_TIMEOUT_SECONDS", 10)
+)
+
 # Maximum count of records considered as a 'small table' during field rule operations.
 FIELD_RULE_ROWS_LIMIT = int(os.getenv("FIELD_RULE_ROWS_LIMIT", BATCH_ROWS_SIZE_LIMIT))
 
@@ -985,9 +1084,18 @@ STALE_MENTIONS_CLEANUP_INTERVAL_MINUTES = int(
     os.getenv("BASEROW_STALE_MENTIONS_CLEANUP_INTERVAL_MINUTES", "") or 360
 )
 
-# Indicates how frequently the workspace storage should be updated. Once every X number
-# of hours.
-BASEROW_UPDATE_WORKSPACE_STORAGE_USAGE_HOURS = 24
+# Indicates how frequently the storage of every workspace should be recalculated. Once
+# every X number of hours. Workspaces containing tables whose storage usage changed are
+# updated sooner, the next time the job runs.
+BASEROW_UPDATE_WORKSPACE_STORAGE_USAGE_HOURS = int(
+    os.getenv("BASEROW_UPDATE_WORKSPACE_STORAGE_USAGE_HOURS", "") or 24
+)
+# The row count of a table is updated incrementally when rows are created or deleted.
+# If the rows of a changed table haven't been counted for X number of hours, they're
+# counted again instead.
+BASEROW_TABLE_USAGE_RECOUNT_HOURS = int(
+    os.getenv("BASEROW_TABLE_USAGE_RECOUNT_HOURS", "") or 24
+)
 
 ONE_AM_CRONTAB_STR = "0 1 * * *"
 BASEROW_SEAT_USAGE_JOB_CRONTAB = get_crontab_from_env(
@@ -1086,6 +1194,17 @@ BASEROW_LOGIN_ACTION_LOG_LIMIT = (
 # Configurable thumbnails that are going to be generated when a user uploads an image
 # file.
 USER_THUMBNAILS = {"tiny": [None, 21], "small": [48, 48], "card_cover": [300, 160]}
+# When enabled, the thumbnails of uploaded images are generated by a background task
+# instead of during the upload request. Until the task has run, the thumbnails of the
+# files in file fields are not available yet.
+BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND = str_to_bool(
+    os.getenv("BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND", "false")
+)
+# The maximum number of queued user files that are processed per transaction by the
+# background thumbnail generation task.
+BASEROW_USER_FILE_THUMBNAILS_BATCH_SIZE = int(
+    os.getenv("BASEROW_USER_FILE_THUMBNAILS_BATCH_SIZE", "") or 20
+)
 
 # The directory that contains the all the templates in JSON format. When for example
 # the `sync_templates` management command is called, then the templates in the
@@ -1104,6 +1223,11 @@ MAX_FIELD_LIMIT = int(os.getenv("BASEROW_MAX_FIELD_LIMIT", 600))
 BASEROW_ICAL_VIEW_MAX_EVENTS = try_int(
     os.getenv("BASEROW_ICAL_VIEW_MAX_EVENTS", None), None
 )
+# The number of seconds a rendered ICal feed is cached. The cache is invalidated when
+# the rows, fields or view of the feed change. `0` disables the cache.
+BASEROW_ICAL_VIEW_CACHE_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_ICAL_VIEW_CACHE_TIMEOUT_SECONDS", 60 * 60)
+)
 
 
 # If you change this default please also update the default for the web-frontend found
@@ -1112,6 +1236,11 @@ HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = int(
     os.getenv("HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3)
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The maximum number of trash entries of the same type and parent, like the rows of
+# a table, that are permanently deleted in a single bulk query and transaction.
+TRASH_PERMANENT_DELETION_BATCH_SIZE = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE", 1000)
+)
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
@@ -1122,6 +1251,10 @@ FILE_UPLOAD_PERMISSIONS = None
 
 MAX_FORMULA_STRING_LENGTH = 10000
 MAX_FIELD_REFERENCE_DEPTH = 1000
+# The max number of parsed formula expressions that every process keeps in memory.
+BASEROW_FORMULA_EXPRESSION_CACHE_SIZE = int(
+    os.getenv("BASEROW_FORMULA_EXPRESSION_CACHE_SIZE", "") or 4096
+)
 DONT_UPDATE_FORMULAS_AFTER_MIGRATION = bool(
     os.getenv("DONT_UPDATE_FORMULAS_AFTER_MIGRATION", "")
 )
@@ -1233,6 +1366,14 @@ BASEROW_ROW_HISTORY_CLEANUP_INTERVAL_MINUTES = int(
 BASEROW_ROW_HISTORY_RETENTION_DAYS = int(
     os.getenv("BASEROW_ROW_HISTORY_RETENTION_DAYS", 180)
 )
+# The number of months after the current one for which partitions of time
+# partitioned tables, like the row history, are created ahead of time.
+BASEROW_PARTITIONS_PRECREATE_MONTHS = int(
+    os.getenv("BASEROW_PARTITIONS_PRECREATE_MONTHS", 3)
+)
+BASEROW_PARTITIONS_MAINTENANCE_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_PARTITIONS_MAINTENANCE_INTERVAL_MINUTES", 60 * 6)  # 6 hours
+)
 BASEROW_MAX_ROW_REPORT_ERROR_COUNT = int(
     os.getenv("BASEROW_MAX_ROW_REPORT_ERROR_COUNT", 30)
 )
@@ -1260,6 +1401,17 @@ BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT = int(
     os.getenv("BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT", 0)
 )
 
+# The maximum number of concurrent requests made to Airtable while importing a base.
+# Tables, views and file checks are fetched in parallel using this many connections.
+BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS = int(
+    os.getenv("BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS", 4)
+)
+# The size of the chunks in which Airtable files are downloaded to a temporary file
+# before they're uploaded to the storage.
+BASEROW_AIRTABLE_IMPORT_DOWNLOAD_CHUNK_SIZE = int(
+    os.getenv("BASEROW_AIRTABLE_IMPORT_DOWNLOAD_CHUNK_SIZE", 1024 * 1024)
+)
+
 PERMISSION_MANAGERS = [
     "view_ownership",
     "core",
@@ -1351,6 +1503,11 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The field attrs of the projection models, which only contain some fields of a
+# table, are cached per field set and expire so that unused field sets don't pile up.
+BASEROW_PROJECTION_MODEL_CACHE_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_PROJECTION_MODEL_CACHE_TIMEOUT_SECONDS", 60 * 60)
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1383,6 +1540,18 @@ PG_FULLTEXT_SEARCH_CONFIG = os.getenv("BASEROW_PG_SEARCH_CONFIG", "simple")
 PG_FULLTEXT_SEARCH_UPDATE_DATA_THROTTLE_SECONDS = float(
     os.getenv("BASEROW_PG_FULLTEXT_SEARCH_UPDATE_DATA_THROTTLE_SECONDS", 2)  # seconds
 )
+# The semantic search mode keeps an embedding of the searchable values of every row,
+# which is created by the embeddings API in `BASEROW_EMBEDDINGS_API_URL`. It requires
+# the pgvector extension and is updated together with the full-text search data.
+BASEROW_SEMANTIC_SEARCH_ENABLED = str_to_bool(
+    os.getenv("BASEROW_SEMANTIC_SEARCH_ENABLED", "false")
+)
+BASEROW_SEMANTIC_SEARCH_MAX_RESULTS = int(
+    os.getenv("BASEROW_SEMANTIC_SEARCH_MAX_RESULTS", "") or 100
+)
+BASEROW_SEMANTIC_SEARCH_EMBEDDING_BATCH_SIZE = int(
+    os.getenv("BASEROW_SEMANTIC_SEARCH_EMBEDDING_BATCH_SIZE", "") or 100
+)
 
 POSTHOG_PROJECT_API_KEY = os.getenv("POSTHOG_PROJECT_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST") or None
@@ -1492,6 +1661,18 @@ BASEROW_OLLAMA_MODELS = (
     BASEROW_OLLAMA_MODELS.split(",") if BASEROW_OLLAMA_MODELS else []
 )
 
+# The budgets of the requests made to the provider of every generative AI model
+# type, shared by all the processes. 0 means unlimited.
+BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS = int(
+    os.getenv("BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS", "") or 20
+)
+BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS_PER_WORKSPACE = int(
+    os.getenv("BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS_PER_WORKSPACE", "") or 10
+)
+BASEROW_GENERATIVE_AI_MAX_TOKENS_PER_MINUTE = int(
+    os.getenv("BASEROW_GENERATIVE_AI_MAX_TOKENS_PER_MINUTE", "") or 0
+)
+
 BASEROW_TWO_WAY_SYNC_MAX_CONSECUTIVE_FAILURES = int(
     os.getenv("BASEROW_TWO_WAY_SYNC_MAX_CONSECUTIVE_FAILURES", "") or 8
 )
@@ -1521,6 +1702,16 @@ BASEROW_MAX_HEALTHY_CELERY_QUEUE_SIZE = int(
 )
 
 BASEROW_USE_LOCAL_CACHE = str_to_bool(os.getenv("BASEROW_USE_LOCAL_CACHE", "true"))
+# The maximum number of global cache values that every process also keeps in memory,
+# in front of Redis. 0 disables the in-process tier.
+BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES = int(
+    os.getenv("BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES", "") or 1000
+)
+# The maximum number of seconds a value is kept in the in-process tier, even if it
+# hasn't been invalidated.
+BASEROW_GLOBAL_CACHE_LOCAL_TTL_SECONDS = int(
+    os.getenv("BASEROW_GLOBAL_CACHE_LOCAL_TTL_SECONDS", "") or 30
+)
 
 BASEROW_EMBEDDINGS_API_URL = os.getenv("BASEROW_EMBEDDINGS_API_URL", "")
 
@@ -79,6 +79,7 @@ DATABASES["default-copy"] = deepcopy(DATABASES["default"])
 USER_FILES_DIRECTORY = "user_files"
 USER_THUMBNAILS_DIRECTORY = "thumbnails"
 USER_THUMBNAILS = {"tiny": [21, 21]}
+BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND = False
 
 # Make sure that we are not using the `MEDIA_URL` environment variable because that
 # could break the tests. They are expecting it to be 'http://localhost:8000/media/'
@@ -115,6 +116,27 @@ REST_FRAMEWORK["DEFAULT_THROTTLE_CLASSES"] = []
 # Disable object caches (users, tokens, settings, licenses) so every request
 # hits the DB. This ensures query-count assertions remain stable and predictable.
 BASEROW_CACHE_TTL_SECONDS = 0
+# Many tests change rows directly through the model, which doesn't invalidate the
+# rendered ICal feeds.
+BASEROW_ICAL_VIEW_CACHE_TIMEOUT_SECONDS = 0
+# Many tests change role assignments, teams and workspace users directly through the
+# models, which doesn't invalidate the shared permission snapshots.
+BASEROW_ENTERPRISE_PERMISSION_SNAPSHOT_TTL_SECONDS = 0
+# Many tests change rows directly through the model, which doesn't invalidate the
+# cached dashboard data source results.
+DASHBOARD_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS = 0
+# For the same reason, the public view rows responses aren't cached.
+BASEROW_PUBLIC_VIEW_ROWS_CACHE_TTL_SECONDS = 0
+# Many tests clear the Redis cache during the test, which doesn't reset the versions
+# remembered by the in-process tier of the global cache.
+BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES = 0
+# Many tests change rows directly through the model, which isn't reflected in the
+# grouped aggregate rollups, and looking up the rollups on every row change would
+# make the row query counts depend on the premium app.
+BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS = 0
+# Many tests record row history at a frozen date years in the past and list it at the
+# current date, which would otherwise be excluded as expired.
+BASEROW_ROW_HISTORY_RETENTION_DAYS = 365 * 100
 
 # Tests should not inherit the anonymous IP throttle from any local env.
 BASEROW_THROTTLE_IP_ENABLED = False
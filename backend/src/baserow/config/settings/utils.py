@@ -1,7 +1,10 @@
+import importlib.util
 import os
 import traceback
 from enum import Enum
-from typing import Any, Callable, List, NamedTuple, Optional, Type, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type, Union
+
+from django.core.exceptions import ImproperlyConfigured
 
 from celery.schedules import crontab
 from loguru import logger
@@ -119,6 +122,34 @@ def set_setting_from_env_if_present(
         settings_module[setting_name] = value
 
 
+def configure_db_connection_pool(
+    databases: Dict[str, Dict[str, Any]], pool_options: Dict[str, Any]
+):
+    """
+    Configures Django's native psycopg connection pool for all the databases, unless
+    a database already has its own pool options.
+
+    :param databases: The `DATABASES` setting, which is updated in place.
+    :param pool_options: The keyword arguments of the psycopg `ConnectionPool`.
+    :raises ImproperlyConfigured: If psycopg 3 with the pool extra isn't installed,
+        because Django only supports pooling with psycopg 3.
+    """
+
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    if not is_psycopg3 or importlib.util.find_spec("psycopg_pool") is None:
+        raise ImproperlyConfigured(
+            "BASEROW_DB_POOL_ENABLED requires psycopg 3 with the pool extra to be "
+            "installed, for example with `pip install psycopg[binary,pool]`."
+        )
+
+    for database in databases.values():
+        # A pooled connection is returned to the pool when Django closes it, so the
+        # connections must not be persisted by Django itself.
+        database["CONN_MAX_AGE"] = 0
+        database.setdefault("OPTIONS", {}).setdefault("pool", dict(pool_options))
+
+
 def str_to_bool(s: str) -> bool:
     return s.lower().strip() in ("y", "yes", "t", "true", "on", "1")
 
@@ -363,6 +363,9 @@ class AutomationNodeTriggerType(AutomationNodeType):
             .select_related("workflow__automation__workspace")
         )
 
+        if not triggers:
+            return
+
         # For perf reasons, store the trigger<->service relationship.
         service_map = {service.id: service for service in services}
 
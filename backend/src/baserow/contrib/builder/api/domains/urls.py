@@ -1,5 +1,6 @@
 from django.urls import re_path
 
+from baserow.api.async_views import async_read_view
 from baserow.contrib.builder.api.domains.public_views import (
     PublicBuilderByDomainNameView,
     PublicBuilderByIdView,
@@ -67,12 +68,12 @@ urlpatterns_without_builder_id = [
     ),
     re_path(
         r"published/data-source/(?P<data_source_id>[0-9]+)/dispatch/$",
-        PublicDispatchDataSourceView.as_view(),
+        async_read_view(PublicDispatchDataSourceView.as_view(), methods=["POST"]),
         name="public_dispatch",
     ),
     re_path(
         r"published/page/(?P<page_id>[0-9]+)/dispatch-data-sources/$",
-        PublicDispatchDataSourcesView.as_view(),
+        async_read_view(PublicDispatchDataSourcesView.as_view(), methods=["POST"]),
         name="public_dispatch_all",
     ),
 ]
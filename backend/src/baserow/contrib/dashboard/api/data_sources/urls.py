@@ -3,6 +3,7 @@ from django.urls import re_path
 from baserow.contrib.dashboard.api.data_sources.views import (
     DashboardDataSourcesView,
     DashboardDataSourceView,
+    DispatchDashboardDataSourcesView,
     DispatchDashboardDataSourceView,
 )
 
@@ -14,6 +15,11 @@ urlpatterns = [
         DashboardDataSourcesView.as_view(),
         name="list",
     ),
+    re_path(
+        r"(?P<dashboard_id>[0-9]+)/dispatch-data-sources/$",
+        DispatchDashboardDataSourcesView.as_view(),
+        name="dispatch-all",
+    ),
     re_path(
         r"data-sources/(?P<data_source_id>[0-9]+)/$",
         DashboardDataSourceView.as_view(),
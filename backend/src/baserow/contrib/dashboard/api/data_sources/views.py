@@ -7,6 +7,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from baserow.api.decorators import map_exceptions, validate_data_custom_fields
+from baserow.api.errors import ERROR_PERMISSION_DENIED
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
@@ -16,6 +17,7 @@ from baserow.api.services.errors import ERROR_SERVICE_INVALID_TYPE
 from baserow.api.utils import (
     CustomFieldRegistryMappingSerializer,
     DiscriminatorCustomFieldsMappingSerializer,
+    apply_exception_mapping,
 )
 from baserow.contrib.dashboard.api.errors import ERROR_DASHBOARD_DOES_NOT_EXIST
 from baserow.contrib.dashboard.data_sources.actions import (
@@ -32,6 +34,7 @@ from baserow.contrib.dashboard.data_sources.exceptions import (
 from baserow.contrib.dashboard.data_sources.handler import DashboardDataSourceHandler
 from baserow.contrib.dashboard.data_sources.service import DashboardDataSourceService
 from baserow.contrib.dashboard.exceptions import DashboardDoesNotExist
+from baserow.core.exceptions import PermissionException
 from baserow.core.services.exceptions import (
     DoesNotExist,
     InvalidServiceTypeDispatchSource,
@@ -250,3 +253,66 @@ class DispatchDashboardDataSourceView(APIView):
             request.user, data_source_id, dispatch_context
         )
         return Response(response)
+
+
+class DispatchDashboardDataSourcesView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="dashboard_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The id of the dashboard you want to dispatch the data "
+                "sources for.",
+            ),
+        ],
+        tags=["Dashboard data sources"],
+        operation_id="dispatch_dashboard_data_sources",
+        description=(
+            "Dispatches the services of all the data sources of the dashboard and "
+            "returns the results mapped by data source id. If a data source can't be "
+            "dispatched, then its result contains the error instead."
+        ),
+        request=None,
+        responses={
+            401: get_error_schema(["ERROR_PERMISSION_DENIED"]),
+            404: get_error_schema(["ERROR_DASHBOARD_DOES_NOT_EXIST"]),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            DashboardDoesNotExist: ERROR_DASHBOARD_DOES_NOT_EXIST,
+        }
+    )
+    def post(self, request, dashboard_id: int):
+        """
+        Call the dispatch method of the services related to all the data sources of
+        the given dashboard.
+        """
+
+        dispatch_context = DashboardDispatchContext(request)
+        data_source_contents = DashboardDataSourceService().dispatch_data_sources(
+            request.user, dashboard_id, dispatch_context
+        )
+
+        responses = {}
+        for data_source_id, content in data_source_contents.items():
+            if isinstance(content, Exception):
+                _, error, detail = apply_exception_mapping(
+                    {
+                        DashboardDataSourceImproperlyConfigured: ERROR_DASHBOARD_DATA_SOURCE_IMPROPERLY_CONFIGURED,
+                        ServiceImproperlyConfiguredDispatchException: ERROR_DASHBOARD_DATA_SOURCE_IMPROPERLY_CONFIGURED,
+                        DoesNotExist: ERROR_DASHBOARD_DATA_DOES_NOT_EXIST,
+                        PermissionException: ERROR_PERMISSION_DENIED,
+                    },
+                    content,
+                    with_fallback=True,
+                )
+                responses[data_source_id] = {"_error": error, "detail": detail}
+            else:
+                responses[data_source_id] = content
+
+        return Response(responses)
@@ -95,6 +95,7 @@ class DashboardConfig(AppConfig):
             AllowIfTemplatePermissionManagerType(prev_manager)
         )
 
+        import baserow.contrib.dashboard.data_sources.receivers  # noqa: F401
         from baserow.contrib.dashboard.data_sources.actions import (
             UpdateDashboardDataSourceActionType,
         )
@@ -1,7 +1,9 @@
 from decimal import Decimal
-from typing import Any, Iterable, cast
+from typing import Any, Callable, Dict, Iterable, List, Union, cast
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import transaction
 from django.db.models import QuerySet
 
 from baserow.contrib.dashboard.data_sources.dispatch_context import (
@@ -13,6 +15,7 @@ from baserow.contrib.dashboard.data_sources.exceptions import (
 )
 from baserow.contrib.dashboard.data_sources.models import DashboardDataSource
 from baserow.contrib.dashboard.models import Dashboard
+from baserow.core.cache import global_cache
 from baserow.core.integrations.models import Integration
 from baserow.core.integrations.registries import integration_type_registry
 from baserow.core.services.handler import ServiceHandler
@@ -28,6 +31,20 @@ from .types import (
 )
 
 
+def get_dispatch_cache_invalidate_key(table_id: int) -> str:
+    return f"table_{table_id}__dashboard_data_source_dispatch_invalidate_key"
+
+
+class _DispatchCacheMiss(Exception):
+    """
+    Raised instead of dispatching a data source, to only look up its cached result.
+    """
+
+
+def _raise_dispatch_cache_miss():
+    raise _DispatchCacheMiss()
+
+
 class DashboardDataSourceHandler:
     def __init__(self):
         self.service_handler = ServiceHandler()
@@ -218,6 +235,7 @@ class DashboardDataSourceHandler:
             data_source.service.specific
         )
         original_service = data_source.service
+        original_table_id = getattr(original_service.specific, "table_id", None)
         updated_service = None
         if service_type != original_service_type:
             # If the service type is not the same let's create
@@ -258,6 +276,14 @@ class DashboardDataSourceHandler:
         if original_service.id != data_source.service.id:
             self.service_handler.delete_service(service_type, original_service)
 
+        # The cached results of the data source depend on its configuration.
+        for table_id in {
+            original_table_id,
+            getattr(data_source.service.specific, "table_id", None),
+        }:
+            if table_id:
+                self.invalidate_dispatch_cache(table_id)
+
         return UpdatedDashboardDataSource(
             data_source,
             updated_service.original_service_values if updated_service else {},
@@ -298,17 +324,116 @@ class DashboardDataSourceHandler:
         :return: The result of dispatching the data source.
         """
 
-        if not data_source.service_id:
-            raise DashboardDataSourceImproperlyConfigured(
-                "The service type is missing."
+        result = self.dispatch_data_sources([data_source], dispatch_context)[
+            data_source.id
+        ]
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    def dispatch_data_sources(
+        self,
+        data_sources: List[DashboardDataSource],
+        dispatch_context: DashboardDispatchContext,
+    ) -> Dict[int, Union[Any, Exception]]:
+        """
+        Dispatch the services related to the data sources. The results of the data
+        sources aggregating a table are cached until the table changes. The data
+        sources that are not cached are dispatched together, so that their services
+        can share the queries.
+
+        :param data_sources: The data sources to be dispatched.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The result of dispatching the data sources mapped by data source id.
+            If an exception occurred during the dispatch of a data source, the
+            exception is returned as its result.
+        """
+
+        for data_source in data_sources:
+            if data_source.service_id:
+                data_source.service = data_source.service.specific
+
+        results = {}
+        missed_data_sources = []
+        for data_source in data_sources:
+            if not data_source.service_id:
+                results[data_source.id] = DashboardDataSourceImproperlyConfigured(
+                    "The service type is missing."
+                )
+                continue
+
+            try:
+                results[data_source.id] = self._get_cached_dispatch(
+                    data_source, _raise_dispatch_cache_miss
+                )
+            except _DispatchCacheMiss:
+                missed_data_sources.append(data_source)
+            except Exception as e:
+                results[data_source.id] = e
+
+        if not missed_data_sources:
+            return results
+
+        # Only the data sources that are not cached are dispatched, all at once.
+        try:
+            service_results = self.service_handler.dispatch_services(
+                [d.service for d in missed_data_sources], dispatch_context
             )
+        except Exception as e:
+            service_results = {d.service_id: e for d in missed_data_sources}
+
+        for data_source in missed_data_sources:
+            result = service_results[data_source.service_id]
+            if isinstance(result, Exception):
+                results[data_source.id] = result
+                continue
+
+            try:
+                results[data_source.id] = self._get_cached_dispatch(
+                    data_source, lambda result=result: result.data
+                )
+            except Exception as e:
+                results[data_source.id] = e
+
+        return results
+
+    def _get_cached_dispatch(
+        self, data_source: DashboardDataSource, dispatch: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the cached result of the data source if its service aggregates a
+        table, or dispatches it otherwise. Exceptions raised by the dispatch are not
+        cached.
+        """
 
-        specific_service = ServiceHandler().get_service(data_source.service.id)
-        service_dispatch = self.service_handler.dispatch_service(
-            specific_service, dispatch_context
+        table_id = getattr(data_source.service, "table_id", None)
+        timeout = settings.DASHBOARD_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS
+        if not table_id or timeout <= 0:
+            return dispatch()
+
+        return global_cache.get(
+            f"dashboard_data_source_{data_source.id}_{data_source.service_id}_dispatch",
+            dispatch,
+            invalidate_key=get_dispatch_cache_invalidate_key(table_id),
+            timeout=timeout,
         )
 
-        return service_dispatch.data
+    def invalidate_dispatch_cache(self, table_id: int):
+        """
+        Invalidates the cached results of all the data sources using the table. The
+        cache is invalidated again when the transaction commits, so that a result
+        computed concurrently before the commit isn't kept.
+
+        :param table_id: The id of the table that changed.
+        """
+
+        invalidate_key = get_dispatch_cache_invalidate_key(table_id)
+        global_cache.invalidate(invalidate_key=invalidate_key)
+        transaction.on_commit(
+            lambda: global_cache.invalidate(invalidate_key=invalidate_key)
+        )
 
     def export_data_source(
         self,
@@ -0,0 +1,53 @@
+from django.dispatch import receiver
+
+from baserow.contrib.database.rows.signals import (
+    rows_created,
+    rows_deleted,
+    rows_updated,
+)
+from baserow.contrib.database.table.signals import table_schema_changed, table_updated
+from baserow.contrib.database.views.signals import (
+    view_deleted,
+    view_filter_created,
+    view_filter_deleted,
+    view_filter_group_created,
+    view_filter_group_deleted,
+    view_filter_group_updated,
+    view_filter_updated,
+    view_updated,
+)
+
+from .handler import DashboardDataSourceHandler
+
+
+@receiver([rows_created, rows_updated, rows_deleted, table_updated])
+def invalidate_dispatch_cache_on_table_change(sender, table, **kwargs):
+    # `table_updated` is also sent for the tables whose rows changed because of
+    # dependencies on another table.
+    DashboardDataSourceHandler().invalidate_dispatch_cache(table.id)
+
+
+@receiver(table_schema_changed)
+def invalidate_dispatch_cache_on_table_schema_change(sender, table_id, **kwargs):
+    DashboardDataSourceHandler().invalidate_dispatch_cache(table_id)
+
+
+@receiver([view_updated, view_deleted])
+def invalidate_dispatch_cache_on_view_change(sender, view, **kwargs):
+    DashboardDataSourceHandler().invalidate_dispatch_cache(view.table_id)
+
+
+@receiver([view_filter_created, view_filter_updated, view_filter_deleted])
+def invalidate_dispatch_cache_on_view_filter_change(sender, view_filter, **kwargs):
+    DashboardDataSourceHandler().invalidate_dispatch_cache(view_filter.view.table_id)
+
+
+@receiver(
+    [view_filter_group_created, view_filter_group_updated, view_filter_group_deleted]
+)
+def invalidate_dispatch_cache_on_view_filter_group_change(
+    sender, view_filter_group, **kwargs
+):
+    DashboardDataSourceHandler().invalidate_dispatch_cache(
+        view_filter_group.view.table_id
+    )
@@ -1,4 +1,4 @@
-from typing import Any, Iterable
+from typing import Any, Dict, Iterable, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.utils import translation
@@ -18,6 +18,7 @@ from baserow.contrib.dashboard.data_sources.operations import (
     UpdateDashboardDataSourceOperationType,
 )
 from baserow.contrib.dashboard.handler import DashboardHandler
+from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.services.exceptions import InvalidServiceTypeDispatchSource
 from baserow.core.services.registries import (
@@ -25,6 +26,7 @@ from baserow.core.services.registries import (
     ServiceType,
     service_type_registry,
 )
+from baserow.core.types import PermissionCheck
 
 from .exceptions import DashboardDataSourceDoesNotExist, ServiceConfigurationNotAllowed
 from .signals import (
@@ -289,3 +291,54 @@ class DashboardDataSourceService:
 
         result = self.handler.dispatch_data_source(data_source, dispatch_context)
         return result
+
+    def dispatch_data_sources(
+        self,
+        user,
+        dashboard_id: int,
+        dispatch_context: DashboardDispatchContext,
+    ) -> Dict[int, Union[Any, Exception]]:
+        """
+        Dispatch the services related to all the data sources of the dashboard the
+        user has the permission to dispatch.
+
+        :param user: The current user.
+        :param dashboard_id: The dashboard that holds the data sources.
+        :param dispatch_context: The context used for the dispatch.
+        :raises DashboardDoesNotExist: If the dashboard id doesn't point
+             to an existing dashboard.
+        :raises PermissionException: If the user doesn't have access to
+             list the data sources.
+        :return: The result of dispatching the data sources mapped by data source id.
+            If the user isn't allowed to dispatch a data source, or if an exception
+            occurred during its dispatch, the exception is returned as its result.
+        """
+
+        data_sources = list(self.get_data_sources(user, dashboard_id))
+        if not data_sources:
+            return {}
+
+        checks = [
+            PermissionCheck(user, DispatchDashboardDataSourceOperationType.type, d)
+            for d in data_sources
+        ]
+        permissions = CoreHandler().check_multiple_permissions(
+            checks,
+            workspace=data_sources[0].dashboard.workspace,
+            return_permissions_exceptions=True,
+        )
+
+        results = {}
+        allowed_data_sources = []
+        for check, data_source in zip(checks, data_sources):
+            if permissions[check] is True:
+                allowed_data_sources.append(data_source)
+            elif isinstance(permissions[check], Exception):
+                results[data_source.id] = permissions[check]
+            else:
+                results[data_source.id] = PermissionDenied(user)
+
+        results.update(
+            self.handler.dispatch_data_sources(allowed_data_sources, dispatch_context)
+        )
+        return results
@@ -1,10 +1,12 @@
 import json
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from http import HTTPStatus
 from io import BytesIO, IOBase
+from tempfile import SpooledTemporaryFile
 from typing import Dict, List, Optional, Tuple, Union
 
 from django.conf import settings
@@ -14,6 +16,7 @@ from django.core.files.storage import Storage
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from baserow.contrib.database.airtable.constants import (
     AIRTABLE_API_BASE_URL,
@@ -83,6 +86,22 @@ BASE_HEADERS = {
 }
 
 
+def create_airtable_session() -> requests.Session:
+    """
+    Creates a `requests` session whose connections are kept alive and reused for all
+    the requests made during an import. The connection pool is big enough to be
+    shared by all the threads that make requests concurrently.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=settings.BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def download_airtable_file(
     name: str,
     download_file: DownloadFile,
@@ -90,6 +109,7 @@ def download_airtable_file(
     request_id: str,
     cookies: dict,
     headers: dict = None,
+    session: Optional[requests.Session] = None,
 ) -> Response:
     """
     Downloads a file from Airtable using either direct URL fetch or
@@ -105,12 +125,17 @@ def download_airtable_file(
     :param cookies: The cookies dict returned by the initially
         requested shared base
     :param headers: Optional headers to use for the request
-    :return: The response object from the download request
+    :param session: Optional session to make the request with, so that its
+        connections can be reused.
+    :return: The streamed response object from the download request. The body must
+        be read or the response closed to release the connection.
     :raises FileDownloadFailed: When the file could not be downloaded.
     """
 
     if download_file.type == AIRTABLE_DOWNLOAD_FILE_TYPE_FETCH:
-        response = requests.get(download_file.url, headers=headers)  # noqa: S113
+        response = (session or requests).get(  # noqa: S113
+            download_file.url, headers=headers, stream=True
+        )
     elif download_file.type == AIRTABLE_DOWNLOAD_FILE_TYPE_ATTACHMENT_ENDPOINT:
         response = AirtableHandler.fetch_attachment(
             row_id=download_file.row_id,
@@ -120,11 +145,23 @@ def download_airtable_file(
             request_id=request_id,
             cookies=cookies,
             headers=headers,
+            session=session,
         )
     else:
         raise FileDownloadFailed(
             f"Unknown download file type: {download_file.type}",
         )
+
+    try:
+        _check_downloadable_file_response(name, response)
+    except FileDownloadFailed:
+        response.close()
+        raise
+
+    return response
+
+
+def _check_downloadable_file_response(name: str, response: Response):
     if response.status_code not in [HTTPStatus.OK, HTTPStatus.PARTIAL_CONTENT]:
         raise FileDownloadFailed(
             f"File {name} could not be downloaded (HTTP {response.status_code}).",
@@ -160,7 +197,6 @@ def download_airtable_file(
         raise FileDownloadFailed(
             f"File {name} exceeds the size limit of {settings.BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB} bytes."
         )
-    return response
 
 
 class AirtableFileImport:
@@ -168,7 +204,9 @@ class AirtableFileImport:
     A file-like object (we only need open and close methods) that facilitates on-demand
     file downloads from Airtable for re-uploading to Baserow. This avoids downloading
     all files at once, enabling efficient, one-by-one downloads as needed during the
-    import process.
+    import process. Every file is streamed in chunks into a temporary file that only
+    spills to disk when it's large, and all downloads share the connections of one
+    session.
     """
 
     def __init__(self, init_data, request_id, cookies, headers=BASE_HEADERS):
@@ -177,6 +215,7 @@ class AirtableFileImport:
         self.request_id = request_id
         self.cookies = cookies
         self.headers = headers
+        self.session = create_airtable_session()
 
     def add_files(self, files_to_download):
         self.files_to_download.update(files_to_download)
@@ -199,16 +238,22 @@ class AirtableFileImport:
             request_id=self.request_id,
             cookies=self.cookies,
             headers=BASE_HEADERS,
+            session=self.session,
         )
 
-        stream = BytesIO(response.content)
+        chunk_size = settings.BASEROW_AIRTABLE_IMPORT_DOWNLOAD_CHUNK_SIZE
+        stream = SpooledTemporaryFile(max_size=chunk_size)
         try:
+            with response:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    stream.write(chunk)
+            stream.seek(0)
             yield stream
         finally:
             stream.close()
 
     def close(self):
-        pass
+        self.session.close()
 
 
 class AirtableHandler:
@@ -264,7 +309,7 @@ class AirtableHandler:
 
     @staticmethod
     def make_airtable_request(
-        init_data: dict, request_id: str, headers=None, **kwargs
+        init_data: dict, request_id: str, headers=None, session=None, **kwargs
     ) -> Response:
         """
         Helper method to make a valid request to to Airtable with the correct headers
@@ -274,6 +319,8 @@ class AirtableHandler:
         :param request_id: The request_id returned by the initially requested shared
             base.
         :param headers: The headers to be passed into the `requests` request.
+        :param session: Optionally a `requests` session to make the request with, so
+            that its connections can be reused.
         :param kwargs: THe kwargs that must be passed into the `requests.get` method.
         :return: The requests Response object related to the request.
         """
@@ -290,7 +337,7 @@ class AirtableHandler:
         params["accessPolicy"] = json.dumps(access_policy)
         params["request_id"] = request_id
 
-        return requests.get(
+        return (session or requests).get(
             headers={
                 "x-airtable-application-id": application_id,
                 "x-airtable-client-queue-time": "45",
@@ -314,6 +361,7 @@ class AirtableHandler:
         cookies: dict,
         fetch_application_structure: bool,
         stream=True,
+        session=None,
     ) -> Response:
         """
         Fetches the data or application structure of a publicly shared Airtable table.
@@ -335,6 +383,7 @@ class AirtableHandler:
         :param stream: Indicates whether the request should be streamed. This could be
             useful if we want to show a progress bar. It will directly be passed into
             the `requests` request.
+        :param session: Optionally a `requests` session to make the request with.
         :return: The `requests` response containing the result.
         """
 
@@ -360,6 +409,7 @@ class AirtableHandler:
                 "stringifiedObjectParams": json.dumps(stringified_object_params),
             },
             cookies=cookies,
+            session=session,
         )
         return response
 
@@ -370,6 +420,7 @@ class AirtableHandler:
         request_id: str,
         cookies: dict,
         stream=True,
+        session=None,
     ) -> Response:
         """
         :param view_id: The Airtable view id that must be fetched. The id starts with
@@ -382,6 +433,7 @@ class AirtableHandler:
         :param stream: Indicates whether the request should be streamed. This could be
             useful if we want to show a progress bar. It will directly be passed into
             the `requests` request.
+        :param session: Optionally a `requests` session to make the request with.
         :return: The `requests` response containing the result.
         """
 
@@ -395,6 +447,7 @@ class AirtableHandler:
             stream=stream,
             params={"stringifiedObjectParams": json.dumps(stringified_object_params)},
             cookies=cookies,
+            session=session,
         )
         return response
 
@@ -408,6 +461,7 @@ class AirtableHandler:
         cookies: dict,
         stream=True,
         headers=None,
+        session=None,
     ) -> Response:
         """
         :param row_id: The Airtable row id of the attachment that must be fetched.
@@ -425,6 +479,7 @@ class AirtableHandler:
             useful if we want to show a progress bar. It will directly be passed into
             the `requests` request.
         :param headers: The headers to be passed into the `requests` request.
+        :param session: Optionally a `requests` session to make the request with.
         :return: The `requests` response containing the result.
         """
 
@@ -443,6 +498,7 @@ class AirtableHandler:
             cookies=cookies,
             allow_redirects=True,
             headers=headers,
+            session=session,
         )
         return response
 
@@ -673,16 +729,39 @@ class AirtableHandler:
             headers=BASE_HEADERS,
         )
 
-        failed_files = []
-        for file_name, download_file in files_to_download.items():
-            headers = BASE_HEADERS.copy()
-            headers["Range"] = "bytes=0-5"
+        headers = BASE_HEADERS.copy()
+        headers["Range"] = "bytes=0-5"
 
+        def is_downloadable(file_name_and_download_file):
+            file_name, download_file = file_name_and_download_file
             try:
-                download_airtable_file(
-                    file_name, download_file, init_data, request_id, cookies, headers
+                response = download_airtable_file(
+                    file_name,
+                    download_file,
+                    init_data,
+                    request_id,
+                    cookies,
+                    headers,
+                    session=file_archive.session,
                 )
             except FileDownloadFailed:
+                return False
+            response.close()
+            return True
+
+        # Checking whether the files can be downloaded requires a request per file,
+        # so they're done concurrently.
+        files = list(files_to_download.items())
+        with ThreadPoolExecutor(
+            max_workers=settings.BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS
+        ) as executor:
+            downloadable = list(executor.map(is_downloadable, files))
+
+        failed_files = []
+        for (file_name, download_file), is_file_downloadable in zip(
+            files, downloadable
+        ):
+            if not is_file_downloadable:
                 field_name = ""
                 table_name = ""
                 baserow_row_id = download_file.row_id
@@ -1138,72 +1217,86 @@ class AirtableHandler:
         )
         progress.increment(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE)
 
-        # Loop over all the tables and make a request for each table to obtain the raw
-        # Airtable table data.
-        tables = []
-        raw_tables = list(
-            init_data["singleApplicationScaffoldingData"]["tableById"].keys()
-        )
-        for index, table_id in enumerate(
-            progress.track(
-                represents_progress=49,
-                state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
-                iterable=raw_tables,
-            )
+        # The table and view data requests don't depend on each other, so they're
+        # made concurrently over a shared pool of kept alive connections. The results
+        # are collected in the original order, so that the outcome doesn't depend on
+        # which request finishes first.
+        with (
+            create_airtable_session() as session,
+            ThreadPoolExecutor(
+                max_workers=settings.BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS
+            ) as executor,
         ):
-            response = cls.fetch_table_data(
-                table_id=table_id,
-                init_data=init_data,
-                request_id=request_id,
-                cookies=cookies,
-                # At least one request must also fetch the application structure that
-                # contains the schema of all the tables, so we do this for the first
-                # table.
-                fetch_application_structure=index == 0,
-                stream=False,
-            )
-            json_decoded_content = parse_json_and_remove_invalid_surrogate_characters(
-                response
-            )
-
-            tables.append(json_decoded_content)
 
-        # Split database schema from the tables because we need this to be separated
-        # later on.
-        schema, tables = cls.extract_schema(tables)
+            def fetch_json(fetch, **kwargs):
+                response = fetch(
+                    init_data=init_data,
+                    request_id=request_id,
+                    cookies=cookies,
+                    stream=False,
+                    session=session,
+                    **kwargs,
+                )
+                return parse_json_and_remove_invalid_surrogate_characters(response)
 
-        # Collect which for which view the data is missing, so that they can be
-        # fetched while respecting the progress afterward.
-        view_data_to_fetch = []
-        for table in schema["tableSchemas"]:
-            existing_view_data = [
-                view_data["id"] for view_data in tables[table["id"]]["viewDatas"]
+            # Make a request for each table to obtain the raw Airtable table data.
+            raw_tables = list(
+                init_data["singleApplicationScaffoldingData"]["tableById"].keys()
+            )
+            table_futures = [
+                executor.submit(
+                    fetch_json,
+                    cls.fetch_table_data,
+                    table_id=table_id,
+                    # At least one request must also fetch the application structure
+                    # that contains the schema of all the tables, so we do this for
+                    # the first table.
+                    fetch_application_structure=index == 0,
+                )
+                for index, table_id in enumerate(raw_tables)
+            ]
+            tables = [
+                future.result()
+                for future in progress.track(
+                    represents_progress=49,
+                    state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
+                    iterable=table_futures,
+                )
             ]
-            for view in table["views"]:
-                # Skip the view data that has already been loaded.
-                if view["id"] in existing_view_data:
-                    continue
 
-                view_data_to_fetch.append((table["id"], view["id"]))
+            # Split database schema from the tables because we need this to be
+            # separated later on.
+            schema, tables = cls.extract_schema(tables)
 
-        # Fetch the missing view data, and add them to the table object so that we have
-        # a complete object.
-        for table_id, view_id in progress.track(
-            represents_progress=50,
-            state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
-            iterable=view_data_to_fetch,
-        ):
-            response = cls.fetch_view_data(
-                view_id=view_id,
-                init_data=init_data,
-                request_id=request_id,
-                cookies=cookies,
-                stream=False,
-            )
-            json_decoded_content = parse_json_and_remove_invalid_surrogate_characters(
-                response
-            )
-            tables[table_id]["viewDatas"].append(json_decoded_content["data"])
+            # Collect which for which view the data is missing, so that they can be
+            # fetched while respecting the progress afterward.
+            view_data_to_fetch = []
+            for table in schema["tableSchemas"]:
+                existing_view_data = [
+                    view_data["id"] for view_data in tables[table["id"]]["viewDatas"]
+                ]
+                for view in table["views"]:
+                    # Skip the view data that has already been loaded.
+                    if view["id"] in existing_view_data:
+                        continue
+
+                    view_data_to_fetch.append((table["id"], view["id"]))
+
+            # Fetch the missing view data, and add them to the table object so that we
+            # have a complete object.
+            view_futures = [
+                (
+                    table_id,
+                    executor.submit(fetch_json, cls.fetch_view_data, view_id=view_id),
+                )
+                for table_id, view_id in view_data_to_fetch
+            ]
+            for table_id, future in progress.track(
+                represents_progress=50,
+                state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
+                iterable=view_futures,
+            ):
+                tables[table_id]["viewDatas"].append(future.result()["data"])
 
         return init_data, request_id, cookies, schema, tables
 
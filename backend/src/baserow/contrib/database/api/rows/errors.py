@@ -27,3 +27,8 @@ ERROR_CANNOT_DELETE_ROWS_IN_TABLE = (
     HTTP_400_BAD_REQUEST,
     "It is not possible to delete a row in the provided table.",
 )
+ERROR_COALESCED_ROW_UPDATE_FAILED = (
+    "ERROR_COALESCED_ROW_UPDATE_FAILED",
+    HTTP_400_BAD_REQUEST,
+    "The coalesced row update could not be applied.",
+)
@@ -1,17 +1,20 @@
 from copy import deepcopy
-from typing import Dict, List
+from typing import Any, Dict, Hashable, List
 
 from django.conf import settings
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db.models.base import ModelBase
 
 from loguru import logger
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.utils import get_serializer_class
 from baserow.contrib.database.api.rows.fields import UserFieldNamesField
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.rows.constants import COALESCED_UPDATE_ACKNOWLEDGEMENTS
 from baserow.contrib.database.rows.models import RowHistory
 from baserow.contrib.database.rows.registries import (
     RowMetadataType,
@@ -83,13 +86,14 @@ class BatchUpdateRowsSerializer(serializers.Serializer):
 def serialize_rows_for_response(
     rows, model, user_field_names=False, many=True, field_ids=None
 ):
-    return get_row_serializer_class(
+    serializer = get_compiled_row_serializer(
         model,
         RowSerializer,
         is_response=True,
         user_field_names=user_field_names,
         field_ids=field_ids,
-    )(rows, many=many).data
+    )
+    return serializer.serialize_many(rows) if many else serializer.serialize(rows)
 
 
 def is_read_only(value):
@@ -223,6 +227,162 @@ def get_row_serializer_class(
     )
 
 
+# Serializer fields of which the `to_representation` method is equivalent to calling
+# the builtin directly, so that the builtin can be called without the method call.
+FAST_TO_REPRESENTATION = {
+    serializers.CharField: str,
+    serializers.EmailField: str,
+    serializers.URLField: str,
+    serializers.SlugField: str,
+    serializers.IntegerField: int,
+    serializers.FloatField: float,
+    serializers.BooleanField: bool,
+}
+
+
+class CompiledRowSerializer:
+    """
+    Produces exactly the same data as the provided row serializer class, but without
+    the overhead that DRF adds for every cell. The serializer is instantiated once to
+    resolve its fields, after which a plan containing the name, the attribute and the
+    conversion function of every field is used to serialize the rows into plain
+    dicts. Because the fields are only bound once, the instance can be reused for any
+    number of rows and requests.
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer = serializer_class()
+        self.custom_to_representation = (
+            type(self.serializer).to_representation
+            is not serializers.Serializer.to_representation
+        )
+        self.plan = [
+            self._compile_field(field) for field in self.serializer._readable_fields
+        ]
+
+    @staticmethod
+    def _compile_field(field):
+        # The attribute can only be read directly if the field doesn't change how
+        # it's looked up and the source doesn't traverse relations.
+        attname = None
+        if (
+            len(field.source_attrs) == 1
+            and type(field).get_attribute is serializers.Field.get_attribute
+        ):
+            attname = field.source_attrs[0]
+
+        to_representation = FAST_TO_REPRESENTATION.get(
+            type(field), field.to_representation
+        )
+        return field.field_name, attname, field, to_representation
+
+    def serialize(self, row) -> Dict[str, Any]:
+        """
+        Serializes a single row.
+
+        :param row: The row instance that must be serialized.
+        :return: The serialized row.
+        """
+
+        if self.custom_to_representation:
+            return self.serializer.to_representation(row)
+
+        data = {}
+        for field_name, attname, field, to_representation in self.plan:
+            try:
+                if attname is None:
+                    value = field.get_attribute(row)
+                else:
+                    value = getattr(row, attname)
+                    if callable(value):
+                        # DRF calls the methods that don't need any argument.
+                        value = field.get_attribute(row)
+            except (AttributeError, ObjectDoesNotExist):
+                # Let DRF decide, it for example falls back on the default value.
+                try:
+                    value = field.get_attribute(row)
+                except SkipField:
+                    continue
+            except SkipField:
+                continue
+
+            check_for_none = value.pk if isinstance(value, PKOnlyObject) else value
+            data[field_name] = (
+                None if check_for_none is None else to_representation(value)
+            )
+        return data
+
+    def serialize_many(self, rows) -> List[Dict[str, Any]]:
+        """
+        Serializes all the provided rows.
+
+        :param rows: An iterable, queryset or manager of row instances.
+        :return: A list containing the serialized rows.
+        """
+
+        if hasattr(rows, "all") and not isinstance(rows, (list, tuple)):
+            rows = rows.all()
+        serialize = self.serialize
+        return [serialize(row) for row in rows]
+
+
+def _make_hashable(value) -> Hashable:
+    """
+    Converts the provided arguments into a cache key. Only primitive values and
+    classes are accepted because other objects, like the link row joins in field
+    kwargs, are different for every request.
+
+    :raises TypeError: If the value contains anything else.
+    """
+
+    if isinstance(value, dict):
+        return tuple(sorted((key, _make_hashable(val)) for key, val in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_make_hashable(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(item) for item in value)
+    if value is None or isinstance(value, (str, int, float, type)):
+        return value
+    raise TypeError(f"{type(value)} can't be used in a cache key.")
+
+
+def get_compiled_row_serializer(model, base_class=None, **kwargs):
+    """
+    Returns a `CompiledRowSerializer` for the row serializer class that
+    `get_row_serializer_class` generates with the same arguments. A generated model
+    belongs to a specific version of the table and its fields, so the compiled
+    serializer is cached on the model class and reused for as long as the model is.
+    If the arguments can't be used as cache key, for example because field kwargs
+    containing objects are provided, a new compiled serializer is returned.
+
+    :param model: The model for which to generate the serializer.
+    :param base_class: The base serializer class that will be extended.
+    :param kwargs: The other arguments that are passed into
+        `get_row_serializer_class`.
+    :return: The compiled row serializer.
+    """
+
+    try:
+        cache_key = _make_hashable((base_class, kwargs))
+    except TypeError:
+        cache_key = None
+
+    if cache_key is not None:
+        compiled_serializers = model.__dict__.get("_compiled_row_serializers")
+        if compiled_serializers is None:
+            compiled_serializers = {}
+            model._compiled_row_serializers = compiled_serializers
+        elif cache_key in compiled_serializers:
+            return compiled_serializers[cache_key]
+
+    serializer = CompiledRowSerializer(
+        get_row_serializer_class(model, base_class, **kwargs)
+    )
+    if cache_key is not None:
+        compiled_serializers[cache_key] = serializer
+    return serializer
+
+
 def get_batch_operation_metadata_serializer(row_serializer_class):
     cascade_update_fields = dict(
         rows=serializers.ListField(
@@ -529,6 +689,9 @@ class GetRowQueryParamsSerializer(serializers.Serializer):
 
 class UpdateRowQueryParamsSerializer(serializers.Serializer):
     view = serializers.IntegerField(required=False)
+    coalesce = serializers.ChoiceField(
+        choices=COALESCED_UPDATE_ACKNOWLEDGEMENTS, required=False
+    )
 
 
 class BatchUpdateRowsQueryParamsSerializer(serializers.Serializer):
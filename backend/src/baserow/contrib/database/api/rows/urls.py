@@ -1,5 +1,7 @@
 from django.urls import re_path
 
+from baserow.api.async_views import async_read_view
+
 from .views import (
     BatchDeleteRowsView,
     BatchRowsView,
@@ -14,10 +16,14 @@ from .views import (
 app_name = "baserow.contrib.database.api.rows"
 
 urlpatterns = [
-    re_path(r"table/(?P<table_id>[0-9]+)/$", RowsView.as_view(), name="list"),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/$",
+        async_read_view(RowsView.as_view()),
+        name="list",
+    ),
     re_path(
         r"table/(?P<table_id>[0-9]+)/(?P<row_id>[0-9]+)/$",
-        RowView.as_view(),
+        async_read_view(RowView.as_view()),
         name="item",
     ),
     re_path(
@@ -10,7 +10,7 @@ from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.status import HTTP_204_NO_CONTENT
+from rest_framework.status import HTTP_202_ACCEPTED, HTTP_204_NO_CONTENT
 from rest_framework.views import APIView
 
 from baserow.api.decorators import (
@@ -26,6 +26,7 @@ from baserow.api.exceptions import (
     RequestBodyValidationException,
 )
 from baserow.api.pagination import PageNumberPagination
+from baserow.api.renderers import OrjsonRenderer
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
@@ -51,6 +52,7 @@ from baserow.contrib.database.api.fields.errors import (
 from baserow.contrib.database.api.rows.errors import (
     ERROR_CANNOT_CREATE_ROWS_IN_TABLE,
     ERROR_CANNOT_DELETE_ROWS_IN_TABLE,
+    ERROR_COALESCED_ROW_UPDATE_FAILED,
     ERROR_INVALID_JOIN_PARAMETER,
     ERROR_ROW_DOES_NOT_EXIST,
     ERROR_ROW_IDS_NOT_UNIQUE,
@@ -99,9 +101,18 @@ from baserow.contrib.database.rows.actions import (
     MoveRowActionType,
     UpdateRowsActionType,
 )
+from baserow.contrib.database.rows.coalescing import CoalescedRowUpdateHandler
+from baserow.contrib.database.rows.constants import (
+    COALESCED_UPDATE_ACKNOWLEDGEMENTS,
+    COALESCED_UPDATE_APPLIED,
+    COALESCED_UPDATE_FIELD_DATA_CONSTRAINT,
+    COALESCED_UPDATE_INVALID,
+    COALESCED_UPDATE_ROW_DOES_NOT_EXIST,
+)
 from baserow.contrib.database.rows.exceptions import (
     CannotCreateRowsInTable,
     CannotDeleteRowsInTable,
+    CoalescedRowUpdateFailed,
     RowDoesNotExist,
     RowIdsNotUnique,
 )
@@ -156,6 +167,7 @@ from .serializers import (
     RowSerializer,
     UpdateRowQueryParamsSerializer,
     get_batch_row_serializer_class,
+    get_compiled_row_serializer,
     get_example_batch_rows_serializer_class,
     get_example_row_serializer_class,
     get_row_serializer_class,
@@ -197,6 +209,7 @@ def build_response_with_metadata(
 class RowsView(APIView):
     authentication_classes = APIView.authentication_classes + [TokenAuthentication]
     permission_classes = (IsAuthenticated,)
+    renderer_classes = (OrjsonRenderer,)
 
     @extend_schema(
         parameters=[
@@ -443,11 +456,11 @@ class RowsView(APIView):
             queryset = model.objects.all().enhance_by_fields(**field_kwargs)
             queryset = view_handler.apply_filters(view, queryset)
             queryset = view_handler.apply_sorting(view, queryset)
+        elif fields:
+            model = table.get_projection_model([field.id for field in fields])
+            queryset = model.objects.all().enhance_by_fields(**field_kwargs)
         else:
-            model = table.get_model(
-                fields=fields,
-                field_ids=[] if fields else None,
-            )
+            model = table.get_model()
             queryset = model.objects.all().enhance_by_fields(**field_kwargs)
 
         adhoc_filters = AdHocFilters.from_request(
@@ -462,9 +475,12 @@ class RowsView(APIView):
         if order_by:
             queryset = queryset.order_by_fields_string(order_by, user_field_names)
 
+        if view_id and fields:
+            queryset = queryset.only_fields([f.id for f in fields], **field_kwargs)
+
         paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
+        serializer = get_compiled_row_serializer(
             model,
             RowSerializer,
             is_response=True,
@@ -472,11 +488,11 @@ class RowsView(APIView):
             user_field_names=user_field_names,
             field_kwargs=field_kwargs,
         )
-        serializer = serializer_class(page, many=True)
+        data = serializer.serialize_many(page)
 
         rows_loaded.send(sender=self, table=table)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response(data)
 
     @extend_schema(
         parameters=[
@@ -923,6 +939,23 @@ class RowView(APIView):
                     "Defaults to `true`"
                 ),
             ),
+            OpenApiParameter(
+                name="coalesce",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                enum=COALESCED_UPDATE_ACKNOWLEDGEMENTS,
+                description=(
+                    "If provided, the update is buffered and applied together with "
+                    "the other coalesced updates of the table made within a short "
+                    "window, as one bulk update. This is meant for integrations that "
+                    "update single rows at a high rate. With `accepted`, the "
+                    "endpoint responds with status 202 as soon as the update has "
+                    "been buffered. With `applied`, the endpoint waits until the "
+                    "update has been applied and responds with the updated row, or "
+                    "with status 202 if that takes too long. Coalesced updates can't "
+                    "be undone."
+                ),
+            ),
             CLIENT_SESSION_ID_SCHEMA_PARAMETER,
             CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
         ],
@@ -951,8 +984,13 @@ class RowView(APIView):
             200: get_example_row_serializer_class(
                 example_type="get", user_field_names=True
             ),
+            202: {"type": "object", "properties": {"id": {"type": "integer"}}},
             400: get_error_schema(
-                ["ERROR_USER_NOT_IN_GROUP", "ERROR_REQUEST_BODY_VALIDATION"]
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_COALESCED_ROW_UPDATE_FAILED",
+                ]
             ),
             401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
             404: get_error_schema(
@@ -968,9 +1006,9 @@ class RowView(APIView):
             NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
             DeadlockException: ERROR_DATABASE_DEADLOCK,
             FieldDataConstraintException: ERROR_FIELD_DATA_CONSTRAINT,
+            CoalescedRowUpdateFailed: ERROR_COALESCED_ROW_UPDATE_FAILED,
         }
     )
-    @atomic_with_retry_on_deadlock()
     @require_request_data_type(dict)
     @validate_query_parameters(UpdateRowQueryParamsSerializer)
     def patch(
@@ -986,6 +1024,19 @@ class RowView(APIView):
         :return: The updated row values serialized as a json object
         """
 
+        if query_params.get("coalesce"):
+            # A coalesced update is applied in another transaction, so waiting for
+            # it must not keep a transaction open, and it must not be buffered again
+            # if the transaction is retried because of a deadlock.
+            return self._update_row(request, table_id, row_id, query_params)
+
+        return atomic_with_retry_on_deadlock()(self._update_row)(
+            request, table_id, row_id, query_params
+        )
+
+    def _update_row(
+        self, request: Request, table_id: int, row_id: int, query_params
+    ) -> Response:
         table = TableHandler().get_table(table_id)
         TokenHandler().check_table_permissions(request, "update", table, False)
 
@@ -1012,22 +1063,39 @@ class RowView(APIView):
             user_field_names=user_field_names,
         )
         data = validate_data(validation_serializer, request_data, return_validated=True)
-        try:
+        coalesce = query_params.get("coalesce")
+        if coalesce:
             data["id"] = int(row_id)
-            row = (
-                action_type_registry.get_by_type(UpdateRowsActionType)
-                .do(
-                    request.user,
-                    table,
-                    [data],
-                    model=model,
-                    view=view,
-                    send_webhook_events=send_webhook_events,
-                )
-                .updated_rows[0]
+            row = self._apply_coalesced_update(
+                request,
+                table,
+                model,
+                view,
+                data,
+                request_data,
+                user_field_names,
+                send_webhook_events,
+                wait_until_applied=coalesce == COALESCED_UPDATE_APPLIED,
             )
-        except ValidationError as exc:
-            raise RequestBodyValidationException(detail=exc.message) from exc
+            if row is None:
+                return Response({"id": data["id"]}, status=HTTP_202_ACCEPTED)
+        else:
+            try:
+                data["id"] = int(row_id)
+                row = (
+                    action_type_registry.get_by_type(UpdateRowsActionType)
+                    .do(
+                        request.user,
+                        table,
+                        [data],
+                        model=model,
+                        view=view,
+                        send_webhook_events=send_webhook_events,
+                    )
+                    .updated_rows[0]
+                )
+            except ValidationError as exc:
+                raise RequestBodyValidationException(detail=exc.message) from exc
 
         hidden_field_ids = (
             get_hidden_field_ids_for_view_user(request.user, view) if view else None
@@ -1042,6 +1110,62 @@ class RowView(APIView):
         serializer = serializer_class(row)
         return Response(serializer.data)
 
+    def _apply_coalesced_update(
+        self,
+        request: Request,
+        table: Table,
+        model,
+        view,
+        data: Dict[str, Any],
+        request_data: Dict[str, Any],
+        user_field_names: bool,
+        send_webhook_events: bool,
+        wait_until_applied: bool,
+    ):
+        """
+        Buffers the validated row update, so that it's applied together with the
+        other coalesced updates of the table.
+
+        :return: The updated row if the update has been applied in time, or None
+            if it has only been buffered. The row is fetched again after the update
+            has been applied by the flush task.
+        """
+
+        row_id = data["id"]
+        RowHandler().check_update_rows_permissions(
+            request.user, table, [data], model, view
+        )
+        handler = CoalescedRowUpdateHandler()
+        update_id = handler.buffer_update(
+            request.user,
+            table,
+            row_id,
+            request_data,
+            user_field_names=user_field_names,
+            send_webhook_events=send_webhook_events,
+            wait_for_result=wait_until_applied,
+        )
+        if not wait_until_applied:
+            return None
+
+        result = handler.wait_for_result(
+            update_id, settings.BASEROW_COALESCED_ROW_UPDATES_WAIT_TIMEOUT_SECONDS
+        )
+        if result is None:
+            return None
+
+        status = result["status"]
+        if status == COALESCED_UPDATE_ROW_DOES_NOT_EXIST:
+            raise RowDoesNotExist(row_id)
+        elif status == COALESCED_UPDATE_INVALID:
+            raise RequestBodyValidationException(detail=result["detail"])
+        elif status == COALESCED_UPDATE_FIELD_DATA_CONSTRAINT:
+            raise FieldDataConstraintException()
+        elif status != COALESCED_UPDATE_APPLIED:
+            raise CoalescedRowUpdateFailed()
+
+        return RowHandler().get_row(request.user, table, row_id, model, view=view)
+
     @extend_schema(
         parameters=[
             OpenApiParameter(
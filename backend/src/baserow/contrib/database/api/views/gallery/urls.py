@@ -1,5 +1,7 @@
 from django.urls import re_path
 
+from baserow.api.async_views import async_read_view
+
 from .views import GalleryViewView, PublicGalleryViewRowsView
 
 app_name = "baserow.contrib.database.api.views.gallery"
@@ -8,7 +10,7 @@ urlpatterns = [
     re_path(r"(?P<view_id>[0-9]+)/$", GalleryViewView.as_view(), name="list"),
     re_path(
         r"(?P<slug>[-\w]+)/public/rows/$",
-        PublicGalleryViewRowsView.as_view(),
+        async_read_view(PublicGalleryViewRowsView.as_view()),
         name="public_rows",
     ),
 ]
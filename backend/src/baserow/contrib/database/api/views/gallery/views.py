@@ -1,3 +1,5 @@
+from functools import partial
+
 from django.db import transaction
 
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
@@ -46,6 +48,7 @@ from baserow.contrib.database.api.views.gallery.serializers import (
 )
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
 from baserow.contrib.database.api.views.utils import (
+    get_cached_public_view_rows_response,
     get_hidden_field_ids_for_view_user,
     get_public_view_authorization_token,
     parse_limit_linked_items_params,
@@ -466,6 +469,23 @@ class PublicGalleryViewRowsView(APIView):
         `field_options` are provided in the include GET parameter.
         """
 
+        view_handler = ViewHandler()
+        view = view_handler.get_public_view_by_slug(
+            request.user,
+            slug,
+            GalleryView,
+            authorization_token=get_public_view_authorization_token(request),
+        )
+
+        return get_cached_public_view_rows_response(
+            request,
+            view,
+            partial(self._list_rows, request, view, field_options, query_params),
+        )
+
+    def _list_rows(
+        self, request: Request, view: GalleryView, field_options: bool, query_params
+    ) -> Response:
         search = query_params.get("search")
         search_mode = query_params.get("search_mode")
         order_by = request.GET.get("order_by")
@@ -475,13 +495,6 @@ class PublicGalleryViewRowsView(APIView):
 
         count = "count" in request.GET
 
-        view_handler = ViewHandler()
-        view = view_handler.get_public_view_by_slug(
-            request.user,
-            slug,
-            GalleryView,
-            authorization_token=get_public_view_authorization_token(request),
-        )
         view_type = view_type_registry.get_by_model(view)
         model = view.table.get_model()
 
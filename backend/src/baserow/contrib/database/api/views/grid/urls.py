@@ -1,5 +1,7 @@
 from django.urls import re_path
 
+from baserow.api.async_views import async_read_view
+
 from .views import (
     GridViewFieldAggregationsView,
     GridViewFieldAggregationView,
@@ -26,10 +28,15 @@ urlpatterns = [
         PublicGridViewFieldAggregationsView.as_view(),
         name="public-field-aggregations",
     ),
-    re_path(r"(?P<view_id>[0-9]+)/$", GridViewView.as_view(), name="list"),
+    re_path(
+        r"(?P<view_id>[0-9]+)/$",
+        # Filtering the rows with a POST request only reads them as well.
+        async_read_view(GridViewView.as_view(), methods=["GET", "HEAD", "POST"]),
+        name="list",
+    ),
     re_path(
         r"(?P<slug>[-\w]+)/public/rows/$",
-        PublicGridViewRowsView.as_view(),
+        async_read_view(PublicGridViewRowsView.as_view()),
         name="public_rows",
     ),
 ]
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import partial
 
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
@@ -14,6 +15,7 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
+from baserow.api.renderers import OrjsonRenderer
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
@@ -41,9 +43,9 @@ from baserow.contrib.database.api.fields.errors import (
 )
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
+    get_compiled_row_serializer,
     get_example_multiple_rows_metadata_serializer,
     get_example_row_serializer_class,
-    get_row_serializer_class,
 )
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.api.views.errors import (
@@ -57,11 +59,13 @@ from baserow.contrib.database.api.views.grid.serializers import (
 )
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
 from baserow.contrib.database.api.views.utils import (
+    get_cached_public_view_rows_response,
     get_hidden_field_ids_for_view_user,
     get_public_view_authorization_token,
     get_public_view_filtered_queryset,
     get_view_filtered_queryset,
     paginate_and_serialize_queryset,
+    select_only_serialized_fields,
     serialize_group_by_fields_metadata,
     serialize_rows_metadata,
     serialize_view_field_options,
@@ -110,6 +114,7 @@ def get_available_aggregation_type():
 
 class GridViewView(APIView):
     permission_classes = (IsAuthenticated,)
+    renderer_classes = (OrjsonRenderer,)
 
     def get_permissions(self):
         if self.request.method == "GET":
@@ -264,14 +269,27 @@ class GridViewView(APIView):
         if ONLY_COUNT_API_PARAM.name in request.GET:
             return Response({"count": queryset.count()})
 
+        group_by_field_ids = (
+            [group_by.field_id for group_by in view.viewgroupby_set.all()]
+            if view_type.can_group_by
+            else []
+        )
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids, exclude_field_ids=hidden_field_ids
+            select_only_serialized_fields(
+                queryset,
+                field_ids,
+                exclude_field_ids=hidden_field_ids,
+                extra_field_ids=group_by_field_ids,
+            ),
+            request,
+            field_ids,
+            exclude_field_ids=hidden_field_ids,
         )
 
-        if view_type.can_group_by and view.viewgroupby_set.all():
+        if group_by_field_ids:
             group_by_fields = [
-                model._field_objects[group_by.field_id]["field"]
-                for group_by in view.viewgroupby_set.all()
+                model._field_objects[field_id]["field"]
+                for field_id in group_by_field_ids
             ]
             serialized_group_by_metadata = serialize_group_by_fields_metadata(
                 queryset, group_by_fields, page
@@ -361,14 +379,13 @@ class GridViewView(APIView):
         model = view.table.get_model(field_ids=data["field_ids"])
         results = model.objects.filter(pk__in=data["row_ids"])
 
-        serializer_class = get_row_serializer_class(
+        serializer = get_compiled_row_serializer(
             model,
             RowSerializer,
             is_response=True,
             exclude_field_ids=hidden_field_ids,
         )
-        serializer = serializer_class(results, many=True)
-        return Response(serializer.data)
+        return Response(serializer.serialize_many(results))
 
 
 class GridViewFieldAggregationsView(APIView):
@@ -703,6 +720,7 @@ class GridViewFieldAggregationView(APIView):
 
 class PublicGridViewRowsView(APIView):
     permission_classes = (AllowAny,)
+    renderer_classes = (OrjsonRenderer,)
 
     @extend_schema(
         parameters=[
@@ -824,6 +842,15 @@ class PublicGridViewRowsView(APIView):
             authorization_token=get_public_view_authorization_token(request),
         )
 
+        return get_cached_public_view_rows_response(
+            request,
+            view,
+            partial(self._list_rows, request, view, field_options, query_params),
+        )
+
+    def _list_rows(
+        self, request: Request, view: GridView, field_options: bool, query_params
+    ) -> Response:
         (
             queryset,
             field_ids,
@@ -834,8 +861,24 @@ class PublicGridViewRowsView(APIView):
         if ONLY_COUNT_API_PARAM.name in request.GET:
             return Response({"count": queryset.count()})
 
+        group_by = request.GET.get("group_by")
+        # We can safely do this without having to check whether the `group_by` input
+        # is valid because this has already been validated by the
+        # `get_public_rows_queryset_and_field_ids`.
+        group_by_field_ids = (
+            [
+                get_field_id_from_field_key(field_string, False)
+                for field_string in split_comma_separated_string(group_by)
+            ]
+            if group_by
+            else []
+        )
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            select_only_serialized_fields(
+                queryset, field_ids, extra_field_ids=group_by_field_ids
+            ),
+            request,
+            field_ids,
         )
 
         if field_options:
@@ -845,16 +888,10 @@ class PublicGridViewRowsView(APIView):
             )
             response.data.update(**public_view_field_options)
 
-        group_by = request.GET.get("group_by")
-        if group_by:
+        if group_by_field_ids:
             group_by_fields = [
-                # We can safely do this without having to check whether the
-                # `group_by` input is valid because this has already been validated
-                # by the `get_public_rows_queryset_and_field_ids`.
-                model._field_objects[get_field_id_from_field_key(field_string, False)][
-                    "field"
-                ]
-                for field_string in split_comma_separated_string(group_by)
+                model._field_objects[field_id]["field"]
+                for field_id in group_by_field_ids
             ]
             serialized_group_by_metadata = serialize_group_by_fields_metadata(
                 queryset, group_by_fields, page
@@ -1,5 +1,6 @@
 from django.urls import re_path
 
+from baserow.api.async_views import async_read_view
 from baserow.contrib.database.views.registries import view_type_registry
 
 from .views import (
@@ -117,7 +118,7 @@ urlpatterns = view_type_registry.api_urls + [
     ),
     re_path(
         r"(?P<slug>[-\w]+)/row/(?P<row_id>[0-9]+)/$",
-        PublicViewGetRowView.as_view(),
+        async_read_view(PublicViewGetRowView.as_view()),
         name="public_row",
     ),
 ]
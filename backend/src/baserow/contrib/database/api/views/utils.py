@@ -1,9 +1,23 @@
+import hashlib
 from dataclasses import Field
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Type
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Type,
+)
+from urllib.parse import urlencode
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db.models.query import QuerySet
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
 
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -15,24 +29,29 @@ from baserow.api.pagination import (
     PageNumberPagination,
     PageNumberPaginationWithoutCount,
 )
+from baserow.api.renderers import OrjsonRenderer
 from baserow.contrib.database.api.constants import (
     EXCLUDE_COUNT_API_PARAM,
     LIMIT_LINKED_ITEMS_API_PARAM,
 )
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
-    get_row_serializer_class,
+    get_compiled_row_serializer,
 )
 from baserow.contrib.database.api.views.serializers import serialize_group_by_metadata
 from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.contrib.database.views.filters import AdHocFilters
-from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.handler import (
+    ViewHandler,
+    get_public_view_rows_cache_invalidate_key,
+)
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import (
     view_ownership_type_registry,
     view_type_registry,
 )
+from baserow.core.cache import global_cache
 
 
 def get_public_view_authorization_token(request: Request) -> Optional[str]:
@@ -181,6 +200,88 @@ def get_public_view_filtered_queryset(
     )
 
 
+def get_cached_public_view_rows_response(
+    request: Request, view: View, get_response: Callable[[], Response]
+) -> HttpResponse | Response:
+    """
+    Returns the rendered response listing the rows of a public view from the cache,
+    or computes, renders and caches it if it's not cached yet. The cache key
+    contains all the query parameters, and the cached responses of all the public
+    views of a table are invalidated when the rows, fields or views of the table
+    change. The `ETag` of the response is the hash of its content, so that clients
+    can make conditional requests and get a `304` response if nothing changed.
+
+    The access to the view must have been checked before calling this function.
+
+    :param request: The request listing the rows of the public view.
+    :param view: The public view whose rows are listed.
+    :param get_response: A function that computes the response if it's not cached.
+    :return: The response, or the response computed by `get_response` if the cache
+        is disabled.
+    """
+
+    timeout = settings.BASEROW_PUBLIC_VIEW_ROWS_CACHE_TTL_SECONDS
+    if timeout <= 0:
+        return get_response()
+
+    def render():
+        response = get_response()
+        content = OrjsonRenderer().render(response.data)
+        return content, quote_etag(hashlib.sha256(content).hexdigest())
+
+    query_string = urlencode(sorted(request.GET.lists()), doseq=True)
+    query_hash = hashlib.sha256(query_string.encode()).hexdigest()
+    content, etag = global_cache.get(
+        f"public_view_{view.id}_rows_{query_hash}",
+        render,
+        invalidate_key=get_public_view_rows_cache_invalidate_key(view.table_id),
+        timeout=timeout,
+    )
+
+    if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type="application/json")
+    response["ETag"] = etag
+    return response
+
+
+def select_only_serialized_fields(
+    queryset: QuerySet[GeneratedTableModel],
+    field_ids: Optional[Iterable[int]],
+    exclude_field_ids: Optional[Iterable[int]] = None,
+    extra_field_ids: Optional[Iterable[int]] = None,
+) -> QuerySet[GeneratedTableModel]:
+    """
+    Narrows the selected columns of the queryset down to the fields that are going to
+    be serialized, so that the columns of the other fields aren't fetched if for
+    example the `include_fields` parameter is provided or some fields are hidden.
+
+    :param queryset: The queryset of the full table model.
+    :param field_ids: The (optional) field IDs the serialized data is restricted to.
+    :param exclude_field_ids: Field IDs hidden by restricted view ownership. None
+        means no restriction applies.
+    :param extra_field_ids: The IDs of the fields that must be selected even though
+        they aren't serialized, for example because the group by metadata needs
+        their values.
+    :return: The narrowed queryset, or the provided one if all the fields are
+        serialized.
+    """
+
+    if field_ids is None and not exclude_field_ids:
+        return queryset
+
+    field_ids = set(field_ids) if field_ids is not None else None
+    exclude_field_ids = set(exclude_field_ids or [])
+    selected_field_ids = [
+        field_id
+        for field_id in queryset.model._field_objects.keys()
+        if (field_ids is None or field_id in field_ids)
+        and field_id not in exclude_field_ids
+    ]
+    return queryset.only_fields([*selected_field_ids, *(extra_field_ids or [])])
+
+
 class PaginatedData(NamedTuple):
     response: Response
     page: QuerySet
@@ -253,7 +354,7 @@ def paginate_and_serialize_queryset(
     limit_linked_items = parse_limit_linked_items_params(request)
     extra_kwargs = {"limit_linked_items": limit_linked_items}
 
-    serializer_class = get_row_serializer_class(
+    serializer = get_compiled_row_serializer(
         queryset.model,
         RowSerializer,
         is_response=True,
@@ -261,9 +362,8 @@ def paginate_and_serialize_queryset(
         exclude_field_ids=exclude_field_ids,
         extra_kwargs=extra_kwargs,
     )
-    serializer = serializer_class(page, many=True)
 
-    response = paginator.get_paginated_response(serializer.data)
+    response = paginator.get_paginated_response(serializer.serialize_many(page))
     return PaginatedData(response, page, paginator)
 
 
@@ -1113,6 +1113,15 @@ class DatabaseConfig(AppConfig):
         row_history_provider_registry.register(UpdateRowsHistoryProvider())
         row_history_provider_registry.register(RestoreFromTrashHistoryProvider())
 
+        from baserow.contrib.database.rows.history import (
+            RowHistoryTimePartitionedModelType,
+        )
+        from baserow.core.partitioning.registries import (
+            time_partitioned_model_registry,
+        )
+
+        time_partitioned_model_registry.register(RowHistoryTimePartitionedModelType())
+
         from baserow.core.search.registries import workspace_search_registry
 
         from .search_types import (
@@ -1184,6 +1193,7 @@ class DatabaseConfig(AppConfig):
         import baserow.contrib.database.tokens.receivers  # noqa: F401
         import baserow.contrib.database.views.receivers  # noqa: F401
         import baserow.contrib.database.views.tasks  # noqa: F401
+        import baserow.contrib.database.webhooks.receivers  # noqa: F401
         from baserow.contrib.database.fields.models import SelectOption
 
         # Make sure that from now on, no model can make the User cache to expire,
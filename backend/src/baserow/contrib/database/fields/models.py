@@ -719,7 +719,7 @@ class FormulaField(Field):
 
     @cached_property
     def cached_untyped_expression(self):
-        return FormulaHandler.raw_formula_to_untyped_expression(self.formula)
+        return FormulaHandler.get_untyped_expression_from_field(self, self.formula)
 
     @cached_property
     def cached_typed_internal_expression(self):
@@ -419,6 +419,11 @@ class BaserowFunctionDefinition(Instance, abc.ABC):
     is_wrapper = False
     try_coerce_nullable_args_to_not_null: bool = True
 
+    def __deepcopy__(self, memo):
+        # Function definitions are registered singletons without any state related
+        # to an expression, so copies of an expression can share them.
+        return self
+
     @property
     @abc.abstractmethod
     def type(self) -> str:
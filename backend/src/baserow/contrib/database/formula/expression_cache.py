@@ -0,0 +1,72 @@
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from django.conf import settings
+
+from baserow.contrib.database.formula.ast.tree import BaserowExpression
+
+
+class FormulaExpressionCache:
+    """
+    A process-wide least recently used cache of parsed formula expressions. Field
+    instances are fetched again for every request, so their cached properties don't
+    survive it, while parsing a formula with ANTLR is expensive. Expressions are
+    mutated while they're being typed, so a copy of the cached expression is returned
+    every time and the cached expressions are never handed out directly.
+    """
+
+    def __init__(self):
+        self._expressions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_parse(
+        self, key: Hashable, parse: Callable[[], BaserowExpression]
+    ) -> BaserowExpression:
+        """
+        Returns a copy of the expression cached for the provided key, parsing and
+        caching it first if needed.
+
+        :param key: The key that uniquely identifies the expression.
+        :param parse: Called to parse the expression if it's not cached.
+        :return: A copy of the expression that the caller is free to modify.
+        """
+
+        max_size = settings.BASEROW_FORMULA_EXPRESSION_CACHE_SIZE
+        if max_size <= 0:
+            return parse()
+
+        with self._lock:
+            expression = self._expressions.get(key)
+            if expression is not None:
+                self._expressions.move_to_end(key)
+
+        if expression is None:
+            expression = parse()
+            with self._lock:
+                self._expressions[key] = expression
+                while len(self._expressions) > max_size:
+                    self._expressions.popitem(last=False)
+
+        return copy.deepcopy(expression)
+
+    def clear(self):
+        with self._lock:
+            self._expressions.clear()
+
+
+formula_expression_cache = FormulaExpressionCache()
+
+
+def get_formula_expression_cache_key(formula_field, formula: str) -> Hashable:
+    """
+    Returns the key of the provided formula of the formula field. Because the hash of
+    the formula is part of it, an expression is never served anymore after the
+    formula changed, either by the user or because of a change in one of the fields
+    it depends on, and expires from the cache automatically.
+    """
+
+    formula_hash = hashlib.blake2b(formula.encode(), digest_size=16).digest()
+    return formula_field.id, formula_field.version, formula_hash
@@ -14,6 +14,10 @@ from baserow.contrib.database.formula.ast.tree import (
     BaserowFunctionCall,
     BaserowFunctionDefinition,
 )
+from baserow.contrib.database.formula.expression_cache import (
+    formula_expression_cache,
+    get_formula_expression_cache_key,
+)
 from baserow.contrib.database.formula.expression_generator.generator import (
     baserow_expression_to_insert_django_expression,
     baserow_expression_to_single_row_update_django_expression,
@@ -279,6 +283,28 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
 
         return raw_formula_to_untyped_expression(formula_string)
 
+    @classmethod
+    def get_untyped_expression_from_field(
+        cls, formula_field, formula_string: str
+    ) -> BaserowExpression:
+        """
+        Same as `raw_formula_to_untyped_expression`, but the expression is cached per
+        process for the formula field, so that it's only parsed once instead of every
+        time the field is fetched from the database.
+
+        :param formula_field: The formula field that the formula belongs to.
+        :param formula_string: The formula or internal formula of the field.
+        :return: An untyped BaserowExpression which the caller is free to modify.
+        """
+
+        if formula_field.id is None:
+            return cls.raw_formula_to_untyped_expression(formula_string)
+
+        return formula_expression_cache.get_or_parse(
+            get_formula_expression_cache_key(formula_field, formula_string),
+            lambda: cls.raw_formula_to_untyped_expression(formula_string),
+        )
+
     @classmethod
     def get_formula_type_from_field(cls, formula_field) -> BaserowFormulaType:
         """
@@ -327,8 +353,8 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         :return: A typed internal Baserow Expression.
         """
 
-        untyped_internal_expr = FormulaHandler.raw_formula_to_untyped_expression(
-            formula_field.internal_formula
+        untyped_internal_expr = FormulaHandler.get_untyped_expression_from_field(
+            formula_field, formula_field.internal_formula
         )
         return untyped_internal_expr.with_type(formula_field.cached_formula_type)
 
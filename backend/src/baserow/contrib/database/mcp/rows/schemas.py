@@ -8,6 +8,13 @@ class ListRowsInput(BaseModel):
     search: str | None = Field(None, description="Optional search term to filter rows.")
     page: int = Field(1, description="Page number (1-based).")
     size: int = Field(100, description="Maximum number of rows to return.")
+    fields: list[str] | None = Field(
+        None,
+        description=(
+            "Optional list of field names to return. Only these fields are fetched, "
+            "which is much faster for tables with many fields."
+        ),
+    )
 
 
 class CreateRowsInput(BaseModel):
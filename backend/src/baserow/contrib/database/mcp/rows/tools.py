@@ -13,6 +13,7 @@ class ListRowsMcpTool(MCPTool):
     """
     List rows from a table with optional search and pagination.
     Returns rows with user-facing field names as keys.
+    Pass the field names in 'fields' to only return those fields.
     """
 
     type = "list_table_rows"
@@ -26,6 +27,7 @@ class ListRowsMcpTool(MCPTool):
             search=args.search or "",
             page=args.page,
             size=args.size,
+            field_names=args.fields,
         )
 
 
@@ -385,10 +385,13 @@ def list_rows(
     search: str = "",
     page: int = 1,
     size: int = 100,
+    field_names: list[str] | None = None,
 ) -> dict:
     """
     Return a paginated list of rows from a table, with user field names.
 
+    :param field_names: If provided, only these fields are fetched and returned.
+        Unknown field names are ignored.
     :returns: Dict with ``count`` and ``results`` (list of row dicts).
     """
     from django.conf import settings
@@ -402,17 +405,35 @@ def list_rows(
     size = max(1, min(size, settings.ROW_PAGE_SIZE_LIMIT))
 
     table = get_table(user, workspace, table_id)
-    model = table.get_model()
+
+    field_ids = None
+    if field_names is not None:
+        field_ids = list(
+            Field.objects.filter(table=table, name__in=field_names).values_list(
+                "id", flat=True
+            )
+        )
+
+    # The search matches all the fields, so the full model is needed to search.
+    if field_ids is not None and not search:
+        model = table.get_projection_model(field_ids)
+    else:
+        model = table.get_model()
     qs = model.objects.filter(trashed=False).order_by("order", "id")
 
     if search:
         qs = qs.search_all_fields(search)
 
+    if field_ids is not None:
+        qs = qs.only_fields(field_ids)
+
     count = qs.count()
     offset = (page - 1) * size
     rows = list(qs[offset : offset + size])
 
-    data = serialize_rows_for_response(rows, model, user_field_names=True)
+    data = serialize_rows_for_response(
+        rows, model, user_field_names=True, field_ids=field_ids
+    )
     return {"count": count, "results": list(data)}
 
 
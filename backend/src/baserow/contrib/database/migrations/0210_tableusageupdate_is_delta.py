@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0209_partition_rowhistory_by_action_timestamp"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tableusageupdate",
+            name="is_delta",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates that the row_count is the exact change of the row "
+                "count, so that the usage can be updated without counting the rows of "
+                "the table.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tableusageupdate",
+            name="storage_usage_changed",
+            field=models.BooleanField(
+                default=True,
+                help_text="Indicates that the storage usage of the table might have "
+                "changed and must be recalculated.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tableusageupdate",
+            name="committed_at",
+            field=models.DateTimeField(
+                null=True,
+                help_text="The time at which the change of a delta has been "
+                "committed. Deltas committed before the last time the rows of the "
+                "table have been counted are already included in the count and are "
+                "skipped.",
+            ),
+        ),
+    ]
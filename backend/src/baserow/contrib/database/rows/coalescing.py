@@ -0,0 +1,376 @@
+import json
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from django_redis import get_redis_connection
+from loguru import logger
+
+from baserow.contrib.database.fields.exceptions import FieldDataConstraintException
+from baserow.contrib.database.table.exceptions import TableDoesNotExist
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+
+from .constants import (
+    COALESCED_UPDATE_APPLIED,
+    COALESCED_UPDATE_FAILED,
+    COALESCED_UPDATE_FIELD_DATA_CONSTRAINT,
+    COALESCED_UPDATE_INVALID,
+    COALESCED_UPDATE_ROW_DOES_NOT_EXIST,
+)
+from .handler import RowHandler
+
+# If the flush task gets lost, the next update must be able to schedule a new one.
+SCHEDULED_FLUSH_EXPIRY_MS = 60 * 1000
+FLUSH_LOCK_TIMEOUT_SECONDS = 10 * 60
+
+
+class CoalescedRowUpdateHandler:
+    """
+    Buffers single row updates per table, so that the updates made to the same table
+    within a short window are applied together with one `force_update_rows` call per
+    user, instead of one transaction, dependency update, search update, realtime
+    event and webhook call per update. The buffer lives in Redis so that the updates
+    received by all the backend workers are coalesced, and it's flushed by the
+    `flush_coalesced_row_updates` task, which is scheduled once per window.
+
+    Note that the coalesced updates can't be undone because they're not registered
+    as actions.
+    """
+
+    def __init__(self, redis_connection=None):
+        self.redis = redis_connection or get_redis_connection("default")
+
+    def get_buffer_key(self, table_id: int) -> str:
+        return f"coalesced_row_updates_{table_id}"
+
+    def get_scheduled_key(self, table_id: int) -> str:
+        return f"coalesced_row_updates_{table_id}_scheduled"
+
+    def get_lock_key(self, table_id: int) -> str:
+        return f"coalesced_row_updates_{table_id}_lock"
+
+    def get_result_key(self, update_id: str) -> str:
+        return f"coalesced_row_update_result_{update_id}"
+
+    def buffer_update(
+        self,
+        user: AbstractUser,
+        table: Table,
+        row_id: int,
+        values: Dict[str, Any],
+        user_field_names: bool = False,
+        send_webhook_events: bool = True,
+        wait_for_result: bool = False,
+    ) -> str:
+        """
+        Adds the row update to the buffer of the table and makes sure that the buffer
+        is flushed at the end of the window. The values are validated again when the
+        buffer is flushed, so they must be the values as provided by the client. The
+        permissions must be checked by the caller.
+
+        :param user: The user of whose behalf the change is made.
+        :param table: The table of the row.
+        :param row_id: The id of the row that must be updated.
+        :param values: The new values of the row, as provided by the client.
+        :param user_field_names: Whether the values are keyed by the field names
+            instead of the internal `field_{id}` names.
+        :param send_webhook_events: Whether the webhooks must be triggered.
+        :param wait_for_result: If True, the result of the update is published when
+            the buffer is flushed, so that it can be read with `wait_for_result`.
+        :return: The unique id of the buffered update.
+        """
+
+        update_id = uuid.uuid4().hex
+        self.redis.rpush(
+            self.get_buffer_key(table.id),
+            json.dumps(
+                {
+                    "id": update_id,
+                    "user_id": user.id,
+                    "row_id": row_id,
+                    "values": values,
+                    "user_field_names": user_field_names,
+                    "send_webhook_events": send_webhook_events,
+                    "wait_for_result": wait_for_result,
+                }
+            ),
+        )
+        self.schedule_flush(table.id)
+        return update_id
+
+    def schedule_flush(self, table_id: int):
+        """
+        Schedules the task that flushes the buffer of the table at the end of the
+        window, unless it has already been scheduled.
+        """
+
+        from .tasks import flush_coalesced_row_updates
+
+        window = settings.BASEROW_COALESCED_ROW_UPDATES_WINDOW_MS
+        if self.redis.set(
+            self.get_scheduled_key(table_id),
+            1,
+            nx=True,
+            px=window + SCHEDULED_FLUSH_EXPIRY_MS,
+        ):
+            flush_coalesced_row_updates.apply_async(
+                (table_id,), countdown=window / 1000
+            )
+
+    def wait_for_result(self, update_id: str, timeout: int) -> Optional[Dict]:
+        """
+        Blocks until the buffered update has been applied.
+
+        :param update_id: The id returned by `buffer_update`.
+        :param timeout: The maximum number of seconds to wait.
+        :return: The result of the update, or None if it hasn't been applied in
+            time. The `status` key contains `applied` or one of the errors.
+        """
+
+        result = self.redis.blpop(self.get_result_key(update_id), timeout=timeout)
+        if result is None:
+            return None
+        return json.loads(result[1])
+
+    def pop_updates(self, table_id: int, count: int) -> List[Dict]:
+        """
+        Atomically removes and returns the oldest buffered updates of the table.
+        """
+
+        pipeline = self.redis.pipeline()
+        pipeline.lrange(self.get_buffer_key(table_id), 0, count - 1)
+        pipeline.ltrim(self.get_buffer_key(table_id), count, -1)
+        updates, _ = pipeline.execute()
+        return [json.loads(update) for update in updates]
+
+    def flush(self, table_id: int):
+        """
+        Applies all the buffered updates of the table, in batches of at most
+        `BATCH_ROWS_SIZE_LIMIT` updates, and publishes the results of the updates
+        that are waited for.
+        """
+
+        # The scheduled key is removed before the buffer is read, so an update that
+        # is buffered after this point always schedules a new flush.
+        self.redis.delete(self.get_scheduled_key(table_id))
+
+        # The updates of one table are applied in order, so a later flush must wait
+        # until the previous one has finished.
+        with self.redis.lock(
+            self.get_lock_key(table_id), timeout=FLUSH_LOCK_TIMEOUT_SECONDS
+        ):
+            while updates := self.pop_updates(table_id, settings.BATCH_ROWS_SIZE_LIMIT):
+                results = self.apply_updates(table_id, updates)
+                self.publish_results(updates, results)
+
+    def publish_results(self, updates: List[Dict], results: Dict[str, Dict]):
+        expiry = settings.BASEROW_COALESCED_ROW_UPDATES_WAIT_TIMEOUT_SECONDS
+        pipeline = self.redis.pipeline()
+        for update in updates:
+            if not update["wait_for_result"]:
+                continue
+            result_key = self.get_result_key(update["id"])
+            pipeline.rpush(result_key, json.dumps(results[update["id"]]))
+            pipeline.expire(result_key, expiry)
+        pipeline.execute()
+
+    def apply_updates(self, table_id: int, updates: List[Dict]) -> Dict[str, Dict]:
+        """
+        Validates the buffered updates and applies them with one `force_update_rows`
+        call per user, unless a row is also updated by another user in between, in
+        which case the later updates are applied in a separate call afterwards.
+        Multiple updates of the same row are therefore merged and applied in order, so
+        the latest value of every field wins.
+
+        :param table_id: The id of the table that the updates belong to.
+        :param updates: The buffered updates.
+        :return: The result of every update by update id.
+        """
+
+        try:
+            table = TableHandler().get_table(table_id)
+        except TableDoesNotExist:
+            return {
+                update["id"]: {"status": COALESCED_UPDATE_ROW_DOES_NOT_EXIST}
+                for update in updates
+            }
+
+        model = table.get_model()
+        users = get_user_model().objects.in_bulk(
+            {update["user_id"] for update in updates}
+        )
+
+        results = {}
+        serializer_classes = {}
+        groups = []
+        latest_group_index_by_key = {}
+        latest_group_index_by_row_id = {}
+        for update in updates:
+            user = users.get(update["user_id"])
+            if user is None or not user.is_active:
+                results[update["id"]] = {"status": COALESCED_UPDATE_FAILED}
+                continue
+
+            values, errors = self._validate_values(model, update, serializer_classes)
+            if errors:
+                results[update["id"]] = {
+                    "status": COALESCED_UPDATE_INVALID,
+                    "detail": errors,
+                }
+                continue
+
+            # The update can only be added to the latest group of the same user if
+            # the row hasn't been updated by a later group in the meantime, otherwise
+            # it would be applied before that update.
+            key = (user.id, update["send_webhook_events"])
+            row_id = update["row_id"]
+            group_index = latest_group_index_by_key.get(key)
+            if (
+                group_index is None
+                or latest_group_index_by_row_id.get(row_id, group_index) > group_index
+            ):
+                group_index = len(groups)
+                groups.append((key, []))
+                latest_group_index_by_key[key] = group_index
+            groups[group_index][1].append((update, values))
+            latest_group_index_by_row_id[row_id] = group_index
+
+        for (user_id, send_webhook_events), group in groups:
+            results.update(
+                self._apply_group(
+                    users[user_id], table, model, group, send_webhook_events
+                )
+            )
+
+        return results
+
+    def _validate_values(
+        self,
+        model: Type[GeneratedTableModel],
+        update: Dict,
+        serializer_classes: Dict,
+    ) -> Tuple[Dict[str, Any], Optional[Dict]]:
+        """
+        Validates the values of the update in the same way as the row update endpoint
+        does. The serializer classes are cached by the provided keys because the
+        updates of a burst usually change the same fields.
+        """
+
+        from baserow.api.utils import serialize_validation_errors_recursive
+        from baserow.contrib.database.api.rows.serializers import (
+            get_row_serializer_class,
+        )
+
+        values = update["values"]
+        user_field_names = update["user_field_names"]
+        cache_key = (user_field_names, tuple(sorted(values.keys())))
+        if cache_key not in serializer_classes:
+            field_ids, field_names = None, None
+            if user_field_names:
+                field_names = values.keys()
+            else:
+                field_ids = RowHandler().extract_field_ids_from_dict(values)
+            serializer_classes[cache_key] = get_row_serializer_class(
+                model,
+                field_ids=field_ids,
+                field_names_to_include=field_names,
+                user_field_names=user_field_names,
+            )
+
+        serializer = serializer_classes[cache_key](data=values)
+        if not serializer.is_valid():
+            return {}, serialize_validation_errors_recursive(serializer.errors)
+        return serializer.validated_data, None
+
+    def _apply_group(
+        self,
+        user: AbstractUser,
+        table: Table,
+        model: Type[GeneratedTableModel],
+        group: List[Tuple[Dict, Dict[str, Any]]],
+        send_webhook_events: bool,
+    ) -> Dict[str, Dict]:
+        handler = RowHandler()
+        results = {}
+        rows_values_by_id = {}
+        update_ids_by_row_id = defaultdict(list)
+        for update, values in group:
+            row_id = update["row_id"]
+            rows_values_by_id.setdefault(row_id, {"id": row_id}).update(values)
+            update_ids_by_row_id[row_id].append(update["id"])
+
+        def set_result(row_ids, result):
+            for row_id in row_ids:
+                for update_id in update_ids_by_row_id[row_id]:
+                    results[update_id] = result
+
+        with transaction.atomic():
+            existing_row_ids = set(
+                model.objects.filter(id__in=rows_values_by_id.keys()).values_list(
+                    "id", flat=True
+                )
+            )
+            set_result(
+                rows_values_by_id.keys() - existing_row_ids,
+                {"status": COALESCED_UPDATE_ROW_DOES_NOT_EXIST},
+            )
+            rows_values = [
+                values
+                for row_id, values in rows_values_by_id.items()
+                if row_id in existing_row_ids
+            ]
+            if not rows_values:
+                return results
+
+            try:
+                with transaction.atomic():
+                    handler.force_update_rows(
+                        user,
+                        table,
+                        rows_values,
+                        model=model,
+                        send_webhook_events=send_webhook_events,
+                    )
+            except Exception:
+                # Fall back to updating the rows one by one below, so that one
+                # failing update doesn't fail the others.
+                pass
+            else:
+                set_result(existing_row_ids, {"status": COALESCED_UPDATE_APPLIED})
+                return results
+
+            for row_values in rows_values:
+                row_id = row_values["id"]
+                try:
+                    with transaction.atomic():
+                        handler.force_update_rows(
+                            user,
+                            table,
+                            [row_values],
+                            model=model,
+                            send_webhook_events=send_webhook_events,
+                        )
+                    result = {"status": COALESCED_UPDATE_APPLIED}
+                except FieldDataConstraintException:
+                    result = {"status": COALESCED_UPDATE_FIELD_DATA_CONSTRAINT}
+                except ValidationError as exc:
+                    result = {
+                        "status": COALESCED_UPDATE_INVALID,
+                        "detail": exc.messages,
+                    }
+                except Exception:
+                    logger.exception(
+                        f"Failed to apply the coalesced update of row {row_id} in "
+                        f"table {table.id}."
+                    )
+                    result = {"status": COALESCED_UPDATE_FAILED}
+                set_result([row_id], result)
+
+        return results
@@ -1,2 +1,18 @@
 ROW_IMPORT_VALIDATION = "row-import-validation"
 ROW_IMPORT_CREATION = "row-import-creation"
+
+# The acknowledgements that can be requested for a coalesced row update. `accepted`
+# responds as soon as the update has been buffered, and `applied` waits until it
+# has been applied.
+COALESCED_UPDATE_ACCEPTED = "accepted"
+COALESCED_UPDATE_APPLIED = "applied"
+COALESCED_UPDATE_ACKNOWLEDGEMENTS = [
+    COALESCED_UPDATE_ACCEPTED,
+    COALESCED_UPDATE_APPLIED,
+]
+
+# The statuses of a coalesced row update that couldn't be applied.
+COALESCED_UPDATE_ROW_DOES_NOT_EXIST = "row_does_not_exist"
+COALESCED_UPDATE_INVALID = "invalid"
+COALESCED_UPDATE_FIELD_DATA_CONSTRAINT = "field_data_constraint"
+COALESCED_UPDATE_FAILED = "failed"
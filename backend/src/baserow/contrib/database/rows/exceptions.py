@@ -45,3 +45,9 @@ class InvalidRowLength(Exception):
 
     def __init__(self, row_idx: int):
         self.row_idx = row_idx
+
+
+class CoalescedRowUpdateFailed(Exception):
+    """
+    Raised when a coalesced row update couldn't be applied.
+    """
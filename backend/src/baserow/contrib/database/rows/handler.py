@@ -73,6 +73,7 @@ from baserow.core.db import (
     get_highest_order_of_queryset,
     get_unique_orders_before_item,
     recalculate_full_orders,
+    recalculate_orders_around_item,
 )
 from baserow.core.exceptions import (
     CannotCalculateIntermediateOrder,
@@ -437,8 +438,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         provided `before_row` or at the end of the table, depending on whether the
         `before_row` value is provided.
 
-        Note that this method can trigger an update of all the rows in the table in
-        the event all the orders must be recalculated.
+        Note that this method can trigger an update of the orders of the rows around
+        the `before_row` in the event there is no room left for the new orders.
 
         :param before_row: The row instance where the before orders must be
             calculated for. If `None`, then it's assumed that the orders are for
@@ -459,12 +460,23 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             except CannotCalculateIntermediateOrder:
                 # If the `find_intermediate_order` fails with a
                 # `CannotCalculateIntermediateOrder`, it means that it's not possible
-                # calculate an intermediate fraction. Therefore, must reset all the
-                # orders of the table (while respecting their original order),
-                # so that we can then can find the fraction any many more after.
-                self.recalculate_row_orders(model.baserow_table, model)
+                # calculate an intermediate fraction. Therefore, must reset the
+                # orders of the rows around the before row (while respecting their
+                # original order), so that we can then can find the fraction any many
+                # more after.
+                self.recalculate_row_orders_around(before_row, model, amount=amount)
                 # Refresh the row element as its order might have changed
                 before_row.refresh_from_db()
+
+            try:
+                return get_unique_orders_before_item(
+                    before_row, queryset, amount=amount
+                )
+            except CannotCalculateIntermediateOrder:
+                # This should never happen, but resetting the orders of all the rows
+                # always makes room.
+                self.recalculate_row_orders(model.baserow_table, model)
+                before_row.refresh_from_db()
                 return get_unique_orders_before_item(
                     before_row, queryset, amount=amount
                 )
@@ -2652,20 +2664,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             instances, the original row values and the updated fields metadata.
         """
 
-        self._check_permissions_with_view_fallback(
-            UpdateDatabaseRowOperationType.type,
-            UpdateViewRowOperationType.type,
-            user,
-            table,
-            view,
-            [row["id"] for row in rows_values],
-        )
-
         if model is None:
             model = table.get_model()
 
-        self._raise_if_values_contain_hidden_fields(user, view, rows_values)
-        self._check_write_fields_values_permissions(user, model, rows_values)
+        self.check_update_rows_permissions(user, table, rows_values, model, view)
 
         return self.force_update_rows(
             user,
@@ -2680,6 +2682,37 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             signal_params=signal_params,
         )
 
+    def check_update_rows_permissions(
+        self,
+        user: AbstractUser,
+        table: Table,
+        rows_values: List[Dict[str, Any]],
+        model: Type[GeneratedTableModel],
+        view: Optional["View"] = None,
+    ):
+        """
+        Checks if the user is allowed to update the provided rows values, without
+        updating them.
+
+        :param user: The user of whose behalf the change is made.
+        :param table: The table for which the rows must be updated.
+        :param rows_values: The list of rows with new values that should be set.
+        :param model: The model of the table.
+        :param view: Optionally provide view, if the rows are updated in the view.
+            This can result in different permissions checks.
+        """
+
+        self._check_permissions_with_view_fallback(
+            UpdateDatabaseRowOperationType.type,
+            UpdateViewRowOperationType.type,
+            user,
+            table,
+            view,
+            [row["id"] for row in rows_values],
+        )
+        self._raise_if_values_contain_hidden_fields(user, view, rows_values)
+        self._check_write_fields_values_permissions(user, model, rows_values)
+
     def _extract_field_ids_from_row_values(
         self, rows_values: List[Dict[str, Any]], model: GeneratedTableModel
     ) -> Set[int]:
@@ -3180,6 +3213,32 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return trashed_rows
 
+    def recalculate_row_orders_around(
+        self,
+        before_row: GeneratedTableModel,
+        model: Type[GeneratedTableModel],
+        amount: int = 1,
+    ):
+        """
+        Recalculates the orders of only the rows around the provided `before_row`,
+        so that `amount` unique orders can be calculated before it again. Contrary
+        to `recalculate_row_orders`, the number of updated rows doesn't depend on the
+        size of the table.
+
+        :param before_row: The row that needs room for orders before it.
+        :param model: The model of the related table.
+        :param amount: The number of orders that must be available before the row.
+        """
+
+        recalculate_orders_around_item(
+            before_row, model.objects_and_trash, amount=amount
+        )
+
+        row_orders_recalculated.send(
+            self,
+            table=model.baserow_table,
+        )
+
     def recalculate_row_orders(self, table: Table, model: GeneratedTableModel = None):
         """
         Recalculates the order to whole numbers of all rows based on the existing
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, time, timedelta, timezone
 from itertools import groupby
 
 from django.conf import settings
@@ -18,6 +18,8 @@ from baserow.contrib.database.rows.signals import rows_history_updated
 from baserow.contrib.database.rows.types import ActionData
 from baserow.core.action.signals import action_done
 from baserow.core.models import Workspace
+from baserow.core.partitioning.handler import PartitionHandler
+from baserow.core.partitioning.registries import TimePartitionedModelType
 from baserow.core.psycopg import sql
 from baserow.core.telemetry.utils import baserow_trace
 from baserow.core.types import AnyUser
@@ -49,6 +51,20 @@ class RowHistoryHandler:
                     row_history_entries=list(per_table_row_history_entries),
                 )
 
+    @classmethod
+    def get_retention_cutoff(cls) -> datetime:
+        """
+        Returns the date and time before which the row history entries are expired
+        according to the `BASEROW_ROW_HISTORY_RETENTION_DAYS` setting.
+        """
+
+        older_than_days = timedelta(days=settings.BASEROW_ROW_HISTORY_RETENTION_DAYS)
+        return datetime.combine(
+            datetime.now(tz=timezone.utc) - older_than_days,
+            time.min,
+            tzinfo=timezone.utc,
+        )
+
     @classmethod
     @baserow_trace(tracer)
     def list_row_history(
@@ -56,12 +72,16 @@ class RowHistoryHandler:
     ) -> QuerySet[RowHistory]:
         """
         Returns queryset of row history entries for the provided
-        workspace, table_id and row_id.
+        workspace, table_id and row_id. Expired entries that haven't been cleaned up
+        yet are excluded, which also lets Postgres skip the partitions only
+        containing older entries.
         """
 
-        queryset = RowHistory.objects.filter(table_id=table_id, row_id=row_id).order_by(
-            "-action_timestamp", "-id"
-        )
+        queryset = RowHistory.objects.filter(
+            table_id=table_id,
+            row_id=row_id,
+            action_timestamp__gte=cls.get_retention_cutoff(),
+        ).order_by("-action_timestamp", "-id")
 
         for op_type in change_row_history_registry.get_all():
             queryset = op_type.apply_to_list_queryset(
@@ -73,13 +93,17 @@ class RowHistoryHandler:
     @classmethod
     def delete_entries_older_than(cls, cutoff: datetime, batch_size: int = 20_000):
         """
-        Deletes all row history entries that are older than the given cutoff date
-        in batches to avoid long-running transactions.
+        Deletes all row history entries that are older than the given cutoff date.
+        If the row history table is partitioned, then the partitions only containing
+        older entries are dropped first. The remaining entries are deleted in batches
+        to avoid long-running transactions.
 
         :param cutoff: The date and time before which all entries will be deleted.
         :param batch_size: The number of rows to delete per batch.
         """
 
+        PartitionHandler.drop_partitions_older_than(RowHistory, cutoff)
+
         table = sql.Identifier(RowHistory._meta.db_table)
         query = sql.SQL(
             """
@@ -100,6 +124,12 @@ class RowHistoryHandler:
                     break
 
 
+class RowHistoryTimePartitionedModelType(TimePartitionedModelType):
+    type = "row_history"
+    model_class = RowHistory
+    partition_field_name = "action_timestamp"
+
+
 @receiver(action_done)
 def on_action_done_update_row_history(
     sender,
@@ -65,3 +65,10 @@ class RowHistory(models.Model):
             # For listing the history of a row.
             models.Index(fields=["table", "row_id", "-action_timestamp", "-id"]),
         ]
+        constraints = [
+            # The primary key of the table once it's partitioned by migration 0209.
+            models.UniqueConstraint(
+                fields=("id", "action_timestamp"),
+                name="database_rowhistory_partitioned_pkey",
+            ),
+        ]
@@ -1,4 +1,4 @@
-from datetime import datetime, time, timedelta, timezone
+from datetime import timedelta
 
 from django.conf import settings
 
@@ -13,12 +13,9 @@ def clean_up_row_history_entries(self):
 
     from .history import RowHistoryHandler
 
-    older_than_days = timedelta(days=settings.BASEROW_ROW_HISTORY_RETENTION_DAYS)
-
-    cutoff_datetime = datetime.combine(
-        datetime.now(tz=timezone.utc) - older_than_days, time.min
+    RowHistoryHandler.delete_entries_older_than(
+        RowHistoryHandler.get_retention_cutoff()
     )
-    RowHistoryHandler.delete_entries_older_than(cutoff_datetime)
 
 
 @app.on_after_finalize.connect
@@ -26,3 +23,15 @@ def setup_periodic_tasks(sender, **kwargs):
     every = timedelta(minutes=settings.BASEROW_ROW_HISTORY_CLEANUP_INTERVAL_MINUTES)
 
     sender.add_periodic_task(every, clean_up_row_history_entries.s())
+
+
+@app.task
+def flush_coalesced_row_updates(table_id: int):
+    """
+    Applies the row updates that have been buffered for the table during the
+    coalescing window.
+    """
+
+    from .coalescing import CoalescedRowUpdateHandler
+
+    CoalescedRowUpdateHandler().flush(table_id)
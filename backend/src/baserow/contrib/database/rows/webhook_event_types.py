@@ -10,6 +10,7 @@ from baserow.contrib.database.api.rows.serializers import (
     serialize_rows_for_response,
 )
 from baserow.contrib.database.fields.field_types import LinkRowFieldType
+from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.webhooks.models import TableWebhook
 from baserow.contrib.database.webhooks.registries import WebhookEventType
@@ -63,32 +64,12 @@ class RowsEventType(RespectSendWebhookEvents, WebhookEventType):
         :return: A Q object that can be used to filter webhooks for related tables.
         """
 
-        table = model.baserow_table
-        table_field_objs = model.get_field_objects()
-        link_row_fields = [
-            fo["field"]
-            for fo in table_field_objs
-            if fo["type"].type == LinkRowFieldType.type
-        ]
-
         updated_table_ids = set()
         updated_field_ids = set()
 
-        for link_row_field in link_row_fields:
-            skip_field_update = (
-                updated_fields_ids is not None
-                and link_row_field.id not in updated_fields_ids
-            )
-            if skip_field_update:
-                continue
-
-            no_related_field_in_linked_table = (
-                link_row_field.link_row_table_id == table.id
-                or link_row_field.link_row_related_field_id is None
-            )
-            if no_related_field_in_linked_table:
-                continue
-
+        for link_row_field in self.get_link_row_fields_with_related_webhooks(
+            model, updated_fields_ids
+        ):
             related_field_id = link_row_field.link_row_related_field_id
             related_table = link_row_field.link_row_table
             rows_with_changes = self.get_related_table_row_ids_with_changes(
@@ -114,6 +95,82 @@ class RowsEventType(RespectSendWebhookEvents, WebhookEventType):
 
         return related_q
 
+    def get_link_row_fields_with_related_webhooks(
+        self,
+        model: GeneratedTableModel,
+        updated_fields_ids: List[int] | None = None,
+    ) -> List[Field]:
+        """
+        Returns the link row fields of the model that have a related field in a table
+        having an active webhook that can be triggered by a change of that related
+        field. The webhook index of the related tables is used, so that the rows of a
+        large batch are only compared for the link row fields that could trigger a
+        webhook.
+
+        :param model: The model of the current table.
+        :param updated_fields_ids: The ids of the fields that have been updated. If
+            None, all fields will be considered.
+        :return: The link row fields that could trigger a webhook in a related table.
+        """
+
+        from baserow.contrib.database.webhooks.handler import WebhookHandler
+
+        table = model.baserow_table
+        webhook_handler = WebhookHandler()
+        link_row_fields = []
+
+        for field_object in model.get_field_objects():
+            link_row_field = field_object["field"]
+            if field_object["type"].type != LinkRowFieldType.type:
+                continue
+
+            skip_field_update = (
+                updated_fields_ids is not None
+                and link_row_field.id not in updated_fields_ids
+            )
+            if skip_field_update:
+                continue
+
+            no_related_field_in_linked_table = (
+                link_row_field.link_row_table_id == table.id
+                or link_row_field.link_row_related_field_id is None
+            )
+            if no_related_field_in_linked_table:
+                continue
+
+            related_webhook_index = webhook_handler.get_table_webhook_index(
+                link_row_field.link_row_table_id
+            )
+            if RowsUpdatedEventType.has_webhooks_for_fields(
+                related_webhook_index, [link_row_field.link_row_related_field_id]
+            ):
+                link_row_fields.append(link_row_field)
+
+        return link_row_fields
+
+    def _has_webhooks_to_call(self, webhook_index: dict, **kwargs) -> bool:
+        """
+        Returns the default check. This method can be overwritten together with
+        `_get_filters_for_webhooks_to_call`.
+        """
+
+        return super().has_webhooks_to_call(webhook_index, **kwargs)
+
+    def has_webhooks_to_call(self, webhook_index: dict, **kwargs) -> bool:
+        """
+        Also checks if a webhook of a related table can be triggered when the rows
+        were updated via a link row field.
+        """
+
+        if self._has_webhooks_to_call(webhook_index, **kwargs):
+            return True
+
+        return kwargs.get("rows") is not None and bool(
+            self.get_link_row_fields_with_related_webhooks(
+                kwargs["model"], kwargs.get("updated_field_ids", None)
+            )
+        )
+
     def get_payload_for_related_webhook(
         self, event_id: str, webhook: TableWebhook, row_ids: List[int], **kwargs
     ) -> Dict[str, Any]:
@@ -413,6 +470,37 @@ class RowsUpdatedEventType(RowsEventType):
 
         return q & Q(table_id=table.id, active=True)
 
+    @classmethod
+    def has_webhooks_for_fields(
+        cls, webhook_index: dict, field_ids: List[int] | None
+    ) -> bool:
+        """
+        Checks with the webhook index if a webhook of the table is triggered by an
+        update of the provided fields. Must be kept in sync with
+        `_get_filters_for_webhooks_to_call`.
+
+        :param webhook_index: The index returned by
+            `WebhookHandler.get_table_webhook_index`.
+        :param field_ids: The ids of the updated fields, or None if any field could
+            have been updated.
+        :return: True if at least one webhook could be triggered.
+        """
+
+        if webhook_index["include_all_events"]:
+            return True
+
+        return any(
+            field_ids is None
+            or not event["field_ids"]
+            or not event["field_ids"].isdisjoint(field_ids)
+            for event in webhook_index["events"].get(cls.type, [])
+        )
+
+    def _has_webhooks_to_call(self, webhook_index: dict, **kwargs) -> bool:
+        return self.has_webhooks_for_fields(
+            webhook_index, kwargs.get("updated_field_ids", None)
+        )
+
     def get_test_call_payload(self, table, model, event_id, webhook):
         rows = [model(id=0, order=0)]
         before_return = {
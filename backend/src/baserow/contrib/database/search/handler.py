@@ -78,6 +78,11 @@ class SearchMode(str, Enum):
     # method is much faster as tables grow in size.
     FT_WITH_COUNT = "full-text-with-count"
 
+    # Use this mode to search rows by the meaning of their values, using the
+    # embeddings of the rows in the workspace embedding table. Falls back to the
+    # default mode of the table if semantic search is not available.
+    SEMANTIC = "semantic"
+
 
 ALL_SEARCH_MODES = [mode.value for mode in SearchMode]
 
@@ -368,6 +373,10 @@ class SearchHandler(
 
         _workspace_search_table_exists.cache_clear()
 
+        from baserow.contrib.database.search.semantic import SemanticSearchHandler
+
+        SemanticSearchHandler.delete_workspace_embedding_table_if_exists(workspace_id)
+
     @classmethod
     def special_char_tokenizer(cls, expression: Expression) -> Func:
         """
@@ -713,6 +722,10 @@ class SearchHandler(
             else:
                 raise e
 
+        from baserow.contrib.database.search.semantic import SemanticSearchHandler
+
+        SemanticSearchHandler.delete_embeddings_marked_for_deletion(workspace_id)
+
         cls.delete_pending_updates(
             Q(deletion_workspace_id=workspace_id), manager="objects_and_trash"
         )
@@ -867,10 +880,16 @@ class SearchHandler(
            field.
         2. Row‐specific updates: groups updates for remaining fields into batches and
            refreshes only affected cells.
+        3. Embeddings: if semantic search is enabled, the changed rows are embedded
+           again, outside of the transactions of the previous phases.
 
         :param table: The Table whose pending search updates will be handled.
         """
 
+        from baserow.contrib.database.search.semantic import SemanticSearchHandler
+
+        update_embeddings = SemanticSearchHandler.semantic_search_enabled()
+
         table_field_ids = list(
             Field.objects_and_trash.filter(table=table)
             .order_by()
@@ -890,6 +909,7 @@ class SearchHandler(
         # First process full-field updates (row_id=None), removing any remaining
         # row-specific updates on the same field.
         last = False
+        embed_all_rows = False
         while not last:
             with transaction.atomic():
                 field_ids = list(full_field_updates[:fields_batch_size])
@@ -903,6 +923,7 @@ class SearchHandler(
                     cls.delete_pending_updates(
                         Q(field_id__in=field_ids, updated_on__lte=check_timestamp)
                     )
+                    embed_all_rows = True
 
         def _fetch_next_batch() -> QuerySet[PendingSearchValueUpdate]:
             return PendingSearchValueUpdate.objects.filter(
@@ -910,6 +931,7 @@ class SearchHandler(
             ).order_by("-updated_on")
 
         # Now handle single-cells updates, grouping them for efficiency
+        row_ids_to_embed = set()
         last = False
         while not last:
             with transaction.atomic():
@@ -929,6 +951,18 @@ class SearchHandler(
                     cls.update_search_data(
                         table, field_ids=list(field_ids), row_ids=list(row_ids)
                     )
+                    row_ids_to_embed.update(row_ids)
                     cls.delete_pending_updates(
                         Q(id__in=update_ids, updated_on__lte=check_timestamp)
                     )
+
+        # The embeddings are updated outside of the transactions because the
+        # embeddings API can be slow. The embedding of a row contains the values of
+        # all the fields, so all the rows must be embedded again once after any
+        # full-field update.
+        if update_embeddings and embed_all_rows:
+            SemanticSearchHandler.update_embeddings(table)
+        elif update_embeddings and row_ids_to_embed:
+            SemanticSearchHandler.update_embeddings(
+                table, row_ids=sorted(row_ids_to_embed)
+            )
@@ -3,6 +3,9 @@ from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from django_cte import CTEManager
+from pgvector.django import HnswIndex, VectorField
+
+from baserow.core.pgvector import DEFAULT_EMBEDDING_DIMENSIONS
 
 
 class PendingSearchValueUpdateTrashManager(CTEManager):
@@ -114,3 +117,58 @@ def get_search_indexes(workspace_id: int) -> list[models.Index]:
         )
     ]
     return indexes
+
+
+class AbstractRowEmbedding(models.Model):
+    """
+    Abstract base model for a table containing the semantic search embeddings of the
+    rows of a workspace, keyed by (table_id, row_id). The embedding is computed from
+    the searchable values of all the fields of the row.
+    """
+
+    id = models.BigAutoField(
+        auto_created=True,
+        primary_key=True,
+        serialize=False,
+        verbose_name="ID",
+    )
+    table_id = models.IntegerField(
+        help_text="The ID of the table this embedding belongs to.",
+    )
+    row_id = models.IntegerField(
+        help_text="The ID of the row this embedding belongs to.",
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        help_text=(
+            "The sha256 hash of the text that has been embedded. Used to avoid "
+            "embedding the same text again."
+        ),
+    )
+    updated_on = models.DateTimeField(
+        help_text="The time this embedding was last updated.",
+    )
+    embedding = VectorField(
+        dimensions=DEFAULT_EMBEDDING_DIMENSIONS,
+        help_text="The embedding of the searchable values of the row.",
+    )
+    objects = CTEManager()
+
+    class Meta:
+        abstract = True
+
+
+def get_embedding_indexes(workspace_id: int) -> list[models.Index]:
+    """
+    Build the indexes of the workspace embedding table.
+    """
+
+    return [
+        HnswIndex(
+            name=f"database_workspace_{workspace_id}_embedding_idx",
+            fields=["embedding"],
+            m=16,
+            ef_construction=64,
+            opclasses=["vector_cosine_ops"],
+        )
+    ]
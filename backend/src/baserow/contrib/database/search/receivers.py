@@ -4,7 +4,11 @@ from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.views.signals import view_loaded
 from baserow.core.models import Workspace
-from baserow.core.trash.signals import before_permanently_deleted, permanently_deleted
+from baserow.core.trash.signals import (
+    before_permanently_deleted,
+    before_permanently_deleted_many,
+    permanently_deleted,
+)
 
 
 @receiver(permanently_deleted, sender="workspace")
@@ -94,6 +98,27 @@ def handle_permanently_deleted_rows(
         SearchHandler.delete_workspace_search_table_if_exists(workspace_id)
 
 
+@receiver(before_permanently_deleted_many, sender="row")
+def handle_permanently_deleted_many_rows(
+    sender, trash_item_ids, parent_id, *args, **kwargs
+):
+    """
+    When trashed rows are permanently deleted in bulk, then search data should be
+    cleaned from data for those rows.
+    """
+
+    try:
+        table = Table.objects_and_trash.select_related("database").get(id=parent_id)
+    except Table.DoesNotExist:
+        return
+
+    if SearchHandler.full_text_enabled():
+        SearchHandler.mark_search_data_for_deletion(table, row_ids=trash_item_ids)
+    else:  # we can drop the entire search table if exists
+        workspace_id = table.database.workspace_id
+        SearchHandler.delete_workspace_search_table_if_exists(workspace_id)
+
+
 @receiver(view_loaded)
 def view_loaded_schedule_update_search_data(
     sender,
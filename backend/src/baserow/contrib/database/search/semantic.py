@@ -0,0 +1,552 @@
+"""
+Handler and utils for the semantic search mode.
+
+Next to the full-text search data, every workspace can have an embedding table that
+contains one embedding per row, computed from the searchable values of all the fields
+of the row. The embeddings are kept up to date by the same `PendingSearchValueUpdate`
+pipeline that updates the full-text search data, and the rows are searched by the
+cosine distance between their embedding and the embedding of the search query, using
+an HNSW index.
+
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, ProgrammingError, connection, transaction
+from django.db.models import Model, Q, QuerySet
+
+import httpx
+from loguru import logger
+from pgvector.django import CosineDistance
+
+from baserow.contrib.database.db.schema import safe_django_schema_editor
+from baserow.contrib.database.fields.field_filters import FILTER_TYPE_OR, FilterBuilder
+from baserow.contrib.database.search.handler import (
+    SearchDatabaseSchemaEditor,
+    SearchHandler,
+)
+from baserow.contrib.database.search.models import (
+    AbstractRowEmbedding,
+    PendingSearchValueUpdate,
+    get_embedding_indexes,
+)
+from baserow.core.pgvector import (
+    DEFAULT_EMBEDDING_DIMENSIONS,
+    is_pgvector_enabled,
+    supports_hnsw_iterative_scan,
+)
+from baserow.core.psycopg import errors
+from baserow.core.utils import to_camel_case
+
+if TYPE_CHECKING:
+    from baserow.contrib.database.fields.models import Field
+    from baserow.contrib.database.table.models import Table
+
+# The default and maximum number of candidates returned by an HNSW index scan.
+HNSW_DEFAULT_EF_SEARCH = 40
+HNSW_MAX_EF_SEARCH = 1000
+
+
+@lru_cache(maxsize=1024)
+def _workspace_embedding_table_exists(workspace_id: int) -> bool:
+    """
+    Determines if the embedding table exists for the given workspace ID.
+
+    :param workspace_id: The ID of the workspace to check.
+    :return: True if the embedding table exists, False otherwise.
+    """
+
+    table_name = SemanticSearchHandler.get_workspace_embedding_table_name(workspace_id)
+    with connection.cursor() as cursor:
+        raw_sql = """
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.tables
+                WHERE table_schema = current_schema()
+                AND table_name = %s
+            )
+        """  # noqa: S608
+        cursor.execute(raw_sql, [table_name])
+        return cursor.fetchone()[0]
+
+
+@lru_cache(maxsize=1024)
+def _generate_embedding_table_model(
+    workspace_id: int, managed=False
+) -> "AbstractRowEmbedding":
+    """
+    Generates the embedding table model for the given workspace ID.
+
+    :param workspace_id: The ID of the workspace for which the embedding table model
+        is being generated.
+    :param managed: This flag should be set to True only when the database table needs
+        to be created or dropped, False otherwise.
+    :return: A dynamically generated model class that represents the embedding table
+        for the specified workspace.
+    :raises ValueError: If the workspace_id is not provided.
+    """
+
+    from baserow.contrib.database.table.models import GeneratedModelAppsProxy
+
+    if not workspace_id:
+        raise ValueError(
+            "Workspace ID must be provided to generate an embedding table model."
+        )
+
+    app_label = "database_search"
+    table_name = SemanticSearchHandler.get_workspace_embedding_table_name(workspace_id)
+    model_name = to_camel_case(table_name)
+
+    baserow_models = {}
+    apps = GeneratedModelAppsProxy(baserow_models, app_label)
+    meta = type(
+        "Meta",
+        (),
+        {
+            "apps": apps,
+            "managed": managed,
+            "db_table": table_name,
+            "app_label": app_label,
+            "indexes": get_embedding_indexes(workspace_id),
+            "unique_together": [("table_id", "row_id")],
+        },
+    )
+
+    def __str__(self):
+        return model_name
+
+    attrs = {
+        "Meta": meta,
+        "__module__": "database.models",
+        "_generated_table_model": True,
+        "baserow_workspace_id": workspace_id,
+        "baserow_models": baserow_models,
+        "parent": workspace_id,
+        "__str__": __str__,
+    }
+
+    return type(model_name, (AbstractRowEmbedding, Model), attrs)
+
+
+class EmbeddingsClient:
+    """
+    Embeds texts using the `/embed` endpoint of the Baserow embeddings API.
+    """
+
+    def __init__(self, api_url: str, dimensions: int = DEFAULT_EMBEDDING_DIMENSIONS):
+        self.api_url = api_url
+        self.dimensions = dimensions
+
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        with httpx.Client(base_url=self.api_url) as client:
+            response = client.post("/embed", json={"texts": texts})
+            response.raise_for_status()
+
+        embeddings = response.json()["embeddings"]
+        if len(embeddings) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} embeddings, but got {len(embeddings)}."
+            )
+
+        for index, embedding in enumerate(embeddings):
+            if len(embedding) > self.dimensions:
+                raise ValueError(
+                    f"Expected embeddings of dimension {self.dimensions}, but got "
+                    f"{len(embedding)}."
+                )
+            # Smaller embeddings are padded with zeros, which doesn't change the
+            # cosine distance between them.
+            embeddings[index] = embedding + [0.0] * (self.dimensions - len(embedding))
+
+        return embeddings
+
+
+class SemanticSearchHandler:
+    @classmethod
+    def get_workspace_embedding_table_name(cls, workspace_id: int) -> str:
+        """
+        Returns the name of the embedding table for the given workspace ID.
+
+        :param workspace_id: The ID of the workspace.
+        :return: The name of the embedding table for the specified workspace.
+        """
+
+        return f"database_search_workspace_{workspace_id}_embeddings"
+
+    @classmethod
+    def get_workspace_embedding_table_model(
+        cls, workspace_id: int, managed: bool = False
+    ) -> "AbstractRowEmbedding":
+        """
+        Generates the workspace embedding table model.
+
+        :param workspace_id: The ID of the workspace.
+        :param managed: This flag should be set to True only when the table needs to
+            be created or dropped, False otherwise.
+        :return: A dynamically generated model class that represents the embedding
+            table for the specified workspace.
+        """
+
+        return _generate_embedding_table_model(workspace_id, managed=managed)
+
+    @classmethod
+    def semantic_search_enabled(cls) -> bool:
+        return (
+            settings.BASEROW_SEMANTIC_SEARCH_ENABLED
+            and bool(settings.BASEROW_EMBEDDINGS_API_URL)
+            and SearchHandler.full_text_enabled()
+            and is_pgvector_enabled()
+        )
+
+    @classmethod
+    def workspace_embedding_table_exists(cls, workspace_id: int) -> bool:
+        return _workspace_embedding_table_exists(workspace_id)
+
+    @classmethod
+    def can_use_semantic_search(cls, table: "Table") -> bool:
+        """
+        Determines if the semantic search mode can be used for the given table, by
+        checking if it's enabled and if the embedding table exists for the workspace
+        of the table.
+
+        :param table: The table for which to check if semantic search can be used.
+        """
+
+        if not cls.semantic_search_enabled():
+            return False
+
+        return cls.workspace_embedding_table_exists(table.database.workspace_id)
+
+    @classmethod
+    def get_embedder(cls) -> EmbeddingsClient:
+        return EmbeddingsClient(settings.BASEROW_EMBEDDINGS_API_URL)
+
+    @classmethod
+    def embed_texts(cls, texts: List[str]) -> List[List[float]]:
+        """
+        Embeds the provided texts with a single call to the embedder.
+
+        :param texts: The texts to embed.
+        :return: The embeddings, in the same order as the texts.
+        """
+
+        if not texts:
+            return []
+
+        return cls.get_embedder()(texts)
+
+    @classmethod
+    def create_workspace_embedding_table_if_not_exists(cls, workspace_id: int):
+        """
+        Creates the workspace embedding table and its HNSW index if it does not
+        already exist.
+
+        :param workspace_id: The ID of the workspace.
+        """
+
+        if _workspace_embedding_table_exists(workspace_id):
+            return
+
+        embedding_table_model = cls.get_workspace_embedding_table_model(
+            workspace_id, managed=True
+        )
+        try:
+            with transaction.atomic():
+                with connection.schema_editor() as se:
+                    se.create_model(embedding_table_model)
+        except ProgrammingError as exc:
+            if isinstance(
+                exc.__cause__, (errors.DuplicateTable, errors.DuplicateObject)
+            ):
+                logger.debug(
+                    f"Embedding table for workspace {workspace_id} already exists."
+                )
+            else:
+                raise exc
+        except IntegrityError as exc:
+            if isinstance(exc.__cause__, errors.UniqueViolation):
+                logger.debug(
+                    f"Race condition: sequence or object for workspace "
+                    f"{workspace_id} already exists (UniqueViolation)."
+                )
+            else:
+                raise
+        _workspace_embedding_table_exists.cache_clear()
+
+    @classmethod
+    def delete_workspace_embedding_table_if_exists(cls, workspace_id: int):
+        """
+        Drops the workspace embedding table if it exists.
+
+        :param workspace_id: The ID of the workspace.
+        """
+
+        embedding_table_model = cls.get_workspace_embedding_table_model(
+            workspace_id, managed=True
+        )
+        with safe_django_schema_editor(classes=[SearchDatabaseSchemaEditor]) as se:
+            se.delete_model(embedding_table_model)
+
+        _workspace_embedding_table_exists.cache_clear()
+
+    @classmethod
+    def get_rows_text(
+        cls, queryset: QuerySet, fields: Iterable["Field"]
+    ) -> Dict[int, str]:
+        """
+        Returns the text that must be embedded for every row in the queryset. It
+        contains the search values of the provided fields, one per line.
+
+        :param queryset: The queryset of the rows.
+        :param fields: The searchable fields of the table.
+        :return: A dict containing the text of every row by row ID.
+        """
+
+        annotations = {
+            f"search_{field.id}": field.get_type().get_search_expression(
+                field, queryset
+            )
+            for field in fields
+        }
+        rows = queryset.annotate(**annotations).values_list("id", *annotations.keys())
+        return {
+            row_id: "\n".join(str(value) for value in values if value not in (None, ""))
+            for row_id, *values in rows
+        }
+
+    @classmethod
+    def update_embeddings(
+        cls, table: "Table", row_ids: Optional[List[int]] = None
+    ) -> bool:
+        """
+        Updates the embeddings of the provided rows, or of all the rows of the table.
+        The rows are processed in batches, with one call to the embedder per batch.
+        Rows of which the text hasn't changed since it was last embedded are skipped,
+        and the embeddings of rows without any searchable value are removed.
+
+        The embedder is called outside of any transaction, so this must not be
+        called in one. If it fails, the rows that haven't been embedded yet are
+        queued again, so that they're retried by a later search data update.
+
+        :param table: The table of the rows.
+        :param row_ids: The IDs of the rows to update. If None, all the rows of the
+            table are updated.
+        :return: Whether all the rows have been embedded.
+        """
+
+        workspace_id = table.database.workspace_id
+        embedding_model = cls.get_workspace_embedding_table_model(workspace_id)
+        model = table.get_model()
+        fields = list(model.get_searchable_fields())
+        if not fields:
+            return True
+
+        qs = model.objects_and_trash.all().order_by("id")
+        if row_ids is not None:
+            qs = qs.filter(id__in=list(row_ids))
+
+        batch_size = settings.BASEROW_SEMANTIC_SEARCH_EMBEDDING_BATCH_SIZE
+        last_row_id = 0
+        try:
+            while True:
+                texts = cls.get_rows_text(
+                    qs.filter(id__gt=last_row_id)[:batch_size], fields
+                )
+                if not texts:
+                    break
+
+                cls._update_embeddings_batch(embedding_model, table.id, texts)
+                last_row_id = max(texts)
+
+                if len(texts) < batch_size:
+                    break
+        except (httpx.HTTPError, ValueError) as exc:
+            # The full-text search data must still be updated if the embeddings API
+            # is not available, so the rows are queued again instead of failing.
+            logger.warning(f"Failed to embed the rows of table {table.id}: {exc}")
+            if row_ids is not None:
+                row_ids = [row_id for row_id in row_ids if row_id > last_row_id]
+            SearchHandler.queue_pending_search_update(
+                table, field_ids=[fields[0].id], row_ids=row_ids
+            )
+            return False
+
+        return True
+
+    @classmethod
+    def _update_embeddings_batch(
+        cls, embedding_model: AbstractRowEmbedding, table_id: int, texts: Dict[int, str]
+    ):
+        hashes = {
+            row_id: hashlib.sha256(text.encode("utf-8")).hexdigest()
+            for row_id, text in texts.items()
+            if text
+        }
+        existing_hashes = dict(
+            embedding_model.objects.filter(
+                table_id=table_id, row_id__in=list(hashes)
+            ).values_list("row_id", "content_hash")
+        )
+        changed_row_ids = [
+            row_id
+            for row_id, content_hash in hashes.items()
+            if existing_hashes.get(row_id) != content_hash
+        ]
+        embeddings = cls.embed_texts([texts[row_id] for row_id in changed_row_ids])
+        now = datetime.now(tz=timezone.utc)
+        with transaction.atomic():
+            embedding_model.objects.filter(
+                table_id=table_id,
+                row_id__in=[row_id for row_id in texts if row_id not in hashes],
+            ).delete()
+            embedding_model.objects.bulk_create(
+                [
+                    embedding_model(
+                        table_id=table_id,
+                        row_id=row_id,
+                        content_hash=hashes[row_id],
+                        embedding=embedding,
+                        updated_on=now,
+                    )
+                    for row_id, embedding in zip(changed_row_ids, embeddings)
+                ],
+                update_conflicts=True,
+                unique_fields=["table_id", "row_id"],
+                update_fields=["content_hash", "embedding", "updated_on"],
+            )
+
+    @classmethod
+    def table_needs_initial_embeddings(cls, table: "Table") -> bool:
+        """
+        Checks if the table has rows, but none of them has been embedded yet. This
+        is the case for tables that existed before semantic search was enabled.
+        """
+
+        embedding_model = cls.get_workspace_embedding_table_model(
+            table.database.workspace_id
+        )
+        if embedding_model.objects.filter(table_id=table.id).exists():
+            return False
+
+        return table.get_model().objects_and_trash.exists()
+
+    @classmethod
+    def delete_embeddings_marked_for_deletion(cls, workspace_id: int):
+        """
+        Deletes the embeddings of the rows and tables that have been marked for
+        deletion in the workspace. Must be called before the pending updates marked
+        for deletion are removed.
+
+        :param workspace_id: The ID of the workspace.
+        """
+
+        if not cls.workspace_embedding_table_exists(workspace_id):
+            return
+
+        from baserow.contrib.database.fields.models import Field
+        from baserow.contrib.database.table.models import Table
+
+        embedding_table = cls.get_workspace_embedding_table_name(workspace_id)
+        pending_table = PendingSearchValueUpdate._meta.db_table
+        with connection.cursor() as cursor:
+            raw_sql = f"""
+                DELETE FROM {embedding_table} e
+                USING {pending_table} p, {Field._meta.db_table} f
+                WHERE f.id = p.field_id
+                AND e.table_id = f.table_id
+                AND e.row_id = p.row_id
+                AND p.deletion_workspace_id = %s;
+            """  # noqa: S608
+            cursor.execute(raw_sql, (workspace_id,))
+
+        # The fields of permanently deleted tables don't exist anymore, so the
+        # embeddings of those tables are found by checking if the table still exists.
+        has_full_field_deletions = PendingSearchValueUpdate.objects_and_trash.filter(
+            deletion_workspace_id=workspace_id, row_id__isnull=True
+        ).exists()
+        if has_full_field_deletions:
+            with connection.cursor() as cursor:
+                raw_sql = f"""
+                    DELETE FROM {embedding_table} e
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM {Table._meta.db_table} t WHERE t.id = e.table_id
+                    );
+                """  # noqa: S608
+                cursor.execute(raw_sql)
+
+    @classmethod
+    def get_nearest_rows_queryset(
+        cls,
+        workspace_id: int,
+        table_ids: List[int],
+        query_embedding: List[float],
+        limit: int,
+    ) -> QuerySet:
+        """
+        Returns a queryset of the `limit` embeddings of the provided tables that are
+        nearest to the query embedding, ordered by the cosine distance to it and
+        annotated with it as `distance`.
+
+        The HNSW index scan only returns `hnsw.ef_search` candidates before the
+        embeddings of other tables are filtered out, so the nearest embeddings are
+        looked up in a separate query for which the scan is widened to the limit and,
+        if supported by pgvector, continued until enough embeddings have been found.
+
+        :param workspace_id: The ID of the workspace of the tables.
+        :param table_ids: The IDs of the tables to search in.
+        :param query_embedding: The embedding of the search query.
+        :param limit: The maximum number of embeddings to return.
+        :return: The queryset of the nearest embeddings.
+        """
+
+        embedding_model = cls.get_workspace_embedding_table_model(workspace_id)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "SET LOCAL hnsw.ef_search = %s",
+                (min(max(limit, HNSW_DEFAULT_EF_SEARCH), HNSW_MAX_EF_SEARCH),),
+            )
+            if supports_hnsw_iterative_scan():
+                cursor.execute("SET LOCAL hnsw.iterative_scan = relaxed_order")
+            nearest_ids = list(
+                embedding_model.objects.filter(table_id__in=table_ids)
+                .order_by(CosineDistance("embedding", query_embedding))
+                .values_list("id", flat=True)[:limit]
+            )
+
+        return (
+            embedding_model.objects.filter(id__in=nearest_ids)
+            .annotate(distance=CosineDistance("embedding", query_embedding))
+            .order_by("distance")
+        )
+
+    @classmethod
+    def semantic_search_in_table(cls, queryset: QuerySet, input_search: str):
+        """
+        Narrows the queryset down to the rows of which the embedding is nearest to
+        the embedding of the search query. Just like the full-text search, a row
+        also matches if its ID is searched for.
+
+        :param queryset: The queryset of the table rows to search in.
+        :param input_search: The search query.
+        :return: The filtered queryset.
+        """
+
+        table = queryset.model.baserow_table
+        (query_embedding,) = cls.embed_texts([input_search])
+        nearest_row_ids = cls.get_nearest_rows_queryset(
+            table.database.workspace_id,
+            [table.id],
+            query_embedding,
+            settings.BASEROW_SEMANTIC_SEARCH_MAX_RESULTS,
+        ).values("row_id")
+
+        filter_builder = FilterBuilder(filter_type=FILTER_TYPE_OR)
+        filter_builder.filter(Q(id__in=nearest_row_ids))
+        SearchHandler.add_exact_id_search(filter_builder, input_search)
+        return filter_builder.apply_to_queryset(queryset)
@@ -95,6 +95,7 @@ def update_search_data(table_id: int):
     """
 
     from baserow.contrib.database.search.handler import SearchHandler
+    from baserow.contrib.database.search.semantic import SemanticSearchHandler
     from baserow.contrib.database.table.handler import TableHandler
 
     if not SearchHandler.full_text_enabled():
@@ -112,6 +113,11 @@ def update_search_data(table_id: int):
     # Make sure the search table exists for the workspace first.
     workspace_id = table.database.workspace_id
     SearchHandler.create_workspace_search_table_if_not_exists(workspace_id)
+    semantic_search_enabled = SemanticSearchHandler.semantic_search_enabled()
+    if semantic_search_enabled:
+        SemanticSearchHandler.create_workspace_embedding_table_if_not_exists(
+            workspace_id
+        )
 
     # Ensure every table field exists in the search table.
     # Used during migrations or when explicitly reinitializing search data.
@@ -123,6 +129,12 @@ def update_search_data(table_id: int):
 
     SearchHandler.process_search_data_updates(table)
 
+    # Tables that existed before semantic search was enabled must be embedded once.
+    if semantic_search_enabled and SemanticSearchHandler.table_needs_initial_embeddings(
+        table
+    ):
+        SemanticSearchHandler.update_embeddings(table)
+
     # If new updates were queued during processing, schedule another update
     if flag.is_set():
         logger.debug(
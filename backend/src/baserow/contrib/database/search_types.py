@@ -6,6 +6,7 @@ from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.db.models import (
     Case,
     CharField,
+    ExpressionWrapper,
     F,
     FloatField,
     IntegerField,
@@ -20,12 +21,16 @@ from django.db.models import (
 )
 from django.db.models.functions import Cast, Concat, JSONObject, RowNumber
 
+import httpx
+from loguru import logger
+
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.operations import ListFieldsOperationType
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.models import Database
-from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.search.handler import SearchHandler, SearchMode
+from baserow.contrib.database.search.semantic import SemanticSearchHandler
 from baserow.contrib.database.search_base import DatabaseSearchableItemType
 from baserow.contrib.database.table.expressions import RowNotTrashedDynamicTable
 from baserow.contrib.database.table.models import Table
@@ -357,6 +362,17 @@ class RowSearchType(SearchableItemType):
         for f_id, t_id in base_fields:
             field_ids_by_table_id[t_id].append(f_id)
 
+        if (
+            context.search_mode == SearchMode.SEMANTIC
+            and SemanticSearchHandler.semantic_search_enabled()
+            and SemanticSearchHandler.workspace_embedding_table_exists(workspace.id)
+        ):
+            semantic_qs = self._get_semantic_union_values_queryset(
+                workspace, context, list(field_ids_by_table_id.keys())
+            )
+            if semantic_qs is not None:
+                return semantic_qs
+
         # Build field_id -> table_id mapping for CASE expression
         when_clauses = [
             When(field_id__in=f_ids, then=Value(t_id))
@@ -420,6 +436,75 @@ class RowSearchType(SearchableItemType):
 
         return qs
 
+    def _get_semantic_union_values_queryset(
+        self, workspace, context, table_ids: List[int]
+    ) -> Optional[QuerySet]:
+        """
+        Returns the rows of the provided tables of which the embedding is nearest to
+        the embedding of the query, in the same shape as the full-text results. The
+        primary field is used as the matching field of every row.
+
+        :return: The values queryset, or None if the query could not be embedded.
+        """
+
+        try:
+            (query_embedding,) = SemanticSearchHandler.embed_texts([context.query])
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.warning(f"Falling back from semantic workspace search: {exc}")
+            return None
+
+        limit = context.offset + context.limit
+        qs = (
+            SemanticSearchHandler.get_nearest_rows_queryset(
+                workspace.id, table_ids, query_embedding, limit
+            )
+            .annotate(
+                rank=ExpressionWrapper(
+                    Value(1.0) - F("distance"), output_field=FloatField()
+                ),
+            )
+            .annotate(
+                search_type=Value(self.type, output_field=TextField()),
+                is_valid=RowNotTrashedDynamicTable(F("table_id"), F("row_id")),
+                object_id=Concat(
+                    Cast(F("table_id"), output_field=TextField()),
+                    Value("_", output_field=TextField()),
+                    Cast(F("row_id"), output_field=TextField()),
+                    output_field=TextField(),
+                ),
+                sort_key=F("row_id"),
+                priority=Value(self.priority),
+                title=Concat(
+                    Value("row "),
+                    Cast(F("row_id"), output_field=TextField()),
+                    output_field=TextField(),
+                ),
+                subtitle=Value(None, output_field=TextField()),
+                payload=JSONObject(
+                    table_id=F("table_id"),
+                    row_id=F("row_id"),
+                    field_id=Subquery(
+                        Field.objects.filter(
+                            table_id=OuterRef("table_id"), primary=True
+                        ).values("id")[:1]
+                    ),
+                    query=Value(context.query),
+                ),
+            )
+            .filter(is_valid=True)
+            .values(
+                "search_type",
+                "object_id",
+                "sort_key",
+                "rank",
+                "priority",
+                "title",
+                "subtitle",
+                "payload",
+            )
+        )
+        return qs[:limit]
+
     def _fetch_primary_field_values(
         self,
         rows_list: List[Dict],
@@ -12,11 +12,16 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+The field attrs of projection models, which only contain some of the fields of a
+table, are cached in the same way per set of field ids in the cache key:
+    `projection_table_model_{table_id}_{field_ids_hash}_{BASEROW_VERSION}`
 """
 
+import hashlib
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from django.conf import settings
 from django.core.cache import caches
@@ -35,8 +40,32 @@ def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
 
 
-def get_cached_model_field_attrs(table: "Table") -> Optional[Dict[str, Any]]:
-    cache_key = table_model_cache_entry_key(table.id)
+def get_field_ids_hash(field_ids: Iterable[int]) -> str:
+    """
+    Returns a short hash uniquely identifying the set of field ids, regardless of
+    their order.
+    """
+
+    field_ids_string = ",".join(str(field_id) for field_id in sorted(set(field_ids)))
+    return hashlib.sha256(field_ids_string.encode()).hexdigest()
+
+
+def table_projection_model_cache_entry_key(
+    table_id: int, field_ids: Iterable[int]
+) -> str:
+    return (
+        f"projection_table_model_{table_id}_{get_field_ids_hash(field_ids)}_"
+        f"{BASEROW_VERSION}"
+    )
+
+
+def get_cached_model_field_attrs(
+    table: "Table", field_ids: Optional[Iterable[int]] = None
+) -> Optional[Dict[str, Any]]:
+    if field_ids is None:
+        cache_key = table_model_cache_entry_key(table.id)
+    else:
+        cache_key = table_projection_model_cache_entry_key(table.id, field_ids)
     cache_entry = generated_models_cache.get(cache_key)
 
     if cache_entry and cache_entry["version"] == table.version:
@@ -45,12 +74,21 @@ def get_cached_model_field_attrs(table: "Table") -> Optional[Dict[str, Any]]:
         return None
 
 
-def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
-    cache_key = table_model_cache_entry_key(table.id)
+def set_cached_model_field_attrs(
+    table: "Table",
+    field_attrs: Dict[str, Any],
+    field_ids: Optional[Iterable[int]] = None,
+):
+    if field_ids is None:
+        cache_key = table_model_cache_entry_key(table.id)
+        timeout = None
+    else:
+        cache_key = table_projection_model_cache_entry_key(table.id, field_ids)
+        timeout = settings.BASEROW_PROJECTION_MODEL_CACHE_TIMEOUT_SECONDS
     generated_models_cache.set(
         cache_key,
         {"field_attrs": field_attrs, "version": table.version},
-        timeout=None,
+        timeout=timeout,
     )
 
 
@@ -58,6 +96,7 @@ def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
+        generated_models_cache.delete_pattern("projection_table_model_*")
     elif settings.TESTS:
         # Just clear the entire cache in tests
         generated_models_cache.clear()
@@ -1,10 +1,12 @@
 import traceback
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, NewType, Optional, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.aggregates import BoolAnd, BoolOr
 from django.db import DatabaseError, IntegrityError
-from django.db.models import Q, QuerySet, Sum
+from django.db.models import F, Max, Q, QuerySet, Sum
 from django.db.models.functions import Coalesce, Now
 from django.utils import translation
 from django.utils.translation import gettext as _
@@ -38,6 +40,7 @@ from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.handler import CoreHandler
+from baserow.core.models import Workspace
 from baserow.core.registries import ImportExportConfig, application_type_registry
 from baserow.core.telemetry.utils import baserow_trace_methods
 from baserow.core.trash.handler import TrashHandler
@@ -82,7 +85,12 @@ class TableUsageHandler:
 
     @classmethod
     def mark_table_for_usage_update(
-        cls, table_id: int, row_count: int = 0
+        cls,
+        table_id: int,
+        row_count: int = 0,
+        is_delta: bool = False,
+        storage_usage_changed: bool = True,
+        committed_at: Optional[datetime] = None,
     ) -> Optional[TableUsageUpdate]:
         """
         Creates a new table usage log entry. This function can be called when an
@@ -93,13 +101,25 @@ class TableUsageHandler:
         :param row_count: This represents the change in row count for the table
             identified by 'table_id'. `0` means that the row count has not changed but
             we still want to recalcuate the storage usage at the next update.
+        :param is_delta: Indicates that `row_count` is the exact change of the row
+            count, so that the rows of the table don't have to be counted again.
+        :param storage_usage_changed: Indicates that the storage usage of the table
+            must be recalculated.
+        :param committed_at: The time at which the change of the delta has been
+            committed. The delta is skipped if the rows of the table have been
+            counted after that.
         :return: The created TableUsageUpdate object or None if the table_id is not
             valid.
         """
 
         try:
             return TableUsageUpdate.objects.create(
-                table_id=table_id, row_count=row_count, timestamp=Now()
+                table_id=table_id,
+                row_count=row_count,
+                is_delta=is_delta,
+                storage_usage_changed=storage_usage_changed,
+                committed_at=committed_at,
+                timestamp=Now(),
             )
         except IntegrityError as integrity_exc:
             if "violates foreign key constraint" in str(integrity_exc):
@@ -140,11 +160,11 @@ class TableUsageHandler:
         :return: The number of tables for which the usage has been updated or created.
         """
 
-        # Since calculating the row count and storage usage can be expensive, we
-        # use a small chunk size to process the updates in smaller batches.
+        # Most of the updates are applied incrementally, the tables that must be
+        # counted again are processed one by one by `_update_existing_tables_usage`.
         table_usage_updates_qs = TableUsageUpdate.objects.all()
         updated = cls._update_existing_tables_usage(
-            table_usage_updates_qs, chunk_size=1
+            table_usage_updates_qs, chunk_size=100
         )
 
         tables_without_usage_qs = TableHandler.get_tables().filter(
@@ -219,8 +239,15 @@ class TableUsageHandler:
         cls, usage_update_qs: QuerySet[TableUsageUpdate], chunk_size=10
     ) -> int:
         """
-        Recalculates the row count and storage usage for the tables that have changed
-        and have a TableUsageUpdate entry, and then delete them.
+        Applies the TableUsageUpdate entries of the tables that have changed, and then
+        deletes them. If all the entries of a table are deltas, they're added to the
+        row count of the existing TableUsage and the storage usage is only
+        recalculated if needed. Otherwise, or if the row count hasn't been counted for
+        `BASEROW_TABLE_USAGE_RECOUNT_HOURS`, the row count and the storage usage are
+        calculated again. The deltas committed before the last count of the rows of
+        their table are skipped, because they're already included in it. The storage
+        usage of the workspaces of the tables whose storage usage has been
+        recalculated is marked as outdated.
 
         :param usage_update_qs: The queryset containing the table usage updates that
             need to be processed.
@@ -229,16 +256,90 @@ class TableUsageHandler:
         """
 
         total_tables_counted = 0
+        recount_before = datetime.now(tz=timezone.utc) - timedelta(
+            hours=settings.BASEROW_TABLE_USAGE_RECOUNT_HOURS
+        )
+        # The deltas committed before the rows of the table were last counted are
+        # already included in the count.
+        not_counted_yet = Q(committed_at__isnull=True) | Q(
+            committed_at__gt=F("table__usage__row_count_updated_at")
+        )
+        pending_updates_qs = (
+            usage_update_qs.values("table_id")
+            .annotate(
+                row_count_delta=Coalesce(Sum("row_count", filter=not_counted_yet), 0),
+                only_deltas=BoolAnd("is_delta"),
+                storage_usage_changed=BoolOr("storage_usage_changed"),
+                last_update_id=Max("id"),
+            )
+            .order_by()
+        )
 
-        for chunk in grouper(
-            chunk_size, usage_update_qs.values("table_id").distinct().iterator(1000)
-        ):
-            table_ids = [u["table_id"] for u in chunk]
+        for chunk in grouper(chunk_size, pending_updates_qs.iterator(1000)):
+            counted_table_usages = {
+                table_usage.table_id: table_usage
+                for table_usage in TableUsage.objects.filter(
+                    table_id__in=[u["table_id"] for u in chunk],
+                    row_count__isnull=False,
+                    row_count_updated_at__gte=recount_before,
+                )
+            }
 
-            cls._bulk_create_or_update(table_ids)
-            TableUsageUpdate.objects.filter(table_id__in=table_ids).delete()
+            table_usages_to_update = []
+            table_ids_to_recount = []
+            applied_updates_q = Q()
+            storage_changed_table_ids = []
+            for pending_update in chunk:
+                table_id = pending_update["table_id"]
+                table_usage = counted_table_usages.get(table_id)
+                if pending_update["storage_usage_changed"]:
+                    storage_changed_table_ids.append(table_id)
+
+                if table_usage is None or not pending_update["only_deltas"]:
+                    table_ids_to_recount.append(table_id)
+                    continue
+
+                table_usage.row_count = max(
+                    table_usage.row_count + pending_update["row_count_delta"], 0
+                )
+                if pending_update["storage_usage_changed"]:
+                    table_usage.storage_usage = cls.calculate_table_storage_usage(
+                        table_id
+                    )
+                    table_usage.storage_usage_updated_at = datetime.now(tz=timezone.utc)
+                table_usages_to_update.append(table_usage)
+                # Newer entries have been created after the aggregation, so they must
+                # be applied the next time.
+                applied_updates_q |= Q(
+                    table_id=table_id, id__lte=pending_update["last_update_id"]
+                )
 
-            total_tables_counted += len(table_ids)
+            if table_usages_to_update:
+                TableUsage.objects.bulk_update(
+                    table_usages_to_update,
+                    ["row_count", "storage_usage", "storage_usage_updated_at"],
+                )
+                TableUsageUpdate.objects.filter(applied_updates_q).delete()
+
+            # Calculating the row count and storage usage can be expensive, so the
+            # tables are counted one by one.
+            for table_id in table_ids_to_recount:
+                cls._bulk_create_or_update([table_id])
+                # The deltas committed during the count must still be applied.
+                TableUsageUpdate.objects.filter(
+                    Q(committed_at__isnull=True)
+                    | Q(committed_at__lte=F("table__usage__row_count_updated_at")),
+                    table_id=table_id,
+                ).delete()
+
+            if storage_changed_table_ids:
+                Workspace.objects.filter(
+                    id__in=Table.objects.filter(
+                        id__in=storage_changed_table_ids
+                    ).values("database__workspace_id")
+                ).update(storage_usage_updated_at=None)
+
+            total_tables_counted += len(chunk)
 
         return total_tables_counted
 
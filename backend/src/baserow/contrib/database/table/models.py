@@ -13,7 +13,9 @@ from django.db import models
 from django.db.models import BooleanField, JSONField, Q, QuerySet
 from django.db.models import Field as DjangoModelFieldClass
 
+import httpx
 from django_cte.cte import CTEManager, CTEQuerySet
+from loguru import logger
 from opentelemetry import trace
 
 from baserow.cachalot_patch import cachalot_enabled
@@ -43,6 +45,7 @@ from baserow.contrib.database.search.handler import (
 )
 from baserow.contrib.database.table.cache import (
     get_cached_model_field_attrs,
+    get_field_ids_hash,
     set_cached_model_field_attrs,
 )
 from baserow.contrib.database.table.constants import (
@@ -117,6 +120,33 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, BaserowCTEQuerySet):
             self, input_search, fields_to_search
         )
 
+    def semantic_search(self, input_search: str) -> QuerySet:
+        """
+        Responsible for narrowing the queryset down to the rows of which the
+        embedding is nearest to the embedding of the search query. If the query
+        can't be embedded, the default search mode of the table is used instead.
+
+        :param input_search: The search query to use for narrowing down the queryset.
+            If empty, the queryset will not be narrowed down.
+        :return: The narrowed queryset which contains the nearest rows.
+        """
+
+        from baserow.contrib.database.search.semantic import SemanticSearchHandler
+
+        if not input_search or not input_search.strip():
+            return self
+
+        try:
+            return SemanticSearchHandler.semantic_search_in_table(self, input_search)
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.warning(f"Falling back from semantic search: {exc}")
+            return self.search_all_fields(
+                input_search,
+                search_mode=SearchHandler.get_default_search_mode_for_table(
+                    self.model.baserow_table
+                ),
+            )
+
     def count(self):
         with cachalot_enabled():
             return super().count()
@@ -150,6 +180,35 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, BaserowCTEQuerySet):
             self = field_type.enhance_queryset_in_bulk(self, field_objects, **kwargs)
         return self
 
+    def only_fields(self, field_ids: Iterable[int], **kwargs) -> QuerySet:
+        """
+        Narrows the selected columns down to the ones of the fields with the provided
+        ids, and the `id` and `order` columns, so that the columns that are not going
+        to be serialized aren't fetched. This is useful if the full model is needed to
+        filter, sort or search the rows, but only some of the fields are returned. The
+        queryset is enhanced again for the provided fields only, because the
+        prefetches of the other fields aren't needed and a deferred field can't be
+        traversed using `select_related`.
+
+        :param field_ids: The ids of the fields of which the columns must be selected.
+            The ids of fields that are not in the model are ignored.
+        :return: The narrowed queryset.
+        """
+
+        field_ids = set(field_ids)
+        field_names = [
+            field_object["name"]
+            for field_id, field_object in self.model._field_objects.items()
+            if field_id in field_ids
+        ]
+        return (
+            self.select_related(None)
+            .prefetch_related(None)
+            .clear_multi_field_prefetch()
+            .enhance_by_fields(only_field_ids=field_ids, **kwargs)
+            .only("id", "order", *field_names)
+        )
+
     def search_all_fields(
         self,
         search: str,
@@ -168,15 +227,26 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, BaserowCTEQuerySet):
             ignored and not be filtered.
         :param search_mode: In `COMPAT` we will use the old search method, using
             the LIKE operator on each column. In `FT_WITH_COUNT`  we will switch
-            to using Postgres full-text search.
+            to using Postgres full-text search. In `SEMANTIC` the rows nearest to the
+            search query are returned, regardless of `only_search_by_field_ids`,
+            because the embedding contains the values of all the fields.
         :return: The queryset containing the search queries.
         :rtype: QuerySet
         """
 
+        from baserow.contrib.database.search.semantic import SemanticSearchHandler
+
         search_mode = search_mode or settings.DEFAULT_SEARCH_MODE
         if search_mode not in ALL_SEARCH_MODES:
             raise NotImplementedError(f"Unsupported search_mode {search_mode}.")
 
+        if search_mode == SearchMode.SEMANTIC:
+            if SemanticSearchHandler.can_use_semantic_search(self.model.baserow_table):
+                return self.semantic_search(search)
+            search_mode = SearchHandler.get_default_search_mode_for_table(
+                self.model.baserow_table
+            )
+
         can_use_full_text_search = SearchHandler.can_use_full_text_search(
             self.model.baserow_table
         )
@@ -802,9 +872,14 @@ class TableUsageUpdate(models.Model):
     concurrent operations to run simultaneously. The row count displayed in the admin
     panel can be more accurate by using this value as a delta.
 
-    However, 'storage_usage' needs to be recalculated every time there is an entry in
-    this table. This is because it's challenging to determine if a change related to a
-    file field references a newly uploaded file or not.
+    Entries created for row creations and deletions are marked with `is_delta`, because
+    their 'row_count' is the exact change of the row count. If all the entries of a
+    table are deltas, they are added to the existing `TableUsage.row_count` instead of
+    counting all the rows of the table again. The 'storage_usage' is only recalculated
+    if one of the entries has `storage_usage_changed`. This is because it's challenging
+    to determine if a change related to a file field references a newly uploaded file
+    or not. The deltas are stamped with the time their change has been committed, so
+    that the ones already included in a later recount of the rows are skipped.
     """
 
     id = models.BigAutoField(
@@ -819,6 +894,22 @@ class TableUsageUpdate(models.Model):
         "A null value means that the row_count is not changed, but it might be changed "
         "storage count and we want to recalculate the storage needed by this table.",
     )
+    is_delta = models.BooleanField(
+        default=False,
+        help_text="Indicates that the row_count is the exact change of the row count, "
+        "so that the usage can be updated without counting the rows of the table.",
+    )
+    storage_usage_changed = models.BooleanField(
+        default=True,
+        help_text="Indicates that the storage usage of the table might have changed "
+        "and must be recalculated.",
+    )
+    committed_at = models.DateTimeField(
+        null=True,
+        help_text="The time at which the change of a delta has been committed. Deltas "
+        "committed before the last time the rows of the table have been counted are "
+        "already included in the count and are skipped.",
+    )
     timestamp = models.DateTimeField(auto_now=True)
 
 
@@ -950,6 +1041,29 @@ class Table(
             )
         return self._get_model(**kwargs)
 
+    @baserow_trace(tracer)
+    def get_projection_model(
+        self, field_ids: Iterable[int]
+    ) -> Type[GeneratedTableModel]:
+        """
+        Returns a model that only contains the fields with the provided ids and the
+        fields they depend on. For tables with many fields, this is much cheaper to
+        generate and to query than the full model if only a few fields are needed, for
+        example when listing rows with the `include_fields` parameter. The field attrs
+        are cached per table version and set of fields, so that the model can be
+        shared by the requests needing the same fields.
+
+        :param field_ids: The ids of the fields that must be in the model.
+        :return: The generated projection model.
+        """
+
+        field_ids = sorted(set(field_ids))
+        return local_cache.get(
+            f"database_table_model_{self.id}_projection_"
+            f"{get_field_ids_hash(field_ids)}",
+            lambda: self._get_model(field_ids=field_ids, projection=True),
+        )
+
     def _get_model(
         self,
         fields=None,
@@ -961,6 +1075,7 @@ class Table(
         managed=False,
         use_cache=True,
         app_label: Optional[str] = None,
+        projection: bool = False,
     ) -> Type[GeneratedTableModel]:
         """
         Generates a temporary Django model based on available fields that belong to
@@ -996,6 +1111,12 @@ class Table(
             have the same app_label. If passed along in this parameter, then the
             generated model will use that one instead of generating a unique one.
         :type app_label: Optional[String]
+        :param projection: Indicates whether the model is a projection only
+            containing the fields with the provided `field_ids` and their dependencies.
+            The field attrs of a projection can be cached per set of field ids, like
+            the ones of the full model. Use `get_projection_model` instead of setting
+            this directly.
+        :type projection: bool
         :return: The generated model.
         :rtype: Model
         """
@@ -1070,7 +1191,7 @@ class Table(
         use_cache = (
             use_cache
             and len(fields) == 0
-            and field_ids is None
+            and (field_ids is None or projection)
             and add_dependencies is True
             and attribute_names is False
             and not settings.BASEROW_DISABLE_MODEL_CACHE
@@ -1083,7 +1204,8 @@ class Table(
                 f"database_table_model_{self.id}_refreshed",
                 lambda: self.refresh_from_db(fields=["version"]),
             )
-            field_attrs = get_cached_model_field_attrs(self)
+            cached_field_ids = field_ids if projection else None
+            field_attrs = get_cached_model_field_attrs(self, cached_field_ids)
         else:
             field_attrs = None
 
@@ -1098,7 +1220,7 @@ class Table(
             )
 
             if use_cache:
-                set_cached_model_field_attrs(self, field_attrs)
+                set_cached_model_field_attrs(self, field_attrs, cached_field_ids)
         else:
             # We found cached model fields, they will have a cached creation_counter
             # attribute each used to compare model fields to do django
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from django.db import transaction
 from django.dispatch import receiver
 
@@ -16,20 +18,40 @@ from baserow.core.signals import application_created
 from .tasks import create_tables_usage_for_new_database, update_table_usage
 
 
-@receiver(rows_created)
-def on_rows_created(sender, rows, before, user, table, **kwargs):
-    transaction.on_commit(
-        lambda: update_table_usage.delay(table.id, row_count=len(rows))
+def _has_file_field(model) -> bool:
+    return any(
+        isinstance(field_object["field"], FileField)
+        for field_object in model.get_field_objects()
     )
 
 
-@receiver(rows_deleted)
-def on_rows_deleted(sender, rows, user, table, **kwargs):
+def _update_table_row_count_on_commit(table_id: int, row_count: int, model):
+    # The row count can be updated incrementally, but the storage usage only needs to
+    # be recalculated if the rows can contain files. The delta is stamped with the
+    # time it has been committed, so that it's skipped if the rows of the table are
+    # counted again before it's applied.
+    storage_usage_changed = _has_file_field(model)
     transaction.on_commit(
-        lambda: update_table_usage.delay(table.id, row_count=-len(rows))
+        lambda: update_table_usage.delay(
+            table_id,
+            row_count=row_count,
+            is_delta=True,
+            storage_usage_changed=storage_usage_changed,
+            committed_at=datetime.now(tz=timezone.utc),
+        )
     )
 
 
+@receiver(rows_created)
+def on_rows_created(sender, rows, before, user, table, model, **kwargs):
+    _update_table_row_count_on_commit(table.id, len(rows), model)
+
+
+@receiver(rows_deleted)
+def on_rows_deleted(sender, rows, user, table, model, **kwargs):
+    _update_table_row_count_on_commit(table.id, -len(rows), model)
+
+
 @receiver(rows_updated)
 def on_rows_updated(
     sender, rows, user, table, model, before_return, updated_field_ids, **kwargs
@@ -40,7 +62,9 @@ def on_rows_updated(
     for field_object in model.get_field_objects():
         field = field_object["field"]
         if isinstance(field, FileField) and field.id in updated_field_ids:
-            transaction.on_commit(lambda: update_table_usage.delay(table.id))
+            transaction.on_commit(
+                lambda: update_table_usage.delay(table.id, is_delta=True)
+            )
             break
 
 
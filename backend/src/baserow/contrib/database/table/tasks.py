@@ -1,4 +1,6 @@
 from collections import defaultdict
+from datetime import datetime
+from typing import Optional
 
 from django.db import transaction
 
@@ -147,10 +149,23 @@ def setup_m2m_field_indexes_if_not_exist(self, table_id: int):
 
 
 @app.task(bind=True)
-def update_table_usage(self, table_id: int, row_count: int = 0):
+def update_table_usage(
+    self,
+    table_id: int,
+    row_count: int = 0,
+    is_delta: bool = False,
+    storage_usage_changed: bool = True,
+    committed_at: Optional[datetime] = None,
+):
     from baserow.contrib.database.table.handler import TableUsageHandler
 
-    TableUsageHandler.mark_table_for_usage_update(table_id, row_count)
+    TableUsageHandler.mark_table_for_usage_update(
+        table_id,
+        row_count,
+        is_delta=is_delta,
+        storage_usage_changed=storage_usage_changed,
+        committed_at=committed_at,
+    )
 
     table_usage_updated.send(sender=self, table_id=table_id)
 
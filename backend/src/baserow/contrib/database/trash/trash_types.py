@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.db import connection, router
+from django.db.models import Q
 
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.dependencies.handler import (
@@ -35,6 +36,10 @@ from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.models import TrashEntry
 from baserow.core.trash.exceptions import RelatedTableTrashedException
 from baserow.core.trash.registries import TrashableItemType
+from baserow.core.trash.signals import (
+    before_permanently_deleted_many,
+    permanently_deleted_many,
+)
 
 from ..fields.operations import RestoreFieldOperationType
 from ..rows.operations import RestoreDatabaseRowOperationType
@@ -46,6 +51,77 @@ from .models import TrashedRows
 User = get_user_model()
 
 
+def _get_cached_table_model(
+    table_id: int, trash_item_lookup_cache: Optional[Dict[str, Any]] = None
+) -> GeneratedTableModel:
+    """
+    Returns the model of the table, caching it in the provided trash item lookup
+    cache so that looking up many rows of the same table only generates it once.
+
+    :param table_id: The id of the table to get the model for.
+    :param trash_item_lookup_cache: An optional cache dict shared between many trash
+        item lookups.
+    :raises TrashItemDoesNotExist: If the table has already been deleted.
+    :return: The generated model of the table.
+    """
+
+    if trash_item_lookup_cache is None:
+        return RowTrashableItemType._get_table(table_id).get_model()
+
+    model_cache = trash_item_lookup_cache.setdefault("row_table_model_cache", {})
+    try:
+        return model_cache[table_id]
+    except KeyError:
+        return model_cache.setdefault(
+            table_id, RowTrashableItemType._get_table(table_id).get_model()
+        )
+
+
+def _permanently_delete_trashed_rows_in_bulk(
+    model: GeneratedTableModel, row_ids: List[int]
+):
+    """
+    Permanently deletes the provided trashed rows of the model with set based
+    queries instead of deleting every row instance separately. The relations in the
+    many to many through tables and the rich text mentions are cleaned up as well.
+    The bulk permanent deletion signals are sent with the `row` trash type as sender.
+
+    :param model: The generated model of the table the rows belong to.
+    :param row_ids: The ids of the trashed rows to delete.
+    """
+
+    table = model.baserow_table
+    row_ids = list(
+        model.objects_and_trash.filter(id__in=row_ids, trashed=True).values_list(
+            "id", flat=True
+        )
+    )
+    if not row_ids:
+        return
+
+    before_permanently_deleted_many.send(
+        sender=RowTrashableItemType.type, trash_item_ids=row_ids, parent_id=table.id
+    )
+
+    for m2m_field in model._meta.many_to_many:
+        through = m2m_field.remote_field.through
+        q = Q(**{f"{m2m_field.m2m_field_name()}__in": row_ids})
+        if m2m_field.remote_field.model == model:
+            # Self referencing relations also point to the deleted rows from the
+            # other side of the through table.
+            q |= Q(**{f"{m2m_field.m2m_reverse_field_name()}__in": row_ids})
+        delete_qs = through.objects.filter(q)
+        delete_qs._raw_delete(using=router.db_for_write(through))
+
+    delete_qs = model.objects_and_trash.filter(id__in=row_ids)
+    delete_qs._raw_delete(using=router.db_for_write(model))
+    RichTextFieldMention.objects.filter(table_id=table.id, row_id__in=row_ids).delete()
+
+    permanently_deleted_many.send(
+        sender=RowTrashableItemType.type, trash_item_ids=row_ids, parent_id=table.id
+    )
+
+
 class TableTrashableItemType(TrashableItemType):
     type = "table"
     model_class = Table
@@ -320,6 +396,7 @@ class FieldTrashableItemType(TrashableItemType):
 class RowTrashableItemType(TrashableItemType):
     type = "row"
     model_class = GeneratedTableModel
+    supports_bulk_permanent_deletion = True
 
     @property
     def requires_parent_id(self) -> bool:
@@ -386,6 +463,14 @@ class RowTrashableItemType(TrashableItemType):
         ).delete()
         row.delete()
 
+    def permanently_delete_items_in_bulk(
+        self, parent_id, trash_entries, trash_item_lookup_cache=None
+    ):
+        model = _get_cached_table_model(parent_id, trash_item_lookup_cache)
+        _permanently_delete_trashed_rows_in_bulk(
+            model, [trash_entry.trash_item_id for trash_entry in trash_entries]
+        )
+
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
     ):
@@ -402,19 +487,9 @@ class RowTrashableItemType(TrashableItemType):
 
         # Cache the expensive table.get_model function call if we are looking up
         # many trash items at once.
-        if trash_item_lookup_cache is not None:
-            model_cache = trash_item_lookup_cache.setdefault(
-                "row_table_model_cache", {}
-            )
-            try:
-                model = model_cache[trashed_entry.parent_trash_item_id]
-            except KeyError:
-                model = model_cache.setdefault(
-                    trashed_entry.parent_trash_item_id,
-                    self._get_table_model(trashed_entry.parent_trash_item_id),
-                )
-        else:
-            model = self._get_table_model(trashed_entry.parent_trash_item_id)
+        model = _get_cached_table_model(
+            trashed_entry.parent_trash_item_id, trash_item_lookup_cache
+        )
 
         try:
             return model.trash.get(id=trashed_entry.trash_item_id)
@@ -435,6 +510,7 @@ class RowTrashableItemType(TrashableItemType):
 class RowsTrashableItemType(TrashableItemType):
     type = "rows"
     model_class = TrashedRows
+    supports_bulk_permanent_deletion = True
 
     @property
     def requires_parent_id(self) -> bool:
@@ -528,6 +604,20 @@ class RowsTrashableItemType(TrashableItemType):
             row_id__in=trashed_item.row_ids,
         ).delete()
 
+    def permanently_delete_items_in_bulk(
+        self, parent_id, trash_entries, trash_item_lookup_cache=None
+    ):
+        model = _get_cached_table_model(parent_id, trash_item_lookup_cache)
+        trashed_rows = TrashedRows.objects.filter(
+            id__in=[trash_entry.trash_item_id for trash_entry in trash_entries]
+        )
+        row_ids = set()
+        for row_ids_of_trashed_rows in trashed_rows.values_list("row_ids", flat=True):
+            row_ids.update(row_ids_of_trashed_rows or [])
+
+        _permanently_delete_trashed_rows_in_bulk(model, list(row_ids))
+        trashed_rows.delete()
+
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
     ):
@@ -12,7 +12,7 @@ from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
-from django.db import OperationalError, connection
+from django.db import OperationalError, connection, transaction
 from django.db import models as django_models
 from django.db.models import Count, Q, prefetch_related_objects
 from django.db.models.expressions import OrderBy
@@ -91,6 +91,7 @@ from baserow.contrib.database.views.registries import (
     view_ownership_type_registry,
 )
 from baserow.contrib.database.views.view_filter_groups import ViewGroupedFiltersAdapter
+from baserow.core.cache import global_cache
 from baserow.core.db import specific_iterator, sql, transaction_atomic
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
@@ -198,6 +199,10 @@ PerViewTableIndexUpdate = namedtuple(
 )
 
 
+def get_public_view_rows_cache_invalidate_key(table_id: int) -> str:
+    return f"public_view_rows_table_{table_id}"
+
+
 @dataclasses.dataclass
 class UpdatedViewWithChangedAttributes:
     updated_view_instance: View
@@ -3763,6 +3768,21 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return queryset, field_ids, visible_field_options
 
+    def invalidate_public_view_rows_cache(self, table_id: int):
+        """
+        Invalidates the cached responses of the public views of the table. The cache
+        is invalidated again when the transaction commits, so that a response
+        computed concurrently before the commit isn't kept.
+
+        :param table_id: The id of the table whose rows or views changed.
+        """
+
+        invalidate_key = get_public_view_rows_cache_invalidate_key(table_id)
+        global_cache.invalidate(invalidate_key=invalidate_key)
+        transaction.on_commit(
+            lambda: global_cache.invalidate(invalidate_key=invalidate_key)
+        )
+
     def get_group_by_metadata_in_rows(
         self,
         fields: List[Field],
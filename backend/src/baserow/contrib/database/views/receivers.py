@@ -11,18 +11,26 @@ from baserow.contrib.database.rows.signals import (
     rows_updated,
 )
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.contrib.database.table.signals import table_schema_changed, table_updated
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.signals import (
+    view_field_options_updated,
     view_filter_created,
     view_filter_deleted,
     view_filter_group_created,
     view_filter_group_deleted,
     view_filter_group_updated,
     view_filter_updated,
+    view_group_by_created,
+    view_group_by_deleted,
+    view_group_by_updated,
+    view_sort_created,
+    view_sort_deleted,
+    view_sort_updated,
     view_updated,
 )
 
-from .handler import ViewSubscriptionHandler
+from .handler import ViewHandler, ViewSubscriptionHandler
 
 
 def _notify_table_data_updated(table: Table, model: GeneratedTableModel | None = None):
@@ -96,3 +104,57 @@ def notify_field_updated(sender, field, related_fields, user, **kwargs):
 @receiver(field_deleted)
 def notify_field_deleted(sender, field_id, field, related_fields, user, **kwargs):
     _notify_tables_of_fields_updated_or_deleted(field, related_fields, user, **kwargs)
+
+
+@receiver([rows_updated, rows_created, rows_deleted])
+def invalidate_public_view_rows_cache_on_rows_change(
+    sender, table, dependant_fields, **kwargs
+):
+    table_ids = {table.id} | {field.table_id for field in dependant_fields}
+    for table_id in table_ids:
+        ViewHandler().invalidate_public_view_rows_cache(table_id)
+
+
+@receiver(table_updated)
+def invalidate_public_view_rows_cache_on_table_update(sender, table, **kwargs):
+    ViewHandler().invalidate_public_view_rows_cache(table.id)
+
+
+@receiver(table_schema_changed)
+def invalidate_public_view_rows_cache_on_table_schema_change(
+    sender, table_id, **kwargs
+):
+    ViewHandler().invalidate_public_view_rows_cache(table_id)
+
+
+@receiver([view_updated, view_field_options_updated])
+def invalidate_public_view_rows_cache_on_view_change(sender, view, **kwargs):
+    ViewHandler().invalidate_public_view_rows_cache(view.table_id)
+
+
+@receiver([view_filter_created, view_filter_updated, view_filter_deleted])
+def invalidate_public_view_rows_cache_on_view_filter_change(
+    sender, view_filter, **kwargs
+):
+    ViewHandler().invalidate_public_view_rows_cache(view_filter.view.table_id)
+
+
+@receiver(
+    [view_filter_group_created, view_filter_group_updated, view_filter_group_deleted]
+)
+def invalidate_public_view_rows_cache_on_view_filter_group_change(
+    sender, view_filter_group, **kwargs
+):
+    ViewHandler().invalidate_public_view_rows_cache(view_filter_group.view.table_id)
+
+
+@receiver([view_sort_created, view_sort_updated, view_sort_deleted])
+def invalidate_public_view_rows_cache_on_view_sort_change(sender, view_sort, **kwargs):
+    ViewHandler().invalidate_public_view_rows_cache(view_sort.view.table_id)
+
+
+@receiver([view_group_by_created, view_group_by_updated, view_group_by_deleted])
+def invalidate_public_view_rows_cache_on_view_group_by_change(
+    sender, view_group_by, **kwargs
+):
+    ViewHandler().invalidate_public_view_rows_cache(view_group_by.view.table_id)
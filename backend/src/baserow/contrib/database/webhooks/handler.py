@@ -1,9 +1,10 @@
 import json
 import uuid
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from django.conf import settings
 from django.contrib.auth.models import User as DjangoUser
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
@@ -12,6 +13,7 @@ from requests import PreparedRequest, Response
 from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.views.models import View
+from baserow.core.cache import global_cache
 from baserow.core.handler import CoreHandler
 from baserow.core.utils import extract_allowed, set_allowed_attrs
 
@@ -43,7 +45,101 @@ if TYPE_CHECKING:
     from baserow.contrib.database.webhooks.registries import WebhookEventType
 
 
+WEBHOOK_INDEX_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+
+def get_table_webhook_index_cache_key(table_id: int) -> str:
+    return f"database_table_{table_id}_webhook_index"
+
+
 class WebhookHandler:
+    def get_table_webhook_index(self, table_id: int) -> Dict[str, Any]:
+        """
+        Returns a cached summary of the active webhooks of the table. It contains
+        whether one of them listens to all events and, per event type, the fields and
+        views every webhook event is restricted to. Event types use it to figure out
+        with zero queries whether a signal can trigger any webhook at all, before
+        evaluating the filters and the payloads of a potentially large batch of rows.
+
+        :param table_id: The id of the table to get the index for.
+        :return: A dict containing an `include_all_events` boolean and an `events` dict
+            mapping the event type to a list of `field_ids` and `view_ids` dicts, one
+            per webhook event.
+        """
+
+        def compute_index():
+            include_all_events = False
+            events = {}
+            for webhook_include_all, event_id, event_type, field_id, view_id in (
+                TableWebhook.objects.filter(table_id=table_id, active=True)
+                .values_list(
+                    "include_all_events",
+                    "events__id",
+                    "events__event_type",
+                    "events__fields",
+                    "events__views",
+                )
+                .order_by()
+            ):
+                include_all_events = include_all_events or webhook_include_all
+                if event_id is None:
+                    continue
+                event = events.setdefault(event_type, {}).setdefault(
+                    event_id, {"field_ids": set(), "view_ids": set()}
+                )
+                if field_id is not None:
+                    event["field_ids"].add(field_id)
+                if view_id is not None:
+                    event["view_ids"].add(view_id)
+
+            return {
+                "include_all_events": include_all_events,
+                "events": {
+                    event_type: list(events_per_id.values())
+                    for event_type, events_per_id in events.items()
+                },
+            }
+
+        return global_cache.get(
+            get_table_webhook_index_cache_key(table_id),
+            compute_index,
+            timeout=WEBHOOK_INDEX_CACHE_TIMEOUT,
+        )
+
+    def invalidate_table_webhook_index(self, table_id: int):
+        """
+        Invalidates the webhook index of the table. Must be called every time a
+        webhook, one of its events or their fields and views change.
+
+        :param table_id: The id of the table to invalidate the index for.
+        """
+
+        def invalidate():
+            global_cache.invalidate(get_table_webhook_index_cache_key(table_id))
+
+        invalidate()
+        # Also invalidate on commit, in case the index was computed again before the
+        # change was committed.
+        transaction.on_commit(invalidate)
+
+    def has_webhooks_to_call(
+        self, webhook_event_type: "WebhookEventType", **webhook_event_type_kwargs
+    ) -> bool:
+        """
+        Checks with the cached webhook index whether the event can trigger any
+        webhook. If not, there is no need to query them with
+        `find_webhooks_to_call`.
+
+        :param webhook_event_type: The event type that must be triggered.
+        :param webhook_event_type_kwargs: The arguments of the signal.
+        :return: False if no webhook can be triggered by the event.
+        """
+
+        table = webhook_event_type.get_table_object(**webhook_event_type_kwargs)
+        return webhook_event_type.has_webhooks_to_call(
+            self.get_table_webhook_index(table.id), **webhook_event_type_kwargs
+        )
+
     def find_webhooks_to_call(
         self, webhook_event_type: "WebhookEventType", **webhook_event_type_kwargs
     ) -> QuerySet[TableWebhook]:
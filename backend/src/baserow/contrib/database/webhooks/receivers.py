@@ -0,0 +1,66 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from baserow.contrib.database.table.signals import table_schema_changed
+
+from .handler import WebhookHandler
+from .models import TableWebhook, TableWebhookEvent
+
+
+def _invalidate_webhook_index_of_webhook(webhook_id: int):
+    table_id = (
+        TableWebhook.objects.filter(id=webhook_id)
+        .values_list("table_id", flat=True)
+        .first()
+    )
+    # If the webhook doesn't exist anymore, the index has been invalidated when it
+    # was deleted.
+    if table_id is not None:
+        WebhookHandler().invalidate_table_webhook_index(table_id)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=TableWebhook,
+    dispatch_uid="webhook_index_webhook_change",
+)
+def invalidate_webhook_index_on_webhook_change(sender, instance, **kwargs):
+    WebhookHandler().invalidate_table_webhook_index(instance.table_id)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=TableWebhookEvent,
+    dispatch_uid="webhook_index_webhook_event_change",
+)
+def invalidate_webhook_index_on_webhook_event_change(sender, instance, **kwargs):
+    _invalidate_webhook_index_of_webhook(instance.webhook_id)
+
+
+@receiver(
+    m2m_changed,
+    sender=TableWebhookEvent.fields.through,
+    dispatch_uid="webhook_index_webhook_event_fields_change",
+)
+@receiver(
+    m2m_changed,
+    sender=TableWebhookEvent.views.through,
+    dispatch_uid="webhook_index_webhook_event_views_change",
+)
+def invalidate_webhook_index_on_webhook_event_relations_change(
+    sender, instance, action, reverse, **kwargs
+):
+    if not action.startswith("post_"):
+        return
+
+    if reverse:
+        # The instance is the field or the view.
+        WebhookHandler().invalidate_table_webhook_index(instance.table_id)
+    else:
+        _invalidate_webhook_index_of_webhook(instance.webhook_id)
+
+
+@receiver(table_schema_changed)
+def invalidate_webhook_index_on_table_schema_change(sender, table_id, **kwargs):
+    # The fields of the webhook events could have been deleted.
+    WebhookHandler().invalidate_table_webhook_index(table_id)
@@ -119,6 +119,27 @@ class WebhookEventType(Instance):
 
         return q & Q(table_id=table.id, active=True)
 
+    def has_webhooks_to_call(self, webhook_index: dict, **kwargs: dict) -> bool:
+        """
+        Checks with the cached webhook index of the table whether the event can
+        trigger any webhook, without making any query. It must never return False if
+        `get_filters_for_webhooks_to_call` could match a webhook, so this method must
+        be overwritten together with it if the filters are more permissive.
+
+        :param webhook_index: The index returned by
+            `WebhookHandler.get_table_webhook_index` for the table of the event.
+        :param kwargs: The arguments of the signal.
+        :return: False if no webhook can be triggered by the event.
+        """
+
+        if (
+            self.should_trigger_when_all_event_types_selected
+            and webhook_index["include_all_events"]
+        ):
+            return True
+
+        return self.type in webhook_index["events"]
+
     def listener(self, **kwargs: dict):
         """
         The method that is called when the signal is triggered. By default it will
@@ -193,6 +214,9 @@ class WebhookEventType(Instance):
             return
 
         webhook_handler = WebhookHandler()
+        if not webhook_handler.has_webhooks_to_call(self, **kwargs):
+            return
+
         webhooks = webhook_handler.find_webhooks_to_call(self, **kwargs)
         event_id = uuid.uuid4()
         for webhook in webhooks:
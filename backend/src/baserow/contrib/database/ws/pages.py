@@ -51,6 +51,60 @@ class TablePageType(PageType):
     def get_permission_channel_group_name(self, table_id, **kwargs):
         return f"permissions-table-{table_id}"
 
+    def merge_payloads(self, payload, next_payload):
+        """
+        Merges consecutive `rows_updated` payloads, keeping the values of the rows
+        before the first update and after the last one.
+        """
+
+        if payload["type"] != "rows_updated" or next_payload["type"] != "rows_updated":
+            return None
+
+        rows = {row["id"]: row for row in payload["rows"]}
+        for row in next_payload["rows"]:
+            # The rows can be serialized with only the updated fields.
+            rows[row["id"]] = {**rows.get(row["id"], {}), **row}
+
+        # The values before the first update win, but the rows can be serialized with
+        # only the updated fields, so the fields only updated later are taken from
+        # the next payload.
+        rows_before_update = {
+            row["id"]: row for row in next_payload["rows_before_update"]
+        }
+        for row in payload["rows_before_update"]:
+            rows_before_update[row["id"]] = {
+                **rows_before_update.get(row["id"], {}),
+                **row,
+            }
+
+        updated_field_ids = list(payload["updated_field_ids"])
+        updated_field_ids += [
+            field_id
+            for field_id in next_payload["updated_field_ids"]
+            if field_id not in updated_field_ids
+        ]
+
+        return {
+            **payload,
+            "rows_before_update": [rows_before_update[row_id] for row_id in rows],
+            "rows": list(rows.values()),
+            "metadata": {**payload["metadata"], **next_payload["metadata"]},
+            "updated_field_ids": updated_field_ids,
+        }
+
+    def get_oversized_payload_replacement(self, payload):
+        """
+        Large row payloads are replaced by a message that makes the clients refetch
+        the rows of the table.
+        """
+
+        from baserow.contrib.database.ws.rows.signals import RealtimeRowMessages
+
+        if payload["type"] not in ("rows_created", "rows_updated", "rows_deleted"):
+            return None
+
+        return RealtimeRowMessages.row_orders_recalculated(payload["table_id"])
+
 
 class PublicViewPageType(PageType):
     type = "view"
@@ -1,3 +1,5 @@
+from collections import defaultdict
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -13,10 +15,11 @@ from typing import (
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import EmptyResultSet, ValidationError
 from django.core.exceptions import FieldDoesNotExist as DjangoFieldDoesNotExist
-from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal
 from django.utils.translation import gettext as _
 
@@ -41,8 +44,10 @@ from baserow.contrib.database.fields.field_types import (
     MultipleCollaboratorsFieldType,
 )
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.operations import WriteFieldValuesOperationType
 from baserow.contrib.database.fields.registries import (
+    FieldAggregationType,
     field_aggregation_registry,
     field_type_registry,
 )
@@ -72,6 +77,7 @@ from baserow.contrib.database.views.exceptions import (
 )
 from baserow.contrib.database.views.models import DEFAULT_SORT_TYPE_KEY
 from baserow.contrib.database.views.service import ViewService
+from baserow.contrib.database.views.utils import AnnotatedAggregation
 from baserow.contrib.database.views.view_aggregations import (
     DistributionViewAggregationType,
 )
@@ -134,6 +140,7 @@ if TYPE_CHECKING:
 
 
 SCHEMA_CACHE_TTL = 60 * 60  # 1 hour
+TRIGGER_SERVICE_IDS_CACHE_TTL = 60 * 60  # 1 hour
 
 
 class LocalBaserowServiceType(ServiceType):
@@ -1071,18 +1078,10 @@ class LocalBaserowListRowsUserServiceType(
         )
 
         if only_field_names is not None:
-            # Maybe some fields were deleted in the meantime
-            # Let's check we still have them
-            available_fields = set(
-                [fo["name"] for fo in (self.get_table_field_objects(service) or [])]
-                + ["id"]
-            )
-
-            # Ensure that only used fields are fetched from the database.
-            queryset = queryset.only(
-                # We keep the order field here as the serializer needs it
-                *available_fields.intersection(only_field_names),
-                "order",
+            # Ensure that only used fields are fetched from the database. The fields
+            # that were deleted in the meantime are ignored.
+            queryset = queryset.only_fields(
+                extract_field_ids_from_list(only_field_names)
             )
 
         if dispatch_context.only_record_id is not None:
@@ -1472,6 +1471,49 @@ class LocalBaserowAggregateRowsUserServiceType(
 
         return super().resolve_service_formulas(service, dispatch_context)
 
+    @contextmanager
+    def _improperly_configured_on_invalid_field(
+        self, service: LocalBaserowAggregateRows
+    ):
+        """
+        Converts the exceptions raised because the field of the service can't be
+        aggregated into a `ServiceImproperlyConfiguredDispatchException`.
+        """
+
+        try:
+            yield
+        except DjangoFieldDoesNotExist as ex:
+            raise ServiceImproperlyConfiguredDispatchException(
+                f"The field with ID {service.field_id} does not exist."
+            ) from ex
+        except IncompatibleField as ex:
+            raise ServiceImproperlyConfiguredDispatchException(
+                f"The field with ID {service.field_id} is not compatible "
+                f"with the aggregation type {service.aggregation_type}"
+            ) from ex
+
+    def _get_aggregation(
+        self,
+        service: LocalBaserowAggregateRows,
+        dispatch_context: DispatchContext,
+    ) -> Tuple[QuerySet, Field, Any, FieldAggregationType]:
+        """
+        Returns the queryset of the rows to aggregate, the field, its model field and
+        the aggregation type of the service.
+        """
+
+        table = service.table
+        if service.field.trashed:
+            raise ServiceImproperlyConfiguredDispatchException(
+                f"The field with ID {service.field.id} is trashed."
+            )
+        field = service.field.specific
+        model = self.get_table_model(service)
+        model_field = model._meta.get_field(field.db_column)
+        queryset = self.build_queryset(service, table, dispatch_context, model=model)
+        agg_type = field_aggregation_registry.get(service.aggregation_type)
+        return queryset, field, model_field, agg_type
+
     def dispatch_data(
         self,
         service: LocalBaserowAggregateRows,
@@ -1492,35 +1534,124 @@ class LocalBaserowAggregateRowsUserServiceType(
         if only_field_names and "result" not in only_field_names:
             return {"data": {"result": None}}
 
-        try:
-            table = service.table
-            if service.field.trashed:
-                raise ServiceImproperlyConfiguredDispatchException(
-                    f"The field with ID {service.field.id} is trashed."
-                )
-            field = service.field.specific
-            model = self.get_table_model(service)
-            model_field = model._meta.get_field(field.db_column)
-            queryset = self.build_queryset(
-                service, table, dispatch_context, model=model
+        with self._improperly_configured_on_invalid_field(service):
+            queryset, field, model_field, agg_type = self._get_aggregation(
+                service, dispatch_context
             )
-            agg_type = field_aggregation_registry.get(service.aggregation_type)
             result = agg_type.aggregate(queryset, model_field, field)
 
-            return {
-                "data": {"result": result},
-                "baserow_table_model": model,
-                "field": field,
-            }
-        except DjangoFieldDoesNotExist as ex:
-            raise ServiceImproperlyConfiguredDispatchException(
-                f"The field with ID {service.field_id} does not exist."
-            ) from ex
-        except IncompatibleField as ex:
-            raise ServiceImproperlyConfiguredDispatchException(
-                f"The field with ID {service.field_id} is not compatible "
-                f"with the aggregation type {service.aggregation_type}"
-            ) from ex
+        return {
+            "data": {"result": result},
+            "baserow_table_model": queryset.model,
+            "field": field,
+        }
+
+    def dispatch_many(
+        self,
+        services: List[LocalBaserowAggregateRows],
+        dispatch_context: DispatchContext,
+    ) -> Dict[int, Union[DispatchResult, Exception]]:
+        """
+        Dispatches the services, but computes the aggregations of the services that
+        aggregate the same rows, because they use the same table, view, filters and
+        search query, with a single query.
+
+        :param services: The local baserow aggregate rows services.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The dispatch result, or the raised exception, per service id.
+        """
+
+        if dispatch_context.use_sample_data:
+            return super().dispatch_many(services, dispatch_context)
+
+        results = {}
+        aggregations_per_queryset = defaultdict(list)
+        for service in services:
+            only_field_names = self.get_used_field_names(service, dispatch_context)
+            try:
+                self.resolve_service_formulas(service, dispatch_context)
+                if only_field_names and "result" not in only_field_names:
+                    results[service.id] = DispatchResult(data={"result": None})
+                    continue
+                with self._improperly_configured_on_invalid_field(service):
+                    queryset, field, model_field, agg_type = self._get_aggregation(
+                        service, dispatch_context
+                    )
+                    if not agg_type.field_is_compatible(field):
+                        raise IncompatibleField()
+            except Exception as e:
+                results[service.id] = e
+                continue
+
+            try:
+                # The compiled query identifies the rows that are aggregated.
+                queryset_key = (service.table_id, str(queryset.query))
+            except EmptyResultSet:
+                queryset_key = (service.table_id, service.id)
+
+            aggregations_per_queryset[queryset_key].append(
+                (service, queryset, field, model_field, agg_type)
+            )
+
+        for aggregations in aggregations_per_queryset.values():
+            try:
+                with transaction.atomic():
+                    results.update(self._aggregate_many(aggregations))
+            except Exception as e:
+                if len(aggregations) == 1:
+                    results[aggregations[0][0].id] = e
+                    continue
+                # Dispatch the services separately, so that only the results of the
+                # services causing the problem are errors.
+                results.update(
+                    super().dispatch_many(
+                        [aggregation[0] for aggregation in aggregations],
+                        dispatch_context,
+                    )
+                )
+
+        return results
+
+    def _aggregate_many(
+        self,
+        aggregations: List[
+            Tuple[LocalBaserowAggregateRows, QuerySet, Field, Any, FieldAggregationType]
+        ],
+    ) -> Dict[int, DispatchResult]:
+        """
+        Computes the aggregations of multiple services over the same queryset with a
+        single query.
+        """
+
+        queryset = aggregations[0][1]
+        aggregation_dict = {}
+        for aggregation in aggregations:
+            field, model_field, agg_type = aggregation[2:]
+            aggregation_dict.update(
+                agg_type._get_aggregation_dict(
+                    queryset, model_field, field, include_agg_type=True
+                )
+            )
+
+        # Like in `FieldAggregationType.aggregate`, apply the annotations some
+        # aggregations depend on.
+        for key, value in aggregation_dict.items():
+            if isinstance(value, AnnotatedAggregation):
+                queryset = queryset.annotate(**value.annotations)
+                aggregation_dict[key] = value.aggregation
+
+        raw_results = queryset.aggregate(**aggregation_dict)
+
+        results = {}
+        for service, queryset, field, model_field, agg_type in aggregations:
+            result = agg_type._compute_final_aggregation(
+                raw_results[f"{field.db_column}_{agg_type.type}_raw"],
+                raw_results.get("total", None),
+            )
+            results[service.id] = self.dispatch_transform(
+                {"data": {"result": result}, "field": field}
+            )
+        return results
 
     def dispatch_transform(
         self,
@@ -2341,9 +2472,58 @@ class LocalBaserowRowsSignalServiceType(
     def start_listening(self, on_event: Callable):
         super().start_listening(on_event)
         self.signal.connect(self._signal_receiver)
+        for service_signal in [post_save, post_delete]:
+            service_signal.connect(
+                self._service_change_receiver,
+                sender=self.model_class,
+                dispatch_uid=f"{self.type}_table_service_ids",
+            )
 
     def stop_listening(self):
         self.signal.disconnect(self._signal_receiver)
+        for service_signal in [post_save, post_delete]:
+            service_signal.disconnect(
+                sender=self.model_class,
+                dispatch_uid=f"{self.type}_table_service_ids",
+            )
+
+    def _get_table_service_ids_cache_key(self, table_id: int) -> str:
+        return f"table_{table_id}__{self.type}_service_ids"
+
+    def get_table_service_ids(self, table_id: int) -> List[int]:
+        """
+        Returns the ids of the services of this type listening to the rows of the
+        given table. The ids are cached, so that the row signals of tables without
+        any trigger don't cost any query.
+
+        :param table_id: The id of the table.
+        :return: The ids of the services of this type using the table.
+        """
+
+        return global_cache.get(
+            self._get_table_service_ids_cache_key(table_id),
+            default=lambda: list(
+                self.model_class.objects.filter(table_id=table_id).values_list(
+                    "id", flat=True
+                )
+            ),
+            timeout=TRIGGER_SERVICE_IDS_CACHE_TTL,
+        )
+
+    def invalidate_table_service_ids(self, table_id: int):
+        def invalidate():
+            global_cache.invalidate(self._get_table_service_ids_cache_key(table_id))
+
+        invalidate()
+        # Also invalidate on commit, in case the ids were cached again before the
+        # change was committed.
+        transaction.on_commit(invalidate)
+
+    def _service_change_receiver(self, sender, instance: Service, **kwargs):
+        # A stale id of a service moved to another table is harmless because the
+        # services are filtered by table again when the signal is handled.
+        if instance.table_id is not None:
+            self.invalidate_table_service_ids(instance.table_id)
 
     def _process_event(self, *args, **kwargs):
         return self.on_event(*args, **kwargs) if callable(self.on_event) else None
@@ -2357,23 +2537,36 @@ class LocalBaserowRowsSignalServiceType(
         model: "GeneratedTableModel",
         **kwargs,
     ):
+        service_ids = self.get_table_service_ids(table.id)
+        if not service_ids:
+            return
+
+        prepared_data = {}
+
         def get_data(service: Service):
-            # Make sure we have an up to date model
-            local_model = model.baserow_table.get_model()
+            # The payload doesn't depend on the service, so the rows are serialized
+            # only once for all the triggers listening to this table.
+            if "result" not in prepared_data:
+                # Make sure we have an up to date model
+                local_model = model.baserow_table.get_model()
+
+                serializer = get_row_serializer_class(
+                    local_model, RowSerializer, is_response=True, user_field_names=True
+                )
 
-            serializer = get_row_serializer_class(
-                local_model, RowSerializer, is_response=True, user_field_names=True
-            )
+                data_to_process = {
+                    "results": serializer(rows, many=True).data,
+                    "has_next_page": False,
+                }
 
-            data_to_process = {
-                "results": serializer(rows, many=True).data,
-                "has_next_page": False,
-            }
+                prepared_data["result"] = self._prepare_result(
+                    local_model, data_to_process
+                )
 
-            return self._prepare_result(local_model, data_to_process)
+            return prepared_data["result"]
 
         self._process_event(
-            self.model_class.objects.filter(table=table),
+            self.model_class.objects.filter(id__in=service_ids, table=table),
             get_data,
             user=user,
         )
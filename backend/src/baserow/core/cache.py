@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import pickle
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from django.conf import settings
 from django.core.cache import cache
@@ -10,6 +14,7 @@ from asgiref.local import Local
 from loguru import logger
 from redis.exceptions import LockNotOwnedError
 
+from baserow.core.middleware import SyncAndAsyncMiddleware
 from baserow.version import VERSION as BASEROW_VERSION
 
 if TYPE_CHECKING:
@@ -121,7 +126,7 @@ class LocalCache:
 local_cache = LocalCache()
 
 
-class LocalCacheMiddleware:
+class LocalCacheMiddleware(SyncAndAsyncMiddleware):
     """
     Django middleware for managing the lifecycle of LocalCache.
 
@@ -134,17 +139,96 @@ class LocalCacheMiddleware:
         'baserow.core.cache.LocalCacheMiddleware'
     """
 
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
+    def sync_call(self, request):
         with local_cache.context():
             return self.get_response(request)
 
+    async def async_call(self, request):
+        with local_cache.context():
+            return await self.get_response(request)
+
 
 SENTINEL = object()
 
 
+class LocalTierCache:
+    """
+    A bounded in-process cache shared by all the threads of the process, used as the
+    first tier of the `GlobalCache`. The entries are evicted in least recently used
+    order when `BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES` is exceeded, and expire after
+    their timeout. The values are stored pickled, so that every hit returns a new
+    copy like the Redis tier does, and a caller can't change the cached value.
+
+    It also remembers the most recently used version keys of the global cache, so
+    that they can be fetched all at once at the beginning of a request.
+    """
+
+    MAX_TRACKED_VERSION_KEYS = 256
+
+    def __init__(self):
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._version_keys: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return settings.BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES > 0
+
+    def get(self, key: str) -> Any:
+        """
+        Returns a copy of the cached value, or `SENTINEL` if the key is not cached or
+        has expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return SENTINEL
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return SENTINEL
+            self._entries.move_to_end(key)
+
+        return pickle.loads(data)  # noqa: S301
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None):
+        """
+        Caches the value for the provided number of seconds, or at most
+        `BASEROW_GLOBAL_CACHE_LOCAL_TTL_SECONDS`.
+        """
+
+        max_entries = settings.BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES
+        max_timeout = settings.BASEROW_GLOBAL_CACHE_LOCAL_TTL_SECONDS
+        timeout = max_timeout if timeout is None else min(timeout, max_timeout)
+        if max_entries <= 0 or timeout <= 0:
+            return
+
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def track_version_keys(self, version_keys: List[str]):
+        with self._lock:
+            for version_key in version_keys:
+                self._version_keys[version_key] = None
+                self._version_keys.move_to_end(version_key)
+            while len(self._version_keys) > self.MAX_TRACKED_VERSION_KEYS:
+                self._version_keys.popitem(last=False)
+
+    def get_tracked_version_keys(self) -> List[str]:
+        with self._lock:
+            return list(self._version_keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._version_keys.clear()
+
+
 class GlobalCache:
     """
     A global cache wrapper around the Django cache system that provides
@@ -165,9 +249,21 @@ class GlobalCache:
 
         # Invalidating a cache key
         global_cache.invalidate("user_123_data")
+
+    If `BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES` is set, the values are also cached in
+    the memory of the process, in front of Redis. Those entries are keyed by the
+    current version of the key, so they're invalidated in the same way. The versions
+    used by a request are fetched from Redis at once, the first time they're needed,
+    and are then reused for at most `VERSIONS_MAX_AGE` seconds, so that a request that
+    only hits the local tier makes one Redis round trip in total.
     """
 
     VERSION_KEY_TTL = 60 * 60 * 24 * 10  # 10 days
+    VERSIONS_MAX_AGE = 1
+    VERSIONS_LOCAL_CACHE_KEY = "global_cache_versions"
+
+    def __init__(self):
+        self.local_tier = LocalTierCache()
 
     def _get_version_cache_key(
         self, key: str, invalidate_key: None | str = None
@@ -185,6 +281,83 @@ class GlobalCache:
 
         return f"{BASEROW_VERSION}_{GLOBAL_CACHE_VERSION}_{key}__current_version"
 
+    def _get_revision_cache_key(self, key: str) -> str:
+        """
+        Generates the key of the revision of a cached value, which is incremented
+        every time the value is changed with `update`. It's only used to invalidate
+        the local tier, because `update` changes the value without changing its
+        version.
+
+        :param key: The base cache key.
+        :return: The cache key of the revision.
+        """
+
+        return f"{BASEROW_VERSION}_{GLOBAL_CACHE_VERSION}_{key}__current_revision"
+
+    def _get_versions(self, version_keys: List[str]) -> Dict[str, int]:
+        """
+        Returns the current value of the provided version keys. The versions are
+        memoized in the local cache of the request for at most `VERSIONS_MAX_AGE`
+        seconds. The first time versions are fetched, the recently used version keys
+        of the process are fetched as well, so that the other lookups of the request
+        usually don't need a Redis round trip.
+
+        :param version_keys: The version or revision keys to get.
+        :return: The version of every key, 0 if it doesn't exist.
+        """
+
+        if not settings.BASEROW_USE_LOCAL_CACHE:
+            # The versions can't be memoized without the local cache, so only the
+            # provided keys are fetched, which is still one Redis round trip.
+            fetched = cache.get_many(version_keys)
+            return {k: fetched.get(k, 0) for k in version_keys}
+
+        memo = local_cache.get(
+            self.VERSIONS_LOCAL_CACHE_KEY,
+            lambda: {"fetched_at": time.monotonic(), "versions": {}},
+        )
+        if time.monotonic() - memo["fetched_at"] > self.VERSIONS_MAX_AGE:
+            memo["fetched_at"] = time.monotonic()
+            memo["versions"] = {}
+
+        versions = memo["versions"]
+        missing = [k for k in version_keys if k not in versions]
+        if missing:
+            keys_to_fetch = set(missing)
+            if not versions:
+                keys_to_fetch.update(self.local_tier.get_tracked_version_keys())
+            fetched = cache.get_many(list(keys_to_fetch))
+            for version_key in keys_to_fetch:
+                versions[version_key] = fetched.get(version_key, 0)
+        self.local_tier.track_version_keys(version_keys)
+
+        return {k: versions[k] for k in version_keys}
+
+    def _set_known_version(self, version_key: str, version: int):
+        """
+        Remembers the new version of a key that has been changed by this process, so
+        that the request sees its own changes.
+        """
+
+        if self.local_tier.enabled and settings.BASEROW_USE_LOCAL_CACHE:
+            memo = local_cache.get(self.VERSIONS_LOCAL_CACHE_KEY)
+            if memo is not None:
+                memo["versions"][version_key] = version
+
+    def _incr_version(self, version_key: str) -> int:
+        try:
+            version = cache.incr(version_key, 1)
+        except ValueError:
+            # If the cache key does not exist, initialize its versioning.
+            version = 1
+            cache.set(
+                version_key,
+                version,
+                timeout=self.VERSION_KEY_TTL,
+            )
+        self._set_known_version(version_key, version)
+        return version
+
     def _get_cache_key_with_version(self, key: str) -> str:
         """
         Generates a cache key with included version.
@@ -237,10 +410,40 @@ class GlobalCache:
         :return: The cached value if it exists; otherwise, the newly set value.
         """
 
-        cache_key_to_use = self._get_versioned_cache_key(key, invalidate_key)
+        if not self.local_tier.enabled:
+            cache_key_to_use = self._get_versioned_cache_key(key, invalidate_key)
+            return self._get_or_set(cache_key_to_use, key, default, timeout)
+
+        version_key = self._get_version_cache_key(key, invalidate_key)
+        revision_key = self._get_revision_cache_key(key)
+        versions = self._get_versions([version_key, revision_key])
+        cache_key_to_use = (
+            f"{BASEROW_VERSION}_{GLOBAL_CACHE_VERSION}_{key}"
+            f"__version_{versions[version_key]}"
+        )
+        local_key = f"{cache_key_to_use}__revision_{versions[revision_key]}"
+
+        cached = self.local_tier.get(local_key)
+        if cached is not SENTINEL:
+            logger.debug(f"Global cache local hit for: {key}")
+            return cached
+
+        cached = self._get_or_set(cache_key_to_use, key, default, timeout)
+        self.local_tier.set(local_key, cached, timeout)
+        return cached
+
+    def _get_or_set(
+        self,
+        cache_key_to_use: str,
+        key: str,
+        default: T | Callable[[], T] | None,
+        timeout: int,
+    ) -> T:
         cached = cache.get(cache_key_to_use, SENTINEL)
 
         if cached is SENTINEL:
+            # The lock makes sure that the concurrent misses of the same key, in all
+            # the processes, compute the value only once.
             use_lock = hasattr(cache, "lock")
             if use_lock:
                 cache_lock = cache.lock(f"{cache_key_to_use}__lock", timeout=10)
@@ -300,6 +503,10 @@ class GlobalCache:
                 new_value,
                 timeout=timeout,
             )
+            if self.local_tier.enabled:
+                # The version doesn't change, so the local tier of every process is
+                # invalidated with the revision instead.
+                self._incr_version(self._get_revision_cache_key(key))
         finally:
             if use_lock:
                 try:
@@ -325,15 +532,7 @@ class GlobalCache:
 
         logger.debug(f"Global cache invalidation for: {key or invalidate_key}")
 
-        try:
-            cache.incr(version_key, 1)
-        except ValueError:
-            # If the cache key does not exist, initialize its versioning.
-            cache.set(
-                version_key,
-                1,
-                timeout=self.VERSION_KEY_TTL,
-            )
+        self._incr_version(version_key)
 
 
 global_cache = GlobalCache()
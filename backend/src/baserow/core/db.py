@@ -25,9 +25,18 @@ from django.db import (
     DEFAULT_DB_ALIAS,
     OperationalError,
     connection,
+    connections,
     transaction,
 )
-from django.db.models import ForeignKey, ManyToManyField, Max, Model, Prefetch, QuerySet
+from django.db.models import (
+    ForeignKey,
+    ManyToManyField,
+    Max,
+    Model,
+    Prefetch,
+    Q,
+    QuerySet,
+)
 from django.db.models.functions import Collate
 from django.db.models.query import ModelIterable
 from django.db.models.sql.query import LOOKUP_SEP
@@ -380,6 +389,102 @@ def get_unique_orders_before_item(
     return new_orders
 
 
+def recalculate_orders_around_item(
+    before: Model,
+    queryset: QuerySet,
+    amount: int = 1,
+    field: str = "order",
+    neighbours: int = 100,
+    min_gap: Decimal = Decimal("0.001"),
+) -> int:
+    """
+    Recalculates the orders of only the items around the provided `before`, so that
+    there is room again for `amount` intermediate orders before it. This can be used
+    instead of `recalculate_full_orders` when `get_unique_orders_before_item` raises
+    `CannotCalculateIntermediateOrder`, because it doesn't rewrite every item.
+
+    The `neighbours` items before and after `before` are spread evenly between the
+    orders of the first items outside of that window, which are not changed. If
+    that doesn't leave a gap of at least `min_gap * amount` between the items, the
+    window is doubled until it does. At the end of the queryset there is no upper
+    bound, so the window always stops growing before containing every item, unless
+    `before` is close to both ends. For example, with `neighbours=1` and item 3 as
+    `before`:
+
+    id     old_order              new_order
+    1      1.00000000000000000000 1.00000000000000000000 (lower bound)
+    2      1.50000000000000000000 1.33333333333333325932
+    3      1.50000000000000000001 1.66666666666666674068
+    4      2.00000000000000000000 2.00000000000000000000 (upper bound)
+
+    :param before: The model instance that needs room for orders before it.
+    :param queryset: The queryset containing all the items that share the order,
+        including the trashed ones.
+    :param amount: The number of orders that must be available before `before`.
+    :param field: The order field name.
+    :param neighbours: The initial number of items to recalculate on both sides.
+    :param min_gap: The minimum gap between two recalculated orders.
+    :return: The number of items of which the order has been recalculated.
+    """
+
+    before_order = getattr(before, field)
+    preceding = queryset.filter(
+        Q(**{f"{field}__lt": before_order})
+        | Q(**{field: before_order, "id__lt": before.id})
+    ).order_by(f"-{field}", "-id")
+    following = queryset.filter(
+        Q(**{f"{field}__gt": before_order})
+        | Q(**{field: before_order, "id__gte": before.id})
+    ).order_by(field, "id")
+    required_gap = min_gap * amount
+
+    while True:
+        preceding_items = list(preceding.values_list("id", field)[: neighbours + 1])
+        following_items = list(following.values_list("id", field)[: neighbours + 1])
+        lower = preceding_items.pop()[1] if len(preceding_items) > neighbours else None
+        upper = following_items.pop()[1] if len(following_items) > neighbours else None
+        items = preceding_items[::-1] + following_items
+
+        if lower is None:
+            # Just like `get_unique_orders_before_item`, the orders are expected to
+            # be positive.
+            lower = Decimal("0")
+        if upper is None:
+            upper = lower + (len(items) + 1) * max(Decimal("1"), required_gap)
+
+        step = (upper - lower) / (len(items) + 1)
+        if step >= required_gap:
+            break
+        neighbours *= 2
+
+    new_orders = []
+    for index, (item_id, _) in enumerate(items, start=1):
+        # Picking the simplest fraction close to the evenly spread order keeps the
+        # denominators small, which leaves the most room for intermediate orders.
+        target = lower + step * index
+        new_order = find_intermediate_order(target - step / 4, target + step / 4)
+        new_orders.append((item_id, round(Decimal(new_order), 20)))
+
+    raw_query = """
+        update {table_name} c1
+            set {order_field} = c2.new_order from (values {values}) c2 (id, new_order)
+        where c2.id = c1.id"""
+    with connection.cursor() as cursor:
+        sql_query = sql.SQL(raw_query).format(
+            order_field=sql.Identifier(field),
+            table_name=sql.Identifier(queryset.model._meta.db_table),
+            values=sql.SQL(", ").join(
+                [
+                    sql.SQL("({}, {})").format(sql.Literal(item_id), sql.Literal(order))
+                    for item_id, order in new_orders
+                ]
+            ),
+        )
+        cursor.execute(sql_query)
+
+    return len(new_orders)
+
+
 def get_highest_order_of_queryset(
     queryset: QuerySet,
     amount: int = 1,
@@ -905,3 +1010,42 @@ def atomic_with_retry_on_deadlock(
         return wrapper
 
     return decorator
+
+
+def _get_database_pools() -> Dict[str, Any]:
+    """
+    Returns the psycopg connection pools that have been created in this process by
+    database alias. The pools are only created when `BASEROW_DB_POOL_ENABLED` is
+    set and the first connection to the database is made.
+    """
+
+    pools = {}
+    for alias in connections:
+        connection_pools = getattr(connections[alias], "_connection_pools", {})
+        if alias in connection_pools:
+            pools[alias] = connection_pools[alias]
+    return pools
+
+
+def get_database_pool_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Returns the statistics of the database connection pools of this process by
+    database alias, like the `pool_size`, `pool_available` and `requests_waiting`
+    values. The counters are not reset when they're read.
+    """
+
+    return {alias: pool.get_stats() for alias, pool in _get_database_pools().items()}
+
+
+def discard_inherited_database_pools():
+    """
+    Forgets the database connection pools that have been inherited from the parent
+    process after a fork. The threads of those pools don't exist in the child
+    process and their connections are still used by the parent, so they're dropped
+    without being closed, and new pools are created when the child connects.
+    """
+
+    for alias in _get_database_pools():
+        connections[alias]._connection_pools.pop(alias, None)
+        # The connection is owned by the pool of the parent process.
+        connections[alias].connection = None
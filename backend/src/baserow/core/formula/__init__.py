@@ -24,10 +24,8 @@ __all__ = [
     BaserowFormulaSyntaxError,
 ]
 
-from baserow.core.formula.parser.formula_execution_visitor import (
-    BaserowFormulaExecutionVisitor,
-)
-from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.formula_compiler import compile_formula
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula  # noqa: F401
 
 
 def resolve_formula(
@@ -52,5 +50,4 @@ def resolve_formula(
     if formula["mode"] == BASEROW_FORMULA_MODE_RAW:
         return formula["formula"]
 
-    tree = get_parse_tree_for_formula(formula["formula"])
-    return BaserowFormulaExecutionVisitor(functions, formula_context).visit(tree)
+    return compile_formula(formula["formula"])(functions, formula_context)
@@ -0,0 +1,148 @@
+from functools import lru_cache
+from typing import Any, Callable, List
+
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    FieldByIdReferencesAreDeprecated,
+    FormulaFunctionTypeDoesNotExist,
+    UnknownOperator,
+)
+from baserow.core.formula.parser.formula_execution_visitor import (
+    BaserowFormulaExecutionVisitor,
+)
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.types import FormulaContext, FunctionCollection
+
+# A compiled formula is called with the functions that can be used in the formula and
+# the context to resolve it against, and returns the result of the formula.
+CompiledFormula = Callable[[FunctionCollection, FormulaContext], Any]
+
+COMPILED_FORMULA_CACHE_SIZE = 4096
+
+BINARY_OPERATORS = [
+    ("PLUS", "add"),
+    ("MINUS", "minus"),
+    ("SLASH", "divide"),
+    ("EQUAL", "equal"),
+    ("BANG_EQUAL", "not_equal"),
+    ("STAR", "multiply"),
+    ("GT", "greater_than"),
+    ("LT", "less_than"),
+    ("GTE", "greater_than_or_equal"),
+    ("LTE", "less_than_or_equal"),
+    ("AMP_AMP", "and"),
+    ("PIPE_PIPE", "or"),
+]
+
+
+def _constant(value: Any) -> CompiledFormula:
+    return lambda functions, context: value
+
+
+def _raise(exception: Exception) -> CompiledFormula:
+    def raise_exception(functions, context):
+        raise exception
+
+    return raise_exception
+
+
+class BaserowFormulaCompilerVisitor(BaserowFormulaVisitor):
+    """
+    Compiles a parse tree into a tree of closures that produces the same result as
+    the `BaserowFormulaExecutionVisitor` would for that tree. The compiled formula
+    doesn't depend on the functions nor on the context, so it can be reused for every
+    resolution of the same formula without parsing it again.
+
+    Functions are looked up by name when the compiled formula is called, so that it
+    keeps using the functions that are registered at that moment.
+    """
+
+    def visitRoot(self, ctx: BaserowFormula.RootContext):
+        return ctx.expr().accept(self)
+
+    def visitStringLiteral(self, ctx: BaserowFormula.StringLiteralContext):
+        literal_without_outer_quotes = ctx.getText()[1:-1]
+        if ctx.SINGLEQ_STRING_LITERAL() is not None:
+            literal = literal_without_outer_quotes.replace("\\'", "'")
+        else:
+            literal = literal_without_outer_quotes.replace('\\"', '"')
+        return _constant(literal)
+
+    def visitDecimalLiteral(self, ctx: BaserowFormula.DecimalLiteralContext):
+        return _constant(float(ctx.getText()))
+
+    def visitIntegerLiteral(self, ctx: BaserowFormula.IntegerLiteralContext):
+        return _constant(int(ctx.getText()))
+
+    def visitBooleanLiteral(self, ctx: BaserowFormula.BooleanLiteralContext):
+        return _constant(ctx.TRUE() is not None)
+
+    def visitBrackets(self, ctx: BaserowFormula.BracketsContext):
+        return ctx.expr().accept(self)
+
+    def visitLeftWhitespaceOrComments(
+        self, ctx: BaserowFormula.LeftWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitRightWhitespaceOrComments(
+        self, ctx: BaserowFormula.RightWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        function_name = ctx.func_name().getText().lower()
+        return self._compile_func(ctx.expr(), function_name)
+
+    def visitBinaryOp(self, ctx: BaserowFormula.BinaryOpContext):
+        for token_name, op in BINARY_OPERATORS:
+            if getattr(ctx, token_name)():
+                return self._compile_func(ctx.expr(), op)
+
+        return _raise(UnknownOperator(ctx.getText()))
+
+    def visitFieldByIdReference(self, ctx: BaserowFormula.FieldByIdReferenceContext):
+        return _raise(FieldByIdReferencesAreDeprecated())
+
+    def visitChildren(self, node):
+        # Nodes that aren't supported by runtime formulas are still resolved exactly
+        # like the execution visitor does.
+        def execute(functions, context):
+            return BaserowFormulaExecutionVisitor(functions, context).visit(node)
+
+        return execute
+
+    def _compile_func(self, function_argument_expressions, function_name: str):
+        compiled_args: List[CompiledFormula] = [
+            expr.accept(self) for expr in function_argument_expressions
+        ]
+
+        def call_function(functions: FunctionCollection, context: FormulaContext):
+            args = [compiled_arg(functions, context) for compiled_arg in compiled_args]
+            try:
+                formula_function_type = functions.get(function_name)
+            except FormulaFunctionTypeDoesNotExist:
+                raise BaserowFormulaSyntaxError(
+                    f"{function_name} is not a valid function"
+                )
+            args_parsed = formula_function_type.parse_args(args)
+            return formula_function_type.execute(context, args_parsed)
+
+        return call_function
+
+
+@lru_cache(maxsize=COMPILED_FORMULA_CACHE_SIZE)
+def compile_formula(formula: str) -> CompiledFormula:
+    """
+    Parses and compiles the provided formula. The result is cached per process, so
+    that resolving the same formula many times, for example for every record of a
+    repeat element or for every item of an iterator node, only parses it once.
+
+    :param formula: The formula to compile.
+    :return: A callable resolving the formula given the functions and the context.
+    :raises BaserowFormulaSyntaxError: If the formula is invalid.
+    """
+
+    tree = get_parse_tree_for_formula(formula)
+    return BaserowFormulaCompilerVisitor().visit(tree)
@@ -5,6 +5,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional
 
 from loguru import logger
+from pydantic import BaseModel
 from pydantic_ai.messages import UserContent
 
 from baserow.core.models import Workspace
@@ -258,6 +259,10 @@ class FileHandler:
                 )
 
 
+class BatchPromptAnswers(BaseModel):
+    answers: list[str]
+
+
 class GenerativeAIModelType(Instance):
     @cached_property
     def file_handler(self) -> FileHandler | None:
@@ -275,6 +280,15 @@ class GenerativeAIModelType(Instance):
 
         return self.file_handler is not None
 
+    @property
+    def supports_batch_prompts(self) -> bool:
+        """
+        Return True if multiple independent text prompts can be answered with a
+        single request to the model using `prompt_batch`.
+        """
+
+        return True
+
     def prepare_files(
         self,
         files: list["AIFile"],
@@ -584,6 +598,73 @@ class GenerativeAIModelType(Instance):
         except Exception as e:
             raise GenerativeAIPromptError(get_user_friendly_error_message(e)) from e
 
+    def prompt_batch(
+        self,
+        model: str,
+        prompts: list[str],
+        workspace: Optional[Workspace] = None,
+        temperature: Optional[float] = None,
+        settings_override: Optional[dict[str, Any]] = None,
+        output_type: Any = None,
+    ) -> list[Any]:
+        """
+        Answers multiple independent text prompts with a single request to the model,
+        which saves the per request overhead and the repeated instructions when many
+        short prompts must be answered. The model is asked to return the answers as a
+        structured list in the same order as the prompts.
+
+        :param model: The model name to use.
+        :param prompts: The text prompts to answer.
+        :param workspace: The workspace for settings resolution.
+        :param temperature: Optional temperature override.
+        :param settings_override: Optional provider settings override.
+        :param output_type: Either None for plain text answers, or a list of strings
+            of which every answer must select one. Structured output types are not
+            supported.
+        :return: The answers, in the same order as the prompts.
+        :raises GenerativeAIPromptError: If the model doesn't return exactly one
+            answer per prompt.
+        """
+
+        import json
+
+        from .exceptions import GenerativeAIPromptError
+
+        instructions = (
+            f"Answer each of the following {len(prompts)} prompts independently of "
+            f"each other. Return exactly {len(prompts)} answers, in the same order as "
+            f"the prompts."
+        )
+        if self._is_choices(output_type):
+            instructions += (
+                f" Every answer must be exactly one option from: "
+                f"{json.dumps(output_type)}"
+            )
+        numbered_prompts = "\n\n".join(
+            f'<prompt number="{number}">\n{prompt}\n</prompt>'
+            for number, prompt in enumerate(prompts, start=1)
+        )
+
+        result = self.prompt(
+            model,
+            f"{instructions}\n\n{numbered_prompts}",
+            workspace=workspace,
+            temperature=temperature,
+            settings_override=settings_override,
+            output_type=BatchPromptAnswers,
+        )
+
+        if len(result.answers) != len(prompts):
+            raise GenerativeAIPromptError(
+                f"Expected {len(prompts)} answers, but the model returned "
+                f"{len(result.answers)}."
+            )
+
+        if self._is_choices(output_type):
+            return [self._resolve_choices(a, output_type) for a in result.answers]
+
+        return result.answers
+
     def get_settings_serializer(self) -> type:
         """
         Return the DRF serializer class for this provider's workspace-level
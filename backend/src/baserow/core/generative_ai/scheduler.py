@@ -0,0 +1,145 @@
+import random
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+SCHEDULER_CACHE_KEY_PREFIX = "generative_ai_scheduler"
+
+# A slot is released when the request finishes, but it expires automatically after
+# this many seconds so that a crashed worker can't hold it forever.
+SLOT_LEASE_SECONDS = 10 * 60
+
+TOKEN_BUDGET_WINDOW_SECONDS = 60
+
+MIN_POLL_INTERVAL_SECONDS = 0.05
+MAX_POLL_INTERVAL_SECONDS = 1.0
+
+
+def estimate_tokens(*texts: str) -> int:
+    """
+    Roughly estimates the number of tokens that the provided texts consume. Providers
+    don't expose their tokenizer, but about four characters per token is a good
+    enough approximation to budget the requests.
+    """
+
+    return max(1, sum(len(text) for text in texts) // 4)
+
+
+class GenerativeAIRequestScheduler:
+    """
+    Schedules the requests made to the provider of a generative AI model type. The
+    budgets are shared by all the processes of the instance because the state is
+    kept in the cache:
+
+    - At most `BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS` requests run at the
+      same time per model type.
+    - At most `BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS_PER_WORKSPACE` of those
+      requests belong to the same workspace, so that one workspace generating
+      values for a big table can't starve the others.
+    - At most `BASEROW_GENERATIVE_AI_MAX_TOKENS_PER_MINUTE` estimated tokens are
+      sent per model type per minute.
+
+    A limit of 0 disables the corresponding budget. Every request waits until all
+    budgets allow it to run.
+    """
+
+    def __init__(self, model_type: str):
+        self.model_type = model_type
+        self.key_prefix = f"{SCHEDULER_CACHE_KEY_PREFIX}_{model_type}"
+
+    @contextmanager
+    def reserve(
+        self, workspace_id: Optional[int] = None, tokens: int = 0
+    ) -> Iterator[None]:
+        """
+        Waits until a request of the provided workspace consuming the provided number
+        of tokens can be made and keeps the concurrency slots reserved for the
+        duration of the context.
+
+        :param workspace_id: The id of the workspace making the request.
+        :param tokens: The estimated number of tokens of the request.
+        """
+
+        reserved_slots = []
+        try:
+            # The workspace slot is reserved first so that a workspace waiting on
+            # its own budget doesn't hold a global slot that others could use.
+            if workspace_id is not None:
+                reserved_slots.append(
+                    self._reserve_slot(
+                        f"{self.key_prefix}_workspace_{workspace_id}_slot",
+                        settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS_PER_WORKSPACE,
+                    )
+                )
+            reserved_slots.append(
+                self._reserve_slot(
+                    f"{self.key_prefix}_slot",
+                    settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS,
+                )
+            )
+            self._consume_tokens(tokens)
+            yield
+        finally:
+            cache.delete_many([slot for slot in reserved_slots if slot is not None])
+
+    def _reserve_slot(self, key_prefix: str, limit: int) -> Optional[str]:
+        """
+        Waits until one of the `limit` slots with the provided key prefix is free and
+        reserves it.
+
+        :return: The cache key of the reserved slot, or None if there is no limit.
+        """
+
+        if limit <= 0:
+            return None
+
+        poll_interval = MIN_POLL_INTERVAL_SECONDS
+        while True:
+            # Starting at a random slot spreads the waiting requests over the slots
+            # instead of having all of them compete for the first one.
+            offset = random.randrange(limit)  # nosec
+            for index in range(limit):
+                key = f"{key_prefix}_{(offset + index) % limit}"
+                if cache.add(key, True, timeout=SLOT_LEASE_SECONDS):
+                    return key
+            poll_interval = self._sleep(poll_interval)
+
+    def _consume_tokens(self, tokens: int):
+        """
+        Waits until the provided number of tokens fits in the token budget of the
+        current window and consumes them.
+        """
+
+        limit = settings.BASEROW_GENERATIVE_AI_MAX_TOKENS_PER_MINUTE
+        if limit <= 0 or tokens <= 0:
+            return
+
+        # A request that is bigger than the whole budget must be able to run
+        # eventually, so it consumes the full budget of a window instead.
+        tokens = min(tokens, limit)
+        poll_interval = MIN_POLL_INTERVAL_SECONDS
+        while True:
+            window = int(time.time() // TOKEN_BUDGET_WINDOW_SECONDS)
+            key = f"{self.key_prefix}_tokens_{window}"
+            cache.add(key, 0, timeout=TOKEN_BUDGET_WINDOW_SECONDS * 2)
+            try:
+                used = cache.incr(key, tokens)
+            except ValueError:
+                # The key expired in between, which means that the window is over.
+                continue
+
+            if used <= limit:
+                return
+
+            try:
+                cache.decr(key, tokens)
+            except ValueError:
+                pass
+            poll_interval = self._sleep(poll_interval)
+
+    def _sleep(self, poll_interval: float) -> float:
+        time.sleep(poll_interval)
+        return min(poll_interval * 2, MAX_POLL_INTERVAL_SECONDS)
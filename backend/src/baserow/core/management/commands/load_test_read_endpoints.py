@@ -0,0 +1,165 @@
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+
+import httpx
+
+
+@dataclass
+class LoadTestResult:
+    concurrency: int
+    requests: int
+    errors: int
+    duration: float
+    latencies: List[float]
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.duration if self.duration else 0.0
+
+    def get_latency_percentile(self, percentile: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[percentile - 1]
+
+
+async def run_load_test(
+    urls: List[str],
+    concurrency: int,
+    duration: float,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> LoadTestResult:
+    """
+    Lets the provided number of clients request the urls in a loop, one request at
+    a time each, until the duration has elapsed.
+
+    :param urls: The urls that are requested in turns by every client.
+    :param concurrency: The number of concurrent clients.
+    :param duration: The number of seconds the clients keep making requests.
+    :param headers: The headers of every request, for example the authorization.
+    :param timeout: The number of seconds after which a request is an error.
+    :param transport: An optional httpx transport, mostly useful in tests.
+    :return: The number of requests and errors, and the latency of every
+        successful request.
+    """
+
+    latencies = []
+    counts = {"requests": 0, "errors": 0}
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+
+    async with httpx.AsyncClient(
+        headers=headers, timeout=timeout, limits=limits, transport=transport
+    ) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+
+        async def make_requests(client_index: int):
+            index = client_index
+            while time.perf_counter() < deadline:
+                url = urls[index % len(urls)]
+                index += 1
+                request_started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    failed = response.status_code >= 400
+                except httpx.HTTPError:
+                    failed = True
+                counts["requests"] += 1
+                if failed:
+                    counts["errors"] += 1
+                else:
+                    latencies.append(time.perf_counter() - request_started)
+
+        await asyncio.gather(*(make_requests(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return LoadTestResult(
+        concurrency=concurrency,
+        requests=counts["requests"],
+        errors=counts["errors"],
+        duration=elapsed,
+        latencies=latencies,
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the throughput and latency of read endpoints, like listing the "
+        "rows of a table or a public view, at different numbers of concurrent "
+        "clients. Run it against a running Baserow backend."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "urls",
+            nargs="+",
+            help="The full urls that are requested, for example "
+            "http://localhost:8000/api/database/rows/table/1/.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            nargs="+",
+            type=int,
+            default=[100, 500, 1000],
+            help="The numbers of concurrent clients to measure with.",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=10,
+            help="The number of seconds to measure every concurrency for.",
+        )
+        parser.add_argument(
+            "--token",
+            help="A database token used to authenticate the requests.",
+        )
+        parser.add_argument(
+            "--jwt",
+            help="A JWT access token used to authenticate the requests.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30,
+            help="The number of seconds after which a request is counted as error.",
+        )
+
+    def handle(self, *args, **options):
+        if options["token"] and options["jwt"]:
+            raise CommandError("Only one of --token and --jwt can be provided.")
+
+        headers = {}
+        if options["token"]:
+            headers["Authorization"] = f"Token {options['token']}"
+        elif options["jwt"]:
+            headers["Authorization"] = f"JWT {options['jwt']}"
+
+        self.stdout.write(
+            f"{'clients':>8} {'requests':>9} {'errors':>7} {'req/s':>9} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for concurrency in options["concurrency"]:
+            result = asyncio.run(
+                run_load_test(
+                    options["urls"],
+                    concurrency,
+                    options["duration"],
+                    headers=headers,
+                    timeout=options["timeout"],
+                )
+            )
+            self.stdout.write(
+                f"{result.concurrency:>8} {result.requests:>9} {result.errors:>7} "
+                f"{result.throughput:>9.1f} "
+                f"{result.get_latency_percentile(50) * 1000:>8.1f} "
+                f"{result.get_latency_percentile(95) * 1000:>8.1f} "
+                f"{result.get_latency_percentile(99) * 1000:>8.1f}"
+            )
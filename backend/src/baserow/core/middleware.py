@@ -0,0 +1,45 @@
+from typing import Awaitable, Callable, Union
+
+from django.http import HttpRequest, HttpResponse
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+
+class SyncAndAsyncMiddleware:
+    """
+    Base class of the middlewares that support both the synchronous and the
+    asynchronous request handling. If all the middlewares support it, Django doesn't
+    have to switch to a thread for every request when Baserow is served with ASGI,
+    which allows the asynchronous views to not block a thread at all. The subclasses
+    implement `sync_call` and `async_call`, the right one is called depending on
+    whether the next middleware or view is asynchronous.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[
+            [HttpRequest], Union[HttpResponse, Awaitable[HttpResponse]]
+        ],
+    ):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if self.async_mode:
+            return self.async_call(request)
+        return self.sync_call(request)
+
+    def sync_call(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError(
+            "Each middleware must implement the sync_call method."
+        )
+
+    async def async_call(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError(
+            "Each middleware must implement the async_call method."
+        )
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0114_alter_workspaceinvitation_message"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userfile",
+            name="thumbnails_queued",
+            field=models.BooleanField(
+                default=False,
+                help_text=(
+                    "If True, then the thumbnails of the image have not been "
+                    "generated yet because they're queued for generation in the "
+                    "background."
+                ),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userfile",
+            index=models.Index(
+                condition=models.Q(("thumbnails_queued", True)),
+                fields=["sha256_hash", "id"],
+                name="userfile_thumbnails_queued_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,523 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional, Type
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+from loguru import logger
+
+from baserow.core.psycopg import sql
+
+LEGACY_PARTITION_SUFFIX = "_legacy"
+DEFAULT_PARTITION_SUFFIX = "_default"
+
+
+@dataclass
+class TimeRangePartition:
+    name: str
+    # `None` means that the partition is unbounded on that side, which is the case
+    # for the lower bound of the legacy partition and for the default partition.
+    lower_bound: Optional[datetime]
+    upper_bound: Optional[datetime]
+    is_default: bool = False
+
+
+def _month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    month_index = value.month - 1 + months
+    return value.replace(
+        year=value.year + month_index // 12, month=month_index % 12 + 1
+    )
+
+
+def _parse_bound(bound: str) -> Optional[datetime]:
+    if bound in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(bound.strip("'"))
+
+
+class PartitionHandler:
+    """
+    Manages tables that are range partitioned by month on a timestamp column. Data
+    that existed before a table was converted lives in a single legacy partition,
+    every month after that gets its own partition, and a default partition catches
+    rows for which no partition exists yet. Retention can then drop partitions that
+    only contain expired rows instead of deleting those rows one batch at a time.
+    """
+
+    @classmethod
+    def get_partition_name(cls, model: Type[models.Model], month: datetime) -> str:
+        """
+        Returns the name of the partition table containing the rows of the month
+        that the provided datetime is in.
+        """
+
+        return f"{model._meta.db_table}_p{month:%Y%m}"
+
+    @classmethod
+    def is_partitioned(
+        cls,
+        model: Type[models.Model],
+        db_connection: Optional[BaseDatabaseWrapper] = None,
+    ) -> bool:
+        """
+        Checks whether the table of the provided model is a partitioned table. Tables
+        are only partitioned by migrations, so this is for example not the case for
+        a test database created without running the migrations.
+
+        :param model: The model of the table to check.
+        :param db_connection: The connection to use, the default one if not provided.
+        """
+
+        with (db_connection or connection).cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT 1 FROM pg_partitioned_table pt
+                JOIN pg_class c ON c.oid = pt.partrelid
+                WHERE c.relname = %s AND c.relnamespace = current_schema()::regnamespace
+                """,
+                [model._meta.db_table],
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def get_partitions(
+        cls,
+        model: Type[models.Model],
+        db_connection: Optional[BaseDatabaseWrapper] = None,
+    ) -> List[TimeRangePartition]:
+        """
+        Returns all the partitions of the partitioned table of the provided model
+        ordered by their lower bound, with the default partition last.
+
+        :param model: The model of the partitioned table.
+        :param db_connection: The connection to use, the default one if not provided.
+        """
+
+        with (db_connection or connection).cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s
+                AND parent.relnamespace = current_schema()::regnamespace
+                """,
+                [model._meta.db_table],
+            )
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, bound in rows:
+            if bound == "DEFAULT":
+                partitions.append(TimeRangePartition(name, None, None, True))
+                continue
+            match = re.match(r"FOR VALUES FROM \((.+)\) TO \((.+)\)", bound)
+            lower, upper = match.groups()
+            partitions.append(
+                TimeRangePartition(name, _parse_bound(lower), _parse_bound(upper))
+            )
+
+        min_datetime = datetime.min.replace(tzinfo=timezone.utc)
+        return sorted(
+            partitions, key=lambda p: (p.is_default, p.lower_bound or min_datetime)
+        )
+
+    @classmethod
+    def convert_to_time_partitioned_table(
+        cls,
+        schema_editor: BaseDatabaseSchemaEditor,
+        model: Type[models.Model],
+        partition_field_name: str,
+    ):
+        """
+        Converts the existing table of the provided model into a table that is range
+        partitioned by month on the provided timestamp field, without copying the
+        existing data. The existing table is renamed and attached as the legacy
+        partition containing everything before the start of next month. The primary
+        key of the partitioned table becomes (id, timestamp) because Postgres requires
+        the partition key to be part of it, while the id keeps being generated by a
+        sequence so that it stays unique for Django. The indexes and foreign keys of
+        the model are created on the partitioned table, so that every partition gets
+        them. Meant to be called from a non atomic `RunPython` migration operation.
+
+        The legacy table can be big, so everything that requires scanning it is done
+        up front without blocking writes: a unique index matching the new primary key
+        is built concurrently, and a check constraint matching the bounds of the
+        legacy partition is validated. Attaching the legacy partition then doesn't
+        have to scan it nor build any index while the table is locked. The legacy
+        table keeps its original primary key next to the new one.
+
+        :param schema_editor: The schema editor of the migration.
+        :param model: The (historical) model of the table to convert.
+        :param partition_field_name: The name of the timestamp field to partition on.
+        """
+
+        db_connection = schema_editor.connection
+        if cls.is_partitioned(model, db_connection):
+            return
+
+        table = model._meta.db_table
+        legacy_table = f"{table}{LEGACY_PARTITION_SUFFIX}"
+        pk_column = model._meta.pk.column
+        partition_column = model._meta.get_field(partition_field_name).column
+        sequence = f"{table}_{pk_column}_partitioned_seq"
+        pkey = f"{table}_partitioned_pkey"
+        legacy_pkey_index = f"{pkey}{LEGACY_PARTITION_SUFFIX}"
+        bounds_check = f"{table}_partition_bounds_check"
+        legacy_upper_bound = _add_months(_month_start(datetime.now(tz=timezone.utc)), 1)
+
+        def execute(query, params=None):
+            with db_connection.cursor() as cursor:
+                cursor.execute(query, params)
+
+        # A table created from the current models instead of the migrations already
+        # has a unique constraint named like the new primary key.
+        execute(
+            sql.SQL("ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {pkey}").format(
+                table=sql.Identifier(table), pkey=sql.Identifier(pkey)
+            )
+        )
+        # Concurrent index creation is only possible outside a transaction, which is
+        # for example not the case in the tests.
+        concurrently = sql.SQL("" if db_connection.in_atomic_block else "CONCURRENTLY")
+        execute(
+            sql.SQL(
+                "CREATE UNIQUE INDEX {concurrently} IF NOT EXISTS {name} "
+                "ON {table} ({pk_column}, {partition_column})"
+            ).format(
+                concurrently=concurrently,
+                name=sql.Identifier(legacy_pkey_index),
+                table=sql.Identifier(table),
+                pk_column=sql.Identifier(pk_column),
+                partition_column=sql.Identifier(partition_column),
+            )
+        )
+        # The primary key of the partitioned table only reuses an index of a partition
+        # if it backs a constraint.
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_constraint WHERE conname = %s "
+                "AND conrelid = %s::regclass",
+                [legacy_pkey_index, table],
+            )
+            has_legacy_pkey_constraint = cursor.fetchone() is not None
+        if not has_legacy_pkey_constraint:
+            execute(
+                sql.SQL(
+                    "ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {name}"
+                ).format(
+                    table=sql.Identifier(table), name=sql.Identifier(legacy_pkey_index)
+                )
+            )
+        # Adding the constraint as not valid only briefly locks the table, and the
+        # validation doesn't block the reads and writes.
+        execute(
+            sql.SQL("ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check}").format(
+                table=sql.Identifier(table), check=sql.Identifier(bounds_check)
+            )
+        )
+        execute(
+            sql.SQL(
+                "ALTER TABLE {table} ADD CONSTRAINT {check} CHECK "
+                "({partition_column} IS NOT NULL AND {partition_column} < "
+                "{upper_bound}) NOT VALID"
+            ).format(
+                table=sql.Identifier(table),
+                check=sql.Identifier(bounds_check),
+                partition_column=sql.Identifier(partition_column),
+                upper_bound=sql.Literal(legacy_upper_bound.isoformat()),
+            )
+        )
+        execute(
+            sql.SQL("ALTER TABLE {table} VALIDATE CONSTRAINT {check}").format(
+                table=sql.Identifier(table), check=sql.Identifier(bounds_check)
+            )
+        )
+
+        with transaction.atomic(using=db_connection.alias):
+            execute(
+                sql.SQL("ALTER TABLE {table} RENAME TO {legacy_table}").format(
+                    table=sql.Identifier(table),
+                    legacy_table=sql.Identifier(legacy_table),
+                )
+            )
+            cls._rename_legacy_indexes(db_connection, legacy_table)
+
+            execute(
+                sql.SQL(
+                    "CREATE TABLE {table} (LIKE {legacy_table} INCLUDING DEFAULTS "
+                    "INCLUDING CONSTRAINTS) PARTITION BY RANGE ({partition_column})"
+                ).format(
+                    table=sql.Identifier(table),
+                    legacy_table=sql.Identifier(legacy_table),
+                    partition_column=sql.Identifier(partition_column),
+                )
+            )
+            # The bounds check has been copied together with the other constraints,
+            # but it's only needed to attach the legacy partition.
+            execute(
+                sql.SQL("ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check}").format(
+                    table=sql.Identifier(table), check=sql.Identifier(bounds_check)
+                )
+            )
+            execute(
+                sql.SQL(
+                    "ALTER TABLE {table} ADD CONSTRAINT {pkey} "
+                    "PRIMARY KEY ({pk_column}, {partition_column})"
+                ).format(
+                    table=sql.Identifier(table),
+                    pkey=sql.Identifier(pkey),
+                    pk_column=sql.Identifier(pk_column),
+                    partition_column=sql.Identifier(partition_column),
+                )
+            )
+
+            # The sequence of the legacy table is owned by it and would be dropped
+            # together with it, so the partitioned table gets its own sequence that
+            # continues where the legacy one stopped.
+            execute(
+                sql.SQL(
+                    "CREATE SEQUENCE {sequence} OWNED BY {table}.{pk_column}"
+                ).format(
+                    sequence=sql.Identifier(sequence),
+                    table=sql.Identifier(table),
+                    pk_column=sql.Identifier(pk_column),
+                )
+            )
+            execute(
+                sql.SQL(
+                    "SELECT setval({sequence}, COALESCE((SELECT MAX({pk_column}) "
+                    "FROM {legacy_table}), 0) + 1, false)"
+                ).format(
+                    sequence=sql.Literal(sequence),
+                    pk_column=sql.Identifier(pk_column),
+                    legacy_table=sql.Identifier(legacy_table),
+                )
+            )
+            execute(
+                sql.SQL(
+                    "ALTER TABLE {table} ALTER COLUMN {pk_column} "
+                    "SET DEFAULT nextval({sequence})"
+                ).format(
+                    table=sql.Identifier(table),
+                    pk_column=sql.Identifier(pk_column),
+                    sequence=sql.Literal(sequence),
+                )
+            )
+            # Partitions can't have their own identity column.
+            execute(
+                sql.SQL(
+                    "ALTER TABLE {legacy_table} ALTER COLUMN {pk_column} "
+                    "DROP IDENTITY IF EXISTS"
+                ).format(
+                    legacy_table=sql.Identifier(legacy_table),
+                    pk_column=sql.Identifier(pk_column),
+                )
+            )
+
+            # The indexes and foreign keys are created on the partitioned table, the
+            # equivalent ones of the legacy table are attached to them instead of
+            # being created again when it's attached as a partition.
+            for field in model._meta.local_fields:
+                for statement in schema_editor._field_indexes_sql(model, field):
+                    schema_editor.execute(statement)
+                if field.remote_field and field.db_constraint:
+                    schema_editor.execute(
+                        schema_editor._create_fk_sql(
+                            model, field, "_fk_%(to_table)s_%(to_column)s"
+                        )
+                    )
+            for index in model._meta.indexes:
+                schema_editor.execute(index.create_sql(model, schema_editor))
+
+            execute(
+                sql.SQL(
+                    "ALTER TABLE {table} ATTACH PARTITION {legacy_table} "
+                    "FOR VALUES FROM (MINVALUE) TO ({upper_bound})"
+                ).format(
+                    table=sql.Identifier(table),
+                    legacy_table=sql.Identifier(legacy_table),
+                    upper_bound=sql.Literal(legacy_upper_bound.isoformat()),
+                )
+            )
+            execute(
+                sql.SQL("ALTER TABLE {legacy_table} DROP CONSTRAINT {check}").format(
+                    legacy_table=sql.Identifier(legacy_table),
+                    check=sql.Identifier(bounds_check),
+                )
+            )
+            execute(
+                sql.SQL(
+                    "CREATE TABLE {default_table} PARTITION OF {table} DEFAULT"
+                ).format(
+                    default_table=sql.Identifier(f"{table}{DEFAULT_PARTITION_SUFFIX}"),
+                    table=sql.Identifier(table),
+                )
+            )
+
+            cls.create_future_partitions(
+                model, partition_field_name, db_connection=db_connection
+            )
+
+    @classmethod
+    def _rename_legacy_indexes(
+        cls, db_connection: BaseDatabaseWrapper, legacy_table: str
+    ):
+        """
+        Frees up the names of the indexes of the legacy table, so that they can be
+        created on the partitioned table. The indexes backing a constraint keep
+        their name, the partitioned table gets its own primary key.
+        """
+
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT i.relname FROM pg_index x
+                JOIN pg_class i ON i.oid = x.indexrelid
+                JOIN pg_class t ON t.oid = x.indrelid
+                WHERE t.relname = %s AND t.relnamespace = current_schema()::regnamespace
+                AND NOT EXISTS (
+                    SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid
+                )
+                """,
+                [legacy_table],
+            )
+            index_names = [name for (name,) in cursor.fetchall()]
+
+            max_length = db_connection.ops.max_name_length()
+            for name in index_names:
+                if name.endswith(LEGACY_PARTITION_SUFFIX):
+                    continue
+                legacy_name = (
+                    f"{name[: max_length - len(LEGACY_PARTITION_SUFFIX)]}"
+                    f"{LEGACY_PARTITION_SUFFIX}"
+                )
+                cursor.execute(
+                    sql.SQL("ALTER INDEX {name} RENAME TO {legacy_name}").format(
+                        name=sql.Identifier(name),
+                        legacy_name=sql.Identifier(legacy_name),
+                    )
+                )
+
+    @classmethod
+    def create_future_partitions(
+        cls,
+        model: Type[models.Model],
+        partition_field_name: str,
+        months_ahead: Optional[int] = None,
+        db_connection: Optional[BaseDatabaseWrapper] = None,
+    ) -> List[str]:
+        """
+        Makes sure that a monthly partition exists for the current month and the
+        provided number of months ahead. Partitions are created contiguously after
+        the last existing one. If rows for a missing month have already ended up in
+        the default partition, the partition can't be created anymore and the
+        creation stops until those rows are expired.
+
+        :param model: The model of the partitioned table.
+        :param partition_field_name: The name of the timestamp field that the table
+            is partitioned on.
+        :param months_ahead: The number of months after the current one to create
+            partitions for. Defaults to the `BASEROW_PARTITIONS_PRECREATE_MONTHS`
+            setting.
+        :param db_connection: The connection to use, the default one if not provided.
+        :return: The names of the newly created partitions.
+        """
+
+        if months_ahead is None:
+            months_ahead = settings.BASEROW_PARTITIONS_PRECREATE_MONTHS
+
+        db_connection = db_connection or connection
+        if not cls.is_partitioned(model, db_connection):
+            return []
+
+        partitions = cls.get_partitions(model, db_connection)
+        upper_bounds = [p.upper_bound for p in partitions if p.upper_bound]
+        current_month = _month_start(datetime.now(tz=timezone.utc))
+        month = max(upper_bounds) if upper_bounds else current_month
+        default_partition = next((p for p in partitions if p.is_default), None)
+
+        table = model._meta.db_table
+        partition_column = model._meta.get_field(partition_field_name).column
+        created = []
+        with db_connection.cursor() as cursor:
+            while month <= _add_months(current_month, months_ahead):
+                next_month = _add_months(month, 1)
+                if default_partition is not None:
+                    cursor.execute(
+                        sql.SQL(
+                            "SELECT 1 FROM {default_table} WHERE {column} >= %s "
+                            "AND {column} < %s LIMIT 1"
+                        ).format(
+                            default_table=sql.Identifier(default_partition.name),
+                            column=sql.Identifier(partition_column),
+                        ),
+                        [month, next_month],
+                    )
+                    if cursor.fetchone() is not None:
+                        logger.warning(
+                            "Could not create the {} partition of {} because the "
+                            "default partition already contains rows of that month.",
+                            f"{month:%Y-%m}",
+                            table,
+                        )
+                        break
+
+                name = cls.get_partition_name(model, month)
+                cursor.execute(
+                    sql.SQL(
+                        "CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                        "FOR VALUES FROM ({lower}) TO ({upper})"
+                    ).format(
+                        name=sql.Identifier(name),
+                        table=sql.Identifier(table),
+                        lower=sql.Literal(month.isoformat()),
+                        upper=sql.Literal(next_month.isoformat()),
+                    )
+                )
+                created.append(name)
+                month = next_month
+
+        return created
+
+    @classmethod
+    def drop_partitions_older_than(
+        cls, model: Type[models.Model], cutoff: datetime
+    ) -> int:
+        """
+        Drops all the partitions of the table of the provided model that only contain
+        rows older than the cutoff. Rows older than the cutoff in the remaining
+        partitions must still be deleted separately.
+
+        :param model: The model of the partitioned table.
+        :param cutoff: The date and time before which all rows may be deleted.
+        :return: The number of dropped partitions. Always zero if the table is not
+            partitioned.
+        """
+
+        if not cls.is_partitioned(model):
+            return 0
+
+        expired_partitions = [
+            partition
+            for partition in cls.get_partitions(model)
+            if partition.upper_bound is not None and partition.upper_bound <= cutoff
+        ]
+        with connection.cursor() as cursor:
+            for partition in expired_partitions:
+                cursor.execute(
+                    sql.SQL("DROP TABLE {name}").format(
+                        name=sql.Identifier(partition.name)
+                    )
+                )
+
+        return len(expired_partitions)
@@ -0,0 +1,30 @@
+from baserow.core.registry import (
+    Instance,
+    ModelInstanceMixin,
+    ModelRegistryMixin,
+    Registry,
+)
+
+
+class TimePartitionedModelType(ModelInstanceMixin, Instance):
+    """
+    A time partitioned model type marks a model whose database table can be range
+    partitioned by month on one of its timestamp fields. The partition maintenance
+    task makes sure that partitions exist ahead of time for every registered type
+    whose table has been converted to a partitioned table, and retention can drop
+    whole partitions instead of deleting rows in batches.
+    """
+
+    partition_field_name: str = None
+    """The name of the timestamp field that the table is partitioned on."""
+
+
+class TimePartitionedModelTypeRegistry(ModelRegistryMixin, Registry):
+    """
+    Contains all the models whose tables can be range partitioned by time.
+    """
+
+    name = "time_partitioned_model"
+
+
+time_partitioned_model_registry = TimePartitionedModelTypeRegistry()
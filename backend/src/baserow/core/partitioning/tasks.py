@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+# noinspection PyUnusedLocal
+@app.task(bind=True, queue="export")
+def create_future_partitions(self):
+    """
+    Creates the partitions of the upcoming months for all the time partitioned
+    tables, so that new rows never end up in their default partition.
+    """
+
+    from baserow.core.partitioning.handler import PartitionHandler
+    from baserow.core.partitioning.registries import time_partitioned_model_registry
+
+    for partitioned_model_type in time_partitioned_model_registry.get_all():
+        PartitionHandler.create_future_partitions(
+            partitioned_model_type.model_class,
+            partitioned_model_type.partition_field_name,
+        )
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_partition_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(minutes=settings.BASEROW_PARTITIONS_MAINTENANCE_INTERVAL_MINUTES),
+        create_future_partitions.s(),
+    )
@@ -38,6 +38,29 @@ def is_pgvector_enabled() -> bool:
         return cursor.fetchone() is not None
 
 
+@lru_cache(maxsize=1)
+def supports_hnsw_iterative_scan() -> bool:
+    """
+    Checks if the installed pgvector extension supports iterative index scans,
+    which have been added in version 0.8.0. Also caches the result for future calls.
+
+    :return: True if the `hnsw.iterative_scan` setting is available, False otherwise.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector';")
+        result = cursor.fetchone()
+
+    if result is None:
+        return False
+
+    try:
+        version = tuple(int(part) for part in result[0].split(".")[:2])
+    except ValueError:
+        return False
+    return version >= (0, 8)
+
+
 def try_enable_pgvector() -> bool:
     """
     Try to enable the pgvector extension.
@@ -49,6 +72,7 @@ def try_enable_pgvector() -> bool:
         with connection.cursor() as cursor:
             cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
             is_pgvector_enabled.cache_clear()
+            supports_hnsw_iterative_scan.cache_clear()
     except Exception:
         return False
 
@@ -51,3 +51,4 @@ class SearchContext:
     query: str
     limit: int = 20
     offset: int = 0
+    search_mode: Optional[str] = None
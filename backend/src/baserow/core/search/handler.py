@@ -111,6 +111,7 @@ class WorkspaceSearchHandler:
         query: str,
         limit: int = DEFAULT_SEARCH_LIMIT,
         offset: int = 0,
+        search_mode: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Execute workspace search within a workspace.
@@ -120,6 +121,8 @@ class WorkspaceSearchHandler:
         param query: Search query string
         param limit: Maximum number of results to return
         param offset: Result offset for pagination
+        param search_mode: The search mode, used by the types that support more
+            than one
 
         return Dict with a flat, priority-ordered list of search results
             and has_more flag
@@ -132,6 +135,7 @@ class WorkspaceSearchHandler:
             query=query,
             limit=search_limit,
             offset=offset,
+            search_mode=search_mode,
         )
 
         raw_results, has_more = self.search_all_types(user, workspace, context)
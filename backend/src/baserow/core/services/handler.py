@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, cast
 from zipfile import ZipFile
 
@@ -229,6 +230,42 @@ class ServiceHandler:
 
         return service.get_type().dispatch(service, dispatch_context)
 
+    def dispatch_services(
+        self,
+        services: Iterable[Service],
+        dispatch_context: DispatchContext,
+    ) -> Dict[int, Union[DispatchResult, Exception]]:
+        """
+        Dispatch the given services. The services are dispatched per service type so
+        that the types can share the work between services.
+
+        :param services: The specific services to be dispatched.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The result of dispatching the services mapped by service id. If an
+            exception occurred during the dispatch of a service, then the exception is
+            returned as its result.
+        """
+
+        results = {}
+        services_per_type = defaultdict(list)
+        for service in services:
+            service_type = service.get_type()
+            if service.integration_id is None and service_type.requires_integration(
+                service
+            ):
+                results[service.id] = ServiceImproperlyConfiguredDispatchException(
+                    "No integration selected"
+                )
+            else:
+                services_per_type[service_type].append(service)
+
+        for service_type, services_of_type in services_per_type.items():
+            results.update(
+                service_type.dispatch_many(services_of_type, dispatch_context)
+            )
+
+        return results
+
     def export_service(
         self,
         service,
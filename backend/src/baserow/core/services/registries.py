@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import fields
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
@@ -401,6 +401,30 @@ class ServiceType(
                 service.save()
             return serialized_data
 
+    def dispatch_many(
+        self,
+        services: List[ServiceSubClass],
+        dispatch_context: DispatchContext,
+    ) -> Dict[int, Union[DispatchResult, Exception]]:
+        """
+        Dispatches several services of this type at once. By default every service is
+        dispatched separately, service types that can share the work between services,
+        like a single query, can override this method.
+
+        :param services: The service instances to dispatch with.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The dispatch result per service id. If an exception occurred during
+            the dispatch of a service, then the exception is returned as its result.
+        """
+
+        results = {}
+        for service in services:
+            try:
+                results[service.id] = self.dispatch(service, dispatch_context)
+            except Exception as e:
+                results[service.id] = e
+        return results
+
     def remove_unused_field_names(
         self,
         row: Dict[str, Any],
@@ -5,6 +5,7 @@ from celery_singleton import Singleton
 from baserow.config.celery import app
 
 from .action.tasks import cleanup_old_actions, setup_periodic_action_tasks
+from .partitioning.tasks import create_future_partitions, setup_periodic_partition_tasks
 from .snapshots.tasks import delete_expired_snapshots
 from .telemetry.tasks import initialize_otel
 from .trash.tasks import (
@@ -17,6 +18,7 @@ from .user.tasks import (
     check_pending_account_deletion,
     share_onboarding_details_with_baserow,
 )
+from .user_files.tasks import generate_queued_user_file_thumbnails
 
 
 @app.task(
@@ -45,4 +47,7 @@ __all__ = [
     "delete_expired_snapshots",
     "initialize_otel",
     "share_onboarding_details_with_baserow",
+    "create_future_partitions",
+    "setup_periodic_partition_tasks",
+    "generate_queued_user_file_thumbnails",
 ]
@@ -1,29 +1,43 @@
-from typing import Callable
-
 from django.http import HttpRequest, HttpResponse
 from django.urls import Resolver404, resolve
 
 from opentelemetry import baggage, context
 
+from baserow.core.middleware import SyncAndAsyncMiddleware
 
-class BaserowOTELMiddleware:
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
-        self.get_response = get_response
 
-    def __call__(self, request: HttpRequest) -> HttpResponse:
+class BaserowOTELMiddleware(SyncAndAsyncMiddleware):
+    def get_route_context(self, request: HttpRequest):
         try:
             match = getattr(request, "resolver_match", None) or resolve(request.path)
             route = getattr(match, "route", None)
         except Resolver404:
             route = None
 
-        if route:
-            ctx = context.get_current()
-            new_ctx = baggage.set_baggage("http.route", route, context=ctx)
-            token = context.attach(new_ctx)
-            try:
-                return self.get_response(request)
-            finally:
-                context.detach(token)
-        else:
+        if not route:
+            return None
+
+        ctx = context.get_current()
+        return baggage.set_baggage("http.route", route, context=ctx)
+
+    def sync_call(self, request: HttpRequest) -> HttpResponse:
+        new_ctx = self.get_route_context(request)
+        if new_ctx is None:
             return self.get_response(request)
+
+        token = context.attach(new_ctx)
+        try:
+            return self.get_response(request)
+        finally:
+            context.detach(token)
+
+    async def async_call(self, request: HttpRequest) -> HttpResponse:
+        new_ctx = self.get_route_context(request)
+        if new_ctx is None:
+            return await self.get_response(request)
+
+        token = context.attach(new_ctx)
+        try:
+            return await self.get_response(request)
+        finally:
+            context.detach(token)
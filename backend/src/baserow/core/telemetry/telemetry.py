@@ -99,6 +99,7 @@ def setup_telemetry(add_django_instrumentation: bool):
             metrics.set_meter_provider(provider)
 
             _setup_celery_metrics()
+            _setup_database_pool_metrics()
             _setup_standard_backend_instrumentation()
 
             print("Configured default backend instrumentation")
@@ -144,6 +145,61 @@ def _setup_celery_metrics():
     signals.after_task_publish.connect(count_task, weak=False)
 
 
+# The current state of the database connection pools.
+DATABASE_POOL_GAUGES = {
+    "pool_min": "The minimum number of connections of the pool.",
+    "pool_max": "The maximum number of connections of the pool.",
+    "pool_size": "The number of connections currently managed by the pool.",
+    "pool_available": "The number of idle connections in the pool.",
+    "requests_waiting": "The number of requests waiting for a connection.",
+}
+# The totals since the pools have been created.
+DATABASE_POOL_COUNTERS = {
+    "requests_num": "The number of connections requested from the pool.",
+    "requests_queued": "The number of requests that had to wait for a connection.",
+    "requests_wait_ms": "The total time spent waiting for a connection.",
+    "requests_errors": "The number of requests that didn't get a connection.",
+    "connections_lost": "The number of connections found broken by the pool.",
+}
+
+
+def _setup_database_pool_metrics():
+    from django.conf import settings
+
+    from opentelemetry.metrics import Observation
+
+    if not settings.BASEROW_DB_POOL_ENABLED:
+        return
+
+    pool_meter = metrics.get_meter("database_pools")
+
+    def observe(stat_name):
+        def callback(options):
+            from baserow.core.db import get_database_pool_stats
+
+            return [
+                Observation(stats.get(stat_name, 0), {"db.alias": alias})
+                for alias, stats in get_database_pool_stats().items()
+            ]
+
+        return callback
+
+    for stat_name, description in DATABASE_POOL_GAUGES.items():
+        pool_meter.create_observable_gauge(
+            name=f"baserow.db_pool.{stat_name}",
+            callbacks=[observe(stat_name)],
+            description=description,
+            unit="1",
+        )
+    for stat_name, description in DATABASE_POOL_COUNTERS.items():
+        pool_meter.create_observable_counter(
+            name=f"baserow.db_pool.{stat_name}",
+            callbacks=[observe(stat_name)],
+            description=description,
+            unit="ms" if stat_name.endswith("_ms") else "1",
+        )
+
+
 def _setup_standard_backend_instrumentation():
     from opentelemetry.instrumentation.botocore import BotocoreInstrumentor
     from opentelemetry.instrumentation.celery import CeleryInstrumentor
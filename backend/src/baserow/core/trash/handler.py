@@ -314,14 +314,59 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
                 raise PermanentDeletionMaxLocksExceededException()
             raise e
 
+    @staticmethod
+    def try_perm_delete_trash_entries_in_bulk(
+        trash_item_type: TrashableItemType,
+        parent_id: Optional[int],
+        trash_entries: List[TrashEntry],
+        trash_item_lookup_cache: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Permanently deletes the items of the provided trash entries, which must all
+        share the provided trash item type and parent id, using the bulk deletion
+        of the trash item type.
+
+        :param trash_item_type: The trash item type of all the trash entries.
+        :param parent_id: The parent trash item id of all the trash entries.
+        :param trash_entries: The trash entries of the items to delete.
+        :param trash_item_lookup_cache: An optional dictionary used for caching during
+            many different invocations.
+        """
+
+        _check_parent_id_valid(parent_id, trash_item_type)
+
+        try:
+            trash_item_type.permanently_delete_items_in_bulk(
+                parent_id, trash_entries, trash_item_lookup_cache
+            )
+        except TrashItemDoesNotExist:
+            # The parent of the items has already been deleted, which means that the
+            # items themselves don't exist anymore either.
+            pass
+        except OperationalError as e:
+            if is_max_lock_exceeded_exception(e):
+                raise PermanentDeletionMaxLocksExceededException()
+            raise e
+
     @staticmethod
     def permanently_delete_marked_trash():
         """
         Looks up every trash item marked for permanent deletion and removes them
         irreversibly from the database along with their corresponding trash entries.
+
+        Trash entries of types that can cascade to other trash entries, like
+        workspaces and applications, are deleted first one by one. The remaining
+        entries of types supporting bulk deletion, like rows, are then grouped by type
+        and parent and deleted in batches using set based queries.
         """
 
         trash_item_lookup_cache = {}
+        bulk_trash_item_types = [
+            trash_item_type.type
+            for trash_item_type in trash_item_type_registry.get_all()
+            if trash_item_type.supports_bulk_permanent_deletion
+        ]
+
         deleted_count = 0
         while True:
             with transaction.atomic():
@@ -330,9 +375,11 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
                 # looped over a single queryset lookup of all TrashEntries then we could
                 # end up trying to delete TrashEntries which have already been deleted
                 # by a previous cascading delete of a workspace or application.
-                trash_entry = TrashEntry.objects.filter(
-                    should_be_permanently_deleted=True
-                ).first()
+                trash_entry = (
+                    TrashEntry.objects.filter(should_be_permanently_deleted=True)
+                    .exclude(trash_item_type__in=bulk_trash_item_types)
+                    .first()
+                )
                 if not trash_entry:
                     break
 
@@ -341,6 +388,34 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
                 )
                 trash_entry.delete()
                 deleted_count += 1
+
+        batch_size = settings.TRASH_PERMANENT_DELETION_BATCH_SIZE
+        while True:
+            with transaction.atomic():
+                marked_entries = TrashEntry.objects.filter(
+                    should_be_permanently_deleted=True,
+                    trash_item_type__in=bulk_trash_item_types,
+                )
+                group = (
+                    marked_entries.order_by("id")
+                    .values("trash_item_type", "parent_trash_item_id")
+                    .first()
+                )
+                if not group:
+                    break
+
+                trash_entries = list(marked_entries.filter(**group)[:batch_size])
+                TrashHandler.try_perm_delete_trash_entries_in_bulk(
+                    trash_item_type_registry.get(group["trash_item_type"]),
+                    group["parent_trash_item_id"],
+                    trash_entries,
+                    trash_item_lookup_cache,
+                )
+                TrashEntry.objects.filter(
+                    id__in=[trash_entry.id for trash_entry in trash_entries]
+                ).delete()
+                deleted_count += len(trash_entries)
+
         logger.info(
             f"Successfully deleted {deleted_count} trash entries and their associated "
             "trashed items."
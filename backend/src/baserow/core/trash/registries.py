@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.registry import (
@@ -57,6 +57,39 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
 
         pass
 
+    supports_bulk_permanent_deletion: bool = False
+    """
+    Whether the trash entries of this type can be permanently deleted many at once
+    using `permanently_delete_items_in_bulk` instead of one by one. Only types whose
+    deletion can't cascade to other trash entries, like rows, should enable this.
+    """
+
+    def permanently_delete_items_in_bulk(
+        self,
+        parent_id: Optional[int],
+        trash_entries: List["TrashEntry"],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ):
+        """
+        Should be implemented by types that set `supports_bulk_permanent_deletion` to
+        permanently delete all the items of the provided trash entries using set
+        based queries. All the trash entries share this type and the provided parent
+        id. The `before_permanently_deleted_many` and `permanently_deleted_many`
+        signals must be sent by the implementation. The trash entries themselves are
+        deleted by the caller.
+
+        :param parent_id: The parent id shared by all the provided trash entries.
+        :param trash_entries: The trash entries of the items to delete permanently.
+        :param trash_item_lookup_cache: An optional dictionary used for caching
+            expensive lookups during many different invocations.
+        :raises TrashItemDoesNotExist: If the parent of the items no longer exists,
+            meaning that the items themselves have already been deleted.
+        """
+
+        raise NotImplementedError(
+            f"The {self.type} trash type does not support bulk permanent deletion."
+        )
+
     @property
     def requires_parent_id(self) -> bool:
         """
@@ -21,3 +21,24 @@ Sent when any trashable item in Baserow is permanently deleted with kwargs conta
     None.
 :param parent_id: The parent id of the trashable item if required for that type.
 """
+
+before_permanently_deleted_many = django.dispatch.Signal()
+"""
+Sent immediately before many trashable items of the same type and parent are
+permanently deleted in bulk by the periodic trash cleanup, so that the trashed items
+still exist and all CASCADE relations are still intact. Trash types which group many
+items into a single trash entry, like `rows`, send this signal with the type of the
+individual items they contain as sender. This signal is sent with kwargs containing:
+
+:param trash_item_ids: The ids of the items that are about to be deleted.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
+
+permanently_deleted_many = django.dispatch.Signal()
+"""
+Sent when many trashable items of the same type and parent have been permanently
+deleted in bulk by the periodic trash cleanup with kwargs containing:
+
+:param trash_item_ids: The ids of the items that were deleted.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
@@ -36,15 +36,17 @@ class UsageHandler:
         qs = (
             Workspace.objects.filter(
                 # Only update the workspaces that have been updated more than X number
-                # hours ago. The task runs every 30 minutes, so even if the task fails
-                # or can't complete, it will resume the next time it runs.
+                # hours ago, or that have been marked as outdated because the storage
+                # usage of one of their tables changed. The task runs every 30 minutes,
+                # so even if the task fails or can't complete, it will resume the next
+                # time it runs.
                 Q(storage_usage_updated_at__lt=hours_ago)
                 | Q(storage_usage_updated_at__isnull=True),
                 template__isnull=True,
             )
-            # Make sure that the workspaces that have last been updated are going to be
-            # updated first.
-            .order_by("storage_usage_updated_at")
+            # Make sure that the workspaces that have been marked as outdated and the
+            # ones that have last been updated are going to be updated first.
+            .order_by(F("storage_usage_updated_at").asc(nulls_first=True))
         )
         workspaces_queryset = qs.iterator(chunk_size=chunk_size)
 
@@ -5,14 +5,18 @@ import pathlib
 import re
 import secrets
 from io import BytesIO
+from itertools import groupby
+from operator import attrgetter
 from os.path import join
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from urllib.parse import urlparse
 from zipfile import ZipFile
 
 from django.conf import settings
 from django.core.files.storage import Storage
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from django.db.models import QuerySet
 from django.utils.http import parse_header_parameters
 
@@ -28,7 +32,13 @@ from baserow.core.storage import (
     OverwritingStorageHandler,
     get_default_storage,
 )
-from baserow.core.utils import random_string, sha256_hash, stream_size, truncate_middle
+from baserow.core.utils import (
+    random_string,
+    sha256_hash,
+    stream_size,
+    transaction_on_commit_if_not_already,
+    truncate_middle,
+)
 
 from .exceptions import (
     ActiveContentBlockedUserFileError,
@@ -225,10 +235,25 @@ class UserFileHandler:
             ).exists():
                 return unique
 
+    def can_generate_image_thumbnails(self, image: "Image") -> bool:
+        """
+        Checks whether thumbnails can be generated for the provided image without
+        decoding it. The thumbnails are saved in the format of the original image,
+        so that format must be writable by Pillow (i.e. PSD files are not).
+
+        :param image: The lazily opened Pillow image.
+        :return: Whether thumbnails can be generated for the image.
+        """
+
+        from PIL import Image
+
+        Image.init()
+        return image.format in Image.SAVE
+
     def generate_and_save_image_thumbnails(
         self,
         image: "Image",
-        user_file_name: str,
+        user_file_name: str | List[str],
         storage: Storage | None = None,
         only_with_name: str | None = None,
     ):
@@ -240,6 +265,8 @@ class UserFileHandler:
         :param image: The original Pillow image that serves as base when generating the
             image.
         :param user_file_name: The name of the user file that the thumbnail is for.
+            Multiple names can be provided if the user files have the same content,
+            the thumbnails are then generated once and saved for every name.
         :param storage: The storage where the thumbnails must be saved to.
         :param only_with_name: If provided, then only thumbnail types with that name
             will be regenerated.
@@ -249,6 +276,9 @@ class UserFileHandler:
         from PIL import Image, ImageOps
 
         storage = storage or get_default_storage()
+        user_file_names = (
+            [user_file_name] if isinstance(user_file_name, str) else user_file_name
+        )
 
         # adjust image orientation, if exif data differs from the image data
         try:
@@ -279,11 +309,12 @@ class UserFileHandler:
             else:
                 thumbnail_stream = BytesIO()
                 thumbnail.save(thumbnail_stream, image.format)
-                thumbnail_stream.seek(0)
-                thumbnail_path = self.user_file_thumbnail_path(user_file_name, name)
 
                 handler = OverwritingStorageHandler(storage)
-                handler.save(thumbnail_path, thumbnail_stream)
+                for file_name in user_file_names:
+                    thumbnail_stream.seek(0)
+                    thumbnail_path = self.user_file_thumbnail_path(file_name, name)
+                    handler.save(thumbnail_path, thumbnail_stream)
 
                 del thumbnail
                 del thumbnail_stream
@@ -321,6 +352,10 @@ class UserFileHandler:
                 "The provided file is too large.",
             )
 
+        # The background task generates the thumbnails in the default storage.
+        queue_thumbnails = (
+            storage is None and settings.BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND
+        )
         storage = storage or get_default_storage()
         stream_hash = sha256_hash(stream)
         file_name = truncate_middle(file_name, 64)
@@ -369,11 +404,16 @@ class UserFileHandler:
         else:
             image = None
             try:
+                # Opening the image only reads the header, so the format and the
+                # dimensions are known without decoding the whole image.
                 image = Image.open(stream)
                 user_file.mime_type = f"image/{image.format}".lower()
-                self.generate_and_save_image_thumbnails(
-                    image, user_file.name, storage=storage
-                )
+                if queue_thumbnails and self.can_generate_image_thumbnails(image):
+                    user_file.thumbnails_queued = True
+                else:
+                    self.generate_and_save_image_thumbnails(
+                        image, user_file.name, storage=storage
+                    )
                 # Skip marking as images if thumbnails cannot be generated (i.e. PSD files).
                 user_file.is_image = True
                 user_file.image_width = image.width
@@ -399,8 +439,72 @@ class UserFileHandler:
         # Close the stream because we don't need it anymore.
         stream.close()
 
+        if user_file.thumbnails_queued:
+            from .tasks import generate_queued_user_file_thumbnails
+
+            transaction_on_commit_if_not_already(
+                generate_queued_user_file_thumbnails.delay
+            )
+
         return user_file
 
+    def generate_queued_thumbnails(self, storage: Storage | None = None) -> int:
+        """
+        Generates the thumbnails of all the user files that have been queued for
+        thumbnail generation. The queued user files are processed in batches and
+        grouped by their sha256 hash, so that an image that has been uploaded multiple
+        times is only decoded once. Concurrent calls skip the user files that are
+        already being processed.
+
+        :param storage: The storage where the user files and thumbnails are stored.
+        :return: The number of user files that have been processed.
+        """
+
+        from PIL import Image
+
+        storage = storage or get_default_storage()
+        processed = 0
+
+        while True:
+            with transaction.atomic():
+                user_files = list(
+                    UserFile.objects.filter(thumbnails_queued=True)
+                    .order_by("sha256_hash", "id")
+                    .select_for_update(skip_locked=True)[
+                        : settings.BASEROW_USER_FILE_THUMBNAILS_BATCH_SIZE
+                    ]
+                )
+
+                if not user_files:
+                    return processed
+
+                for _, group in groupby(user_files, key=attrgetter("sha256_hash")):
+                    names = [
+                        user_file.name
+                        for user_file in group
+                        if user_file.deleted_at is None
+                    ]
+                    if not names:
+                        continue
+
+                    try:
+                        with storage.open(self.user_file_path(names[0])) as stream:
+                            image = Image.open(stream)
+                            self.generate_and_save_image_thumbnails(
+                                image, names, storage=storage
+                            )
+                            del image
+                    except Exception as exc:
+                        logger.warning(
+                            f"Failed to generate thumbnails for user files "
+                            f"{', '.join(names)}: {exc}"
+                        )
+
+                UserFile.objects.filter(
+                    id__in=[user_file.id for user_file in user_files]
+                ).update(thumbnails_queued=False)
+                processed += len(user_files)
+
     def upload_user_file_by_url(self, user, url, file_name=None, storage=None):
         """
         Uploads a user file by downloading it from the provided URL.
@@ -431,6 +535,10 @@ class UserFileHandler:
             else file_name
         )
 
+        # The content is streamed into a file that is only kept in memory while it's
+        # small, so large files are never fully loaded into memory.
+        content = SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+
         try:
             response = advocate.get(url, stream=True, timeout=10)
 
@@ -449,18 +557,21 @@ class UserFileHandler:
             except ValueError:
                 pass
 
-            content = b""
-            for chunk in response.iter_content(chunk_size=None):
-                content += chunk
-                if len(content) > settings.BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB:
+            size = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                size += len(chunk)
+                if size > settings.BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB:
                     response.close()
+                    content.close()
                     raise FileSizeTooLargeError(
                         settings.BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB,
                         "The provided file is too large.",
                     )
+                content.write(chunk)
             content_type = response.headers.get("Content-Type", "")
 
         except (RequestException, UnacceptableAddressException, ConnectionError):
+            content.close()
             raise FileURLCouldNotBeReached("The provided URL could not be reached.")
 
         # content-type may contain extra params, like charset: text/plain; charset=utf-8
@@ -485,7 +596,10 @@ class UserFileHandler:
             # hexdigest value
             file_name = f"{file_name_generator.hexdigest()[:12]}{ext}"
 
-        file = SimpleUploadedFile(file_name, content, content_type=content_type)
+        content.seek(0)
+        file = UploadedFile(
+            content, name=file_name, content_type=content_type, size=size
+        )
         return self.upload_user_file(user, file_name, file, storage)
 
     def export_user_file(
@@ -23,11 +23,25 @@ class UserFile(models.Model):
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     sha256_hash = models.CharField(max_length=64, db_index=True)
     deleted_at = models.DateTimeField(null=True, blank=True, default=None)
+    thumbnails_queued = models.BooleanField(
+        default=False,
+        help_text=(
+            "If True, then the thumbnails of the image have not been generated yet "
+            "because they're queued for generation in the background."
+        ),
+    )
 
     objects = UserFileQuerySet.as_manager()
 
     class Meta:
         ordering = ("id",)
+        indexes = [
+            models.Index(
+                fields=["sha256_hash", "id"],
+                name="userfile_thumbnails_queued_idx",
+                condition=models.Q(thumbnails_queued=True),
+            )
+        ]
 
     def serialize(self):
         """
@@ -0,0 +1,10 @@
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue=settings.BASEROW_USER_FILE_THUMBNAILS_QUEUE)
+def generate_queued_user_file_thumbnails(self):
+    from .handler import UserFileHandler
+
+    UserFileHandler().generate_queued_thumbnails()
@@ -1,5 +1,3 @@
-from typing import Callable
-
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.urls import is_valid_path
@@ -8,6 +6,7 @@ from rest_framework import status
 
 from baserow.config.db_routers import clear_db_state
 from baserow.core.handler import CoreHandler
+from baserow.core.middleware import SyncAndAsyncMiddleware
 
 
 def json_error_404_add_trailing_slash(path: str) -> HttpResponse:
@@ -43,13 +42,16 @@ def json_is_accepted(request: HttpRequest) -> bool:
     return "application/json" in accept_headers or accept_headers in ["*/*", ""]
 
 
-class BaserowCustomHttp404Middleware:
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
-        self.get_response = get_response
+class BaserowCustomHttp404Middleware(SyncAndAsyncMiddleware):
+    def sync_call(self, request: HttpRequest) -> HttpResponse:
+        return self.process_response(request, self.get_response(request))
 
-    def __call__(self, request: HttpRequest) -> HttpResponse:
-        response = self.get_response(request)
+    async def async_call(self, request: HttpRequest) -> HttpResponse:
+        return self.process_response(request, await self.get_response(request))
 
+    def process_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
         if response.status_code == 404:
             path, urlconf = request.path_info, getattr(request, "urlconf", None)
             if (
@@ -65,16 +67,13 @@ class BaserowCustomHttp404Middleware:
         return response
 
 
-class ClearContextMiddleware:
+class ClearContextMiddleware(SyncAndAsyncMiddleware):
     """
     This middleware is used to clear the context after the response has been returned.
     Such context can be used i.e. to store the current workspace id
     """
 
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
-        self.get_response = get_response
-
-    def __call__(self, request: HttpRequest) -> HttpResponse:
+    def sync_call(self, request: HttpRequest) -> HttpResponse:
         try:
             response = self.get_response(request)
         finally:
@@ -83,17 +82,26 @@ class ClearContextMiddleware:
             CoreHandler().clear_context()
         return response
 
+    async def async_call(self, request: HttpRequest) -> HttpResponse:
+        try:
+            response = await self.get_response(request)
+        finally:
+            CoreHandler().clear_context()
+        return response
+
 
-class ClearDBStateMiddleware:
+class ClearDBStateMiddleware(SyncAndAsyncMiddleware):
     """
     Clearing the db state after every request, so that if a read-only replica is
     configured, it will correctly use that one instead of the writer.
     """
 
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
-        self.get_response = get_response
-
-    def __call__(self, request):
+    def sync_call(self, request: HttpRequest) -> HttpResponse:
         response = self.get_response(request)
         clear_db_state()
         return response
+
+    async def async_call(self, request: HttpRequest) -> HttpResponse:
+        response = await self.get_response(request)
+        clear_db_state()
+        return response
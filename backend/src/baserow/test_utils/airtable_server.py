@@ -0,0 +1,184 @@
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+AIRTABLE_FILES_HOST = "https://dl.airtable.com"
+
+
+class AirtableStandInServer:
+    """
+    A local HTTP server that behaves like the publicly shared Airtable base endpoints
+    used by the Airtable import. It serves the recorded responses of one of the
+    directories in `tests/airtable_responses`, so that an import can run completely
+    offline. An artificial latency can be added to every request to get a realistic
+    picture of the import throughput, because that's dominated by waiting on Airtable.
+
+    The server keeps track of the number of handled requests and the maximum number
+    of requests that were handled at the same time.
+    """
+
+    def __init__(self, responses_dir: str, latency: float = 0):
+        """
+        :param responses_dir: The directory containing the recorded responses. It must
+            contain the `airtable_base.html`, `airtable_application.json`,
+            `airtable_table.json` and `airtable_view_<view_id>.json` files and the
+            files referenced by the attachments.
+        :param latency: The number of seconds that every request is delayed.
+        """
+
+        self.responses_dir = Path(responses_dir)
+        self.latency = latency
+        self.request_count = 0
+        self.max_concurrent_requests = 0
+        self._concurrent_requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._get_handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    @contextmanager
+    def patch_airtable_urls(self):
+        """
+        Points the Airtable import to this server instead of to Airtable.
+        """
+
+        with (
+            patch(
+                "baserow.contrib.database.airtable.handler.AIRTABLE_BASE_URL", self.url
+            ),
+            patch(
+                "baserow.contrib.database.airtable.handler.AIRTABLE_API_BASE_URL",
+                f"{self.url}/v0.3",
+            ),
+        ):
+            yield self
+
+    def _enter_request(self):
+        with self._lock:
+            self.request_count += 1
+            self._concurrent_requests += 1
+            self.max_concurrent_requests = max(
+                self.max_concurrent_requests, self._concurrent_requests
+            )
+
+    def _exit_request(self):
+        with self._lock:
+            self._concurrent_requests -= 1
+
+    def _read_response(self, file_name: str) -> bytes:
+        # Rewrite the attachment URLs so that they're downloaded from this server
+        # as well.
+        content = (self.responses_dir / file_name).read_bytes()
+        return content.replace(
+            AIRTABLE_FILES_HOST.encode(), f"{self.url}/files".encode()
+        )
+
+    def _resolve(self, path: str):
+        """
+        Returns the status, headers and body of the response to the request with the
+        provided path.
+        """
+
+        if re.fullmatch(r"/v0\.3/application/[^/]+/read", path):
+            return HTTPStatus.OK, {}, self._read_response("airtable_application.json")
+        elif re.fullmatch(r"/v0\.3/table/[^/]+/readData", path):
+            return HTTPStatus.OK, {}, self._read_response("airtable_table.json")
+        elif match := re.fullmatch(r"/v0\.3/view/([^/]+)/readData", path):
+            file_name = f"airtable_view_{match.group(1)}.json"
+            if not (self.responses_dir / file_name).exists():
+                return HTTPStatus.NOT_FOUND, {}, b""
+            return HTTPStatus.OK, {}, self._read_response(file_name)
+        elif match := re.fullmatch(r"/files/.*/([^/]+)", path):
+            file_path = self.responses_dir / match.group(1)
+            if not file_path.exists():
+                return HTTPStatus.NOT_FOUND, {}, b""
+            return HTTPStatus.OK, {}, file_path.read_bytes()
+        elif re.fullmatch(r"/[^/]+", path):
+            return (
+                HTTPStatus.OK,
+                {"Set-Cookie": "brw=test;"},
+                self._read_response("airtable_base.html"),
+            )
+        return HTTPStatus.NOT_FOUND, {}, b""
+
+    def _get_handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._enter_request()
+                try:
+                    if server.latency:
+                        time.sleep(server.latency)
+                    status, headers, body = server._resolve(urlparse(self.path).path)
+                    range_match = re.fullmatch(
+                        r"bytes=(\d+)-(\d*)", self.headers.get("Range", "")
+                    )
+                    if status == HTTPStatus.OK and range_match and body:
+                        start = int(range_match.group(1))
+                        end = min(int(range_match.group(2) or len(body)), len(body)) - 1
+                        headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+                        status, body = HTTPStatus.PARTIAL_CONTENT, body[start : end + 1]
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    server._exit_request()
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@contextmanager
+def airtable_stand_in_server(responses_dir: str = None, latency: float = 0):
+    """
+    Starts an `AirtableStandInServer` and points the Airtable import to it for the
+    duration of the context.
+
+    :param responses_dir: The directory containing the recorded responses. Defaults to
+        `tests/airtable_responses/basic`.
+    :param latency: The number of seconds that every request is delayed.
+    """
+
+    if responses_dir is None:
+        from django.conf import settings
+
+        responses_dir = os.path.join(
+            settings.BASE_DIR, "../../../tests/airtable_responses/basic"
+        )
+
+    server = AirtableStandInServer(responses_dir, latency)
+    server.start()
+    try:
+        with server.patch_airtable_urls():
+            yield server
+    finally:
+        server.stop()
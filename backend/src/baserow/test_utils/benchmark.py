@@ -0,0 +1,203 @@
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+DEFAULT_BASELINE_PATH = Path(".benchmarks") / "baseline.json"
+# The query counts don't depend on the machine, so unlike the wall times they're
+# committed and checked in CI.
+QUERY_COUNT_BASELINE_PATH = (
+    Path("tests") / "baserow" / "performance" / "query_counts.json"
+)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    query_count: int
+    wall_time: Optional[float] = None
+
+    def get_regressions(
+        self,
+        baseline: "BenchmarkResult",
+        query_threshold: float,
+        time_threshold: float,
+    ) -> List[str]:
+        """
+        Compares the result with the baseline result of the same benchmark.
+
+        :param baseline: The recorded baseline result.
+        :param query_threshold: The relative amount of extra queries that is allowed.
+        :param time_threshold: The relative amount of extra wall time that is allowed.
+            The wall time isn't compared if it's missing from the baseline.
+        :return: A description of every budget that has been exceeded.
+        """
+
+        regressions = []
+        query_budget = baseline.query_count * (1 + query_threshold)
+        if self.query_count > query_budget:
+            regressions.append(
+                f"{self.name}: {self.query_count} queries, the budget is "
+                f"{query_budget:.0f} ({baseline.query_count} in the baseline)."
+            )
+
+        if self.wall_time is None or baseline.wall_time is None:
+            return regressions
+
+        time_budget = baseline.wall_time * (1 + time_threshold)
+        if self.wall_time > time_budget:
+            regressions.append(
+                f"{self.name}: {self.wall_time:.3f}s, the budget is "
+                f"{time_budget:.3f}s ({baseline.wall_time:.3f}s in the baseline)."
+            )
+
+        return regressions
+
+
+class BenchmarkRecorder:
+    """
+    Measures the number of queries and the wall time of the benchmarked operations
+    and compares them with a JSON baseline. The wall times are machine dependent, so
+    a baseline containing them must be recorded locally by running the benchmarks
+    with the `--benchmarks-update-baseline` flag before making changes. A baseline
+    recorded with `query_counts_only` only contains the query counts, like the one
+    committed at `QUERY_COUNT_BASELINE_PATH`.
+    """
+
+    def __init__(
+        self,
+        baseline_path: Path = DEFAULT_BASELINE_PATH,
+        update_baseline: bool = False,
+        query_threshold: float = 0.0,
+        time_threshold: float = 0.25,
+        query_counts_only: bool = False,
+        strict: bool = False,
+    ):
+        """
+        :param baseline_path: The JSON file containing the baseline results.
+        :param update_baseline: Whether the results are written to the baseline
+            instead of being compared with it.
+        :param query_threshold: The relative amount of extra queries that is allowed.
+        :param time_threshold: The relative amount of extra wall time that is allowed.
+        :param query_counts_only: Whether only the query counts are compared and
+            written to the baseline.
+        :param strict: Whether a benchmark that is missing from the baseline is
+            reported as a regression.
+        """
+
+        self.baseline_path = Path(baseline_path)
+        self.update_baseline = update_baseline
+        self.query_threshold = query_threshold
+        self.time_threshold = time_threshold
+        self.query_counts_only = query_counts_only
+        self.strict = strict
+        self.results: Dict[str, BenchmarkResult] = {}
+        self.baseline: Dict[str, BenchmarkResult] = {}
+
+        if self.baseline_path.exists():
+            with open(self.baseline_path, encoding="utf-8") as baseline_file:
+                self.baseline = {
+                    name: BenchmarkResult(name=name, **result)
+                    for name, result in json.load(baseline_file).items()
+                }
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        rounds: int = 1,
+        warmup_rounds: int = 0,
+        setup: Optional[Callable[[], None]] = None,
+    ) -> BenchmarkResult:
+        """
+        Runs the function `rounds` times and records the highest number of executed
+        queries and the median wall time of the runs.
+
+        :param name: The unique name of the benchmark in the baseline.
+        :param func: The function that executes the benchmarked operation.
+        :param rounds: The number of measured runs.
+        :param warmup_rounds: The number of runs before the measured runs, which
+            can be used to fill the caches, like the generated model cache.
+        :param setup: An optional function that is called before every run, that
+            isn't measured. It can be used to reset the state that the benchmarked
+            operation changes.
+        :return: The result of the benchmark.
+        """
+
+        for _ in range(warmup_rounds):
+            if setup:
+                setup()
+            func()
+
+        query_counts = []
+        wall_times = []
+        for _ in range(rounds):
+            if setup:
+                setup()
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                func()
+                wall_times.append(time.perf_counter() - start)
+            query_counts.append(len(captured.captured_queries))
+
+        result = BenchmarkResult(
+            name=name,
+            query_count=max(query_counts),
+            wall_time=statistics.median(wall_times),
+        )
+        self.results[name] = result
+        return result
+
+    def get_regressions(self, result: BenchmarkResult) -> List[str]:
+        """
+        Returns a description of the budgets that the result exceeds compared to the
+        baseline. Benchmarks that are not in the baseline yet only regress in strict
+        mode.
+        """
+
+        if self.update_baseline:
+            return []
+
+        baseline = self.baseline.get(result.name)
+        if baseline is None:
+            if not self.strict:
+                return []
+            return [
+                f"{result.name}: missing from the baseline {self.baseline_path}, "
+                f"record it with the --benchmarks-update-baseline flag."
+            ]
+
+        if self.query_counts_only:
+            baseline = BenchmarkResult(baseline.name, baseline.query_count)
+        return result.get_regressions(
+            baseline, self.query_threshold, self.time_threshold
+        )
+
+    def write_baseline(self):
+        """
+        Merges the recorded results into the baseline file.
+        """
+
+        baseline = {**self.baseline, **self.results}
+        self.baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.baseline_path, "w", encoding="utf-8") as baseline_file:
+            json.dump(
+                {
+                    name: {
+                        key: value
+                        for key, value in asdict(result).items()
+                        if key != "name"
+                        and value is not None
+                        and not (self.query_counts_only and key == "wall_time")
+                    }
+                    for name, result in sorted(baseline.items())
+                },
+                baseline_file,
+                indent=2,
+            )
+            baseline_file.write("\n")
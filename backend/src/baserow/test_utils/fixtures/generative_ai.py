@@ -1,6 +1,11 @@
+import re
+import threading
+import time
+
 from baserow.api.generative_ai.serializers import GenerativeAIModelsSerializer
 from baserow.core.generative_ai.exceptions import GenerativeAIPromptError
 from baserow.core.generative_ai.registries import (
+    BatchPromptAnswers,
     GenerativeAIModelType,
     generative_ai_model_type_registry,
 )
@@ -102,6 +107,72 @@ class TestGenerativeAIWithFilesModelType(GenerativeAIModelType):
         pass
 
 
+class TestGenerativeAIBatchModelType(GenerativeAIModelType):
+    """
+    A local fake provider that answers batched prompts like a real model would. It
+    keeps track of the prompts of every request and of the maximum number of requests
+    that ran at the same time, and can delay every request to simulate the latency
+    of a real provider in benchmarks.
+    """
+
+    type = "test_generative_ai_batch"
+
+    def __init__(self, latency: float = 0):
+        super().__init__()
+        self.latency = latency
+        self.requests = []
+        self.max_concurrent_requests = 0
+        self._concurrent_requests = 0
+        self._lock = threading.Lock()
+
+    def is_enabled(self, workspace=None):
+        return True
+
+    def get_enabled_models(self, workspace=None):
+        return ["test_1"]
+
+    def prompt(
+        self,
+        model,
+        prompt,
+        workspace=None,
+        temperature=None,
+        settings_override=None,
+        output_type=None,
+        content=None,
+    ):
+        with self._lock:
+            self._concurrent_requests += 1
+            self.max_concurrent_requests = max(
+                self.max_concurrent_requests, self._concurrent_requests
+            )
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+
+            if output_type is BatchPromptAnswers:
+                prompts = re.findall(
+                    r'<prompt number="\d+">\n(.*?)\n</prompt>', prompt, re.DOTALL
+                )
+                with self._lock:
+                    self.requests.append(prompts)
+                return BatchPromptAnswers(
+                    answers=[f"Generated in batch: {p}" for p in prompts]
+                )
+
+            with self._lock:
+                self.requests.append([prompt])
+            if isinstance(output_type, list):
+                return output_type[0]
+            return f"Generated: {prompt}"
+        finally:
+            with self._lock:
+                self._concurrent_requests -= 1
+
+    def get_settings_serializer(self):
+        return GenerativeAIModelsSerializer
+
+
 class TestGenerativeAIModelTypePromptError(GenerativeAIModelType):
     type = "test_generative_ai_prompt_error"
 
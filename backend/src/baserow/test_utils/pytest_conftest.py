@@ -34,7 +34,7 @@ from baserow.contrib.database.application_types import DatabaseApplicationType
 from baserow.contrib.database.fields.fields import SerialField
 from baserow.contrib.database.fields.models import LinkRowField
 from baserow.contrib.database.webhooks.registries import webhook_event_type_registry
-from baserow.core.cache import local_cache
+from baserow.core.cache import global_cache, local_cache
 from baserow.core.context import clear_current_workspace_id
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.jobs.registries import job_type_registry
@@ -45,9 +45,16 @@ from baserow.core.services.utils import ServiceAdhocRefinements
 from baserow.core.trash.trash_types import WorkspaceTrashableItemType
 from baserow.core.user_sources.registries import UserSourceCount
 from baserow.core.utils import get_value_at_path
+from baserow.test_utils.airtable_server import airtable_stand_in_server
+from baserow.test_utils.benchmark import (
+    DEFAULT_BASELINE_PATH,
+    QUERY_COUNT_BASELINE_PATH,
+    BenchmarkRecorder,
+    BenchmarkResult,
+)
 from baserow.test_utils.setup_formulas import iter_formula_pgsql_functions
 
-SKIP_FLAGS = ["disabled-in-ci", "once-per-day-in-ci"]
+SKIP_FLAGS = ["disabled-in-ci", "once-per-day-in-ci", "benchmarks"]
 COMMAND_LINE_FLAG_PREFIX = "--run-"
 
 # List of heavy callables to defer by default during tests
@@ -156,6 +163,7 @@ def clear_cache():
 
     # fakeredis cache
     cache.clear()
+    global_cache.local_tier.clear()
 
     # Workspace search table cache
     from baserow.contrib.database.search.handler import (
@@ -575,6 +583,43 @@ def pytest_addoption(parser):
                 default=False,
                 help=f"run {flag} tests",
             )
+        parser.addoption(
+            "--benchmarks-baseline",
+            default=None,
+            help="the JSON file containing the baseline results of the benchmarks, "
+            f"defaults to {DEFAULT_BASELINE_PATH}, or to {QUERY_COUNT_BASELINE_PATH} "
+            "with --benchmarks-query-counts-only",
+        )
+        parser.addoption(
+            "--benchmarks-query-counts-only",
+            action="store_true",
+            default=False,
+            help="only compare and record the query counts of the benchmarks",
+        )
+        parser.addoption(
+            "--benchmarks-strict",
+            action="store_true",
+            default=False,
+            help="fail the benchmarks that are missing from the baseline",
+        )
+        parser.addoption(
+            "--benchmarks-update-baseline",
+            action="store_true",
+            default=False,
+            help="write the results of the benchmarks to the baseline file",
+        )
+        parser.addoption(
+            "--benchmarks-query-threshold",
+            type=float,
+            default=0.0,
+            help="the relative amount of extra queries a benchmark can execute",
+        )
+        parser.addoption(
+            "--benchmarks-time-threshold",
+            type=float,
+            default=0.25,
+            help="the relative amount of extra wall time a benchmark can take",
+        )
         pytest_addoption.already_run = True
 
 
@@ -614,6 +659,51 @@ def pytest_collection_modifyitems(config, items):
                 break
 
 
+@pytest.fixture(scope="session")
+def benchmark_recorder(request):
+    """
+    Collects the results of all the benchmarks of the session and writes them to the
+    baseline file at the end if the `--benchmarks-update-baseline` flag is provided.
+    """
+
+    query_counts_only = request.config.getoption("--benchmarks-query-counts-only")
+    baseline_path = request.config.getoption("--benchmarks-baseline") or (
+        QUERY_COUNT_BASELINE_PATH if query_counts_only else DEFAULT_BASELINE_PATH
+    )
+    recorder = BenchmarkRecorder(
+        baseline_path=baseline_path,
+        update_baseline=request.config.getoption("--benchmarks-update-baseline"),
+        query_threshold=request.config.getoption("--benchmarks-query-threshold"),
+        time_threshold=request.config.getoption("--benchmarks-time-threshold"),
+        query_counts_only=query_counts_only,
+        strict=request.config.getoption("--benchmarks-strict"),
+    )
+
+    yield recorder
+
+    if recorder.update_baseline and recorder.results:
+        recorder.write_baseline()
+
+
+@pytest.fixture
+def measure_benchmark(benchmark_recorder):
+    """
+    Measures the queries and the wall time of an operation and fails the test if
+    they exceed the budgets derived from the baseline. See
+    `BenchmarkRecorder.measure` for the accepted arguments.
+    """
+
+    def measure(name: str, func, **kwargs) -> BenchmarkResult:
+        result = benchmark_recorder.measure(name, func, **kwargs)
+        print(f"{result.name}: {result.query_count} queries, {result.wall_time:.3f}s")
+        regressions = benchmark_recorder.get_regressions(result)
+        if regressions:
+            pytest.fail("\n".join(regressions))
+        return result
+
+    return measure
+
+
 @pytest.fixture()
 def profiler():
     """
@@ -661,6 +751,19 @@ def profiler():
     return profile_this
 
 
+@pytest.fixture
+def airtable_stand_in():
+    """
+    Runs a local HTTP server that serves the recorded responses of a publicly shared
+    Airtable base and points the Airtable import to it. Set the `latency` attribute
+    of the server to simulate the round trips to Airtable when measuring the import
+    throughput.
+    """
+
+    with airtable_stand_in_server() as server:
+        yield server
+
+
 class BaseMaxLocksPerTransactionStub:
     # Determines whether we raise an `OperationalError` about
     # `max_locks_per_transaction` or something else.
@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Awaitable, Callable, Optional, Union
 
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse
@@ -8,13 +8,14 @@ from baserow.api.exceptions import (
     api_exception_to_json_response,
 )
 from baserow.api.sessions import get_user_remote_ip_address_from_request
+from baserow.core.middleware import SyncAndAsyncMiddleware
 from baserow.throttling.handler import ConcurrentUserRequestsThrottle
 
 from .blacklist import get_token_cooldown_time, is_ip_blacklisted
 from .utils import get_auth_token
 
 
-class ThrottleBlacklistMiddleware:
+class ThrottleBlacklistMiddleware(SyncAndAsyncMiddleware):
     """
     Fast-path rejection for recently throttled tokens and, optionally, IPs.
 
@@ -29,8 +30,13 @@ class ThrottleBlacklistMiddleware:
     blacklist.
     """
 
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
-        self.get_response = get_response
+    def __init__(
+        self,
+        get_response: Callable[
+            [HttpRequest], Union[HttpResponse, Awaitable[HttpResponse]]
+        ],
+    ):
+        super().__init__(get_response)
         if settings.BASEROW_THROTTLE_IP_ENABLED:
             self._check_anonymous = lambda request: is_ip_blacklisted(
                 get_user_remote_ip_address_from_request(request)
@@ -38,7 +44,7 @@ class ThrottleBlacklistMiddleware:
         else:
             self._check_anonymous = lambda request: None
 
-    def __call__(self, request: HttpRequest) -> HttpResponse:
+    def get_throttled_response(self, request: HttpRequest) -> Optional[HttpResponse]:
         if token := get_auth_token(request):
             cooldown = get_token_cooldown_time(token)
         else:
@@ -48,21 +54,36 @@ class ThrottleBlacklistMiddleware:
             # Use the same response format returned by ConcurrentUserRequestsThrottle
             return api_exception_to_json_response(ThrottledAPIException(wait=cooldown))
 
+        return None
+
+    def sync_call(self, request: HttpRequest) -> HttpResponse:
+        if (response := self.get_throttled_response(request)) is not None:
+            return response
+
         return self.get_response(request)
 
+    async def async_call(self, request: HttpRequest) -> HttpResponse:
+        if (response := self.get_throttled_response(request)) is not None:
+            return response
+
+        return await self.get_response(request)
 
-class ConcurrentUserRequestsMiddleware:
+
+class ConcurrentUserRequestsMiddleware(SyncAndAsyncMiddleware):
     """
     Counterpart of ``ConcurrentUserRequestsThrottle``.  Removes the request
     id from the Redis sorted set once the response has been generated, freeing
     the concurrency slot.
     """
 
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
-        self.get_response = get_response
-
-    def __call__(self, request: HttpRequest) -> HttpResponse:
+    def sync_call(self, request: HttpRequest) -> HttpResponse:
         try:
             return self.get_response(request)
         finally:
             ConcurrentUserRequestsThrottle.on_request_processed(request)
+
+    async def async_call(self, request: HttpRequest) -> HttpResponse:
+        try:
+            return await self.get_response(request)
+        finally:
+            ConcurrentUserRequestsThrottle.on_request_processed(request)
@@ -0,0 +1,204 @@
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from asgiref.local import Local
+from loguru import logger
+
+from baserow.core.middleware import SyncAndAsyncMiddleware
+
+if TYPE_CHECKING:
+    from baserow.ws.registries import PageType
+
+
+@dataclass
+class BufferedBroadcast:
+    page_type: "PageType"
+    channel_group_name: str
+    payload: dict
+    ignore_web_socket_id: Optional[str]
+    exclude_user_ids: Optional[List[int]]
+
+    def can_be_merged_with(self, other: "BufferedBroadcast") -> bool:
+        return (
+            self.page_type.type == other.page_type.type
+            and self.ignore_web_socket_id == other.ignore_web_socket_id
+            and self.exclude_user_ids == other.exclude_user_ids
+        )
+
+
+async def send_messages_to_channel_groups(
+    channel_layer, messages: List[BufferedBroadcast]
+):
+    """
+    Sends the buffered messages to their channel groups in order. The pools are
+    closed only once at the end, see `send_message_to_channel_group`.
+    """
+
+    for message in messages:
+        await channel_layer.group_send(
+            message.channel_group_name,
+            {
+                "type": "broadcast_to_group",
+                "payload": message.payload,
+                "ignore_web_socket_id": message.ignore_web_socket_id,
+                "exclude_user_ids": message.exclude_user_ids,
+            },
+        )
+    if hasattr(channel_layer, "close_pools"):
+        # The inmemory channel layer in tests does not have this function.
+        await channel_layer.close_pools()
+
+
+class BroadcastBuffer:
+    """
+    Collects the payloads that are broadcast directly to the channel layer, instead
+    of via a celery task, while a request or a celery task is handled. The payloads
+    are sent when the outermost buffering context exits, which is after the
+    transaction has been committed. While buffering, a payload sent to the same
+    channel group as the previous one is merged into it if the page type supports it,
+    so that for example many `rows_updated` events of one request result in a single
+    message. The buffered payloads are sent early once
+    `BASEROW_WS_BROADCAST_BUFFER_MAX_MESSAGES` of them are waiting, so that a long
+    running task doesn't hold back all its events. Payloads broadcast outside a
+    buffering context are sent immediately.
+    """
+
+    def __init__(self):
+        self._local = Local()
+
+    def start(self):
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._local.messages = []
+        self._local.depth = depth + 1
+
+    def _pop_messages(self) -> List[BufferedBroadcast]:
+        """
+        Leaves the current buffering context and returns the messages that must be
+        sent if it was the outermost one.
+        """
+
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            return []
+
+        self._local.depth = depth - 1
+        if depth > 1:
+            return []
+
+        messages = self._local.messages
+        self._local.messages = []
+        return messages
+
+    def flush(self):
+        self.send(self._pop_messages())
+
+    async def aflush(self):
+        await self.asend(self._pop_messages())
+
+    @contextmanager
+    def context(self):
+        self.start()
+        try:
+            yield self
+        finally:
+            self.flush()
+
+    def add(self, message: BufferedBroadcast):
+        if not getattr(self._local, "depth", 0):
+            self.send([message])
+            return
+
+        messages = self._local.messages
+        # Only the last message of the channel group can be merged with, otherwise
+        # the order of the messages received by the group would change.
+        previous = next(
+            (
+                m
+                for m in reversed(messages)
+                if m.channel_group_name == message.channel_group_name
+            ),
+            None,
+        )
+        if previous is not None and previous.can_be_merged_with(message):
+            merged_payload = message.page_type.merge_payloads(
+                previous.payload, message.payload
+            )
+            if merged_payload is not None:
+                previous.payload = merged_payload
+                return
+
+        messages.append(message)
+        if len(messages) >= settings.BASEROW_WS_BROADCAST_BUFFER_MAX_MESSAGES:
+            # The messages are added once the changes have been committed, so they
+            # can be sent before the buffering context exits.
+            self._local.messages = []
+            self.send(messages)
+
+    def _replace_oversized_payload(self, message: BufferedBroadcast):
+        max_size = settings.BASEROW_WS_BROADCAST_MAX_PAYLOAD_SIZE
+        if max_size <= 0:
+            return
+
+        size = len(json.dumps(message.payload, cls=DjangoJSONEncoder))
+        if size <= max_size:
+            return
+
+        replacement = message.page_type.get_oversized_payload_replacement(
+            message.payload
+        )
+        if replacement is not None:
+            message.payload = replacement
+
+    def send(self, messages: List[BufferedBroadcast]):
+        if not messages:
+            return
+
+        from asgiref.sync import async_to_sync
+
+        try:
+            async_to_sync(self.asend)(messages)
+        except Exception:
+            logger.exception("Failed to broadcast the realtime messages.")
+
+    async def asend(self, messages: List[BufferedBroadcast]):
+        if not messages:
+            return
+
+        from channels.layers import get_channel_layer
+
+        for message in messages:
+            self._replace_oversized_payload(message)
+
+        try:
+            await send_messages_to_channel_groups(get_channel_layer(), messages)
+        except Exception:
+            # The changes have already been committed, so failing to notify the
+            # clients must not fail the request.
+            logger.exception("Failed to broadcast the realtime messages.")
+
+
+broadcast_buffer = BroadcastBuffer()
+
+
+class BroadcastBufferMiddleware(SyncAndAsyncMiddleware):
+    """
+    Buffers the realtime payloads that are broadcast directly to the channel layer
+    during a request and sends them at the end of it.
+    """
+
+    def sync_call(self, request):
+        with broadcast_buffer.context():
+            return self.get_response(request)
+
+    async def async_call(self, request):
+        broadcast_buffer.start()
+        try:
+            return await self.get_response(request)
+        finally:
+            await broadcast_buffer.aflush()
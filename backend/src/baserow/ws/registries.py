@@ -1,6 +1,9 @@
 from typing import Optional
 
+from django.conf import settings
+
 from baserow.core.registry import Instance, Registry
+from baserow.ws.broadcast import BufferedBroadcast, broadcast_buffer
 from baserow.ws.tasks import broadcast_many_to_channel_group, broadcast_to_channel_group
 
 
@@ -78,6 +81,32 @@ class PageType(Instance):
 
         return None
 
+    def merge_payloads(self, payload: dict, next_payload: dict) -> Optional[dict]:
+        """
+        When the payloads are broadcast directly to the channel layer, consecutive
+        payloads sent to the same group during a request are merged into a single
+        message if this method returns the merged payload.
+
+        :param payload: The payload that was broadcast first.
+        :param next_payload: The payload that was broadcast right after it.
+        :return: The merged payload, or None if they can't be merged.
+        """
+
+        return None
+
+    def get_oversized_payload_replacement(self, payload: dict) -> Optional[dict]:
+        """
+        When the payloads are broadcast directly to the channel layer, a payload
+        larger than `BASEROW_WS_BROADCAST_MAX_PAYLOAD_SIZE` is replaced by the
+        returned payload, which can for example tell the clients to refetch the
+        data instead.
+
+        :param payload: The oversized payload.
+        :return: The smaller payload to send instead, or None to send the original.
+        """
+
+        return None
+
     def broadcast(
         self, payload, ignore_web_socket_id=None, exclude_user_ids=None, **kwargs
     ):
@@ -97,6 +126,18 @@ class PageType(Instance):
         :type kwargs: dict
         """
 
+        if settings.BASEROW_WS_BROADCAST_DIRECTLY:
+            broadcast_buffer.add(
+                BufferedBroadcast(
+                    self,
+                    self.get_group_name(**kwargs),
+                    payload,
+                    ignore_web_socket_id,
+                    exclude_user_ids,
+                )
+            )
+            return
+
         broadcast_to_channel_group.delay(
             self.get_group_name(**kwargs),
             payload,
@@ -126,6 +167,13 @@ class PageType(Instance):
         :return:
         """
 
+        if settings.BASEROW_WS_BROADCAST_DIRECTLY:
+            for group_kw, payload in payloads_with_groups:
+                self.broadcast(
+                    payload, ignore_web_socket_id, exclude_user_ids, **group_kw
+                )
+            return
+
         broadcast_many_to_channel_group.delay(
             [
                 (
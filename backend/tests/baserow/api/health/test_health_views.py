@@ -84,6 +84,7 @@ def test_full_health_check_endpoint_returns_dict_of_checks_vs_status_with_200_st
         },
         "celery_queue_size": 5,
         "celery_export_queue_size": 5,
+        "database_pools": {},
     }
 
 
@@ -111,6 +112,30 @@ def test_passing_is_false_when_one_critical_service_fails(
         "passing": False,
         "celery_queue_size": 5,
         "celery_export_queue_size": 5,
+        "database_pools": {},
+    }
+
+
+@pytest.mark.django_db
+@patch("baserow.api.health.views.get_database_pool_stats")
+@patch("baserow.api.health.views.get_celery_queue_size")
+def test_full_health_check_endpoint_returns_database_pool_stats(
+    mock_get_size, mock_get_database_pool_stats, data_fixture, api_client
+):
+    mock_get_size.return_value = 5
+    mock_get_database_pool_stats.return_value = {
+        "default": {"pool_size": 4, "pool_available": 3, "requests_waiting": 0}
+    }
+    user, token = data_fixture.create_user_and_token(is_staff=True)
+
+    response = api_client.get(
+        reverse("api:health:full_health_check"),
+        content_type="application/json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["database_pools"] == {
+        "default": {"pool_size": 4, "pool_available": 3, "requests_waiting": 0}
     }
 
 
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import UUID
+
+from django.utils.translation import gettext_lazy
+
+import orjson
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from baserow.api.renderers import OrjsonRenderer
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        None,
+        [],
+        {"count": 0, "next": None, "previous": None, "results": []},
+        OrderedDict(
+            [
+                ("id", 1),
+                ("order", "1.00000000000000000000"),
+                ("field_1", 'Tëst \u2028 \u2029 "quoted"'),
+                ("field_2", Decimal("1.50")),
+                ("field_3", datetime(2020, 2, 1, 1, 23, tzinfo=timezone.utc)),
+                ("field_4", date(2020, 2, 1)),
+                ("field_5", UUID("a3b7c1e2-8f0a-4b6a-9f7b-0c1d2e3f4a5b")),
+                ("field_6", [{"id": 1, "value": gettext_lazy("Lazy")}]),
+                ("field_7", True),
+                ("field_8", 1.5),
+                (1, "non string key"),
+            ]
+        ),
+    ],
+)
+def test_orjson_renderer_renders_like_the_json_renderer(data):
+    with patch("baserow.api.renderers.orjson.dumps", wraps=orjson.dumps) as mock_dumps:
+        assert OrjsonRenderer().render(data) == JSONRenderer().render(data)
+
+    # Only an empty response is rendered without orjson.
+    assert mock_dumps.called == (data is not None)
+
+
+def test_orjson_renderer_respects_the_requested_indentation():
+    data = {"a": [1, 2]}
+    media_type = "application/json; indent=4"
+
+    with patch("baserow.api.renderers.orjson.dumps", wraps=orjson.dumps) as mock_dumps:
+        assert OrjsonRenderer().render(data, media_type) == JSONRenderer().render(
+            data, media_type
+        )
+
+    mock_dumps.assert_not_called()
+
+
+def test_orjson_renderer_falls_back_on_the_json_renderer():
+    data = {"big": 2**64, "nested": [{"bigger": -(2**100)}]}
+
+    assert OrjsonRenderer().render(data) == JSONRenderer().render(data)
@@ -0,0 +1,49 @@
+import threading
+
+from django.shortcuts import reverse
+from django.test import AsyncClient
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.status import HTTP_200_OK
+
+from baserow.api.async_views import shutdown_read_executor
+from baserow.contrib.database.rows.signals import rows_loaded
+
+
+@pytest.fixture
+def read_thread_names(settings):
+    settings.BASEROW_ASYNC_READ_THREADS = 2
+    shutdown_read_executor()
+    thread_names = []
+
+    def rows_loaded_receiver(sender, table, **kwargs):
+        thread_names.append(threading.current_thread().name)
+
+    rows_loaded.connect(rows_loaded_receiver)
+    try:
+        yield thread_names
+    finally:
+        rows_loaded.disconnect(rows_loaded_receiver)
+        shutdown_read_executor()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_read_view_lists_rows_on_the_read_thread_pool(
+    data_fixture, api_client, read_thread_names
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, primary=True, name="Name")
+    table.get_model().objects.create(**{field.db_column: "Row"})
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    response = async_to_sync(AsyncClient().get)(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    assert [row[field.db_column] for row in response.json()["results"]] == ["Row"]
+    assert read_thread_names[-1].startswith("baserow-read")
+
+    # Requests served with WSGI are handled in the thread of the request.
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    assert read_thread_names[-1] == threading.current_thread().name
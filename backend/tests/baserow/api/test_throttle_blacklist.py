@@ -6,6 +6,7 @@ from django.test.utils import CaptureQueriesContext, override_settings
 from django.utils.module_loading import import_string
 
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
 from rest_framework.status import HTTP_429_TOO_MANY_REQUESTS
 
 from baserow.throttling.blacklist import (
@@ -15,7 +16,11 @@ from baserow.throttling.blacklist import (
     get_token_cooldown_time,
     is_ip_blacklisted,
 )
-from baserow.throttling.middleware import ThrottleBlacklistMiddleware
+from baserow.throttling.handler import ConcurrentUserRequestsThrottle
+from baserow.throttling.middleware import (
+    ConcurrentUserRequestsMiddleware,
+    ThrottleBlacklistMiddleware,
+)
 
 
 def test_blacklist_key_is_sha256_hex():
@@ -115,6 +120,33 @@ def test_middleware_ignores_non_jwt_requests():
     assert response.status_code == 200
 
 
+def test_middlewares_support_async_requests():
+    async def ok_response(request):
+        return HttpResponse(status=200)
+
+    middleware = ThrottleBlacklistMiddleware(ok_response)
+    assert iscoroutinefunction(middleware)
+    blacklist_token("async-token")
+
+    factory = RequestFactory()
+    request = factory.get("/api/workspaces/", HTTP_AUTHORIZATION="JWT async-token")
+    response = async_to_sync(middleware)(request)
+    assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+
+    request = factory.get("/api/workspaces/", HTTP_AUTHORIZATION="JWT clean-token")
+    response = async_to_sync(middleware)(request)
+    assert response.status_code == 200
+
+    middleware = ConcurrentUserRequestsMiddleware(ok_response)
+    assert iscoroutinefunction(middleware)
+    with patch.object(
+        ConcurrentUserRequestsThrottle, "on_request_processed"
+    ) as mock_on_request_processed:
+        response = async_to_sync(middleware)(request)
+    assert response.status_code == 200
+    mock_on_request_processed.assert_called_once_with(request)
+
+
 @pytest.mark.django_db
 def test_middleware_zero_db_queries_on_blacklist_hit(data_fixture):
     """The whole point: a blacklisted token triggers zero DB queries."""
@@ -1,7 +1,7 @@
 import pytest
 from rest_framework.serializers import Serializer
 
-from baserow.api.user_files.serializers import UserFileField
+from baserow.api.user_files.serializers import UserFileField, UserFileSerializer
 
 
 @pytest.mark.django_db
@@ -37,3 +37,14 @@ def test_user_file_field(data_fixture):
 
     serializer = TmpSerializer({"user_file": None})
     assert serializer.data["user_file"] is None
+
+
+@pytest.mark.django_db
+def test_user_file_serializer_omits_the_thumbnails_while_they_are_queued(
+    data_fixture,
+):
+    user_file = data_fixture.create_user_file(is_image=True, thumbnails_queued=True)
+    assert UserFileSerializer(user_file).data["thumbnails"] is None
+
+    user_file.thumbnails_queued = False
+    assert "tiny" in UserFileSerializer(user_file).data["thumbnails"]
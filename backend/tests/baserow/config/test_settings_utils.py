@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+
+import pytest
+
+from baserow.config.settings.utils import configure_db_connection_pool
+
+POOL_OPTIONS = {"min_size": 2, "max_size": 10}
+
+
+@patch("baserow.config.settings.utils.importlib.util.find_spec")
+@patch("django.db.backends.postgresql.psycopg_any.is_psycopg3", True)
+def test_configure_db_connection_pool(mock_find_spec):
+    mock_find_spec.return_value = object()
+    databases = {
+        "default": {"CONN_MAX_AGE": 60},
+        "replica": {"CONN_MAX_AGE": 60, "OPTIONS": {"pool": {"max_size": 4}}},
+    }
+
+    configure_db_connection_pool(databases, POOL_OPTIONS)
+
+    mock_find_spec.assert_called_once_with("psycopg_pool")
+    assert databases == {
+        "default": {"CONN_MAX_AGE": 0, "OPTIONS": {"pool": POOL_OPTIONS}},
+        "replica": {"CONN_MAX_AGE": 0, "OPTIONS": {"pool": {"max_size": 4}}},
+    }
+
+
+@patch("baserow.config.settings.utils.importlib.util.find_spec")
+@patch("django.db.backends.postgresql.psycopg_any.is_psycopg3", False)
+def test_configure_db_connection_pool_requires_psycopg3(mock_find_spec):
+    mock_find_spec.return_value = object()
+    databases = {"default": {"CONN_MAX_AGE": 60}}
+
+    with pytest.raises(ImproperlyConfigured):
+        configure_db_connection_pool(databases, POOL_OPTIONS)
+
+    assert databases == {"default": {"CONN_MAX_AGE": 60}}
+
+
+@patch("baserow.config.settings.utils.importlib.util.find_spec", return_value=None)
+@patch("django.db.backends.postgresql.psycopg_any.is_psycopg3", True)
+def test_configure_db_connection_pool_requires_the_pool_extra(mock_find_spec):
+    with pytest.raises(ImproperlyConfigured):
+        configure_db_connection_pool({"default": {}}, POOL_OPTIONS)
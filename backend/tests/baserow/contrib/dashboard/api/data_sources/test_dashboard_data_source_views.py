@@ -539,3 +539,101 @@ def test_dispatch_data_source_improperly_configured(api_client, data_fixture):
         response.json()["detail"] == "The data_source configuration is incorrect: "
         "No integration selected"
     )
+
+
+@pytest.mark.django_db
+def test_dispatch_dashboard_data_sources(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    field = data_fixture.create_number_field(table=table)
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {f"field_{field.id}": 10},
+            {f"field_{field.id}": 20},
+            {f"field_{field.id}": 30},
+        ],
+    )
+    dashboard = data_fixture.create_dashboard_application(workspace=workspace)
+    integration = data_fixture.create_local_baserow_integration(
+        authorized_user=user, application=dashboard
+    )
+    data_source_1 = (
+        data_fixture.create_dashboard_local_baserow_aggregate_rows_data_source(
+            user=user,
+            dashboard=dashboard,
+            service=data_fixture.create_local_baserow_aggregate_rows_service(
+                integration=integration,
+                table=table,
+                field=field,
+                aggregation_type="sum",
+            ),
+        )
+    )
+    data_source_2 = (
+        data_fixture.create_dashboard_local_baserow_aggregate_rows_data_source(
+            user=user,
+            dashboard=dashboard,
+            service=data_fixture.create_local_baserow_aggregate_rows_service(
+                integration=integration,
+                table=table,
+                field=field,
+                aggregation_type="min",
+            ),
+        )
+    )
+    data_source_3 = (
+        data_fixture.create_dashboard_local_baserow_aggregate_rows_data_source(
+            user=user,
+            dashboard=dashboard,
+            service=data_fixture.create_local_baserow_aggregate_rows_service(
+                integration=integration, table=table, aggregation_type="sum"
+            ),
+        )
+    )
+    url = reverse(
+        "api:dashboard:data_sources:dispatch-all",
+        kwargs={"dashboard_id": dashboard.id},
+    )
+
+    response = api_client.post(
+        url,
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {
+        str(data_source_1.id): {"result": "60"},
+        str(data_source_2.id): {"result": "10"},
+        str(data_source_3.id): {
+            "_error": "ERROR_DASHBOARD_DATA_SOURCE_IMPROPERLY_CONFIGURED",
+            "detail": "The data_source configuration is incorrect: "
+            "The field property is missing.",
+        },
+    }
+
+
+@pytest.mark.django_db
+def test_dispatch_dashboard_data_sources_permission_denied(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    dashboard = data_fixture.create_dashboard_application()
+    data_fixture.create_dashboard_local_baserow_aggregate_rows_data_source(
+        dashboard=dashboard
+    )
+    url = reverse(
+        "api:dashboard:data_sources:dispatch-all",
+        kwargs={"dashboard_id": dashboard.id},
+    )
+
+    response = api_client.post(
+        url,
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert response.json()["error"] == "PERMISSION_DENIED"
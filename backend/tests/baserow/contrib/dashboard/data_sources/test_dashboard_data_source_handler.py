@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.db import DatabaseError, connections, transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
@@ -14,9 +16,13 @@ from baserow.contrib.dashboard.data_sources.handler import DashboardDataSourceHa
 from baserow.contrib.dashboard.data_sources.models import DashboardDataSource
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import LocalBaserowAggregateRows
+from baserow.contrib.integrations.local_baserow.service_types import (
+    LocalBaserowAggregateRowsUserServiceType,
+)
 from baserow.core.services.exceptions import (
     ServiceImproperlyConfiguredDispatchException,
 )
+from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
 from baserow.core.services.registries import service_type_registry
 
@@ -396,3 +402,175 @@ def test_dispatch_data_source_improperly_configured(data_fixture):
 
     with pytest.raises(ServiceImproperlyConfiguredDispatchException):
         DashboardDataSourceHandler().dispatch_data_source(data_source, dispatch_context)
+
+
+def _create_aggregate_data_sources(data_fixture, *service_kwargs):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    field = data_fixture.create_number_field(table=table)
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {f"field_{field.id}": 10},
+            {f"field_{field.id}": 20},
+            {f"field_{field.id}": 30},
+        ],
+    )
+    dashboard = data_fixture.create_dashboard_application(workspace=workspace)
+    integration = data_fixture.create_local_baserow_integration(
+        authorized_user=user, application=dashboard
+    )
+    data_sources = [
+        data_fixture.create_dashboard_local_baserow_aggregate_rows_data_source(
+            user=user,
+            dashboard=dashboard,
+            service=data_fixture.create_local_baserow_aggregate_rows_service(
+                **{"integration": integration, "table": table, "field": field, **kwargs}
+            ),
+        )
+        for kwargs in service_kwargs
+    ]
+    return user, table, field, data_sources
+
+
+@pytest.mark.django_db
+def test_dispatch_data_sources_merges_aggregations_over_the_same_rows(
+    data_fixture,
+):
+    user, table, field, data_sources = _create_aggregate_data_sources(
+        data_fixture,
+        {"aggregation_type": "sum"},
+        {"aggregation_type": "max"},
+        {"aggregation_type": "empty_count"},
+        {"aggregation_type": "sum", "field": None},
+    )
+    view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=view, field=field, type="higher_than", value="15"
+    )
+    data_sources.append(
+        data_fixture.create_dashboard_local_baserow_aggregate_rows_data_source(
+            user=user,
+            dashboard=data_sources[0].dashboard,
+            service=data_fixture.create_local_baserow_aggregate_rows_service(
+                integration=data_sources[0].service.integration,
+                table=table,
+                view=view,
+                field=field,
+                aggregation_type="sum",
+            ),
+        )
+    )
+
+    with patch.object(
+        LocalBaserowAggregateRowsUserServiceType,
+        "_aggregate_many",
+        autospec=True,
+        side_effect=LocalBaserowAggregateRowsUserServiceType._aggregate_many,
+    ) as aggregate_many:
+        results = DashboardDataSourceHandler().dispatch_data_sources(
+            data_sources, DashboardDispatchContext(HttpRequest())
+        )
+
+    # One query for the rows of the table and one for the rows of the view.
+    assert aggregate_many.call_count == 2
+    assert results[data_sources[0].id] == {"result": "60"}
+    assert results[data_sources[1].id] == {"result": "30"}
+    assert results[data_sources[2].id] == {"result": "0"}
+    assert isinstance(
+        results[data_sources[3].id], ServiceImproperlyConfiguredDispatchException
+    )
+    assert results[data_sources[4].id] == {"result": "50"}
+
+
+@pytest.mark.django_db
+def test_dispatch_data_source_results_are_cached_until_the_table_changes(
+    data_fixture, settings
+):
+    settings.DASHBOARD_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS = 300
+    user, table, field, [data_source] = _create_aggregate_data_sources(
+        data_fixture, {"aggregation_type": "sum"}
+    )
+
+    def dispatch():
+        return DashboardDataSourceHandler().dispatch_data_source(
+            DashboardDataSource.objects.get(id=data_source.id),
+            DashboardDispatchContext(HttpRequest()),
+        )
+
+    with patch.object(
+        ServiceHandler, "dispatch_services", wraps=ServiceHandler().dispatch_services
+    ) as dispatch_services:
+        assert dispatch() == {"result": "60"}
+        assert dispatch() == {"result": "60"}
+        assert dispatch_services.call_count == 1
+
+        RowHandler().create_rows(user, table, [{f"field_{field.id}": 40}])
+        assert dispatch() == {"result": "100"}
+        assert dispatch_services.call_count == 2
+
+        DashboardDataSourceHandler().update_data_source(
+            DashboardDataSourceHandler().get_data_source_for_update(data_source.id),
+            service_type_registry.get(LocalBaserowAggregateRowsUserServiceType.type),
+            aggregation_type="max",
+        )
+        assert dispatch() == {"result": "40"}
+        assert dispatch_services.call_count == 3
+
+
+@pytest.mark.django_db
+def test_dispatch_data_sources_only_dispatches_the_data_sources_not_cached(
+    data_fixture, settings
+):
+    settings.DASHBOARD_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS = 300
+    user, table, field, [data_source] = _create_aggregate_data_sources(
+        data_fixture, {"aggregation_type": "sum"}
+    )
+    other_table = data_fixture.create_database_table(database=table.database)
+    other_field = data_fixture.create_number_field(table=other_table)
+    RowHandler().create_rows(user, other_table, [{f"field_{other_field.id}": 5}])
+    other_data_source = (
+        data_fixture.create_dashboard_local_baserow_aggregate_rows_data_source(
+            user=user,
+            dashboard=data_source.dashboard,
+            service=data_fixture.create_local_baserow_aggregate_rows_service(
+                integration=data_source.service.integration,
+                table=other_table,
+                field=other_field,
+                aggregation_type="sum",
+            ),
+        )
+    )
+
+    def dispatch():
+        return DashboardDataSourceHandler().dispatch_data_sources(
+            list(
+                DashboardDataSource.objects.filter(
+                    id__in=[data_source.id, other_data_source.id]
+                ).order_by("id")
+            ),
+            DashboardDispatchContext(HttpRequest()),
+        )
+
+    with patch.object(
+        ServiceHandler, "dispatch_services", wraps=ServiceHandler().dispatch_services
+    ) as dispatch_services:
+        assert dispatch() == {
+            data_source.id: {"result": "60"},
+            other_data_source.id: {"result": "5"},
+        }
+        assert dispatch_services.call_count == 1
+        assert len(dispatch_services.call_args[0][0]) == 2
+
+        RowHandler().create_rows(user, other_table, [{f"field_{other_field.id}": 1}])
+        assert dispatch() == {
+            data_source.id: {"result": "60"},
+            other_data_source.id: {"result": "6"},
+        }
+        assert dispatch_services.call_count == 2
+        assert [service.id for service in dispatch_services.call_args[0][0]] == [
+            other_data_source.service_id
+        ]
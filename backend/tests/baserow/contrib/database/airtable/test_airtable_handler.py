@@ -966,6 +966,80 @@ def test_import_from_airtable_to_workspace(
     assert row_1.checkbox is False
 
 
+@pytest.mark.django_db
+def test_fetch_and_combine_airtable_data_concurrently(airtable_stand_in, settings):
+    settings.BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS = 4
+    airtable_stand_in.latency = 0.1
+
+    (
+        init_data,
+        request_id,
+        cookies,
+        schema,
+        tables,
+    ) = AirtableHandler.fetch_and_combine_airtable_data(
+        "appZkaH3aWX3ZjT3b", AirtableImportConfig()
+    )
+
+    assert request_id == "req8wbZoh7Be65osz"
+    assert [table["id"] for table in schema["tableSchemas"]] == [
+        "tblRpq315qnnIcg5IjI",
+        "tbl7glLIGtH8C8zGCzb",
+    ]
+    # The missing view data is appended in the order of the views, regardless of
+    # which request finished first.
+    assert [view["id"] for view in tables["tbl7glLIGtH8C8zGCzb"]["viewDatas"]] == [
+        "viwcpYeEpAs6kZspktV",
+        "viwDgBCKTEdCQoHTQKH",
+        "viwBAGnUgZ6X5Eyg5Wf",
+    ]
+    # The base page, two tables and two views.
+    assert airtable_stand_in.request_count == 5
+    assert airtable_stand_in.max_concurrent_requests > 1
+
+
+@pytest.mark.django_db
+def test_fetch_and_combine_airtable_data_respects_max_concurrent_requests(
+    airtable_stand_in, settings
+):
+    settings.BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS = 1
+    airtable_stand_in.latency = 0.05
+
+    AirtableHandler.fetch_and_combine_airtable_data(
+        "appZkaH3aWX3ZjT3b", AirtableImportConfig()
+    )
+
+    assert airtable_stand_in.request_count == 5
+    assert airtable_stand_in.max_concurrent_requests == 1
+
+
+@pytest.mark.django_db
+def test_import_from_airtable_to_workspace_with_stand_in_server(
+    data_fixture, tmpdir, airtable_stand_in, settings
+):
+    settings.BASEROW_AIRTABLE_IMPORT_DOWNLOAD_CHUNK_SIZE = 1024
+    workspace = data_fixture.create_workspace()
+    storage = FileSystemStorage(location=(str(tmpdir)), base_url="http://localhost")
+
+    database = AirtableHandler.import_from_airtable_to_workspace(
+        workspace, "appZkaH3aWX3ZjT3b", storage=storage
+    )
+
+    assert database.name == "Test"
+    assert database.table_set.count() == 3
+    base_path = os.path.join(
+        settings.BASE_DIR, "../../../tests/airtable_responses/basic"
+    )
+    # The files are streamed in chunks that are much smaller than the files
+    # themselves, but they must arrive complete in the storage.
+    for file_name in ["file-sample_500kB.doc", "file_example_JPG_100kB.jpg"]:
+        user_file = UserFile.objects.get(original_name=file_name)
+        with open(os.path.join(base_path, file_name), "rb") as file_handler:
+            expected = file_handler.read()
+        assert user_file.size == len(expected)
+        assert tmpdir.join("user_files", user_file.name).read_binary() == expected
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_import_from_airtable_to_workspace_file_size_over_limit(
@@ -1,11 +1,15 @@
 import json
 
+from django.core.exceptions import ObjectDoesNotExist
+
 import pytest
 from pytest_unordered import unordered
 from rest_framework import serializers
 
 from baserow.contrib.database.api.rows.serializers import (
+    CompiledRowSerializer,
     RowSerializer,
+    get_compiled_row_serializer,
     get_example_row_serializer_class,
     get_row_serializer_class,
     remap_serialized_row_to_user_field_names,
@@ -663,3 +667,88 @@ def test_get_table_serializer_single_select_default(data_fixture):
     serializer_instance = serializer_class(data={"status": None})
     assert serializer_instance.is_valid()
     assert serializer_instance.data["status"] is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("user_field_names", [True, False])
+def test_compiled_row_serializer_matches_row_serializer(
+    data_fixture, django_assert_num_queries, user_field_names
+):
+    table, user, row, _, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    model.objects.create()
+    rows = list(model.objects.all().enhance_by_fields().order_by("id"))
+
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, user_field_names=user_field_names
+    )
+    expected = serializer_class(rows, many=True).data
+
+    with django_assert_num_queries(0):
+        compiled = CompiledRowSerializer(serializer_class)
+        result = compiled.serialize_many(rows)
+
+    assert result == expected
+    assert [list(r.keys()) for r in result] == [list(r.keys()) for r in expected]
+    assert compiled.serialize(rows[0]) == expected[0]
+
+
+def test_compiled_row_serializer_resolves_attributes_like_drf():
+    class Row:
+        id = 1
+
+        def name(self):
+            return "Called"
+
+        @property
+        def related(self):
+            raise ObjectDoesNotExist()
+
+    class Serializer(serializers.Serializer):
+        id = serializers.IntegerField()
+        name = serializers.CharField()
+        related = serializers.CharField()
+
+    row = Row()
+    expected = Serializer(row).data
+
+    assert CompiledRowSerializer(Serializer).serialize(row) == expected
+    assert expected["name"] == "Called"
+    assert expected["related"] is None
+
+
+@pytest.mark.django_db
+def test_get_compiled_row_serializer_is_cached_on_the_model(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    model = table.get_model()
+    row = model.objects.create(
+        **{f"field_{text_field.id}": "a", f"field_{number_field.id}": 1}
+    )
+
+    serializer = get_compiled_row_serializer(
+        model, RowSerializer, is_response=True, field_ids=[text_field.id]
+    )
+    assert serializer is get_compiled_row_serializer(
+        model, RowSerializer, is_response=True, field_ids=[text_field.id]
+    )
+    assert serializer.serialize(row) == {
+        "id": row.id,
+        "order": "1.00000000000000000000",
+        f"field_{text_field.id}": "a",
+    }
+
+    all_fields_serializer = get_compiled_row_serializer(
+        model, RowSerializer, is_response=True
+    )
+    assert all_fields_serializer is not serializer
+    assert f"field_{number_field.id}" in all_fields_serializer.serialize(row)
+
+    # Field kwargs containing objects can't be cached.
+    field_kwargs = {f"field_{text_field.id}": {"help_text": object()}}
+    assert get_compiled_row_serializer(
+        model, RowSerializer, is_response=True, field_kwargs=field_kwargs
+    ) is not get_compiled_row_serializer(
+        model, RowSerializer, is_response=True, field_kwargs=field_kwargs
+    )
@@ -16,6 +16,7 @@ from freezegun import freeze_time
 from pytest_unordered import unordered
 from rest_framework.status import (
     HTTP_200_OK,
+    HTTP_202_ACCEPTED,
     HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
@@ -31,6 +32,7 @@ from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.actions import UpdateRowsActionType
+from baserow.contrib.database.rows.coalescing import CoalescedRowUpdateHandler
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.search.handler import ALL_SEARCH_MODES
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
@@ -5205,3 +5207,115 @@ def test_update_row_succeeds_when_legacy_view_index_exceeds_max_size(
 
     grid_view_2.refresh_from_db()
     assert grid_view_2.db_index_name is None
+
+
+@pytest.mark.django_db
+def test_update_row_coalesced(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Color")
+    number_field = data_fixture.create_number_field(table=table, name="Horsepower")
+    model = table.get_model()
+    row = model.objects.create()
+
+    url = reverse(
+        "api:database:rows:item", kwargs={"table_id": table.id, "row_id": row.id}
+    )
+    response = api_client.patch(
+        f"{url}?coalesce=applied&user_field_names=true",
+        {"Color": "Orange", "Horsepower": 120},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["id"] == row.id
+    assert response_json["Color"] == "Orange"
+    assert response_json["Horsepower"] == "120"
+
+    with patch(
+        "baserow.contrib.database.rows.tasks.flush_coalesced_row_updates.apply_async"
+    ) as mock_apply_async:
+        response = api_client.patch(
+            f"{url}?coalesce=accepted",
+            {f"field_{text_field.id}": "Green"},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+    assert response.status_code == HTTP_202_ACCEPTED
+    assert response.json() == {"id": row.id}
+    mock_apply_async.assert_called_once()
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{text_field.id}") == "Orange"
+
+    # The buffered update is applied when the scheduled task runs.
+    from baserow.contrib.database.rows.tasks import flush_coalesced_row_updates
+
+    flush_coalesced_row_updates(table.id)
+    row.refresh_from_db()
+    assert getattr(row, f"field_{text_field.id}") == "Green"
+    assert getattr(row, f"field_{number_field.id}") == 120
+
+    response = api_client.patch(
+        f"{url}?coalesce=applied",
+        {f"field_{number_field.id}": "not a number"},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+
+    url = reverse(
+        "api:database:rows:item", kwargs={"table_id": table.id, "row_id": 99999}
+    )
+    response = api_client.patch(
+        f"{url}?coalesce=applied",
+        {f"field_{text_field.id}": "Green"},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+    response = api_client.patch(
+        f"{url}?coalesce=invalid",
+        {f"field_{text_field.id}": "Green"},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+
+@pytest.mark.django_db
+def test_update_row_coalesced_waits_outside_of_the_transaction(
+    api_client, data_fixture
+):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Color")
+    row = table.get_model().objects.create()
+
+    savepoint_counts = []
+    original_wait_for_result = CoalescedRowUpdateHandler.wait_for_result
+
+    def wait_for_result(self, *args, **kwargs):
+        savepoint_counts.append(len(connection.savepoint_ids))
+        return original_wait_for_result(self, *args, **kwargs)
+
+    url = reverse(
+        "api:database:rows:item", kwargs={"table_id": table.id, "row_id": row.id}
+    )
+    with patch.object(CoalescedRowUpdateHandler, "wait_for_result", wait_for_result):
+        response = api_client.patch(
+            f"{url}?coalesce=applied",
+            {f"field_{text_field.id}": "Orange"},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.json()[f"field_{text_field.id}"] == "Orange"
+    # The request doesn't open a transaction while waiting for the update.
+    assert savepoint_counts == [len(connection.savepoint_ids)]
@@ -3407,6 +3407,106 @@ def test_list_rows_public_doesnt_show_hidden_columns(api_client, data_fixture):
     }
 
 
+@pytest.mark.django_db
+def test_list_rows_public_is_cached_until_the_table_changes(
+    api_client, data_fixture, settings
+):
+    settings.BASEROW_PUBLIC_VIEW_ROWS_CACHE_TTL_SECONDS = 60
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="public")
+    grid_view = data_fixture.create_grid_view(table=table, user=user, public=True)
+    RowHandler().create_row(user, table, values={f"field_{field.id}": "a"})
+    url = reverse(
+        "api:database:views:grid:public_rows", kwargs={"slug": grid_view.slug}
+    )
+
+    response = api_client.get(url)
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 1
+    etag = response["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+    # Rows changed without the row signals are only visible after the cache has
+    # been invalidated.
+    table.get_model().objects.create()
+    response = api_client.get(url)
+    assert response.json()["count"] == 1
+    assert response["ETag"] == etag
+
+    RowHandler().create_row(user, table, values={f"field_{field.id}": "b"})
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 3
+    assert response["ETag"] != etag
+
+    # The query parameters are part of the cache key.
+    response = api_client.get(url + "?size=1")
+    assert response.json()["count"] == 3
+    assert len(response.json()["results"]) == 1
+
+
+@pytest.mark.django_db
+def test_list_rows_public_cache_is_invalidated_when_the_sorts_change(
+    api_client, data_fixture, settings
+):
+    settings.BASEROW_PUBLIC_VIEW_ROWS_CACHE_TTL_SECONDS = 60
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="public")
+    grid_view = data_fixture.create_grid_view(table=table, user=user, public=True)
+    RowHandler().create_row(user, table, values={f"field_{field.id}": "a"})
+    RowHandler().create_row(user, table, values={f"field_{field.id}": "b"})
+    url = reverse(
+        "api:database:views:grid:public_rows", kwargs={"slug": grid_view.slug}
+    )
+
+    def get_values():
+        response = api_client.get(url)
+        return [row[f"field_{field.id}"] for row in response.json()["results"]]
+
+    assert get_values() == ["a", "b"]
+
+    view_sort = ViewHandler().create_sort(user, grid_view, field, "DESC")
+    assert get_values() == ["b", "a"]
+
+    ViewHandler().update_sort(user, view_sort, order="ASC")
+    assert get_values() == ["a", "b"]
+
+    view_sort = ViewHandler().update_sort(user, view_sort, order="DESC")
+    assert get_values() == ["b", "a"]
+
+    ViewHandler().delete_sort(user, view_sort)
+    assert get_values() == ["a", "b"]
+
+
+@pytest.mark.django_db
+def test_list_rows_public_cache_is_invalidated_when_the_group_bys_change(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table, user=user, public=True)
+
+    with patch.object(ViewHandler, "invalidate_public_view_rows_cache") as mock:
+        view_group_by = ViewHandler().create_group_by(
+            user, grid_view, field, "ASC", 200
+        )
+        mock.assert_called_once_with(table.id)
+
+        mock.reset_mock()
+        ViewHandler().update_group_by(user, view_group_by, order="DESC")
+        mock.assert_called_once_with(table.id)
+
+        mock.reset_mock()
+        ViewHandler().delete_group_by(user, view_group_by)
+        mock.assert_called_once_with(table.id)
+
+
 @pytest.mark.django_db
 def test_list_rows_public_with_query_param_filter(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
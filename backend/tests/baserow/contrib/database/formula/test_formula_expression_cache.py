@@ -0,0 +1,144 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import FormulaField
+from baserow.contrib.database.formula import BaserowFormulaTextType
+from baserow.contrib.database.formula.expression_cache import (
+    FormulaExpressionCache,
+    formula_expression_cache,
+)
+from baserow.contrib.database.formula.handler import FormulaHandler
+from baserow.contrib.database.formula.parser.ast_mapper import (
+    raw_formula_to_untyped_expression,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_formula_expression_cache():
+    formula_expression_cache.clear()
+    yield
+    formula_expression_cache.clear()
+
+
+def _patch_parser():
+    return patch(
+        "baserow.contrib.database.formula.handler.raw_formula_to_untyped_expression",
+        wraps=raw_formula_to_untyped_expression,
+    )
+
+
+@pytest.mark.django_db
+def test_formula_expressions_are_only_parsed_once_per_process(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_number_field(table=table, name="number")
+    field = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula="field('number') + 1"
+    )
+
+    formula_expression_cache.clear()
+    with _patch_parser() as parse:
+        for _ in range(3):
+            refetched_field = FormulaField.objects.get(id=field.id)
+            untyped_expression = refetched_field.cached_untyped_expression
+            typed_expression = refetched_field.cached_typed_internal_expression
+
+    # Once for the formula and once for the internal formula.
+    assert parse.call_count == 2
+    assert str(untyped_expression) == str(
+        raw_formula_to_untyped_expression(field.formula)
+    )
+    assert str(typed_expression) == field.internal_formula
+    assert typed_expression.expression_type is refetched_field.cached_formula_type
+
+
+@pytest.mark.django_db
+def test_cached_formula_expressions_are_copies(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula="concat('a', 'b')"
+    )
+
+    first = FormulaField.objects.get(id=field.id).cached_typed_internal_expression
+    first.with_type(BaserowFormulaTextType(nullable=True))
+    first.args.clear()
+
+    second_field = FormulaField.objects.get(id=field.id)
+    second = second_field.cached_typed_internal_expression
+    assert second is not first
+    assert len(second.args) == 2
+    assert second.expression_type is second_field.cached_formula_type
+    # The function definitions are shared because they don't hold any state.
+    assert second.function_def is first.function_def
+
+
+@pytest.mark.django_db
+def test_cached_formula_expressions_follow_formula_and_dependency_changes(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table, name="number")
+    field = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula="field('number') + 1"
+    )
+    FormulaField.objects.get(id=field.id).cached_typed_internal_expression
+
+    FieldHandler().update_field(user, field, formula="field('number') + 2")
+    refetched_field = FormulaField.objects.get(id=field.id)
+    assert str(refetched_field.cached_untyped_expression) == str(
+        raw_formula_to_untyped_expression("field('number') + 2")
+    )
+    assert (
+        str(refetched_field.cached_typed_internal_expression)
+        == refetched_field.internal_formula
+    )
+
+    FieldHandler().update_field(user, number_field, new_type_name="text")
+    refetched_field = FormulaField.objects.get(id=field.id)
+    assert (
+        str(refetched_field.cached_typed_internal_expression)
+        == refetched_field.internal_formula
+    )
+    assert (
+        refetched_field.cached_typed_internal_expression.expression_type
+        is refetched_field.cached_formula_type
+    )
+
+
+def test_formula_expression_cache_evicts_least_recently_used(settings):
+    settings.BASEROW_FORMULA_EXPRESSION_CACHE_SIZE = 2
+    cache = FormulaExpressionCache()
+
+    with _patch_parser() as parse:
+
+        def get(key):
+            return cache.get_or_parse(
+                key, lambda: FormulaHandler.raw_formula_to_untyped_expression("1")
+            )
+
+        get("a")
+        get("b")
+        get("a")
+        get("c")  # Evicts "b" which was used the longest ago.
+        get("a")
+        assert parse.call_count == 3
+
+        get("b")
+        assert parse.call_count == 4
+
+
+def test_formula_expression_cache_can_be_disabled(settings):
+    settings.BASEROW_FORMULA_EXPRESSION_CACHE_SIZE = 0
+    cache = FormulaExpressionCache()
+
+    with _patch_parser() as parse:
+        for _ in range(2):
+            cache.get_or_parse(
+                "a", lambda: FormulaHandler.raw_formula_to_untyped_expression("1")
+            )
+
+    assert parse.call_count == 2
@@ -309,6 +309,29 @@ def test_list_rows_returns_rows_with_user_field_names(data_fixture):
     assert "Bob" in names
 
 
+@pytest.mark.django_db
+def test_list_rows_only_returns_the_requested_fields(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    db = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=db)
+    data_fixture.create_text_field(name="Name", table=table, primary=True)
+    data_fixture.create_text_field(name="Color", table=table)
+
+    model = table.get_model(attribute_names=True)
+    model.objects.create(name="Alice", color="Blue")
+
+    result = services.list_rows(user, workspace, table.id, field_names=["Color"])
+    assert [set(row.keys()) for row in result["results"]] == [{"id", "order", "Color"}]
+    assert result["results"][0]["Color"] == "Blue"
+
+    result = services.list_rows(
+        user, workspace, table.id, search="Alice", field_names=["Color", "Unknown"]
+    )
+    assert [row["Color"] for row in result["results"]] == ["Blue"]
+    assert "Name" not in result["results"][0]
+
+
 @pytest.mark.django_db
 def test_list_rows_cross_workspace_raises(data_fixture):
     user = data_fixture.create_user()
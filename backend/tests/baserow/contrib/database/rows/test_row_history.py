@@ -298,6 +298,42 @@ def test_row_history_handler_list_history_filters_with_registry(data_fixture):
     change_row_history_registry.unregister("row_history_op_stub")
 
 
+@pytest.mark.django_db
+@pytest.mark.row_history
+def test_list_row_history_excludes_expired_entries(settings, data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(user=user, database=database)
+    common_params = {
+        "table": table,
+        "row_id": 1,
+        "action_uuid": "uuid",
+        "action_command_type": "cmd",
+        "action_type": "type",
+        "field_names": [],
+        "fields_metadata": {},
+        "before_values": {},
+        "after_values": {},
+        "user_id": user.id,
+    }
+    RowHistory.objects.bulk_create(
+        [
+            RowHistory(
+                **common_params,
+                action_timestamp=datetime(2021, 1, day, 12, tzinfo=timezone.utc),
+            )
+            for day in range(1, 5)
+        ]
+    )
+
+    settings.BASEROW_ROW_HISTORY_RETENTION_DAYS = 2
+    with freeze_time("2021-01-05 10:00"):
+        entries = RowHistoryHandler().list_row_history(
+            database.workspace, table.id, row_id=1
+        )
+        assert [e.action_timestamp.day for e in entries] == [4, 3]
+
+
 @pytest.mark.django_db
 @pytest.mark.row_history
 def test_row_history_handler_delete_entries_older_than(data_fixture):
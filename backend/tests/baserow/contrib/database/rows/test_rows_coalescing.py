@@ -0,0 +1,202 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.contrib.database.rows.coalescing import CoalescedRowUpdateHandler
+from baserow.contrib.database.rows.constants import (
+    COALESCED_UPDATE_APPLIED,
+    COALESCED_UPDATE_FAILED,
+    COALESCED_UPDATE_INVALID,
+    COALESCED_UPDATE_ROW_DOES_NOT_EXIST,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.signals import rows_updated
+
+
+@pytest.mark.django_db
+def test_coalesced_row_updates_are_applied_as_one_bulk_update(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    model = table.get_model()
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+
+    handler = CoalescedRowUpdateHandler()
+    with patch(
+        "baserow.contrib.database.rows.tasks.flush_coalesced_row_updates.apply_async"
+    ) as mock_apply_async:
+        update_ids = [
+            handler.buffer_update(
+                user,
+                table,
+                row_1.id,
+                {f"field_{text_field.id}": "first"},
+                wait_for_result=True,
+            ),
+            handler.buffer_update(
+                user,
+                table,
+                row_2.id,
+                {"Number": 2},
+                user_field_names=True,
+                wait_for_result=True,
+            ),
+            handler.buffer_update(
+                user,
+                table,
+                row_1.id,
+                {f"field_{text_field.id}": "second", f"field_{number_field.id}": 1},
+                wait_for_result=True,
+            ),
+            handler.buffer_update(
+                user,
+                table,
+                row_2.id,
+                {f"field_{number_field.id}": "not a number"},
+                wait_for_result=True,
+            ),
+            handler.buffer_update(
+                user,
+                table,
+                99999,
+                {f"field_{text_field.id}": "missing"},
+                wait_for_result=True,
+            ),
+        ]
+
+    # The flush is only scheduled once per window.
+    mock_apply_async.assert_called_once_with((table.id,), countdown=0.2)
+
+    received_signals = []
+
+    def rows_updated_receiver(sender, rows, **kwargs):
+        received_signals.append(sorted(row.id for row in rows))
+
+    rows_updated.connect(rows_updated_receiver)
+    try:
+        handler.flush(table.id)
+    finally:
+        rows_updated.disconnect(rows_updated_receiver)
+
+    assert received_signals == [[row_1.id, row_2.id]]
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert getattr(row_1, f"field_{text_field.id}") == "second"
+    assert getattr(row_1, f"field_{number_field.id}") == 1
+    assert getattr(row_2, f"field_{number_field.id}") == 2
+
+    results = [handler.wait_for_result(update_id, 1) for update_id in update_ids]
+    assert [result["status"] for result in results] == [
+        COALESCED_UPDATE_APPLIED,
+        COALESCED_UPDATE_APPLIED,
+        COALESCED_UPDATE_APPLIED,
+        COALESCED_UPDATE_INVALID,
+        COALESCED_UPDATE_ROW_DOES_NOT_EXIST,
+    ]
+    assert handler.pop_updates(table.id, 10) == []
+
+
+@pytest.mark.django_db
+def test_coalesced_row_updates_fall_back_to_updating_rows_one_by_one(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    model = table.get_model()
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+
+    handler = CoalescedRowUpdateHandler()
+    updates = [
+        {
+            "id": str(index),
+            "user_id": user.id,
+            "row_id": row.id,
+            "values": {f"field_{text_field.id}": value},
+            "user_field_names": False,
+            "send_webhook_events": True,
+            "wait_for_result": False,
+        }
+        for index, (row, value) in enumerate([(row_1, "a"), (row_2, "b")])
+    ]
+
+    original_force_update_rows = RowHandler.force_update_rows
+
+    def force_update_rows(self, user, table, rows_values, *args, **kwargs):
+        if len(rows_values) > 1 or rows_values[0]["id"] == row_2.id:
+            raise ValueError("Failed")
+        return original_force_update_rows(
+            self, user, table, rows_values, *args, **kwargs
+        )
+
+    with patch.object(RowHandler, "force_update_rows", force_update_rows):
+        results = handler.apply_updates(table.id, updates)
+
+    assert results["0"]["status"] == COALESCED_UPDATE_APPLIED
+    assert results["1"]["status"] == COALESCED_UPDATE_FAILED
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert getattr(row_1, f"field_{text_field.id}") == "a"
+    assert getattr(row_2, f"field_{text_field.id}") is None
+
+
+@pytest.mark.django_db
+def test_coalesced_row_updates_of_several_users_are_applied_in_order(data_fixture):
+    user_1 = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user_1)
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    model = table.get_model()
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+
+    handler = CoalescedRowUpdateHandler()
+    updates = [
+        {
+            "id": str(index),
+            "user_id": user.id,
+            "row_id": row.id,
+            "values": {f"field_{text_field.id}": value},
+            "user_field_names": False,
+            "send_webhook_events": True,
+            "wait_for_result": False,
+        }
+        for index, (user, row, value) in enumerate(
+            [
+                (user_1, row_1, "a"),
+                (user_2, row_1, "b"),
+                (user_2, row_2, "c"),
+                (user_1, row_1, "d"),
+            ]
+        )
+    ]
+
+    received_signals = []
+
+    def rows_updated_receiver(sender, rows, user, **kwargs):
+        received_signals.append((user.id, sorted(row.id for row in rows)))
+
+    rows_updated.connect(rows_updated_receiver)
+    try:
+        results = handler.apply_updates(table.id, updates)
+    finally:
+        rows_updated.disconnect(rows_updated_receiver)
+
+    # The last update of the first user can't be merged with its first one because
+    # the row has been updated by the second user in between.
+    assert received_signals == [
+        (user_1.id, [row_1.id]),
+        (user_2.id, [row_1.id, row_2.id]),
+        (user_1.id, [row_1.id]),
+    ]
+    assert [results[str(index)]["status"] for index in range(4)] == [
+        COALESCED_UPDATE_APPLIED
+    ] * 4
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert getattr(row_1, f"field_{text_field.id}") == "d"
+    assert getattr(row_2, f"field_{text_field.id}") == "c"
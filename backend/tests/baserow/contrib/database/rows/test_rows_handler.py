@@ -1510,6 +1510,38 @@ def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fix
     assert row_4.order == Decimal("3.00000000000000000000")
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.row_orders_recalculated.send")
+def test_get_unique_orders_before_row_only_recalculates_surrounding_rows(
+    send_mock, data_fixture
+):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    model.objects.bulk_create([model(order=Decimal(order)) for order in range(1, 301)])
+    before_row = model.objects.create(order=Decimal("150.00000000000000000001"))
+    ids_in_order = list(model.objects.values_list("id", flat=True))
+    orders_before = dict(model.objects.values_list("id", "order"))
+
+    handler = RowHandler()
+    [new_order] = handler.get_unique_orders_before_row(before_row, model)
+
+    orders_after = dict(model.objects.values_list("id", "order"))
+    # Only the 100 rows before the before row, the before row and the 99 rows after
+    # it can be recalculated. The rows with order 50 and 250 are the bounds.
+    window = ids_in_order[50:250]
+    for row_id in ids_in_order:
+        if row_id not in window:
+            assert orders_after[row_id] == orders_before[row_id]
+    assert orders_after[before_row.id] != orders_before[before_row.id]
+    assert list(model.objects.values_list("id", flat=True)) == ids_in_order
+
+    before_row.refresh_from_db()
+    previous_order = orders_after[ids_in_order[ids_in_order.index(before_row.id) - 1]]
+    assert previous_order < new_order < before_row.order
+    send_mock.assert_called_once()
+    assert send_mock.call_args[1]["table"].id == table.id
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.row_orders_recalculated.send")
 def test_recalculate_row_orders(send_mock, data_fixture):
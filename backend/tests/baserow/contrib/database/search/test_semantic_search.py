@@ -0,0 +1,230 @@
+import re
+import zlib
+from unittest.mock import patch
+
+from django.db import connection
+
+import httpx
+import pytest
+
+from baserow.contrib.database.search.handler import SearchHandler, SearchMode
+from baserow.contrib.database.search.models import PendingSearchValueUpdate
+from baserow.contrib.database.search.semantic import SemanticSearchHandler
+from baserow.core.pgvector import DEFAULT_EMBEDDING_DIMENSIONS, try_enable_pgvector
+from baserow.core.search.handler import WorkspaceSearchHandler
+
+
+class DeterministicEmbedder:
+    """
+    Embeds a text as the counts of its words, hashed into the dimensions, so that
+    texts sharing words are close to each other without calling an embeddings API.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        embeddings = []
+        for text in texts:
+            embedding = [0.0] * DEFAULT_EMBEDDING_DIMENSIONS
+            for word in re.findall(r"\w+", text.lower()):
+                embedding[zlib.crc32(word.encode()) % DEFAULT_EMBEDDING_DIMENSIONS] += 1
+            embeddings.append(embedding)
+        return embeddings
+
+
+@pytest.fixture
+def embedder(settings):
+    if not try_enable_pgvector():
+        pytest.skip("The pgvector extension is not available.")
+
+    settings.BASEROW_SEMANTIC_SEARCH_ENABLED = True
+    settings.BASEROW_EMBEDDINGS_API_URL = "http://embeddings"
+    embedder = DeterministicEmbedder()
+    with patch.object(SemanticSearchHandler, "get_embedder", return_value=embedder):
+        yield embedder
+
+
+def _create_table_with_rows(data_fixture, user=None):
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, primary=True, name="Name")
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{field.db_column: value})
+        for value in ["apple banana", "car engine", "banana smoothie"]
+    ]
+    workspace_id = table.database.workspace_id
+    SearchHandler.create_workspace_search_table_if_not_exists(workspace_id)
+    SemanticSearchHandler.create_workspace_embedding_table_if_not_exists(workspace_id)
+    return table, field, rows
+
+
+@pytest.mark.django_db
+def test_update_embeddings_only_embeds_changed_rows(data_fixture, embedder, settings):
+    settings.BASEROW_SEMANTIC_SEARCH_EMBEDDING_BATCH_SIZE = 2
+    table, field, rows = _create_table_with_rows(data_fixture)
+    embedding_model = SemanticSearchHandler.get_workspace_embedding_table_model(
+        table.database.workspace_id
+    )
+
+    SemanticSearchHandler.update_embeddings(table)
+
+    assert embedder.calls == [["apple banana", "car engine"], ["banana smoothie"]]
+    assert embedding_model.objects.filter(table_id=table.id).count() == 3
+
+    embedder.calls.clear()
+    model = table.get_model()
+    model.objects.filter(id=rows[1].id).update(**{field.db_column: "car wheel"})
+    model.objects.filter(id=rows[2].id).update(**{field.db_column: ""})
+    SemanticSearchHandler.update_embeddings(table)
+
+    assert embedder.calls == [["car wheel"]]
+    assert sorted(
+        embedding_model.objects.filter(table_id=table.id).values_list(
+            "row_id", flat=True
+        )
+    ) == [rows[0].id, rows[1].id]
+
+
+@pytest.mark.django_db
+def test_process_search_data_updates_updates_embeddings(data_fixture, embedder):
+    table, field, rows = _create_table_with_rows(data_fixture)
+    embedding_model = SemanticSearchHandler.get_workspace_embedding_table_model(
+        table.database.workspace_id
+    )
+
+    PendingSearchValueUpdate.objects.create(field_id=field.id, row_id=rows[0].id)
+    SearchHandler.process_search_data_updates(table)
+
+    assert embedder.calls == [["apple banana"]]
+    assert list(
+        embedding_model.objects.filter(table_id=table.id).values_list(
+            "row_id", flat=True
+        )
+    ) == [rows[0].id]
+
+    embedder.calls.clear()
+    PendingSearchValueUpdate.objects.create(field_id=field.id, row_id=None)
+    SearchHandler.process_search_data_updates(table)
+
+    assert embedder.calls == [["car engine", "banana smoothie"]]
+    assert embedding_model.objects.filter(table_id=table.id).count() == 3
+
+
+@pytest.mark.django_db
+def test_process_search_data_updates_requeues_rows_failing_to_embed(
+    data_fixture, embedder
+):
+    table, field, rows = _create_table_with_rows(data_fixture)
+    embedding_model = SemanticSearchHandler.get_workspace_embedding_table_model(
+        table.database.workspace_id
+    )
+
+    PendingSearchValueUpdate.objects.create(field_id=field.id, row_id=rows[0].id)
+    with patch.object(
+        SemanticSearchHandler,
+        "embed_texts",
+        side_effect=httpx.ConnectError("The embeddings API is down."),
+    ):
+        SearchHandler.process_search_data_updates(table)
+
+    assert not embedding_model.objects.filter(table_id=table.id).exists()
+    assert list(PendingSearchValueUpdate.objects.values_list("field_id", "row_id")) == [
+        (field.id, rows[0].id)
+    ]
+
+    SearchHandler.process_search_data_updates(table)
+
+    assert embedder.calls == [["apple banana"]]
+    assert not PendingSearchValueUpdate.objects.exists()
+
+
+@pytest.mark.django_db
+def test_semantic_search_in_table(data_fixture, embedder, settings):
+    settings.BASEROW_SEMANTIC_SEARCH_MAX_RESULTS = 2
+    table, field, rows = _create_table_with_rows(data_fixture)
+    SemanticSearchHandler.update_embeddings(table)
+
+    queryset = table.get_model().objects.all()
+    results = queryset.search_all_fields("banana", search_mode=SearchMode.SEMANTIC)
+
+    assert sorted(row.id for row in results) == [rows[0].id, rows[2].id]
+
+    # The row ID still matches exactly.
+    results = queryset.search_all_fields(
+        str(rows[1].id), search_mode=SearchMode.SEMANTIC
+    )
+    assert rows[1].id in [row.id for row in results]
+
+
+@pytest.mark.django_db
+def test_semantic_search_in_table_with_rows_in_several_tables(
+    data_fixture, embedder, settings
+):
+    settings.BASEROW_SEMANTIC_SEARCH_MAX_RESULTS = 100
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    tables = []
+    for values in [
+        [f"banana apple{i}" for i in range(50)],
+        [f"banana cherry{i}" for i in range(50)],
+        ["banana car engine wheel", "banana car engine tire"],
+    ]:
+        table = data_fixture.create_database_table(database=database)
+        field = data_fixture.create_text_field(table=table, primary=True)
+        model = table.get_model()
+        for value in values:
+            model.objects.create(**{field.db_column: value})
+        tables.append(table)
+    SearchHandler.create_workspace_search_table_if_not_exists(workspace.id)
+    SemanticSearchHandler.create_workspace_embedding_table_if_not_exists(workspace.id)
+    for table in tables:
+        SemanticSearchHandler.update_embeddings(table)
+
+    # Force the HNSW index scan, which by default only returns 40 candidates, all of
+    # them nearer to the query than the rows of the last table.
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    queryset = tables[2].get_model().objects.all()
+    results = queryset.search_all_fields("banana", search_mode=SearchMode.SEMANTIC)
+
+    assert sorted(row.id for row in results) == sorted(row.id for row in queryset)
+
+
+@pytest.mark.django_db
+def test_semantic_search_falls_back_when_not_available(data_fixture, settings):
+    settings.BASEROW_SEMANTIC_SEARCH_ENABLED = False
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_text_field(table=table, primary=True)
+    model = table.get_model()
+    row = model.objects.create(**{field.db_column: "banana"})
+    model.objects.create(**{field.db_column: "car"})
+
+    results = model.objects.all().search_all_fields(
+        "banana", search_mode=SearchMode.SEMANTIC
+    )
+
+    assert [r.id for r in results] == [row.id]
+
+
+@pytest.mark.django_db
+def test_semantic_workspace_search(data_fixture, embedder):
+    user = data_fixture.create_user()
+    table, field, rows = _create_table_with_rows(data_fixture, user=user)
+    SemanticSearchHandler.update_embeddings(table)
+
+    result_data = WorkspaceSearchHandler().search_workspace(
+        user,
+        table.database.workspace,
+        "banana",
+        search_mode=SearchMode.SEMANTIC,
+    )
+
+    row_results = [r for r in result_data["results"] if r["type"] == "database_row"]
+    assert [r["metadata"]["row_id"] for r in row_results[:2]] in (
+        [rows[0].id, rows[2].id],
+        [rows[2].id, rows[0].id],
+    )
+    assert row_results[0]["metadata"]["field_id"] == field.id
@@ -204,3 +204,28 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+def test_projection_model_is_cached_per_field_set(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"field('{number_field.name}') + 1"
+    )
+    table.refresh_from_db()
+
+    model = table.get_projection_model([formula_field.id])
+
+    # The fields the formula depends on are included as well.
+    assert set(model._field_objects.keys()) == {formula_field.id, number_field.id}
+    assert not hasattr(model, text_field.db_column)
+    assert get_cached_model_field_attrs(table, [formula_field.id]) is not None
+    assert get_cached_model_field_attrs(table, [text_field.id]) is None
+
+    FieldHandler().update_field(user, text_field, name="Renamed")
+
+    table.refresh_from_db()
+    assert get_cached_model_field_attrs(table, [formula_field.id]) is None
@@ -1,5 +1,6 @@
 import os
 import random
+from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
@@ -821,6 +822,105 @@ def test_table_usage_handler_mark_table_for_usage_update_row_count_default_zero(
     assert table_usage.row_count == 0
 
 
+@pytest.mark.django_db
+def test_table_usage_handler_applies_row_count_deltas_incrementally(data_fixture):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    model = table.get_model()
+    model.objects.create()
+
+    TableUsageHandler.update_tables_usage()
+    table_usage = TableUsage.objects.get(table_id=table.id)
+    assert table_usage.row_count == 1
+
+    # Rows created without signals aren't counted if only deltas are pending.
+    model.objects.create()
+    TableUsageHandler.mark_table_for_usage_update(
+        table.id, row_count=2, is_delta=True, storage_usage_changed=False
+    )
+    TableUsageHandler.mark_table_for_usage_update(
+        table.id, row_count=-1, is_delta=True, storage_usage_changed=False
+    )
+    with patch.object(
+        TableUsageHandler, "calculate_table_storage_usage"
+    ) as calculate_table_storage_usage:
+        TableUsageHandler.update_tables_usage()
+    calculate_table_storage_usage.assert_not_called()
+    table_usage.refresh_from_db()
+    assert table_usage.row_count == 2
+    assert not TableUsageUpdate.objects.filter(table_id=table.id).exists()
+
+    # The rows are counted again if one of the pending updates isn't a delta.
+    TableUsageHandler.mark_table_for_usage_update(table.id, row_count=5, is_delta=True)
+    TableUsageHandler.mark_table_for_usage_update(table.id)
+    TableUsageHandler.update_tables_usage()
+    table_usage.refresh_from_db()
+    assert table_usage.row_count == 2
+
+
+@pytest.mark.django_db
+def test_table_usage_handler_skips_deltas_committed_before_the_last_count(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    table.get_model().objects.create()
+    TableUsageHandler.update_tables_usage()
+    table_usage = TableUsage.objects.get(table_id=table.id)
+    assert table_usage.row_count == 1
+    counted_at = table_usage.row_count_updated_at
+
+    # The created row was already included in the count when the delta is applied.
+    TableUsageHandler.mark_table_for_usage_update(
+        table.id,
+        row_count=1,
+        is_delta=True,
+        storage_usage_changed=False,
+        committed_at=counted_at - timedelta(seconds=1),
+    )
+    TableUsageHandler.mark_table_for_usage_update(
+        table.id,
+        row_count=2,
+        is_delta=True,
+        storage_usage_changed=False,
+        committed_at=counted_at + timedelta(seconds=1),
+    )
+    TableUsageHandler.update_tables_usage()
+
+    table_usage.refresh_from_db()
+    assert table_usage.row_count == 3
+    assert not TableUsageUpdate.objects.filter(table_id=table.id).exists()
+
+
+@pytest.mark.django_db
+def test_table_usage_handler_marks_the_workspace_storage_usage_as_outdated(
+    data_fixture,
+):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    TableUsageHandler.update_tables_usage()
+    UsageHandler.calculate_storage_usage()
+    workspace.refresh_from_db()
+    assert workspace.storage_usage_updated_at is not None
+
+    TableUsageHandler.mark_table_for_usage_update(
+        table.id, row_count=1, is_delta=True, storage_usage_changed=False
+    )
+    TableUsageHandler.update_tables_usage()
+    workspace.refresh_from_db()
+    assert workspace.storage_usage_updated_at is not None
+
+    TableUsageHandler.mark_table_for_usage_update(table.id, is_delta=True)
+    TableUsageHandler.update_tables_usage()
+    workspace.refresh_from_db()
+    assert workspace.storage_usage_updated_at is None
+
+    UsageHandler.calculate_storage_usage()
+    workspace.refresh_from_db()
+    assert workspace.storage_usage_updated_at is not None
+
+
 @pytest.mark.django_db(transaction=True)
 def test_table_usage_handler_mark_table_for_usage_update_table_doesnt_exist():
     assert (
@@ -231,6 +231,22 @@ def test_enhance_by_fields_queryset(data_fixture):
     mocked_type.enhance_queryset_in_bulk.assert_called()
 
 
+@pytest.mark.django_db
+def test_only_fields_queryset(data_fixture):
+    table = data_fixture.create_database_table(name="Cars")
+    name_field = data_fixture.create_text_field(table=table, order=0, name="Name")
+    color_field = data_fixture.create_text_field(table=table, order=1, name="Color")
+    model = table.get_model()
+    model.objects.create(**{name_field.db_column: "BMW", color_field.db_column: "Blue"})
+
+    row = model.objects.all().only_fields([color_field.id, 99999]).get()
+
+    assert row.get_deferred_fields() >= {name_field.db_column}
+    assert color_field.db_column not in row.get_deferred_fields()
+    assert "order" not in row.get_deferred_fields()
+    assert getattr(row, color_field.db_column) == "Blue"
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.table.models.TableModelQuerySet.pg_search")
 @patch("baserow.contrib.database.table.models.TableModelQuerySet.compat_search")
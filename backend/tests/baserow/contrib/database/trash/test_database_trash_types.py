@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from django.conf import settings
 from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import pytest
@@ -49,9 +50,8 @@ def test_delete_row_by_id(data_fixture):
 
 
 @pytest.mark.django_db
-@patch("baserow.core.trash.signals.permanently_deleted.send")
-def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
-    mock, data_fixture, django_assert_num_queries
+def test_perm_deleting_many_rows_at_once_uses_a_constant_number_of_queries(
+    data_fixture,
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(name="Car", user=user)
@@ -59,45 +59,152 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
 
     handler = RowHandler()
     model = table.get_model()
-    row_1 = handler.create_row(user=user, table=table)
 
-    TrashHandler.trash(user, table.database.workspace, table.database, row_1)
-    assert model.objects.all().count() == 0
-    assert model.trash.all().count() == 1
-    assert TrashEntry.objects.count() == 1
+    def trash_and_perm_delete_rows(count):
+        rows = handler.create_rows(user, table, [{} for _ in range(count)]).created_rows
+        for row in rows:
+            TrashHandler.trash(user, table.database.workspace, table.database, row)
+        assert model.trash.all().count() == count
+        assert TrashEntry.objects.count() == count
+
+        TrashEntry.objects.update(should_be_permanently_deleted=True)
+        invalidate_table_in_model_cache(table.id)
+        with CaptureQueriesContext(connection) as captured:
+            TrashHandler.permanently_delete_marked_trash()
+
+        assert model.objects_and_trash.all().count() == 0
+        assert TrashEntry.objects.count() == 0
+        return len(captured.captured_queries)
+
+    # Warm up any caches unrelated to the deletion of the rows.
+    trash_and_perm_delete_rows(1)
+
+    # All the rows of the same table are deleted with set based queries, so deleting
+    # ten rows must not need more queries than deleting a single one.
+    assert trash_and_perm_delete_rows(1) == trash_and_perm_delete_rows(10)
+
+
+@pytest.mark.django_db
+def test_perm_deleting_many_rows_respects_the_batch_size(data_fixture, settings):
+    settings.TRASH_PERMANENT_DELETION_BATCH_SIZE = 2
 
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    other_table = data_fixture.create_database_table(
+        name="Other", database=table.database
+    )
+
+    handler = RowHandler()
+    rows = handler.create_rows(user, table, [{} for _ in range(5)]).created_rows
+    other_row = handler.create_row(user=user, table=other_table)
+    for row in rows:
+        TrashHandler.trash(user, table.database.workspace, table.database, row)
+    TrashHandler.trash(user, table.database.workspace, table.database, other_row)
+    # A row which is trashed, but not yet marked for permanent deletion.
+    kept_row = handler.create_row(user=user, table=table)
     TrashEntry.objects.update(should_be_permanently_deleted=True)
+    TrashHandler.trash(user, table.database.workspace, table.database, kept_row)
 
-    invalidate_table_in_model_cache(table.id)
-    with django_assert_num_queries(14):
+    with patch(
+        "baserow.core.trash.handler.TrashHandler.try_perm_delete_trash_entries_in_bulk",
+        wraps=TrashHandler.try_perm_delete_trash_entries_in_bulk,
+    ) as bulk_delete_mock:
         TrashHandler.permanently_delete_marked_trash()
 
-    row_2 = handler.create_row(user=user, table=table)
-    row_3 = handler.create_row(user=user, table=table)
-    TrashHandler.trash(user, table.database.workspace, table.database, row_2)
-    TrashHandler.trash(user, table.database.workspace, table.database, row_3)
+    assert [
+        (call.args[1], len(call.args[2])) for call in bulk_delete_mock.call_args_list
+    ] == [(table.id, 2), (table.id, 2), (table.id, 1), (other_table.id, 1)]
+    assert [r.id for r in table.get_model().objects_and_trash.all()] == [kept_row.id]
+    assert other_table.get_model().objects_and_trash.count() == 0
+    assert TrashEntry.objects.count() == 1
 
-    assert model.objects.all().count() == 0
-    assert model.trash.all().count() == 2
-    assert TrashEntry.objects.count() == 2
 
+@pytest.mark.django_db
+def test_perm_deleting_many_rows_sends_the_bulk_signals(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    handler = RowHandler()
+    row_1, row_2, row_3 = handler.create_rows(user, table, [{}, {}, {}]).created_rows
+
+    TrashHandler.trash(user, table.database.workspace, table.database, row_1)
+    handler.delete_rows(user, table, row_ids=[row_2.id, row_3.id])
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
-    invalidate_table_in_model_cache(table.id)
-    # We only want 8 more queries when deleting 2 rows instead of 1 compared to
-    # above:
-    # 1. An extra query to open the second trash entries savepoint
-    # 2. An extra query to lookup the second trash entry
-    # 3. A query to lookup the extra row we are deleting
-    # 4. A query to delete said row
-    # 5. A query to delete it's trash entry.
-    # 6. A query to delete any related row comments.
-    # 7. An extra query to close the second trash entries savepoint
-    # If we weren't caching the table models an extra number of queries would be first
-    # performed to lookup the table information which breaks this assertion.
-    with django_assert_num_queries(21):
+    with (
+        patch(
+            "baserow.core.trash.signals.before_permanently_deleted_many.send"
+        ) as before_mock,
+        patch("baserow.core.trash.signals.permanently_deleted_many.send") as after_mock,
+    ):
         TrashHandler.permanently_delete_marked_trash()
 
+    expected_calls = [
+        {"sender": "row", "trash_item_ids": [row_1.id], "parent_id": table.id},
+        {
+            "sender": "row",
+            "trash_item_ids": [row_2.id, row_3.id],
+            "parent_id": table.id,
+        },
+    ]
+    for mock in [before_mock, after_mock]:
+        assert [
+            {**call.kwargs, "trash_item_ids": sorted(call.kwargs["trash_item_ids"])}
+            for call in mock.call_args_list
+        ] == expected_calls
+
+
+@pytest.mark.django_db
+def test_perm_deleting_many_rows_cleans_up_link_row_relations(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    customers_table = data_fixture.create_database_table(database=database)
+    link_field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        type_name="link_row",
+        name="Customer",
+        link_row_table=customers_table,
+    )
+    self_link_field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        type_name="link_row",
+        name="Self",
+        link_row_table=table,
+    )
+
+    handler = RowHandler()
+    customer = handler.create_row(user=user, table=customers_table)
+    row_1, row_2 = handler.create_rows(user, table, [{}, {}]).created_rows
+    handler.update_rows(
+        user,
+        table,
+        [
+            {
+                "id": row_1.id,
+                link_field.db_column: [customer.id],
+                self_link_field.db_column: [row_2.id],
+            },
+            {
+                "id": row_2.id,
+                link_field.db_column: [customer.id],
+                self_link_field.db_column: [row_1.id],
+            },
+        ],
+    )
+
+    TrashHandler.trash(user, database.workspace, database, row_1)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+    TrashHandler.permanently_delete_marked_trash()
+
+    model = table.get_model()
+    link_through = getattr(model, link_field.db_column).through
+    self_link_through = getattr(model, self_link_field.db_column).through
+    assert link_through.objects.count() == 1
+    assert self_link_through.objects.count() == 0
+    assert list(model.objects_and_trash.values_list("id", flat=True)) == [row_2.id]
+
 
 @pytest.mark.django_db
 def test_can_delete_fields_and_rows_in_the_same_perm_delete_batch(
@@ -108,6 +108,75 @@ def test_find_webhooks_to_call(data_fixture):
     assert webhook_5.id in webhook_ids
 
 
+@pytest.mark.django_db
+def test_has_webhooks_to_call_uses_the_table_webhook_index(data_fixture):
+    table = data_fixture.create_database_table()
+    field_1 = data_fixture.create_text_field(table=table)
+    field_2 = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    handler = WebhookHandler()
+    rows_created = webhook_event_type_registry.get("rows.created")
+    rows_updated = webhook_event_type_registry.get("rows.updated")
+
+    assert handler.get_table_webhook_index(table.id) == {
+        "include_all_events": False,
+        "events": {},
+    }
+    assert not handler.has_webhooks_to_call(rows_created, table=table, model=model)
+
+    webhook = data_fixture.create_table_webhook(
+        table=table, include_all_events=False, events=["rows.updated"]
+    )
+    webhook.events.get().fields.set([field_1])
+
+    assert not handler.has_webhooks_to_call(rows_created, table=table, model=model)
+    assert handler.has_webhooks_to_call(
+        rows_updated, table=table, model=model, updated_field_ids=[field_1.id]
+    )
+    assert not handler.has_webhooks_to_call(
+        rows_updated, table=table, model=model, updated_field_ids=[field_2.id]
+    )
+
+    webhook.include_all_events = True
+    webhook.save()
+    assert handler.has_webhooks_to_call(rows_created, table=table, model=model)
+
+    webhook.active = False
+    webhook.save()
+    assert not handler.has_webhooks_to_call(
+        rows_updated, table=table, model=model, updated_field_ids=[field_1.id]
+    )
+
+
+@pytest.mark.django_db
+def test_has_webhooks_to_call_checks_the_webhooks_of_the_related_tables(
+    data_fixture,
+):
+    table, related_table, link_field = data_fixture.create_two_linked_tables()
+    model = table.get_model()
+    row = model.objects.create()
+    handler = WebhookHandler()
+    rows_updated = webhook_event_type_registry.get("rows.updated")
+    signal_kwargs = {
+        "table": table,
+        "model": model,
+        "rows": [row],
+        "updated_field_ids": [link_field.id],
+    }
+
+    assert not handler.has_webhooks_to_call(rows_updated, **signal_kwargs)
+
+    webhook = data_fixture.create_table_webhook(
+        table=related_table, include_all_events=False, events=["rows.updated"]
+    )
+    assert handler.has_webhooks_to_call(rows_updated, **signal_kwargs)
+
+    webhook.events.get().fields.set(
+        [data_fixture.create_text_field(table=related_table)]
+    )
+    assert not handler.has_webhooks_to_call(rows_updated, **signal_kwargs)
+
+
 @pytest.mark.django_db()
 def test_get_webhook(data_fixture):
     user = data_fixture.create_user()
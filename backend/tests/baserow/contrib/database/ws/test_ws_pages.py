@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from django.contrib.auth.models import AnonymousUser
 
@@ -7,6 +7,7 @@ from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
 from baserow.ws.auth import ANONYMOUS_USER_TOKEN
+from baserow.ws.broadcast import BufferedBroadcast, broadcast_buffer
 from baserow.ws.registries import page_registry
 
 # TablePageType
@@ -71,6 +72,100 @@ def test_table_page_broadcast(mock_broadcast_to_channel_group):
     assert args[0][2] == ignore_web_socket_id
 
 
+def _rows_updated_payload(table_id, row_id, value, field_id):
+    return {
+        "type": "rows_updated",
+        "table_id": table_id,
+        "rows_before_update": [{"id": row_id, f"field_{field_id}": f"before {value}"}],
+        "rows": [{"id": row_id, f"field_{field_id}": value}],
+        "metadata": {row_id: {"value": value}},
+        "updated_field_ids": [field_id],
+    }
+
+
+@patch("baserow.ws.broadcast.BroadcastBuffer.send")
+@pytest.mark.websockets
+def test_table_page_broadcast_directly_merges_rows_updated(mock_send, settings):
+    settings.BASEROW_WS_BROADCAST_DIRECTLY = True
+    table_page = page_registry.get("table")
+
+    with broadcast_buffer.context():
+        table_page.broadcast(_rows_updated_payload(22, 1, "a", 1), "1", table_id=22)
+        table_page.broadcast(_rows_updated_payload(22, 2, "b", 1), "1", table_id=22)
+        table_page.broadcast(_rows_updated_payload(22, 1, "c", 2), "1", table_id=22)
+        # A different sender can't be merged.
+        table_page.broadcast(_rows_updated_payload(22, 1, "d", 1), "2", table_id=22)
+        table_page.broadcast(_rows_updated_payload(23, 1, "e", 1), "1", table_id=23)
+        mock_send.assert_not_called()
+
+    mock_send.assert_called_once()
+    messages = mock_send.call_args[0][0]
+    assert [m.channel_group_name for m in messages] == [
+        "table-22",
+        "table-22",
+        "table-23",
+    ]
+    assert messages[0].payload == {
+        "type": "rows_updated",
+        "table_id": 22,
+        "rows_before_update": [
+            {"id": 1, "field_1": "before a", "field_2": "before c"},
+            {"id": 2, "field_1": "before b"},
+        ],
+        "rows": [{"id": 1, "field_1": "a", "field_2": "c"}, {"id": 2, "field_1": "b"}],
+        "metadata": {1: {"value": "c"}, 2: {"value": "b"}},
+        "updated_field_ids": [1, 2],
+    }
+    assert messages[1].ignore_web_socket_id == "2"
+
+
+@patch("baserow.ws.broadcast.BroadcastBuffer.send")
+@pytest.mark.websockets
+def test_table_page_broadcast_directly_sends_full_buffer_early(mock_send, settings):
+    settings.BASEROW_WS_BROADCAST_DIRECTLY = True
+    settings.BASEROW_WS_BROADCAST_BUFFER_MAX_MESSAGES = 2
+    table_page = page_registry.get("table")
+
+    with broadcast_buffer.context():
+        table_page.broadcast(_rows_updated_payload(22, 1, "a", 1), "1", table_id=22)
+        # Merged into the previous message, so it doesn't fill the buffer.
+        table_page.broadcast(_rows_updated_payload(22, 2, "b", 1), "1", table_id=22)
+        mock_send.assert_not_called()
+
+        table_page.broadcast(_rows_updated_payload(23, 1, "c", 1), "1", table_id=23)
+        mock_send.assert_called_once()
+        assert [m.channel_group_name for m in mock_send.call_args[0][0]] == [
+            "table-22",
+            "table-23",
+        ]
+
+        table_page.broadcast(_rows_updated_payload(24, 1, "d", 1), "1", table_id=24)
+        assert mock_send.call_count == 1
+
+    assert mock_send.call_count == 2
+    assert [m.channel_group_name for m in mock_send.call_args[0][0]] == ["table-24"]
+
+
+@pytest.mark.websockets
+def test_table_page_oversized_payload_is_replaced_by_a_refresh(settings):
+    settings.BASEROW_WS_BROADCAST_MAX_PAYLOAD_SIZE = 100
+    table_page = page_registry.get("table")
+    payload = _rows_updated_payload(22, 1, "a" * 100, 1)
+
+    channel_layer = AsyncMock()
+    with patch("channels.layers.get_channel_layer", return_value=channel_layer):
+        broadcast_buffer.send(
+            [BufferedBroadcast(table_page, "table-22", payload, None, None)]
+        )
+
+    group_send = channel_layer.group_send
+    group_send.assert_called_once()
+    assert group_send.call_args[0][1]["payload"] == {
+        "type": "row_orders_recalculated",
+        "table_id": 22,
+    }
+
+
 # PublicViewPageType
 
 
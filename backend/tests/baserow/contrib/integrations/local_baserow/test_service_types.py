@@ -2123,7 +2123,7 @@ def test_local_baserow_rows_deleted_trigger_service_type_handler(data_fixture):
     model = table.get_model()
     row1 = model.objects.create()
     row2 = model.objects.create()
-    data_fixture.create_local_baserow_rows_updated_service(
+    data_fixture.create_local_baserow_rows_deleted_service(
         table=table,
     )
     RowHandler().delete_rows(
@@ -2133,3 +2133,28 @@ def test_local_baserow_rows_deleted_trigger_service_type_handler(data_fixture):
         row_ids=[row1.id, row2.id],
     )
     mocked_on_event.assert_called_once()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_baserow_rows_trigger_service_type_handler_skips_tables_without_trigger(
+    data_fixture,
+):
+    mocked_on_event = Mock()
+    user = data_fixture.create_user()
+    service_type = service_type_registry.get(LocalBaserowRowsCreatedServiceType.type)
+    service_type.on_event = mocked_on_event
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    service = data_fixture.create_local_baserow_rows_created_service(
+        table=other_table,
+    )
+
+    RowHandler().create_rows(user=user, table=table, rows_values=[{}])
+    mocked_on_event.assert_not_called()
+
+    service.table = table
+    service.save()
+    RowHandler().create_rows(user=user, table=table, rows_values=[{}, {}])
+    mocked_on_event.assert_called_once()
+    services = mocked_on_event.call_args[0][0]
+    assert [s.id for s in services] == [service.id]
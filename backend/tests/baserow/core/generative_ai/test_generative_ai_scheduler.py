@@ -0,0 +1,149 @@
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+import pytest
+from freezegun import freeze_time
+
+from baserow.core.generative_ai.exceptions import GenerativeAIPromptError
+from baserow.core.generative_ai.registries import BatchPromptAnswers
+from baserow.core.generative_ai.scheduler import (
+    GenerativeAIRequestScheduler,
+    estimate_tokens,
+)
+from baserow.test_utils.fixtures.generative_ai import TestGenerativeAIBatchModelType
+
+
+class WouldWait(Exception):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clear_scheduler_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("a" * 40) == 10
+    assert estimate_tokens("a" * 40, "b" * 40) == 20
+
+
+def test_scheduler_limits_concurrent_requests_per_model_type(settings):
+    settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS = 2
+    settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS_PER_WORKSPACE = 0
+
+    scheduler = GenerativeAIRequestScheduler("test")
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def make_request(workspace_id):
+        nonlocal running, max_running
+        with scheduler.reserve(workspace_id):
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+    threads = [threading.Thread(target=make_request, args=(i,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_running == 2
+
+    # Another model type has its own budget.
+    with scheduler.reserve(1), scheduler.reserve(2):
+        with GenerativeAIRequestScheduler("other").reserve(3):
+            pass
+
+
+def test_scheduler_limits_concurrent_requests_per_workspace(settings):
+    settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS = 0
+    settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS_PER_WORKSPACE = 1
+
+    scheduler = GenerativeAIRequestScheduler("test")
+    with patch.object(GenerativeAIRequestScheduler, "_sleep", side_effect=WouldWait):
+        with scheduler.reserve(1):
+            # Other workspaces don't have to wait for the first one.
+            with scheduler.reserve(2):
+                pass
+
+            with pytest.raises(WouldWait):
+                with scheduler.reserve(1):
+                    pass
+
+        # The slot is released at the end of the request.
+        with scheduler.reserve(1):
+            pass
+
+
+def test_scheduler_limits_tokens_per_minute(settings):
+    settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS = 0
+    settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS_PER_WORKSPACE = 0
+    settings.BASEROW_GENERATIVE_AI_MAX_TOKENS_PER_MINUTE = 100
+
+    scheduler = GenerativeAIRequestScheduler("test")
+    with (
+        patch.object(GenerativeAIRequestScheduler, "_sleep", side_effect=WouldWait),
+        freeze_time("2026-10-15 12:00:10") as frozen_time,
+    ):
+        with scheduler.reserve(1, tokens=60):
+            pass
+
+        with pytest.raises(WouldWait):
+            with scheduler.reserve(1, tokens=60):
+                pass
+
+        # The rejected request didn't consume any tokens.
+        with scheduler.reserve(2, tokens=40):
+            pass
+
+        frozen_time.move_to("2026-10-15 12:01:00")
+
+        # A request that is bigger than the budget can still run in a new window.
+        with scheduler.reserve(1, tokens=500):
+            pass
+
+
+def test_prompt_batch_answers_all_prompts_with_one_request():
+    model_type = TestGenerativeAIBatchModelType()
+
+    assert model_type.prompt_batch("test_1", ["first", "second"]) == [
+        "Generated in batch: first",
+        "Generated in batch: second",
+    ]
+    assert model_type.requests == [["first", "second"]]
+
+
+def test_prompt_batch_resolves_choices():
+    model_type = TestGenerativeAIBatchModelType()
+
+    with patch.object(
+        model_type,
+        "prompt",
+        return_value=BatchPromptAnswers(answers=["**Red**", "blue.", "purple"]),
+    ) as prompt:
+        assert model_type.prompt_batch(
+            "test_1", ["a", "b", "c"], output_type=["Red", "Blue"]
+        ) == ["Red", "Blue", None]
+
+    assert 'exactly one option from: ["Red", "Blue"]' in prompt.call_args[0][1]
+
+
+def test_prompt_batch_raises_if_the_number_of_answers_does_not_match():
+    model_type = TestGenerativeAIBatchModelType()
+
+    with patch.object(
+        model_type, "prompt", return_value=BatchPromptAnswers(answers=["only one"])
+    ):
+        with pytest.raises(GenerativeAIPromptError):
+            model_type.prompt_batch("test_1", ["a", "b"])
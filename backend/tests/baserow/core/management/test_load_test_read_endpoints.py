@@ -0,0 +1,31 @@
+import asyncio
+
+import httpx
+
+from baserow.core.management.commands.load_test_read_endpoints import run_load_test
+
+
+def test_run_load_test_counts_requests_and_errors():
+    requested_urls = []
+
+    def handler(request):
+        requested_urls.append(str(request.url))
+        status_code = 500 if request.url.path == "/error/" else 200
+        return httpx.Response(status_code, json={})
+
+    result = asyncio.run(
+        run_load_test(
+            ["http://testserver/ok/", "http://testserver/error/"],
+            concurrency=4,
+            duration=0.1,
+            headers={"Authorization": "Token test"},
+            transport=httpx.MockTransport(handler),
+        )
+    )
+
+    assert result.concurrency == 4
+    assert result.requests == len(requested_urls) > 0
+    assert result.errors == requested_urls.count("http://testserver/error/")
+    assert len(result.latencies) == result.requests - result.errors
+    assert result.throughput > 0
+    assert result.get_latency_percentile(50) <= result.get_latency_percentile(99)
@@ -8,6 +8,7 @@ import pytest
 
 from baserow.core.cache import (
     GLOBAL_CACHE_VERSION,
+    SENTINEL,
     LocalCacheMiddleware,
     global_cache,
     local_cache,
@@ -180,3 +181,129 @@ def test_global_update_lock_release_on_exception():
 
         # Verify lock was still released
         mock_lock.release.assert_called_once_with()
+
+
+@override_settings(BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES=10)
+def test_global_cache_local_tier_hit_does_not_query_redis():
+    assert global_cache.get("my-key", lambda: ["apple"]) == ["apple"]
+
+    with (
+        patch.object(cache, "get", wraps=cache.get) as mock_get,
+        patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many,
+    ):
+        value = global_cache.get("my-key", lambda: ["banana"])
+        assert value == ["apple"]
+        # Every hit returns a copy, so the cached value can't be changed.
+        value.append("cherry")
+        assert global_cache.get("my-key") == ["apple"]
+
+    mock_get.assert_not_called()
+    mock_get_many.assert_not_called()
+
+
+@override_settings(BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES=10)
+def test_global_cache_local_tier_fetches_the_versions_once_per_request():
+    global_cache.get("key-1", "value-1")
+    global_cache.get("key-2", "value-2", invalidate_key="invalidate-key")
+
+    # A new request fetches the versions of the recently used keys at once.
+    local_cache.clear()
+    with patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many:
+        assert global_cache.get("key-1") == "value-1"
+        assert global_cache.get("key-2", invalidate_key="invalidate-key") == "value-2"
+
+    mock_get_many.assert_called_once()
+    assert set(mock_get_many.call_args[0][0]) == {
+        global_cache._get_version_cache_key("key-1"),
+        global_cache._get_revision_cache_key("key-1"),
+        global_cache._get_version_cache_key("key-2", "invalidate-key"),
+        global_cache._get_revision_cache_key("key-2"),
+    }
+
+
+@override_settings(
+    BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES=10, BASEROW_USE_LOCAL_CACHE=False
+)
+def test_global_cache_local_tier_without_the_local_cache():
+    global_cache.get("key-1", "value-1")
+    global_cache.get("key-2", "value-2")
+
+    # Without the local cache, every lookup only fetches its own versions.
+    with (
+        patch.object(cache, "get", wraps=cache.get) as mock_get,
+        patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many,
+    ):
+        assert global_cache.get("key-1") == "value-1"
+
+    mock_get.assert_not_called()
+    mock_get_many.assert_called_once_with(
+        [
+            global_cache._get_version_cache_key("key-1"),
+            global_cache._get_revision_cache_key("key-1"),
+        ]
+    )
+
+    # And an invalidation is seen right away.
+    global_cache.invalidate("key-1")
+    assert global_cache.get("key-1", "after") == "after"
+
+
+@override_settings(BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES=10)
+def test_global_cache_local_tier_is_invalidated():
+    assert global_cache.get("my-key", "before") == "before"
+
+    # Invalidated by this process.
+    global_cache.invalidate("my-key")
+    assert global_cache.get("my-key", "after") == "after"
+
+    # Invalidated by another process, which is seen by the next request.
+    cache.incr(global_cache._get_version_cache_key("my-key"), 1)
+    assert global_cache.get("my-key", "other") == "after"
+    local_cache.clear()
+    assert global_cache.get("my-key", "other") == "other"
+
+
+@override_settings(BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES=10)
+def test_global_cache_local_tier_is_invalidated_by_update():
+    assert global_cache.get("my-key", default=False) is False
+
+    global_cache.update("my-key", lambda _: True)
+    assert global_cache.get("my-key", default=False) is True
+
+    # Updated by another process, which is seen by the next request.
+    cache.set(global_cache._get_versioned_cache_key("my-key"), False)
+    cache.incr(global_cache._get_revision_cache_key("my-key"), 1)
+    local_cache.clear()
+    assert global_cache.get("my-key", default=True) is False
+
+
+@override_settings(BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES=2)
+def test_global_cache_local_tier_evicts_the_least_recently_used_values():
+    global_cache.get("key-1", "value-1")
+    global_cache.get("key-2", "value-2")
+    global_cache.get("key-1")
+    global_cache.get("key-3", "value-3")
+
+    local_key = global_cache._get_versioned_cache_key("key-{}") + "__revision_0"
+    assert global_cache.local_tier.get(local_key.format(1)) == "value-1"
+    assert global_cache.local_tier.get(local_key.format(2)) is SENTINEL
+    assert global_cache.local_tier.get(local_key.format(3)) == "value-3"
+
+
+@override_settings(
+    BASEROW_GLOBAL_CACHE_LOCAL_MAX_ENTRIES=10,
+    BASEROW_GLOBAL_CACHE_LOCAL_TTL_SECONDS=30,
+)
+def test_global_cache_local_tier_values_expire():
+    with patch("baserow.core.cache.time.monotonic", return_value=100):
+        global_cache.local_tier.set("key-1", "value-1", timeout=60)
+        global_cache.local_tier.set("key-2", "value-2", timeout=10)
+        global_cache.local_tier.set("key-3", "value-3", timeout=0)
+
+    with patch("baserow.core.cache.time.monotonic", return_value=115):
+        assert global_cache.local_tier.get("key-1") == "value-1"
+        assert global_cache.local_tier.get("key-2") is SENTINEL
+        assert global_cache.local_tier.get("key-3") is SENTINEL
+
+    with patch("baserow.core.cache.time.monotonic", return_value=131):
+        assert global_cache.local_tier.get("key-1") is SENTINEL
@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock, patch
 
 from django.contrib.contenttypes.models import ContentType
-from django.db import connection
+from django.db import DEFAULT_DB_ALIAS, connection, connections
 from django.db.models import CharField, Prefetch, Value
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.functions import Concat
@@ -29,6 +29,7 @@ from baserow.core.db import (
     MultiFieldPrefetchQuerysetMixin,
     QuerySet,
     get_approximate_row_count,
+    get_database_pool_stats,
     specific_iterator,
     specific_queryset,
 )
@@ -727,3 +728,19 @@ def test_get_approximate_row_count_works_with_filtered_queryset(data_fixture):
     queryset = Workspace.objects.filter(name__startswith="test_ws_")
     count = get_approximate_row_count(queryset)
     assert count == 2
+
+
+def test_get_database_pool_stats_returns_the_stats_of_the_created_pools():
+    assert get_database_pool_stats() == {}
+
+    pool = MagicMock()
+    pool.get_stats.return_value = {"pool_size": 2, "pool_available": 1}
+    with patch.object(
+        connections[DEFAULT_DB_ALIAS].__class__,
+        "_connection_pools",
+        {DEFAULT_DB_ALIAS: pool},
+        create=True,
+    ):
+        assert get_database_pool_stats() == {
+            DEFAULT_DB_ALIAS: {"pool_size": 2, "pool_available": 1}
+        }
@@ -0,0 +1,193 @@
+from datetime import datetime, timezone
+
+from django.db import connection
+
+import pytest
+from freezegun import freeze_time
+
+from baserow.contrib.database.rows.history import RowHistoryHandler
+from baserow.contrib.database.rows.models import RowHistory
+from baserow.core.partitioning.handler import PartitionHandler
+
+
+def _create_row_history_entries(table, *action_timestamps):
+    return RowHistory.objects.bulk_create(
+        [
+            RowHistory(
+                table=table,
+                row_id=1,
+                action_uuid="uuid",
+                action_command_type="DO",
+                action_type="type",
+                field_names=[],
+                fields_metadata={},
+                before_values={},
+                after_values={},
+                action_timestamp=action_timestamp,
+            )
+            for action_timestamp in action_timestamps
+        ]
+    )
+
+
+def _convert_row_history_table():
+    with connection.schema_editor() as schema_editor:
+        PartitionHandler.convert_to_time_partitioned_table(
+            schema_editor, RowHistory, "action_timestamp"
+        )
+
+
+def _get_partitions():
+    return [
+        (p.name, p.lower_bound, p.upper_bound, p.is_default)
+        for p in PartitionHandler.get_partitions(RowHistory)
+    ]
+
+
+@pytest.mark.django_db
+def test_partition_handler_ignores_tables_that_are_not_partitioned(data_fixture):
+    # The tables of the user databases are never partitioned.
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    model.objects.create()
+
+    assert not PartitionHandler.is_partitioned(model)
+    assert PartitionHandler.get_partitions(model) == []
+    assert PartitionHandler.create_future_partitions(model, "created_on") == []
+    assert (
+        PartitionHandler.drop_partitions_older_than(
+            model, datetime(2100, 1, 1, tzinfo=timezone.utc)
+        )
+        == 0
+    )
+    assert model.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_convert_to_time_partitioned_table_keeps_existing_data(data_fixture, settings):
+    settings.BASEROW_PARTITIONS_PRECREATE_MONTHS = 2
+    table = data_fixture.create_database_table()
+    [old_entry] = _create_row_history_entries(
+        table, datetime(2021, 1, 1, tzinfo=timezone.utc)
+    )
+
+    with freeze_time("2026-10-15 12:00"):
+        _convert_row_history_table()
+
+    assert PartitionHandler.is_partitioned(RowHistory)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT contype, pg_get_constraintdef(oid) FROM pg_constraint
+            WHERE conrelid = 'database_rowhistory'::regclass
+            AND contype IN ('f', 'p') ORDER BY contype
+            """
+        )
+        constraints = cursor.fetchall()
+        cursor.execute(
+            "SELECT indexname FROM pg_indexes WHERE tablename = 'database_rowhistory'"
+        )
+        index_names = {name for (name,) in cursor.fetchall()}
+    assert constraints == [
+        (
+            "f",
+            "FOREIGN KEY (table_id) REFERENCES database_table(id) DEFERRABLE "
+            "INITIALLY DEFERRED",
+        ),
+        ("p", "PRIMARY KEY (id, action_timestamp)"),
+    ]
+    assert {index.name for index in RowHistory._meta.indexes} < index_names
+    assert len(index_names) == len(RowHistory._meta.indexes) + 2
+
+    assert _get_partitions() == [
+        (
+            "database_rowhistory_legacy",
+            None,
+            datetime(2026, 11, 1, tzinfo=timezone.utc),
+            False,
+        ),
+        (
+            "database_rowhistory_p202611",
+            datetime(2026, 11, 1, tzinfo=timezone.utc),
+            datetime(2026, 12, 1, tzinfo=timezone.utc),
+            False,
+        ),
+        (
+            "database_rowhistory_p202612",
+            datetime(2026, 12, 1, tzinfo=timezone.utc),
+            datetime(2027, 1, 1, tzinfo=timezone.utc),
+            False,
+        ),
+        ("database_rowhistory_default", None, None, True),
+    ]
+
+    new_entries = _create_row_history_entries(
+        table,
+        datetime(2026, 10, 20, tzinfo=timezone.utc),
+        datetime(2026, 11, 20, tzinfo=timezone.utc),
+        datetime(2030, 1, 1, tzinfo=timezone.utc),
+    )
+    # The ids keep being generated after the ones of the existing entries.
+    assert all(entry.id > old_entry.id for entry in new_entries)
+    assert RowHistory.objects.count() == 4
+    assert list(RowHistory.objects.values_list("id", flat=True)) == [
+        entry.id for entry in reversed(new_entries)
+    ] + [old_entry.id]
+
+
+@pytest.mark.django_db
+def test_create_future_partitions(data_fixture, settings):
+    settings.BASEROW_PARTITIONS_PRECREATE_MONTHS = 1
+    table = data_fixture.create_database_table()
+
+    with freeze_time("2026-10-15 12:00"):
+        _convert_row_history_table()
+
+    with freeze_time("2027-01-15 12:00"):
+        assert PartitionHandler.create_future_partitions(
+            RowHistory, "action_timestamp"
+        ) == [
+            "database_rowhistory_p202612",
+            "database_rowhistory_p202701",
+            "database_rowhistory_p202702",
+        ]
+
+    # Rows of a month without a partition end up in the default partition, which
+    # prevents creating the partition for that month.
+    _create_row_history_entries(table, datetime(2027, 3, 10, tzinfo=timezone.utc))
+    with freeze_time("2027-03-15 12:00"):
+        assert (
+            PartitionHandler.create_future_partitions(RowHistory, "action_timestamp")
+            == []
+        )
+
+    assert RowHistory.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_delete_entries_older_than_drops_expired_partitions(data_fixture, settings):
+    settings.BASEROW_PARTITIONS_PRECREATE_MONTHS = 2
+    table = data_fixture.create_database_table()
+    _create_row_history_entries(table, datetime(2021, 1, 1, tzinfo=timezone.utc))
+
+    with freeze_time("2026-10-15 12:00"):
+        _convert_row_history_table()
+
+    _create_row_history_entries(
+        table,
+        datetime(2026, 11, 20, tzinfo=timezone.utc),
+        datetime(2026, 12, 10, tzinfo=timezone.utc),
+        datetime(2026, 12, 20, tzinfo=timezone.utc),
+    )
+
+    RowHistoryHandler.delete_entries_older_than(
+        datetime(2026, 12, 15, tzinfo=timezone.utc)
+    )
+
+    assert [name for name, *_ in _get_partitions()] == [
+        "database_rowhistory_p202612",
+        "database_rowhistory_default",
+    ]
+    assert list(RowHistory.objects.values_list("action_timestamp", flat=True)) == [
+        datetime(2026, 12, 20, tzinfo=timezone.utc)
+    ]
@@ -1,7 +1,7 @@
 import re
 import string
 from io import BytesIO
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from django.conf import settings
@@ -343,6 +343,59 @@ def test_upload_user_file_active_content_block_policy_uses_mime_type(
         UserFileHandler().upload_user_file(user, file.name, file, storage=storage)
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND=True)
+def test_upload_user_file_generates_thumbnails_in_background(
+    data_fixture, tmpdir, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    with (
+        patch(
+            "baserow.core.user_files.handler.get_default_storage", return_value=storage
+        ),
+        patch.object(
+            handler,
+            "generate_and_save_image_thumbnails",
+            wraps=handler.generate_and_save_image_thumbnails,
+        ) as generate_thumbnails,
+        patch("baserow.core.user_files.handler.UserFileHandler", return_value=handler),
+    ):
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            user_file_1 = handler.upload_user_file(
+                user, "red.png", BytesIO(image_bytes.getvalue())
+            )
+            user_file_2 = handler.upload_user_file(
+                user, "another red.png", BytesIO(image_bytes.getvalue())
+            )
+
+        assert user_file_1.is_image is True
+        assert user_file_1.image_width == 100
+        assert user_file_1.image_height == 140
+        assert user_file_1.thumbnails_queued is True
+        assert not tmpdir.join("thumbnails", "tiny", user_file_1.name).isfile()
+        # Only one task is scheduled for all the uploads in the transaction.
+        assert len(callbacks) == 1
+
+        callbacks[0]()
+
+    # Both user files have the same content, so the image is decoded only once.
+    generate_thumbnails.assert_called_once()
+    assert not UserFile.objects.filter(thumbnails_queued=True).exists()
+    for user_file in [user_file_1, user_file_2]:
+        file_path = tmpdir.join("thumbnails", "tiny", user_file.name)
+        assert file_path.isfile()
+        thumbnail = Image.open(file_path.open("rb"))
+        assert thumbnail.width == 21
+        assert thumbnail.height == 21
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_upload_user_file_by_url(data_fixture, tmpdir):
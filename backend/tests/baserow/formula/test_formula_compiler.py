@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.core.formula import BaserowFormulaSyntaxError
+from baserow.core.formula.parser import formula_compiler
+from baserow.core.formula.parser.formula_compiler import compile_formula
+from baserow.core.formula.registries import formula_runtime_function_registry
+from baserow.test_utils.helpers import load_test_cases
+
+TEST_DATA = load_test_cases("formula_visitor_cases")
+
+VALID_FORMULA_EXECUTION_TESTS = TEST_DATA["VALID_FORMULA_EXECUTION_TESTS"]
+INVALID_FORMULA_EXECUTION_TESTS = TEST_DATA["INVALID_FORMULA_EXECUTION_TESTS"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("test_data", VALID_FORMULA_EXECUTION_TESTS)
+def test_compiled_valid_formulas(test_data):
+    formula = test_data["formula"]
+    result = test_data["result"]
+    context = test_data["context"]
+
+    compiled = compile_formula(formula)
+    assert compiled(formula_runtime_function_registry, context) == result
+    # The compiled formula can be resolved again with the same result.
+    assert compiled(formula_runtime_function_registry, context) == result
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("test_data", INVALID_FORMULA_EXECUTION_TESTS)
+def test_compiled_invalid_formulas(test_data):
+    formula = test_data["formula"]
+    context = test_data["context"]
+
+    with pytest.raises(Exception):
+        compile_formula(formula)(formula_runtime_function_registry, context)
+
+
+def test_compile_formula_only_parses_a_formula_once():
+    compile_formula.cache_clear()
+
+    with patch.object(
+        formula_compiler,
+        "get_parse_tree_for_formula",
+        wraps=formula_compiler.get_parse_tree_for_formula,
+    ) as get_parse_tree:
+        first = compile_formula("concat('a', 'b')")
+        second = compile_formula("concat('a', 'b')")
+        compile_formula("concat('a', 'c')")
+
+    assert first is second
+    assert get_parse_tree.call_count == 2
+
+
+def test_compiled_formula_looks_up_the_functions_when_called():
+    compiled = compile_formula("upper('a')")
+
+    class Upper:
+        def parse_args(self, args):
+            return args
+
+        def execute(self, context, args):
+            return f"custom {args[0]}"
+
+    class Functions:
+        def get(self, name):
+            assert name == "upper"
+            return Upper()
+
+    assert compiled(Functions(), {}) == "custom a"
+
+
+def test_compiled_formula_raises_for_unknown_functions():
+    compiled = compile_formula("unknown_function('a')")
+
+    with pytest.raises(BaserowFormulaSyntaxError):
+        compiled(formula_runtime_function_registry, {})
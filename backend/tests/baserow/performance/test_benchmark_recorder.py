@@ -0,0 +1,78 @@
+import json
+
+from baserow.test_utils.benchmark import BenchmarkRecorder, BenchmarkResult
+
+
+def test_benchmark_result_get_regressions():
+    baseline = BenchmarkResult("list_rows", query_count=10, wall_time=1.0)
+
+    assert (
+        BenchmarkResult("list_rows", 10, 1.2).get_regressions(baseline, 0, 0.25) == []
+    )
+    assert (
+        BenchmarkResult("list_rows", 11, 1.2).get_regressions(baseline, 0.1, 0.25) == []
+    )
+    assert BenchmarkResult("list_rows", 11, 1.3).get_regressions(baseline, 0, 0.25) == [
+        "list_rows: 11 queries, the budget is 10 (10 in the baseline).",
+        "list_rows: 1.300s, the budget is 1.250s (1.000s in the baseline).",
+    ]
+
+
+def test_benchmark_result_get_regressions_without_wall_time():
+    baseline = BenchmarkResult("list_rows", query_count=10)
+
+    assert BenchmarkResult("list_rows", 10, 100.0).get_regressions(baseline, 0, 0) == []
+    assert BenchmarkResult("list_rows", 12, 100.0).get_regressions(baseline, 0, 0) == [
+        "list_rows: 12 queries, the budget is 10 (10 in the baseline)."
+    ]
+
+
+def test_benchmark_recorder_baseline_round_trip(tmp_path):
+    baseline_path = tmp_path / "benchmarks" / "baseline.json"
+    recorder = BenchmarkRecorder(baseline_path, update_baseline=True)
+    recorder.results = {
+        "b": BenchmarkResult("b", query_count=2, wall_time=0.5),
+        "a": BenchmarkResult("a", query_count=1, wall_time=0.25),
+    }
+    recorder.write_baseline()
+
+    assert json.loads(baseline_path.read_text()) == {
+        "a": {"query_count": 1, "wall_time": 0.25},
+        "b": {"query_count": 2, "wall_time": 0.5},
+    }
+
+    recorder = BenchmarkRecorder(baseline_path)
+    assert recorder.baseline == {
+        "a": BenchmarkResult("a", query_count=1, wall_time=0.25),
+        "b": BenchmarkResult("b", query_count=2, wall_time=0.5),
+    }
+    assert recorder.get_regressions(BenchmarkResult("a", 1, 0.25)) == []
+    assert recorder.get_regressions(BenchmarkResult("a", 2, 0.25)) == [
+        "a: 2 queries, the budget is 1 (1 in the baseline)."
+    ]
+    # Benchmarks that aren't in the baseline yet don't regress.
+    assert recorder.get_regressions(BenchmarkResult("c", 100, 100.0)) == []
+
+    # The new results are merged into the existing baseline.
+    recorder.update_baseline = True
+    recorder.results = {"c": BenchmarkResult("c", query_count=3, wall_time=1.0)}
+    recorder.write_baseline()
+    assert list(BenchmarkRecorder(baseline_path).baseline) == ["a", "b", "c"]
+
+
+def test_benchmark_recorder_query_counts_only(tmp_path):
+    baseline_path = tmp_path / "query_counts.json"
+    recorder = BenchmarkRecorder(
+        baseline_path, update_baseline=True, query_counts_only=True
+    )
+    recorder.results = {"a": BenchmarkResult("a", query_count=1, wall_time=0.25)}
+    recorder.write_baseline()
+
+    assert json.loads(baseline_path.read_text()) == {"a": {"query_count": 1}}
+
+    recorder = BenchmarkRecorder(baseline_path, query_counts_only=True, strict=True)
+    assert recorder.get_regressions(BenchmarkResult("a", 1, 100.0)) == []
+    assert recorder.get_regressions(BenchmarkResult("b", 1, 0.25)) == [
+        f"b: missing from the baseline {baseline_path}, record it with the "
+        "--benchmarks-update-baseline flag."
+    ]
@@ -0,0 +1,214 @@
+import random
+
+from django.urls import reverse
+
+import pytest
+from faker import Faker
+from rest_framework.status import HTTP_200_OK
+
+from baserow.contrib.database.export.handler import ExportHandler
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.test_utils.helpers import setup_interesting_test_table
+
+# The benchmarks only run when the `--run-benchmarks` flag is provided. Record the
+# baseline with `--benchmarks-update-baseline` before making changes, and run them
+# again afterwards to compare:
+#
+#   just b test tests/baserow/performance/test_benchmarks.py --run-benchmarks -s
+pytestmark = [pytest.mark.django_db, pytest.mark.benchmarks]
+
+ROW_COUNT = 2000
+BATCH_SIZE = 200
+
+
+def _setup_benchmark_table(data_fixture):
+    """
+    Creates a table with every field type and fills it with the same pseudo random
+    rows for every run, so that the results can be compared with the baseline.
+    """
+
+    random.seed(0)
+    Faker.seed(0)
+    table, user, _, _, _ = setup_interesting_test_table(data_fixture)
+    fill_table_rows(ROW_COUNT, table)
+    return table, user
+
+
+def _list_grid_view_rows(api_client, grid_view, token, **params):
+    response = api_client.get(
+        reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id}),
+        {"limit": BATCH_SIZE, **params},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    return response
+
+
+def test_benchmark_list_grid_view_rows(data_fixture, api_client, measure_benchmark):
+    table, user = _setup_benchmark_table(data_fixture)
+    token = data_fixture.generate_token(user)
+    grid_view = data_fixture.create_grid_view(user=user, table=table)
+
+    measure_benchmark(
+        "list_grid_view_rows",
+        lambda: _list_grid_view_rows(api_client, grid_view, token),
+        rounds=5,
+        warmup_rounds=1,
+    )
+
+
+def test_benchmark_list_filtered_and_sorted_grid_view_rows(
+    data_fixture, api_client, measure_benchmark
+):
+    table, user = _setup_benchmark_table(data_fixture)
+    token = data_fixture.generate_token(user)
+    grid_view = data_fixture.create_grid_view(user=user, table=table)
+    data_fixture.create_view_filter(
+        view=grid_view,
+        field=table.field_set.get(name="text"),
+        type="contains",
+        value="a",
+    )
+    data_fixture.create_view_sort(
+        view=grid_view, field=table.field_set.get(name="positive_int"), order="DESC"
+    )
+
+    measure_benchmark(
+        "list_filtered_and_sorted_grid_view_rows",
+        lambda: _list_grid_view_rows(api_client, grid_view, token),
+        rounds=5,
+        warmup_rounds=1,
+    )
+
+
+def test_benchmark_search_grid_view_rows(data_fixture, api_client, measure_benchmark):
+    table, user = _setup_benchmark_table(data_fixture)
+    token = data_fixture.generate_token(user)
+    grid_view = data_fixture.create_grid_view(user=user, table=table)
+
+    measure_benchmark(
+        "search_grid_view_rows",
+        lambda: _list_grid_view_rows(api_client, grid_view, token, search="a"),
+        rounds=5,
+        warmup_rounds=1,
+    )
+
+
+def test_benchmark_create_rows(data_fixture, measure_benchmark):
+    table, user = _setup_benchmark_table(data_fixture)
+    text_field = table.field_set.get(name="text")
+    number_field = table.field_set.get(name="positive_int")
+    rows_values = [
+        {f"field_{text_field.id}": f"text {i}", f"field_{number_field.id}": i}
+        for i in range(BATCH_SIZE)
+    ]
+
+    measure_benchmark(
+        "create_rows",
+        lambda: RowHandler().create_rows(user, table, rows_values),
+        rounds=3,
+        warmup_rounds=1,
+    )
+
+
+def test_benchmark_update_rows(data_fixture, measure_benchmark):
+    table, user = _setup_benchmark_table(data_fixture)
+    text_field = table.field_set.get(name="text")
+    row_ids = table.get_model().objects.order_by("id").values_list("id", flat=True)
+    rows_values = [
+        {"id": row_id, f"field_{text_field.id}": f"updated {row_id}"}
+        for row_id in row_ids[:BATCH_SIZE]
+    ]
+
+    measure_benchmark(
+        "update_rows",
+        lambda: RowHandler().update_rows(user, table, rows_values),
+        rounds=3,
+        warmup_rounds=1,
+    )
+
+
+def test_benchmark_convert_field(data_fixture, measure_benchmark):
+    table, user = _setup_benchmark_table(data_fixture)
+    field_id = table.field_set.get(name="text").id
+    handler = FieldHandler()
+
+    measure_benchmark(
+        "convert_text_field_to_number",
+        lambda: handler.update_field(
+            user,
+            handler.get_specific_field_for_update(field_id),
+            new_type_name="number",
+        ),
+        rounds=3,
+        setup=lambda: handler.update_field(
+            user, handler.get_specific_field_for_update(field_id), new_type_name="text"
+        ),
+    )
+
+
+def test_benchmark_recalculate_formula_field(data_fixture, measure_benchmark):
+    table, user = _setup_benchmark_table(data_fixture)
+    handler = FieldHandler()
+    field_id = handler.create_field(
+        user,
+        table,
+        "formula",
+        name="benchmark formula",
+        formula="concat(field('text'), field('positive_int'))",
+    ).id
+    formulas = iter(f"concat(field('text'), '{i}')" for i in range(3))
+
+    measure_benchmark(
+        "recalculate_formula_field",
+        lambda: handler.update_field(
+            user,
+            handler.get_specific_field_for_update(field_id),
+            formula=next(formulas),
+        ),
+        rounds=3,
+    )
+
+
+def test_benchmark_export_table_to_csv(data_fixture, measure_benchmark):
+    table, user = _setup_benchmark_table(data_fixture)
+    handler = ExportHandler()
+
+    def export():
+        job = handler.create_pending_export_job(
+            user, table, None, {"exporter_type": "csv", "export_charset": "utf-8"}
+        )
+        handler.run_export_job(job)
+
+    measure_benchmark("export_table_to_csv", export, rounds=3)
+
+
+def test_benchmark_import_table(data_fixture, measure_benchmark):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    random.seed(0)
+    data = [
+        [f"name {i}", str(random.randint(0, 1000)), f"description {i}"]
+        for i in range(ROW_COUNT)
+    ]
+
+    measure_benchmark(
+        "import_table",
+        lambda: TableHandler().create_table(
+            user, database, "imported", data=data, first_row_header=False
+        ),
+        rounds=3,
+    )
+
+
+def test_benchmark_duplicate_table(data_fixture, measure_benchmark):
+    table, user = _setup_benchmark_table(data_fixture)
+
+    measure_benchmark(
+        "duplicate_table",
+        lambda: TableHandler().duplicate_table(user, table),
+        rounds=3,
+    )
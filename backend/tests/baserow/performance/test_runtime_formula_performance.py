@@ -0,0 +1,42 @@
+import timeit
+
+import pytest
+
+from baserow.core.formula.parser.formula_compiler import compile_formula
+from baserow.core.formula.parser.formula_execution_visitor import (
+    BaserowFormulaExecutionVisitor,
+)
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.registries import formula_runtime_function_registry
+
+
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_compiled_runtime_formula_compared_to_parsing_every_time():
+    # Resolves the same formula for many different records, like a repeat element of
+    # a published page or an iterator node of an automation does.
+    formula = "concat('Name: ', get('name'), ', total: ', get('price') * get('count'))"
+    contexts = [{"name": f"item {i}", "price": i, "count": 3} for i in range(2000)]
+
+    def parse_every_time():
+        for context in contexts:
+            tree = get_parse_tree_for_formula(formula)
+            BaserowFormulaExecutionVisitor(
+                formula_runtime_function_registry, context
+            ).visit(tree)
+
+    def compiled():
+        for context in contexts:
+            compile_formula(formula)(formula_runtime_function_registry, context)
+
+    parse_every_time_seconds = min(timeit.repeat(parse_every_time, number=1, repeat=3))
+    compiled_seconds = min(timeit.repeat(compiled, number=1, repeat=3))
+
+    print(f"--------- Resolving a formula {len(contexts)} times -------")
+    print(f"Parsing every time: {parse_every_time_seconds:.4f}s")
+    print(f"Compiled once:      {compiled_seconds:.4f}s")
+    print(f"Speedup:            {parse_every_time_seconds / compiled_seconds:.1f}x")
+
+    assert compiled_seconds < parse_every_time_seconds
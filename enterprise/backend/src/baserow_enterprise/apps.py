@@ -21,6 +21,17 @@ class BaserowEnterpriseConfig(AppConfig):
         job_type_registry.register(AuditLogExportJobType())
         job_type_registry.register(DataScanResultExportJobType())
 
+        from baserow.core.partitioning.registries import (
+            time_partitioned_model_registry,
+        )
+        from baserow_enterprise.audit_log.handler import (
+            AuditLogEntryTimePartitionedModelType,
+        )
+
+        time_partitioned_model_registry.register(
+            AuditLogEntryTimePartitionedModelType()
+        )
+
         from baserow.api.user.registries import member_data_registry
         from baserow.core.action.registries import (
             action_scope_registry,
@@ -7,6 +7,8 @@ from baserow.api.sessions import get_user_remote_addr_ip
 from baserow.core.action.registries import ActionType
 from baserow.core.action.signals import ActionCommandType
 from baserow.core.models import Workspace
+from baserow.core.partitioning.handler import PartitionHandler
+from baserow.core.partitioning.registries import TimePartitionedModelType
 
 from .models import AuditLogEntry
 
@@ -70,8 +72,17 @@ class AuditLogHandler:
     def delete_entries_older_than(cls, cutoff: datetime):
         """
         Deletes all audit log entries that are older than the given number of days.
+        If the audit log table is partitioned, then the partitions only containing
+        older entries are dropped instead of deleting their entries.
 
         :param cutoff: The date and time before which all entries will be deleted.
         """
 
+        PartitionHandler.drop_partitions_older_than(AuditLogEntry, cutoff)
         AuditLogEntry.objects.filter(action_timestamp__lt=cutoff).delete()
+
+
+class AuditLogEntryTimePartitionedModelType(TimePartitionedModelType):
+    type = "audit_log_entry"
+    model_class = AuditLogEntry
+    partition_field_name = "action_timestamp"
@@ -99,6 +99,13 @@ class AuditLogEntry(CreatedAndUpdatedOnMixin, models.Model):
                 fields=["-action_timestamp", "user_id", "workspace_id", "action_type"]
             )
         ]
+        constraints = [
+            # The primary key of the table once it's partitioned by migration 0061.
+            models.UniqueConstraint(
+                fields=("id", "action_timestamp"),
+                name="baserow_enterprise_auditlogentry_partitioned_pkey",
+            ),
+        ]
 
 
 class AuditLogExportJob(Job):
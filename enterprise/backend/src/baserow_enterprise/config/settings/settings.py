@@ -34,6 +34,10 @@ def setup(settings):
         os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_RETENTION_DAYS", "") or 365
     )
 
+    settings.BASEROW_ENTERPRISE_PERMISSION_SNAPSHOT_TTL_SECONDS = int(
+        os.getenv("BASEROW_ENTERPRISE_PERMISSION_SNAPSHOT_TTL_SECONDS", "") or 300
+    )
+
     # Set this to True to enable users to login with auth providers different than
     # the one they were originally created with.
     settings.BASEROW_ALLOW_MULTIPLE_SSO_PROVIDERS_FOR_SAME_ACCOUNT = bool(
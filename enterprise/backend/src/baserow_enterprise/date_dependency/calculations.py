@@ -1,7 +1,9 @@
 import dataclasses
+import math
 from copy import copy
 from datetime import date, datetime, timedelta
 
+from django.db import connection
 from django.db.models import ForeignKey
 
 from loguru import logger
@@ -12,10 +14,10 @@ from baserow.core.psycopg import sql
 from baserow_enterprise.date_dependency.models import DateDependency
 
 from .constants import (
+    DATE_DEPENDENCY_PROPAGATION_QUERY,
     DURATION_FIELD,
     END_DATE_FIELD,
     NO_VALUE,
-    ROW_DEPENDENCY_GRAPH_QUERY,
     START_DATE_FIELD,
     NoValueSentinel,
 )
@@ -339,11 +341,13 @@ class DateDependencyCalculator:
     of a row. Rows can be organized into hierarchies, where start/end dates should not
     overlap, and linkrow field will describe a connection between specific rows.
 
-    This class receives a starting row and date dependency rule, and will calculate
-    full graph of dependent rows in both directions (predecessors and successors). Then,
-    it will walk up and down the graph, and check if start/end dates between two rows
-    connected don't overlap (according to date dependency parameters). If there's an
-    overlap, the other end of connection will be adjusted accordingly.
+    This class receives a starting row and date dependency rule, and calculates the
+    new values of all dependent rows in both directions (predecessors and successors)
+    with a single recursive query over the linkrow relation table. If start/end dates
+    of two connected rows overlap (according to date dependency parameters), the
+    other end of the connection is adjusted accordingly, and the change is
+    propagated further down the chain. See `adjust_parent` and `adjust_child` for
+    the rules that the query applies to each pair of rows.
     """
 
     def __init__(
@@ -359,17 +363,14 @@ class DateDependencyCalculator:
         :param rule: Rule with dependency parameters.
         :param previsited: Optional list of visited row ids, useful if multiple rules
             may affect the same row. If a row id is present in the visited list, it
-            should not be processed. What's more, the processing of a chain should
-            also be stopped, if it hits a row that was previously visited.
+            should not be modified, but the rows after it in the chain are still
+            adjusted against its current values.
         """
 
         self.row = row
         self.rule = rule
-        self.cache = {row.id: row}
-        self.dependency_map = {}
         self.visited = set().union(previsited or set())
         self.modified = []
-        self.graph_paths = []
 
     def get_linkrow_from_to_fields(
         self, linkrow_field: LinkRowField
@@ -409,15 +410,33 @@ class DateDependencyCalculator:
             parent_field,
         )
 
-    def populate_dependency_graph(self):
+    def get_buffer_offsets(self) -> tuple[int, int, int]:
         """
-        Populates dependency graph for the starting row, and cache for rows.
+        Converts the rule's buffer to whole days, the same way `adjust_child` and
+        `adjust_parent` apply it to dates.
 
-        This queries the table with linkrow relations for user data table, and builds
-        a graph of dependent rows for the starting row. Based on results, it populates
-        `.graph_paths` and  `.cache` with rows.
+        :return: A tuple with the minimum number of days between the end of a parent
+            and the start of a child, and the number of days to move the start of a
+            child forward from, or the end of a parent back from, the connected row.
         """
 
+        day = timedelta(days=1)
+        buffer = timedelta(0)
+        if self.rule.buffer_is_flexible and self.rule.dependency_buffer:
+            buffer = self.rule.dependency_buffer
+        threshold = max(math.ceil(buffer / day), 1)
+        forward_offset = (buffer + day).days
+        backward_offset = math.ceil((buffer + day) / day)
+        return threshold, forward_offset, backward_offset
+
+    def calculate(self):
+        """
+        Calculates the new values of all rows depending on the starting row, and
+        stores them in `.modified` as a list of (row id, values) tuples.
+        """
+
+        self.modified.clear()
+
         rule = self.rule
         if not (
             rule.duration_field
@@ -427,180 +446,49 @@ class DateDependencyCalculator:
         ):
             logger.warning(f"Field Rule doesn't have all fields: {rule.to_dict()}")
             return
-        linkrow_field = self.rule.dependency_linkrow_field.specific
-        table_name = sql.Identifier(self.row.__class__._meta.db_table)
-        start_date_field = sql.Identifier(self.rule.start_date_field.db_column)
-        end_date_field = sql.Identifier(self.rule.end_date_field.db_column)
-        duration_field = sql.Identifier(self.rule.duration_field.db_column)
+        if rule.buffer_is_none:
+            return
 
-        relation_table_name = sql.Identifier(linkrow_field.through_table_name)
+        linkrow_field = rule.dependency_linkrow_field.specific
         from_field, to_field = self.get_linkrow_from_to_fields(linkrow_field)
-        from_field_name = sql.Identifier(from_field.column)
-        to_field_name = sql.Identifier(to_field.column)
-
-        row_id = self.row.pk
+        query = DATE_DEPENDENCY_PROPAGATION_QUERY.format(
+            table_name=sql.Identifier(self.row.__class__._meta.db_table),
+            relation_table_name=sql.Identifier(linkrow_field.through_table_name),
+            from_field_name=sql.Identifier(from_field.column),
+            to_field_name=sql.Identifier(to_field.column),
+            start_date_field=sql.Identifier(rule.start_date_field.db_column),
+            end_date_field=sql.Identifier(rule.end_date_field.db_column),
+            duration_field=sql.Identifier(rule.duration_field.db_column),
+        )
 
+        values = DateValues.from_row(self.row, rule)
+        threshold, forward_offset, backward_offset = self.get_buffer_offsets()
         params = {
-            "value": sql.Literal(row_id),
-            "to_field_name": to_field_name,
-            "from_field_name": from_field_name,
-            "relation_table_name": relation_table_name,
-            "table_name": table_name,
-            "start_date_field": start_date_field,
-            "end_date_field": end_date_field,
-            "duration_field": duration_field,
+            "row_id": self.row.pk,
+            "start_date": (
+                values.start_date if isinstance(values.start_date, date) else None
+            ),
+            "end_date": values.end_date if isinstance(values.end_date, date) else None,
+            "visited": list(self.visited),
+            "include_weekends": rule.include_weekends,
+            "threshold": threshold,
+            "forward_offset": forward_offset,
+            "backward_offset": backward_offset,
         }
 
-        query = ROW_DEPENDENCY_GRAPH_QUERY.format(**params)
-
-        affected_rows = list(self.row.__class__.objects.raw(query))
-
-        for rule in affected_rows:
-            if rule.node_type == "LEAF":
-                self.graph_paths.append(rule.path)
-            if rule.id in self.cache:
-                continue
-            self.cache[rule.id] = rule
-
-    def _get_row(self, row_id) -> GeneratedTableModel:
-        try:
-            return self.cache[row_id]
-        except KeyError:
-            row = self.row.__class__.objects.get(pk=row_id)
-            self.cache[row_id] = row
-            return row
-
-    def _set_row(self, row: GeneratedTableModel) -> GeneratedTableModel:
-        self.cache[row.id] = row
-        return row
-
-    def calculate(self):
-        self.modified.clear()
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            results = cursor.fetchall()
 
-        self.populate_dependency_graph()
-        if not (self.graph_paths):
+        if not results:
             logger.debug(f"No dependencies found for {self.row}")
             return
-        self.adjust_predecessors()
-        self.adjust_successors()
 
-    def adjust_predecessors(self):
-        """
-        Find all paths that will end up in root elements and change values, if dates
-        are overlapping.
-        """
-
-        paths = self.graph_paths
-
-        visited = self.visited
-        modified = self.modified
-
-        for path in paths:
-            # walk from child to parent, so we need to revert the path
-            walk_items = list(reversed(path))
-            child = DateValues.from_row(self.row, self.rule)
-            # we can walk when we get past current row
-            can_walk = False
-            local_visited = set()
-
-            for item_id in walk_items:
-                if item_id == self.row.id:
-                    can_walk = True
-                    continue
-                if not can_walk:
-                    continue
-
-                # If visited just for this path, then we bail, as this may be a loop.
-                if item_id in local_visited:
-                    break
-                local_visited.add(item_id)
-
-                # Row may have been processed globally already, so we move to the
-                # next one. However, any subsequent row should use this one as a
-                # previous row.
-                parent_row = self._get_row(item_id)
-                parent = DateValues.from_row(parent_row, self.rule)
-                if item_id in visited:
-                    child = parent
-                    continue
-
-                visited.add(item_id)
-
-                if not parent.has_valid_value_types():
-                    logger.debug(
-                        "Breaking from adjust_predecessors because parent "
-                        f" {item_id} has invalid values: {parent.to_dict()}"
-                    )
-                    break
-                adjusted = adjust_parent(parent, child, self.rule)
-                if not adjusted:
-                    break
-                self._set_row(parent.to_row(parent_row))
-                modified.append(
-                    (
-                        item_id,
-                        parent,
-                    )
-                )
-                child = parent
-
-    def adjust_successors(self):
-        """
-        Adjust start/end date values for all successors (children) of the initial row.
-
-        This will walk through all paths and update rows after the initial row. If a
-        child row is invalid, or was already processed by another rule, this, and
-        subsequent items won't be processed.
-        """
-
-        paths = self.graph_paths
-
-        visited = self.visited
-        modified = self.modified
-
-        for path in paths:
-            walk_items = copy(path)
-            can_walk = False
-            local_visited = set()
-            parent = DateValues.from_row(self.row, self.rule)
-            for item_id in walk_items:
-                if item_id == self.row.id:
-                    can_walk = True
-                    continue
-                if not can_walk:
-                    continue
-
-                if item_id in local_visited:
-                    break
-                local_visited.add(item_id)
-
-                # Row may have been processed globally already, so we move to the
-                # next one. However, any subsequent row should use this one as a
-                # previous row.
-                child_row = self._get_row(item_id)
-                child = DateValues.from_row(child_row, self.rule)
-                if item_id in visited:
-                    parent = child
-                    continue
-                visited.add(item_id)
-
-                if not child.is_valid():
-                    logger.warning(
-                        "Breaking from adjust_successors because child "
-                        f" {item_id} has invalid values: {child.to_dict()}"
-                    )
-                    break
-                adjusted = adjust_child(parent, child, self.rule)
-                if not adjusted:
-                    break
-                self._set_row(child.to_row(child_row))
-                modified.append(
-                    (
-                        item_id,
-                        child,
-                    )
-                )
-                parent = child
+        for row_id, start_date, end_date, duration in results:
+            self.visited.add(row_id)
+            self.modified.append(
+                (row_id, DateValues(rule, start_date, end_date, duration))
+            )
 
 
 def adjust_parent(parent: DateValues, child: DateValues, rule: DateDependency) -> bool:
@@ -14,94 +14,117 @@ END_DATE_FIELD = "end_date"
 DURATION_FIELD = "duration"
 
 
-# The query builds a list of rows belonging to the graph. Each row contains
-# its path from the root, depth level and a shortcut information if it's a root,
-# intermediate node or a leaf (ending) of a path. Also, each row contains
-# start/end dates and duration to be able to calculate new values.
-# Note: One row can belong to multiple paths, and there may be multiple paths
-# in the graph (one row can have multiple parents and one parent can have
-# multiple children).
-ROW_DEPENDENCY_GRAPH_QUERY = sql.SQL(
+# The query calculates the new dates of all rows that are reachable from the updated
+# row through the dependency link row field, in both directions. Predecessors are
+# found by following the relation from the child (`from_` column) to the parent
+# (`to_` column), and successors the other way around. A reached row is shifted
+# only when it overlaps with the previous row in the chain (respecting the buffer),
+# and only shifted rows continue the chain. Rows in the `visited` array have been
+# processed already, so they keep their values, but the chain continues through
+# them. The `path` array prevents endless recursion in cycles.
+#
+# Note: one row can be reached through multiple paths. Because a later date of a
+# parent can only move a child further, the most restrictive value of all paths is
+# picked for every row.
+#
+# Expected parameters: `row_id`, `start_date`, `end_date` of the updated row,
+# `visited` row ids, `include_weekends`, `threshold` (the minimum number of days
+# between connected rows), `forward_offset` and `backward_offset` (the number of
+# days between the shifted row and the previous row in the chain).
+DATE_DEPENDENCY_PROPAGATION_QUERY = sql.SQL(
     """
     WITH RECURSIVE
-        updated AS
-                (SELECT unnest(ARRAY [{value}]) AS updated_id),
-        ancestors AS (select u.updated_id         AS id,
-                             u.updated_id         AS original_id,
-                             0                    AS level,
-                             ARRAY [u.updated_id] AS path
-                      FROM updated u
-                      JOIN {table_name} t ON t.id = u.updated_id AND NOT t.trashed
-                      UNION ALL
-                      -- Recursively find parents
-                      SELECT ip.{to_field_name} AS parent_id
-                , a.original_id
-                , a.level - 1 AS level
-                , ip.{to_field_name} || a.path AS path
-                      FROM ancestors a
-                          JOIN {relation_table_name} ip
-                      ON ip.{from_field_name} = a.id
-                      JOIN {table_name} t ON t.id = a.id AND NOT t.trashed
-                      WHERE NOT (ip.{to_field_name} = ANY (a.path)) -- Prevent cycles
+        predecessors AS (
+            SELECT %(row_id)s::int           AS id,
+                   %(start_date)s::date     AS start_date,
+                   %(end_date)s::date       AS end_date,
+                   NULL::interval           AS duration,
+                   FALSE                    AS modified,
+                   ARRAY [%(row_id)s::int]  AS path
+            UNION ALL
+            SELECT p.id,
+                   CASE
+                       WHEN p.id = ANY (%(visited)s::int[]) THEN p.{start_date_field}
+                       -- the start can't be calculated for a duration below 1 day
+                       WHEN %(include_weekends)s::boolean
+                           AND p.{duration_field} < INTERVAL '1 day'
+                           THEN p.{start_date_field}
+                       ELSE c.start_date - %(backward_offset)s::int
+                           - (FLOOR(EXTRACT(EPOCH FROM p.{duration_field}) / 86400)::int - 1)
+                   END,
+                   CASE
+                       WHEN p.id = ANY (%(visited)s::int[]) THEN p.{end_date_field}
+                       ELSE c.start_date - %(backward_offset)s::int
+                   END,
+                   p.{duration_field},
+                   NOT p.id = ANY (%(visited)s::int[]),
+                   c.path || p.id
+            FROM predecessors c
+                JOIN {relation_table_name} r ON r.{from_field_name} = c.id
+                JOIN {table_name} p ON p.id = r.{to_field_name} AND NOT p.trashed
+            WHERE NOT p.id = ANY (c.path) -- Prevent cycles
+                AND (
+                    p.id = ANY (%(visited)s::int[])
+                    OR (
+                        p.{start_date_field} IS NOT NULL
+                        AND p.{end_date_field} IS NOT NULL
+                        AND p.{duration_field} IS NOT NULL
+                        AND c.start_date - p.{end_date_field} < %(threshold)s::int
+                    )
+                )
         ),
-        -- one starting row can have multiple roots
-        roots AS (SELECT a.id as root_id,
-                         a.id,
-                         a.original_id
-                  FROM ancestors a
-                           LEFT OUTER JOIN {relation_table_name} ip
-                  ON ip.{from_field_name} = a.id
-                 JOIN {table_name} t ON t.id = a.id AND NOT t.trashed
-                  WHERE ip.id IS NULL
-                  ORDER BY original_id, level ASC),
-        -- Find all descendants starting from roots
-        descendants AS (
-            -- Start with root nodes
-            SELECT r.root_id,
-                   r.root_id         AS id,
-                   r.original_id,
-                   0                 AS level,
-                   ARRAY [r.root_id] AS path
-            FROM roots r
-                JOIN {table_name} t ON t.id = r.root_id AND NOT t.trashed
+        successors AS (
+            SELECT %(row_id)s::int           AS id,
+                   %(start_date)s::date     AS start_date,
+                   %(end_date)s::date       AS end_date,
+                   NULL::interval           AS duration,
+                   FALSE                    AS modified,
+                   ARRAY [%(row_id)s::int]  AS path
             UNION ALL
-            -- Recursively find children
-            SELECT d.root_id,
-                   ip.{from_field_name} AS  id,
-                d.original_id,
-                d.level + 1 AS  level,
-                d.path || ip.{from_field_name} AS  path
-            FROM descendants d
-                JOIN {relation_table_name} ip
-            ON ip.{to_field_name} = d.id
-            JOIN {table_name} t ON t.id = d.id AND NOT t.trashed
-            WHERE NOT (ip.{from_field_name} = ANY (d.path)) -- Prevent cycles
+            SELECT s.id,
+                   CASE
+                       WHEN s.id = ANY (%(visited)s::int[]) THEN s.{start_date_field}
+                       ELSE c.end_date + %(forward_offset)s::int
+                   END,
+                   CASE
+                       WHEN s.id = ANY (%(visited)s::int[]) THEN s.{end_date_field}
+                       ELSE c.end_date + %(forward_offset)s::int
+                           + (FLOOR(EXTRACT(EPOCH FROM s.{duration_field}) / 86400)::int - 1)
+                   END,
+                   s.{duration_field},
+                   NOT s.id = ANY (%(visited)s::int[]),
+                   c.path || s.id
+            FROM successors c
+                JOIN {relation_table_name} r ON r.{to_field_name} = c.id
+                JOIN {table_name} s ON s.id = r.{from_field_name} AND NOT s.trashed
+            WHERE NOT s.id = ANY (c.path) -- Prevent cycles
+                AND (
+                    s.id = ANY (%(visited)s::int[])
+                    OR (
+                        -- only rows with valid values are shifted
+                        s.{duration_field} > INTERVAL '0'
+                        AND MOD(EXTRACT(EPOCH FROM s.{duration_field})::numeric, 86400) = 0
+                        AND s.{end_date_field} - s.{start_date_field}
+                            = FLOOR(EXTRACT(EPOCH FROM s.{duration_field}) / 86400)::int - 1
+                        AND s.{start_date_field} - c.end_date < %(threshold)s::int
+                    )
+                )
         ),
--- Combine all nodes in the dependency trees
-        complete_tree AS (SELECT DISTINCT d.id,
-                                          d.original_id,
-                                          r.root_id,
-                                          d.level,
-                                          d.path
-                          FROM descendants d
-                                   JOIN roots r ON r.root_id = d.root_id)
--- Final result with item details
-    SELECT ct.id,
-           i.{start_date_field},
-    i.{end_date_field},
-    i.{duration_field},
-    ct.root_id,
-    ct.level,
-    ct.path,
-    ct.original_id AS triggered_by_update_of,
-    CASE
-        WHEN ct.id = ct.root_id THEN 'ROOT'
-        WHEN NOT EXISTS (SELECT 1 FROM {relation_table_name} WHERE {to_field_name} = ct.id) THEN 'LEAF'
-        ELSE 'INTERMEDIATE'
-    END AS  node_type
-
-FROM complete_tree ct
-JOIN {table_name} i ON i.id = ct.id AND NOT i.trashed
-ORDER BY ct.original_id, ct.level desc, ct.id;
+        shifted_predecessors AS (
+            SELECT DISTINCT ON (id) id, start_date, end_date, duration
+            FROM predecessors
+            WHERE modified
+            ORDER BY id, end_date
+        ),
+        shifted_successors AS (
+            SELECT DISTINCT ON (id) id, start_date, end_date, duration
+            FROM successors
+            WHERE modified AND id NOT IN (SELECT id FROM shifted_predecessors)
+            ORDER BY id, start_date DESC
+        )
+    SELECT id, start_date, end_date, duration FROM shifted_predecessors
+    UNION ALL
+    SELECT id, start_date, end_date, duration FROM shifted_successors
+    ORDER BY id
     """
 )  # noqa STR100
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+from baserow.core.partitioning.handler import PartitionHandler
+
+
+def forward(apps, schema_editor):
+    AuditLogEntry = apps.get_model("baserow_enterprise", "AuditLogEntry")
+    PartitionHandler.convert_to_time_partitioned_table(
+        schema_editor, AuditLogEntry, "action_timestamp"
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("baserow_enterprise", "0060_datascan_whole_words_datascanresult_cell_value"),
+    ]
+
+    # The partitioned table is created in one transaction, but the index and the
+    # constraint needed to attach the existing table as a partition without locking
+    # it are created and validated concurrently before that.
+    atomic = False
+
+    operations = [
+        # The partitioned table is fully compatible with the model, so it is kept as
+        # is when migrating backwards.
+        migrations.RunPython(forward, migrations.RunPython.noop),
+        # Postgres requires the partition key to be part of the primary key, so the
+        # primary key of the partitioned table is (id, action_timestamp). The id
+        # stays the primary key for Django because it's still unique.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="auditlogentry",
+                    constraint=models.UniqueConstraint(
+                        fields=("id", "action_timestamp"),
+                        name="baserow_enterprise_auditlogentry_partitioned_pkey",
+                    ),
+                ),
+            ],
+        ),
+    ]
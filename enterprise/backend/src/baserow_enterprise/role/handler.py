@@ -4,9 +4,10 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
 
-from baserow.core.cache import local_cache
+from baserow.core.cache import global_cache, local_cache
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.mixins import TrashableModelMixin
@@ -56,6 +57,27 @@ def _clear_role_assignments_from_local_cache():
     local_cache.delete(f"{ROLE_ASSIGNMENT_CACHE_KEY_PREFIX}_*")
 
 
+def get_permission_snapshot_invalidate_key(workspace_id: int) -> str:
+    return f"{ROLE_ASSIGNMENT_CACHE_KEY_PREFIX}_permission_snapshots_{workspace_id}"
+
+
+def invalidate_permission_snapshots(workspace_id: int):
+    """
+    Invalidates the cached permission snapshots of all the actors of the workspace.
+    This is done again when the transaction commits, so that a snapshot built by a
+    concurrent request before the changes were visible doesn't stay cached.
+    """
+
+    def invalidate():
+        global_cache.invalidate(
+            invalidate_key=get_permission_snapshot_invalidate_key(workspace_id)
+        )
+
+    _clear_role_assignments_from_local_cache()
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
 def clear_roles_from_local_cache():
     """
     Decorator to use for methods that need to clear the role assignment cache at the end
@@ -660,6 +682,7 @@ class RoleAssignmentHandler:
             scope_type=content_types[scope],
             defaults={"role": role},
         )
+        invalidate_permission_snapshots(workspace.id)
 
         if send_signals:
             # TODO remove signaling from here
@@ -710,6 +733,7 @@ class RoleAssignmentHandler:
             scope_id=scope.id,
             scope_type=content_types[scope],
         ).delete()
+        invalidate_permission_snapshots(workspace.id)
         role_assignment_deleted.send(
             self, subject=subject, workspace=workspace, scope=scope
         )
@@ -23,6 +23,10 @@ from baserow_premium.license.handler import LicenseHandler
 
 from .constants import READ_ONLY_ROLE_UID
 from .models import Role
+from .permission_snapshot import (
+    get_permission_snapshots,
+    get_scope_keys_with_ancestors,
+)
 
 User = get_user_model()
 
@@ -91,37 +95,37 @@ class RolePermissionManagerType(PermissionManagerType):
             actors_by_subject_type[s_type].add(actor)
             checks_by_actor_and_context[actor][context].append(check)
 
-        result = {}
-        roles_per_scope_by_actor = {}
+        snapshot_by_actor = {}
         for actor_subject_type, actors in actors_by_subject_type.items():
-            roles_per_scope_by_actor.update(
-                RoleAssignmentHandler().get_roles_per_scope_for_actors(
+            snapshot_by_actor.update(
+                get_permission_snapshots(
                     workspace, actor_subject_type, actors, include_trash=include_trash
                 )
             )
 
-        scope_includes_cache = {}
+        result = {}
+        context_keys_cache = {}
         for actor, context_and_checks in checks_by_actor_and_context.items():
+            snapshot = snapshot_by_actor[actor]
             for context, checks in context_and_checks.items():
-                computed_roles = RoleAssignmentHandler().get_computed_roles(
-                    roles_per_scope_by_actor[actor], context, scope_includes_cache
+                context_cache_key = (type(context).__name__, context.id)
+                if context_cache_key not in context_keys_cache:
+                    context_keys_cache[context_cache_key] = (
+                        get_scope_keys_with_ancestors(context)
+                    )
+                permitted_operations = snapshot.get_operations(
+                    context_keys_cache[context_cache_key]
                 )
-                permitted_operations = set(
-                    [
-                        operation_name
-                        for r in computed_roles
-                        for operation_name in self.get_role_operations(r)
-                    ]
+                result.update(
+                    {
+                        check: (
+                            True
+                            if check.operation_name in permitted_operations
+                            else PermissionDenied()
+                        )
+                        for check in checks
+                    }
                 )
-                check_results = {
-                    check: (
-                        True
-                        if check.operation_name in permitted_operations
-                        else PermissionDenied()
-                    )
-                    for check in checks
-                }
-                result.update(check_results)
 
         return result
 
@@ -245,6 +249,23 @@ class RolePermissionManagerType(PermissionManagerType):
         if workspace is None or not self.is_enabled(workspace):
             return None
 
+        all_operations = for_operation_types or operation_type_registry.get_all()
+
+        snapshot = get_permission_snapshots(
+            workspace, subject_type_registry.get_by_model(actor), [actor]
+        )[actor]
+        if snapshot.has_only_workspace_roles:
+            # Without roles on more precise scopes, there can't be any exceptions to
+            # the workspace level roles.
+            workspace_operations = snapshot.get_workspace_operations()
+            return {
+                operation_type.type: {
+                    "default": operation_type.type in workspace_operations,
+                    "exceptions": [],
+                }
+                for operation_type in all_operations
+            }
+
         # Get all role assignments for this actor into this workspace
         roles_by_scope = RoleAssignmentHandler().get_roles_per_scope(workspace, actor)
 
@@ -252,8 +273,6 @@ class RolePermissionManagerType(PermissionManagerType):
 
         scope_map_with_mixed_types_per_scope = defaultdict(set)
 
-        all_operations = for_operation_types or operation_type_registry.get_all()
-
         # First, for each operation we want the default policy and exceptions
         for operation_type in all_operations:
             default, exceptions, inclusions = self.get_operation_policy(
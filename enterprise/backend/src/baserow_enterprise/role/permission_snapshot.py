@@ -0,0 +1,234 @@
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, FrozenSet, Iterable, List, Tuple
+
+from django.conf import settings
+
+from baserow.core.cache import global_cache, local_cache
+from baserow.core.models import Workspace
+from baserow.core.registries import SubjectType, object_scope_type_registry
+from baserow.core.types import ContextObject, ScopeObject, Subject
+
+from .constants import NO_ACCESS_ROLE_UID, READ_ONLY_ROLE_UID
+from .handler import (
+    ROLE_ASSIGNMENT_CACHE_KEY_PREFIX,
+    RoleAssignmentHandler,
+    get_permission_snapshot_invalidate_key,
+)
+from .models import Role
+
+# Identifies a scope or context object by the type of its object scope and its id.
+ScopeKey = Tuple[str, int]
+
+
+def get_scope_key(scope: ScopeObject) -> ScopeKey:
+    return object_scope_type_registry.get_by_model(scope).type, scope.id
+
+
+def get_scope_keys_with_ancestors(context: ContextObject) -> Tuple[ScopeKey, ...]:
+    """
+    Returns the key of the given object followed by the keys of all its parents.
+    """
+
+    keys = []
+    while context is not None:
+        keys.append(get_scope_key(context))
+        context = context.get_parent()
+    return tuple(keys)
+
+
+@dataclass
+class PermissionSnapshot:
+    """
+    The resolved roles of an actor in a workspace, reduced to primitives so that it
+    can be shared between requests and processes. The team subjects, the role
+    assignments and the workspace level role are resolved once when the snapshot is
+    built, after which checking a permission only requires the keys of the context
+    and its ancestors.
+    """
+
+    # For every scope the actor has roles on, ordered from the workspace to the most
+    # precise scope: the key of the scope, the keys of its ancestors and the role ids.
+    scopes: List[Tuple[ScopeKey, FrozenSet[ScopeKey], Tuple[int, ...]]]
+    operations_per_role_id: Dict[int, FrozenSet[str]]
+    no_access_role_id: int
+    read_only_role_id: int
+    _operations_per_context: Dict[Tuple[ScopeKey, ...], FrozenSet[str]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_roles_per_scope(
+        cls, roles_per_scope: List[Tuple[ScopeObject, List[Role]]]
+    ) -> "PermissionSnapshot":
+        """
+        Builds the snapshot from the result of
+        `RoleAssignmentHandler.get_roles_per_scope_for_actors` for a single actor.
+        """
+
+        handler = RoleAssignmentHandler()
+        roles = {
+            handler.get_role_by_uid(NO_ACCESS_ROLE_UID),
+            handler.get_role_by_uid(READ_ONLY_ROLE_UID),
+        }
+        scopes = []
+        for scope, scope_roles in roles_per_scope:
+            ancestor_keys = get_scope_keys_with_ancestors(scope)
+            scopes.append(
+                (
+                    ancestor_keys[0],
+                    frozenset(ancestor_keys[1:]),
+                    tuple(role.id for role in scope_roles),
+                )
+            )
+            roles.update(scope_roles)
+
+        return cls(
+            scopes=scopes,
+            operations_per_role_id={
+                role.id: frozenset(op.name for op in role.operations.all())
+                for role in roles
+            },
+            no_access_role_id=handler.get_role_by_uid(NO_ACCESS_ROLE_UID).id,
+            read_only_role_id=handler.get_role_by_uid(READ_ONLY_ROLE_UID).id,
+        )
+
+    @property
+    def has_only_workspace_roles(self) -> bool:
+        return len(self.scopes) <= 1
+
+    def get_workspace_operations(self) -> FrozenSet[str]:
+        """
+        Returns the operations the actor is allowed to do based on the workspace level
+        roles only.
+        """
+
+        if not self.scopes:
+            return frozenset()
+        return self._get_operations_of_roles(self.scopes[0][2])
+
+    def get_role_ids(self, context_keys: Tuple[ScopeKey, ...]) -> List[int]:
+        """
+        Computes the ids of the roles that apply to the context, exactly like
+        `RoleAssignmentHandler.get_computed_roles` does.
+
+        :param context_keys: The keys of the context and its ancestors, as returned by
+            `get_scope_keys_with_ancestors`.
+        """
+
+        context_key = context_keys[0]
+        role_ids = [self.no_access_role_id]
+        for scope_key, scope_ancestor_keys, scope_role_ids in self.scopes:
+            if scope_key in context_keys:
+                # The scopes are sorted, so this scope is more precise than the
+                # previous one that included the context.
+                role_ids = list(scope_role_ids)
+            elif context_key in scope_ancestor_keys and any(
+                role_id != self.no_access_role_id for role_id in scope_role_ids
+            ):
+                # A role on a child of the context makes the context readable.
+                role_ids.append(self.read_only_role_id)
+        return role_ids
+
+    def get_operations(self, context_keys: Tuple[ScopeKey, ...]) -> FrozenSet[str]:
+        """
+        Returns the operations the actor is allowed to do on the context.
+
+        :param context_keys: The keys of the context and its ancestors, as returned by
+            `get_scope_keys_with_ancestors`.
+        """
+
+        operations = self._operations_per_context.get(context_keys)
+        if operations is None:
+            operations = self._get_operations_of_roles(self.get_role_ids(context_keys))
+            self._operations_per_context[context_keys] = operations
+        return operations
+
+    def _get_operations_of_roles(self, role_ids: Iterable[int]) -> FrozenSet[str]:
+        return frozenset().union(
+            *(self.operations_per_role_id[role_id] for role_id in role_ids)
+        )
+
+    def __getstate__(self):
+        # The operations per context are only memoized while the snapshot lives in
+        # memory, they're not worth sharing.
+        state = self.__dict__.copy()
+        state["_operations_per_context"] = {}
+        return state
+
+
+def _get_permission_snapshot(
+    workspace: Workspace,
+    actor_subject_type: SubjectType,
+    actor: Subject,
+    include_trash: bool,
+    build: Callable[[], PermissionSnapshot],
+) -> PermissionSnapshot:
+    cache_key = (
+        f"{ROLE_ASSIGNMENT_CACHE_KEY_PREFIX}_permission_snapshot_"
+        f"{actor_subject_type.type}_{actor.id}_{workspace.id}_{include_trash}"
+    )
+    timeout = settings.BASEROW_ENTERPRISE_PERMISSION_SNAPSHOT_TTL_SECONDS
+
+    def get_shared_snapshot():
+        if timeout <= 0:
+            return build()
+        return global_cache.get(
+            cache_key,
+            build,
+            invalidate_key=get_permission_snapshot_invalidate_key(workspace.id),
+            timeout=timeout,
+        )
+
+    return local_cache.get(cache_key, get_shared_snapshot)
+
+
+def get_permission_snapshots(
+    workspace: Workspace,
+    actor_subject_type: SubjectType,
+    actors: Iterable[Subject],
+    include_trash: bool = False,
+) -> Dict[Subject, PermissionSnapshot]:
+    """
+    Returns the permission snapshot of every actor in the workspace. Snapshots are
+    cached per request and, unless disabled, in the shared cache until a role
+    assignment, team membership or workspace user of the workspace changes. The
+    snapshots of all the actors that are not cached are built at once.
+
+    :param workspace: The workspace the snapshots are for.
+    :param actor_subject_type: The subject type of all the actors.
+    :param actors: The actors to return the snapshot for.
+    :param include_trash: Whether trashed workspace users must be considered.
+    :return: A dict containing the snapshot per actor.
+    """
+
+    actors = list(actors)
+    built = {}
+
+    def build(actor: Subject) -> PermissionSnapshot:
+        if not built:
+            roles_per_scope_by_actor = (
+                RoleAssignmentHandler().get_roles_per_scope_for_actors(
+                    workspace, actor_subject_type, actors, include_trash=include_trash
+                )
+            )
+            built.update(
+                {
+                    a: PermissionSnapshot.from_roles_per_scope(
+                        roles_per_scope_by_actor[a]
+                    )
+                    for a in actors
+                }
+            )
+        return built[actor]
+
+    return {
+        actor: _get_permission_snapshot(
+            workspace,
+            actor_subject_type,
+            actor,
+            include_trash,
+            partial(build, actor),
+        )
+        for actor in actors
+    }
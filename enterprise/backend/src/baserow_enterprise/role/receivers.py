@@ -6,7 +6,12 @@ from django.dispatch import receiver
 
 from baserow.core.models import Workspace, WorkspaceUser
 from baserow.core.registries import subject_type_registry
-from baserow.core.signals import permissions_updated, workspace_user_updated
+from baserow.core.signals import (
+    permissions_updated,
+    workspace_user_added,
+    workspace_user_deleted,
+    workspace_user_updated,
+)
 from baserow.core.types import Subject
 from baserow.ws.tasks import broadcast_to_users
 from baserow_enterprise.signals import (
@@ -15,8 +20,13 @@ from baserow_enterprise.signals import (
     role_assignment_updated,
     team_deleted,
     team_restored,
+    team_subject_created,
+    team_subject_deleted,
+    team_subject_restored,
 )
-from baserow_enterprise.teams.models import Team
+from baserow_enterprise.teams.models import Team, TeamSubject
+
+from .handler import invalidate_permission_snapshots
 
 User = get_user_model()
 
@@ -65,6 +75,42 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(permissions_updated)
+def invalidate_permission_snapshots_when_permissions_updated(
+    sender, subject: Subject, workspace: Workspace, **kwargs
+):
+    invalidate_permission_snapshots(workspace.id)
+
+
+@receiver(workspace_user_added)
+@receiver(workspace_user_deleted)
+def invalidate_permission_snapshots_when_workspace_user_changed(
+    sender, workspace_user: WorkspaceUser, **kwargs
+):
+    invalidate_permission_snapshots(workspace_user.workspace_id)
+
+
+@receiver(team_subject_created)
+@receiver(team_subject_deleted)
+@receiver(team_subject_restored)
+def invalidate_permission_snapshots_when_team_subject_changed(
+    sender, subject: TeamSubject, **kwargs
+):
+    invalidate_permission_snapshots(subject.team.workspace_id)
+
+
+def _delete_role_assignments(role_assignments):
+    """
+    Deletes the provided role assignments and invalidates the permission snapshots
+    of the workspaces they belonged to.
+    """
+
+    workspace_ids = set(role_assignments.values_list("workspace_id", flat=True))
+    role_assignments.delete()
+    for workspace_id in workspace_ids:
+        invalidate_permission_snapshots(workspace_id)
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
@@ -73,9 +119,9 @@ def cascade_subject_delete(sender, instance, **kwargs):
     from .models import RoleAssignment
 
     subject_ct = ContentType.objects.get_for_model(instance)
-    RoleAssignment.objects.filter(
-        subject_id=instance.id, subject_type=subject_ct
-    ).delete()
+    _delete_role_assignments(
+        RoleAssignment.objects.filter(subject_id=instance.id, subject_type=subject_ct)
+    )
 
 
 def cascade_workspace_user_delete(sender, instance, **kwargs):
@@ -91,6 +137,7 @@ def cascade_workspace_user_delete(sender, instance, **kwargs):
     RoleAssignment.objects.filter(
         subject_id=user_id, subject_type=user_ct, workspace_id=workspace_id
     ).delete()
+    invalidate_permission_snapshots(workspace_id)
 
 
 def cascade_scope_delete(sender, instance, **kwargs):
@@ -101,7 +148,9 @@ def cascade_scope_delete(sender, instance, **kwargs):
     from .models import RoleAssignment
 
     scope_ct = ContentType.objects.get_for_model(instance)
-    RoleAssignment.objects.filter(scope_id=instance.id, scope_type=scope_ct).delete()
+    _delete_role_assignments(
+        RoleAssignment.objects.filter(scope_id=instance.id, scope_type=scope_ct)
+    )
 
 
 def connect_to_post_delete_signals_to_cascade_deletion_to_role_assignments():
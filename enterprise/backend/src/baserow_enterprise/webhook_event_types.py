@@ -51,6 +51,12 @@ class RowsEnterViewEventType(EnterpriseWebhookEventType):
         table = self.get_table_object(**kwargs)
         return q & Q(table_id=table.id, active=True)
 
+    def has_webhooks_to_call(self, webhook_index, view, **kwargs) -> bool:
+        return any(
+            view.id in event["view_ids"]
+            for event in webhook_index["events"].get(self.type, [])
+        )
+
     def serialize_rows(self, model, rows, use_user_field_names):
         rows_serializer = get_row_serializer_class(
             model,
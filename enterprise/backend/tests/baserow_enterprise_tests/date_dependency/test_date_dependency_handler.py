@@ -650,6 +650,99 @@ def test_date_dependency_update_cascade(
     assert set(updated.cascade_update.row_ids) == {1, 2, 4, 7}
 
 
+@pytest.mark.django_db
+def test_date_dependency_update_cascade_multiple_paths(
+    data_fixture, enable_enterprise, django_capture_on_commit_callbacks
+):
+    """test if A3 is moved after the latest of its predecessors
+
+        +- A2 -+
+    A1 -+      +- A3 - A4
+        +- B2 -+
+    """
+
+    data = [
+        # text, start, end, duration, linkrow
+        ["A1", "2025-05-10", "2025-05-11", "2d 0h", []],
+        ["A2", "2025-05-12", "2025-05-16", "5d 0h", ["A1"]],
+        ["B2", "2025-05-12", "2025-05-13", "2d 0h", ["A1"]],
+        ["A3", "2025-05-17", "2025-05-18", "2d 0h", ["A2", "B2"]],
+        ["A4", "2025-05-25", "2025-05-26", "2d 0h", ["A3"]],
+    ]
+
+    user, table, model, fields, rule = create_date_dependency_table(
+        data_fixture, data, django_capture_on_commit_callbacks
+    )
+    text, start, end, duration, linkrow = fields
+    update_data = [{"id": 1, start.db_column: "2025-05-12"}]
+
+    updated = RowHandler().update_rows(
+        user,
+        table,
+        update_data,
+        model,
+        send_realtime_update=False,
+        send_webhook_events=False,
+        skip_search_update=True,
+    )
+
+    expected_updated_rows = {
+        2: (date(2025, 5, 14), date(2025, 5, 18)),
+        3: (date(2025, 5, 14), date(2025, 5, 15)),
+        4: (date(2025, 5, 19), date(2025, 5, 20)),
+    }
+    # A4 doesn't overlap with the moved A3, so it keeps its dates.
+    assert set(updated.cascade_update.row_ids) == set(expected_updated_rows.keys())
+
+    for row in model.objects.filter(id__in=expected_updated_rows.keys()):
+        date_value = DateValues.from_row(row, rule)
+        assert (date_value.start_date, date_value.end_date) == expected_updated_rows[
+            row.id
+        ]
+        assert date_value.is_valid()
+
+
+@pytest.mark.django_db
+def test_date_dependency_update_cascade_with_flexible_buffer(
+    data_fixture, enable_enterprise, django_capture_on_commit_callbacks
+):
+    data = [
+        # text, start, end, duration, linkrow
+        ["P1", "2025-05-01", "2025-05-02", "2d 0h", []],
+        ["P2", "2025-05-05", "2025-05-06", "2d 0h", ["P1"]],
+        ["P3", "2025-05-10", "2025-05-11", "2d 0h", ["P2"]],
+    ]
+
+    user, table, model, fields, rule = create_date_dependency_table(
+        data_fixture, data, django_capture_on_commit_callbacks
+    )
+    rule = rule.specific
+    rule.dependency_buffer_type = "flexible"
+    rule.dependency_buffer = timedelta(days=2)
+    rule.save()
+
+    text, start, end, duration, linkrow = fields
+    update_data = [{"id": 2, start.db_column: "2025-05-08"}]
+
+    updated = RowHandler().update_rows(
+        user,
+        table,
+        update_data,
+        model,
+        send_realtime_update=False,
+        send_webhook_events=False,
+        skip_search_update=True,
+    )
+
+    assert set(updated.cascade_update.row_ids) == {3}
+    row = model.objects.get(id=3)
+    assert getattr(row, start.db_column) == date(2025, 5, 12)
+    assert getattr(row, end.db_column) == date(2025, 5, 13)
+    # P1 ends more than 2 days before P2 starts, so it isn't moved.
+    row = model.objects.get(id=1)
+    assert getattr(row, start.db_column) == date(2025, 5, 1)
+
+
 def create_date_dependency_table(
     data_fixture, data, django_capture_on_commit_callbacks
 ) -> DateDepsTestData:
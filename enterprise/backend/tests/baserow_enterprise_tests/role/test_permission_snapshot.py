@@ -0,0 +1,136 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.contrib.database.table.operations import (
+    ReadDatabaseTableOperationType,
+    UpdateDatabaseTableOperationType,
+)
+from baserow.core.cache import local_cache
+from baserow.core.exceptions import PermissionException
+from baserow.core.registries import operation_type_registry, subject_type_registry
+from baserow.core.subjects import UserSubjectType
+from baserow_enterprise.role.handler import RoleAssignmentHandler
+from baserow_enterprise.role.models import Role
+from baserow_enterprise.role.permission_manager import RolePermissionManagerType
+from baserow_enterprise.role.permission_snapshot import (
+    get_permission_snapshots,
+    get_scope_keys_with_ancestors,
+)
+
+
+@pytest.fixture(autouse=True)
+def enable_enterprise_and_roles_for_all_tests_here(enable_enterprise, synced_roles):
+    pass
+
+
+def _patch_get_roles_per_scope_for_actors():
+    return patch.object(
+        RoleAssignmentHandler,
+        "get_roles_per_scope_for_actors",
+        autospec=True,
+        side_effect=RoleAssignmentHandler.get_roles_per_scope_for_actors,
+    )
+
+
+@pytest.mark.django_db
+def test_permission_snapshot_computes_the_same_roles_as_the_handler(data_fixture):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database_1 = data_fixture.create_database_application(workspace=workspace)
+    database_2 = data_fixture.create_database_application(workspace=workspace)
+    table_1_1 = data_fixture.create_database_table(database=database_1)
+    table_1_2 = data_fixture.create_database_table(database=database_1)
+    table_2_1 = data_fixture.create_database_table(database=database_2)
+
+    handler = RoleAssignmentHandler()
+    handler.assign_role(user, workspace, role=Role.objects.get(uid="NO_ACCESS"))
+    handler.assign_role(
+        user, workspace, role=Role.objects.get(uid="VIEWER"), scope=database_1
+    )
+    handler.assign_role(
+        user, workspace, role=Role.objects.get(uid="EDITOR"), scope=table_1_2
+    )
+    handler.assign_role(
+        user, workspace, role=Role.objects.get(uid="BUILDER"), scope=table_2_1
+    )
+
+    roles_per_scope = handler.get_roles_per_scope(workspace, user)
+    snapshot = get_permission_snapshots(
+        workspace, subject_type_registry.get(UserSubjectType.type), [user]
+    )[user]
+
+    for context in [workspace, database_1, database_2, table_1_1, table_1_2, table_2_1]:
+        expected = handler.get_computed_roles(roles_per_scope, context)
+        context_keys = get_scope_keys_with_ancestors(context)
+        assert snapshot.get_role_ids(context_keys) == [r.id for r in expected]
+
+
+@pytest.mark.django_db
+def test_permission_snapshots_are_shared_until_invalidated(data_fixture, settings):
+    settings.BASEROW_ENTERPRISE_PERMISSION_SNAPSHOT_TTL_SECONDS = 300
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(
+        user=admin, custom_permissions=[(user, "VIEWER")]
+    )
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    permission_manager = RolePermissionManagerType()
+
+    def can_update_table():
+        # Every check simulates a new request with an empty local cache.
+        with local_cache.context():
+            try:
+                return permission_manager.check_permissions(
+                    user,
+                    UpdateDatabaseTableOperationType.type,
+                    workspace=workspace,
+                    context=table,
+                )
+            except PermissionException:
+                return False
+
+    with _patch_get_roles_per_scope_for_actors() as get_roles_per_scope_for_actors:
+        assert not can_update_table()
+        assert not can_update_table()
+        assert get_roles_per_scope_for_actors.call_count == 1
+
+        RoleAssignmentHandler().assign_role(
+            user, workspace, role=Role.objects.get(uid="EDITOR"), scope=table
+        )
+        assert can_update_table()
+        assert can_update_table()
+        assert get_roles_per_scope_for_actors.call_count == 2
+
+        RoleAssignmentHandler().remove_role(user, workspace, scope=table)
+        assert not can_update_table()
+        assert get_roles_per_scope_for_actors.call_count == 3
+
+
+@pytest.mark.django_db
+def test_permissions_object_without_roles_on_scopes_uses_the_snapshot(data_fixture):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(
+        user=admin, custom_permissions=[(user, "VIEWER")]
+    )
+    permission_manager = RolePermissionManagerType()
+    operation_types = [
+        operation_type_registry.get(ReadDatabaseTableOperationType.type),
+        operation_type_registry.get(UpdateDatabaseTableOperationType.type),
+    ]
+
+    with patch.object(
+        RoleAssignmentHandler, "get_roles_per_scope"
+    ) as get_roles_per_scope:
+        permissions = permission_manager.get_permissions_object(
+            user, workspace, for_operation_types=operation_types
+        )
+
+    get_roles_per_scope.assert_not_called()
+    assert permissions == {
+        ReadDatabaseTableOperationType.type: {"default": True, "exceptions": []},
+        UpdateDatabaseTableOperationType.type: {"default": False, "exceptions": []},
+    }
@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.db import transaction
 from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
@@ -77,7 +79,7 @@ from baserow_premium.api.views.calendar.serializers import (
     ListCalendarRowsQueryParamsSerializer,
     get_calendar_view_example_response_serializer,
 )
-from baserow_premium.ical_utils import build_calendar
+from baserow_premium.ical_utils import build_calendar, get_ical_feed
 from baserow_premium.license.features import PREMIUM
 from baserow_premium.license.handler import LicenseHandler
 from baserow_premium.views.actions import RotateCalendarIcalSlugActionType
@@ -489,11 +491,14 @@ class ICalView(APIView):
             "Returns ICal feed for a specific Calendar view "
             "identified by ical_slug value. "
             "Calendar View resource contains full url in .ical_feed_url "
-            "field."
+            "field. The response contains `ETag` and `Last-Modified` headers, if "
+            "they're provided as `If-None-Match` or `If-Modified-Since` and the feed "
+            "didn't change, an empty response with status 304 is returned."
         ),
         request=None,
         responses={
             (200, "text/calendar"): OpenApiTypes.BINARY,
+            304: None,
             400: get_error_schema(["ERROR_CALENDAR_VIEW_HAS_NO_DATE_FIELD"]),
             404: get_error_schema(["ERROR_VIEW_DOES_NOT_EXIST"]),
         },
@@ -518,12 +523,30 @@ class ICalView(APIView):
         )
         if not view.ical_public:
             raise ViewDoesNotExist()
-        qs = view_handler.get_queryset(request.user, view)
-        cal = build_calendar(qs, view, limit=settings.BASEROW_ICAL_VIEW_MAX_EVENTS)
-        return HttpResponse(
-            cal.to_ical(),
+
+        def render():
+            qs = view_handler.get_queryset(request.user, view)
+            cal = build_calendar(qs, view, limit=settings.BASEROW_ICAL_VIEW_MAX_EVENTS)
+            return cal.to_ical()
+
+        feed = get_ical_feed(view, render)
+        last_modified = int(feed["last_modified"].timestamp())
+        response = HttpResponse(
+            feed["content"],
             content_type="text/calendar",
-            headers={"Cache-Control": "max-age=1800"},
+            headers={
+                "Cache-Control": "max-age=1800",
+                "ETag": feed["etag"],
+                "Last-Modified": http_date(last_modified),
+            },
+        )
+        # Returns a `304 Not Modified` response if the client already has the
+        # current version of the feed.
+        return get_conditional_response(
+            request,
+            etag=feed["etag"],
+            last_modified=last_modified,
+            response=response,
         )
 
 
@@ -8,6 +8,7 @@ class BaserowPremiumConfig(AppConfig):
 
     def ready(self):
         # noinspection PyUnresolvedReferences
+        import baserow_premium.integrations.local_baserow.receivers  # noqa: F401
         import baserow_premium.license.receivers  # noqa: F401
         import baserow_premium.row_comments.receivers  # noqa: F401
         from baserow.core.registries import application_type_registry
@@ -266,3 +267,6 @@ class BaserowPremiumConfig(AppConfig):
         widget_type_registry.register(PieChartWidgetType())
 
         from baserow_premium.fields import tasks  # noqa: F401
+        from baserow_premium.integrations.local_baserow import (  # noqa: F401
+            tasks as local_baserow_tasks,
+        )
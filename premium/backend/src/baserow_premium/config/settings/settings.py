@@ -36,11 +36,30 @@ def setup(settings):
         BASEROW_PREMIUM_GROUPED_AGGREGATE_SERVICE_MAX_AGG_BUCKETS
     )
 
+    # The max number of groups that a grouped aggregate rows service rollup can
+    # keep up to date. Services with more groups are computed over the whole table
+    # on every dispatch. 0 disables the rollups.
+    settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS = try_int(
+        os.getenv("BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS"), 1000
+    )
+    # The number of seconds after which a rollup is fully recomputed, as a safety
+    # net for changes that don't go through the row signals. 0 never expires them.
+    settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_AGE_SECONDS = try_int(
+        os.getenv("BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_AGE_SECONDS"), 3600
+    )
+
     # Used to limit thread pool size for running AI field generation in parallel
     settings.BASEROW_AI_FIELD_MAX_CONCURRENT_GENERATIONS = try_int(
         os.getenv("BASEROW_AI_FIELD_MAX_CONCURRENT_GENERATIONS"), 5
     )
 
+    # The max number of rows of which the AI field values are generated with a
+    # single request to the model, if the model type supports it. 1 disables
+    # batching.
+    settings.BASEROW_AI_FIELD_MAX_BATCH_SIZE = max(
+        try_int(os.getenv("BASEROW_AI_FIELD_MAX_BATCH_SIZE"), 1), 1
+    )
+
     # Debounce time for AI field generation, if changes are triggered from
     # auto-update feature. In seconds.
     settings.BASEROW_AI_FIELD_AUTO_UPDATE_DEBOUNCE_TIME = try_int(
@@ -4,6 +4,8 @@ import json
 import mimetypes
 from typing import TYPE_CHECKING, Any, Optional
 
+from loguru import logger
+
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.runtime_formula_contexts import (
     HumanReadableRowContext,
@@ -12,8 +14,15 @@ from baserow.contrib.database.table.models import Table
 from baserow.core.db import specific_iterator
 from baserow.core.formula import resolve_formula
 from baserow.core.formula.registries import formula_runtime_function_registry
-from baserow.core.generative_ai.exceptions import ModelDoesNotBelongToType
+from baserow.core.generative_ai.exceptions import (
+    GenerativeAIPromptError,
+    ModelDoesNotBelongToType,
+)
 from baserow.core.generative_ai.registries import generative_ai_model_type_registry
+from baserow.core.generative_ai.scheduler import (
+    GenerativeAIRequestScheduler,
+    estimate_tokens,
+)
 from baserow_premium.prompts import get_generate_formula_prompt
 
 from .ai_file import AIFile
@@ -119,17 +128,7 @@ class AIFieldHandler:
         workspace = ai_field.table.database.workspace
 
         # 1. Resolve prompt from formula
-        context = HumanReadableRowContext(row, exclude_field_ids=[ai_field.id])
-        message = str(
-            resolve_formula(
-                ai_field.ai_prompt, formula_runtime_function_registry, context
-            )
-        )
-
-        if not message or not message.strip():
-            raise AIFieldEmptyPromptError(
-                "The resolved prompt is empty; nothing to send to the model."
-            )
+        message = cls._resolve_prompt(ai_field, row)
 
         # 2. Build prompt kwargs
         choices = ai_output_type.get_choices(ai_field)
@@ -162,11 +161,13 @@ class AIFieldHandler:
                         f"{names}"
                     )
 
-            value = generative_ai_model_type.prompt(
-                ai_field.ai_generative_ai_model,
-                message,
-                **prompt_kwargs,
-            )
+            scheduler = GenerativeAIRequestScheduler(generative_ai_model_type.type)
+            with scheduler.reserve(workspace.id, estimate_tokens(message)):
+                value = generative_ai_model_type.prompt(
+                    ai_field.ai_generative_ai_model,
+                    message,
+                    **prompt_kwargs,
+                )
         finally:
             # cleanup uses ai_files (not prepared) so that files uploaded
             # before a mid-prepare failure are still cleaned up.
@@ -179,6 +180,107 @@ class AIFieldHandler:
 
         return value
 
+    @classmethod
+    def generate_values_with_ai(
+        cls,
+        ai_field: AIField,
+        rows: list[GeneratedTableModel],
+    ) -> list[Any]:
+        """
+        Generate the AI field values for multiple rows. If the model type supports it
+        and the field doesn't send files, the prompts of all rows are answered with a
+        single request to the model. Otherwise, or if the batch request fails, the
+        values are generated one row at a time.
+
+        :param ai_field: The AI field configuration.
+        :param rows: The rows to generate a value for.
+        :return: For every row, in the same order, either the generated value or the
+            exception raised while generating it.
+        """
+
+        generative_ai_model_type = cls.get_valid_model_type_or_raise(ai_field)
+        use_batch = (
+            len(rows) > 1
+            and generative_ai_model_type.supports_batch_prompts
+            and not (
+                generative_ai_model_type.supports_files
+                and ai_field.ai_file_field_id is not None
+            )
+        )
+        if not use_batch:
+            return [cls._generate_value_or_error(ai_field, row) for row in rows]
+
+        results: list[Any] = [None] * len(rows)
+        messages: dict[int, str] = {}
+        for index, row in enumerate(rows):
+            try:
+                messages[index] = cls._resolve_prompt(ai_field, row)
+            except Exception as exc:
+                results[index] = exc
+
+        if not messages:
+            return results
+
+        ai_output_type = ai_field_output_registry.get(ai_field.ai_output_type)
+        choices = ai_output_type.get_choices(ai_field)
+        workspace = ai_field.table.database.workspace
+        scheduler = GenerativeAIRequestScheduler(generative_ai_model_type.type)
+        try:
+            with scheduler.reserve(workspace.id, estimate_tokens(*messages.values())):
+                values = generative_ai_model_type.prompt_batch(
+                    ai_field.ai_generative_ai_model,
+                    list(messages.values()),
+                    workspace=workspace,
+                    temperature=ai_field.ai_temperature,
+                    output_type=choices,
+                )
+        except GenerativeAIPromptError as exc:
+            logger.warning(
+                f"Batch value generation for AI field {ai_field.id} failed, falling "
+                f"back to generating the values one row at a time: {exc}"
+            )
+            for index in messages:
+                results[index] = cls._generate_value_or_error(ai_field, rows[index])
+            return results
+
+        for index, value in zip(messages, values):
+            if choices is not None:
+                value = ai_output_type.resolve_choice(value, ai_field)
+            results[index] = value
+
+        return results
+
+    @classmethod
+    def _generate_value_or_error(
+        cls, ai_field: AIField, row: GeneratedTableModel
+    ) -> Any:
+        try:
+            return cls.generate_value_with_ai(ai_field, row)
+        except Exception as exc:
+            return exc
+
+    @classmethod
+    def _resolve_prompt(cls, ai_field: AIField, row: GeneratedTableModel) -> str:
+        """
+        Resolves the prompt formula of the AI field for the given row.
+
+        :raises AIFieldEmptyPromptError: If the resolved prompt is empty.
+        """
+
+        context = HumanReadableRowContext(row, exclude_field_ids=[ai_field.id])
+        message = str(
+            resolve_formula(
+                ai_field.ai_prompt, formula_runtime_function_registry, context
+            )
+        )
+
+        if not message or not message.strip():
+            raise AIFieldEmptyPromptError(
+                "The resolved prompt is empty; nothing to send to the model."
+            )
+
+        return message
+
     @classmethod
     def _collect_ai_files(
         cls, ai_field: AIField, row: GeneratedTableModel
@@ -1,6 +1,7 @@
 from collections.abc import Callable, Iterator
 from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
 from queue import Empty, Queue
 from typing import Any, NamedTuple, Type
 
@@ -346,8 +347,10 @@ class AIValueGenerator:
     field context to work, but also utilizes Job object as a sender for generation
     error signal, and Progress object to mark the progress of processing.
 
-    Internally, this schedules processing of each row to a separate thread using a
-    thread pool controlled by a `concurrent.futures.ThreadPoolExecutor`. Because we
+    Internally, this schedules processing of each batch of rows to a separate thread
+    using a thread pool controlled by a `concurrent.futures.ThreadPoolExecutor`. The
+    requests made to the model are additionally limited by the
+    `GenerativeAIRequestScheduler`, which is shared by all the jobs of the instance. Because we
     use threads, a general rule is to run all code that needs a database connection in
     the same, one (main) thread. The code that issues http requests to the model,
     should be run in a separate thread.
@@ -371,6 +374,7 @@ class AIValueGenerator:
         self.signal_sender = signal_sender
         self.workspace = table.database.workspace
         self.max_concurrency = self.ai_field.ai_max_concurrent_generations
+        self.batch_size = self.ai_field.ai_max_batch_size
 
         # A counter of processed rows. This doesn't include rows being still processed.
         self.finished = 0
@@ -384,7 +388,7 @@ class AIValueGenerator:
         self.generate_more_rows = True
 
         # A queue of results
-        self.results_queue = Queue(self.max_concurrency)
+        self.results_queue = Queue(self.max_concurrency * self.batch_size)
 
         # Marker to keep track if any errors ocurred during the process.
         self.error_msg = None
@@ -414,32 +418,38 @@ class AIValueGenerator:
             )
             raise exc
 
-    def generate_value_for(self, row: GeneratedTableModel):
+    def generate_values_for(self, rows: list[GeneratedTableModel]):
         """
-        Runs value generation for a single row using AI model.
+        Runs value generation for a batch of rows using AI model.
 
-        The contents of the method should prepare and run a prompt on a model for the
-        row. This method doesn't return any value. Instead, the result, or any error
-        that will happen during the processing, will be put on a results queue.
+        The contents of the method should prepare and run the prompts on a model for
+        the rows. This method doesn't return any value. Instead, the result, or any
+        error that will happen during the processing, will be put on a results queue
+        for every row.
 
-        :param row: A row to generate value for.
+        :param rows: The rows to generate values for.
         """
 
         start = datetime.now(tz=timezone.utc)
         try:
-            result = AIFieldHandler.generate_value_with_ai(self.ai_field, row)
-        except AIFieldEmptyPromptError:
-            # Empty prompt — preserve existing value.
-            result = getattr(row, self.ai_field.db_column, None)
+            results = AIFieldHandler.generate_values_with_ai(self.ai_field, rows)
         except Exception as exc:
-            logger.exception(f"Value generation for row {row} failed: {exc}")
-            result = exc
+            results = [exc] * len(rows)
 
         end = datetime.now(tz=timezone.utc)
-        self.results_queue.put(
-            AIValueUpdate(row, result, start, end),
-            block=True,
-        )
+        for row, result in zip(rows, results):
+            if isinstance(result, AIFieldEmptyPromptError):
+                # Empty prompt — preserve existing value.
+                result = getattr(row, self.ai_field.db_column, None)
+            elif isinstance(result, Exception):
+                logger.opt(exception=result).error(
+                    f"Value generation for row {row} failed: {result}"
+                )
+
+            self.results_queue.put(
+                AIValueUpdate(row, result, start, end),
+                block=True,
+            )
 
     def handle_error(self, error_message: str):
         """
@@ -471,9 +481,10 @@ class AIValueGenerator:
         """
         Generate AI model value for selected rows in parallel.
 
-        This will call the AI model generator for several rows at once. Each row is
-        processed in a separate thread, and the number of worker threads is fixed,
-        controlled by AIField.ai_max_concurrent_generations value.
+        This will call the AI model generator for several rows at once. Each batch of
+        rows is processed in a separate thread, and the number of worker threads is
+        fixed, controlled by AIField.ai_max_concurrent_generations value. The size of
+        the batches is controlled by AIField.ai_max_batch_size.
 
         When there an error occurs during the processing in a worker thread, it won't
         be propagated immediately. Instead, it's pushed to the queue and handled as a
@@ -499,7 +510,7 @@ class AIValueGenerator:
                     # to process. We add new rows to process only if there's a
                     # 'free slot' in the executor.
                     while self.can_schedule_next():
-                        self.schedule_next_row(rows_iter, executor)
+                        self.schedule_next_rows(rows_iter, executor)
 
                 except StopIteration:
                     self.stop_scheduling_rows()
@@ -529,10 +540,13 @@ class AIValueGenerator:
 
     def can_schedule_next(self) -> bool:
         """
-        Returns True, if there's a free slot to process.
+        Returns True, if there's a free slot to process a batch.
         """
 
-        return self.generate_more_rows and len(self.in_process) < self.max_concurrency
+        return (
+            self.generate_more_rows
+            and len(self.in_process) <= (self.max_concurrency - 1) * self.batch_size
+        )
 
     def is_finished(self) -> bool:
         """
@@ -565,11 +579,15 @@ class AIValueGenerator:
             except Exception as exc:
                 self.handle_error(str(exc))
 
-    def schedule_next_row(self, rows_iter: Iterator, executor: Executor):
+    def schedule_next_rows(self, rows_iter: Iterator, executor: Executor):
         """
-        Prepares and adds the next row to the work queue.
+        Prepares and adds the next batch of rows to the work queue.
+
+        :raises StopIteration: If there are no rows left.
         """
 
-        row = next(rows_iter)
-        executor.submit(self.generate_value_for, row)
-        self.in_process.add(row.id)
+        rows = list(islice(rows_iter, self.batch_size))
+        if not rows:
+            raise StopIteration
+        executor.submit(self.generate_values_for, rows)
+        self.in_process.update(row.id for row in rows)
@@ -65,6 +65,15 @@ class AIField(Field):
 
         return settings.BASEROW_AI_FIELD_MAX_CONCURRENT_GENERATIONS
 
+    @property
+    def ai_max_batch_size(self) -> int:
+        """
+        Returns the max number of rows of which the values are generated with a
+        single request to the model.
+        """
+
+        return settings.BASEROW_AI_FIELD_MAX_BATCH_SIZE
+
 
 class GenerateAIValuesJob(JobWithUserIpAddress, JobWithUndoRedoIds, Job):
     class MODES(StrEnum):
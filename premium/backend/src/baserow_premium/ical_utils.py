@@ -1,4 +1,5 @@
 import collections
+import hashlib
 import typing
 from datetime import date, datetime, timezone
 from functools import partial
@@ -8,10 +9,12 @@ from zoneinfo import ZoneInfo
 
 from django.conf import settings
 from django.db.models import QuerySet
+from django.utils.http import quote_etag
 
 from icalendar import Calendar, Event
 
 from baserow.contrib.database.fields.models import Field
+from baserow.core.cache import global_cache
 from baserow.core.db import specific_queryset
 from baserow_premium.views.exceptions import CalendarViewHasNoDateField
 from baserow_premium.views.models import CalendarView
@@ -21,6 +24,9 @@ ICAL_PROD_ID = "Baserow / baserow.io"
 # required by https://icalendar.org/iCalendar-RFC-5545/3-7-4-version.html
 ICAL_VERSION = "2.0"
 
+ICAL_FEED_CACHE_KEY = "calendar_view_{view_id}__ical_feed_{limit}"
+ICAL_FEED_INVALIDATE_KEY = "table_{table_id}__ical_feed_invalidate_key"
+
 
 def row_url_maker(view: CalendarView) -> typing.Callable[[str], str]:
     """
@@ -243,3 +249,55 @@ def build_calendar(
         evt.add("location", row_url)
         ical.add_component(evt)
     return ical
+
+
+def get_ical_feed(
+    view: CalendarView, render: typing.Callable[[], bytes]
+) -> dict[str, typing.Any]:
+    """
+    Returns the rendered ICal feed of the provided view together with the `etag` and
+    `last_modified` values that clients can use to make conditional requests. The
+    feed is cached until anything in the table of the view changes, so that calendar
+    clients polling the feed only cause a render after a change.
+
+    :param view: The calendar view of the feed.
+    :param render: A callable returning the rendered feed. Only called if the feed
+        isn't cached.
+    :return: A dict containing the `content`, `etag` and `last_modified` of the feed.
+    """
+
+    def render_feed():
+        content = render()
+        return {
+            "content": content,
+            "etag": quote_etag(hashlib.sha256(content).hexdigest()),
+            "last_modified": datetime.now(tz=timezone.utc).replace(microsecond=0),
+        }
+
+    timeout = settings.BASEROW_ICAL_VIEW_CACHE_TIMEOUT_SECONDS
+    if not timeout:
+        return render_feed()
+
+    return global_cache.get(
+        ICAL_FEED_CACHE_KEY.format(
+            view_id=view.id, limit=settings.BASEROW_ICAL_VIEW_MAX_EVENTS
+        ),
+        default=render_feed,
+        invalidate_key=ICAL_FEED_INVALIDATE_KEY.format(table_id=view.table_id),
+        timeout=timeout,
+    )
+
+
+def invalidate_ical_feeds(table_ids: collections.abc.Iterable[int]):
+    """
+    Invalidates the cached ICal feeds of all the calendar views in the provided
+    tables.
+
+    :param table_ids: The ids of the tables of which the rows, fields or views have
+        changed.
+    """
+
+    for table_id in set(table_ids):
+        global_cache.invalidate(
+            invalidate_key=ICAL_FEED_INVALIDATE_KEY.format(table_id=table_id)
+        )
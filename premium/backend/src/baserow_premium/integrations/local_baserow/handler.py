@@ -0,0 +1,680 @@
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, ManyToManyField, Q, QuerySet
+from django.utils import timezone
+
+from baserow.contrib.database.fields.field_types import (
+    AutonumberFieldType,
+    BooleanFieldType,
+    FormulaFieldType,
+    NumberFieldType,
+    RatingFieldType,
+)
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.contrib.database.views.exceptions import AggregationTypeDoesNotExist
+from baserow.contrib.database.views.utils import AnnotatedAggregation
+from baserow.core.cache import global_cache
+from baserow.core.services.dispatch_context import DispatchContext
+from baserow_premium.integrations.local_baserow.models import (
+    LocalBaserowGroupedAggregateRollupEntry,
+    LocalBaserowGroupedAggregateRows,
+    SortOn,
+)
+from baserow_premium.integrations.registries import grouped_aggregation_registry
+
+# The aggregation states that can be maintained incrementally, per raw aggregation
+# type. Counts and sums are updated by adding and subtracting the changed rows,
+# minimums and maximums can only grow and must be recomputed when the extremum of
+# a group is removed.
+ROLLUP_STATE_KIND_PER_RAW_AGGREGATION_TYPE = {
+    "count": "count",
+    "empty_count": "count",
+    "not_empty_count": "count",
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+}
+
+# The group by field types of which the values are sorted in the same way by
+# Python and by the database.
+ROLLUP_SORTABLE_GROUP_BY_FIELD_TYPES = [
+    NumberFieldType.type,
+    RatingFieldType.type,
+    AutonumberFieldType.type,
+    BooleanFieldType.type,
+]
+
+ROLLUP_ROW_COUNT_KEY = "rollup_row_count"
+ROLLUP_SERVICE_IDS_CACHE_TIMEOUT = 60 * 60
+
+
+def get_rollup_service_ids_cache_key(table_id: int) -> str:
+    return f"grouped_aggregate_rollup_service_ids_table_{table_id}"
+
+
+def encode_rollup_value(value: Any) -> Any:
+    """
+    Converts a value returned by an aggregation or a group by to a JSON compatible
+    value that can be decoded to the same Python value.
+    """
+
+    if isinstance(value, Decimal):
+        return {"decimal": str(value)}
+    elif isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    elif isinstance(value, date):
+        return {"date": value.isoformat()}
+    elif isinstance(value, timedelta):
+        return {"timedelta": [value.days, value.seconds, value.microseconds]}
+    return value
+
+
+def decode_rollup_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+
+    (value_type, encoded), *_ = value.items()
+    if value_type == "decimal":
+        return Decimal(encoded)
+    elif value_type == "datetime":
+        return datetime.fromisoformat(encoded)
+    elif value_type == "date":
+        return date.fromisoformat(encoded)
+    elif value_type == "timedelta":
+        return timedelta(*encoded)
+    return value
+
+
+@dataclass
+class GroupedAggregateRollupDefinition:
+    """
+    Describes how the groups of a service are aggregated and how the states of each
+    aggregation are combined.
+    """
+
+    group_by_db_column: Optional[str]
+    aggregations: Dict[str, Any]
+    state_kinds: Dict[str, str]
+    # The key of the state counting the non empty values of every sum, because an
+    # empty sum must be null instead of 0.
+    sum_not_null_keys: Dict[str, str] = field(default_factory=dict)
+
+    def get_empty_states(self) -> Dict[str, Any]:
+        return {
+            key: 0 if kind == "count" else None
+            for key, kind in self.state_kinds.items()
+        }
+
+    def get_raw_result(self, states: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the states as they would have been returned by aggregating the
+        queryset of the service, so without the keys that only the rollup needs.
+        """
+
+        helper_keys = {ROLLUP_ROW_COUNT_KEY, *self.sum_not_null_keys.values()}
+        return {key: value for key, value in states.items() if key not in helper_keys}
+
+
+@dataclass
+class GroupedAggregateRollupGroup:
+    key: str
+    value: Any
+    states: Dict[str, Any]
+
+
+class GroupedAggregateRollupHandler:
+    """
+    Keeps the aggregations of grouped aggregate rows services that have the rollup
+    enabled up to date, so that they can be dispatched without aggregating the whole
+    table.
+
+    The rollup consists of one base entry per group, which is computed once over
+    the whole table. Every row change appends delta entries containing the states
+    of the changed rows before (removal) and after (addition) the change. The
+    deltas are merged into the base entries on the next dispatch or by the periodic
+    compaction.
+
+    Merging locks the service row. Because inserting an entry takes a key share lock
+    on the service row as part of the foreign key check, the merge waits until the
+    transactions that inserted deltas have committed, and new deltas wait until the
+    merge has committed. The rows aggregated during the merge therefore always
+    match the deltas it consumes.
+    """
+
+    def get_rollup_definition(
+        self,
+        service: LocalBaserowGroupedAggregateRows,
+        model: Type[GeneratedTableModel],
+        dispatch_context: Optional[DispatchContext] = None,
+    ) -> Optional[GroupedAggregateRollupDefinition]:
+        """
+        Returns the definition of the rollup of the service, or None if the service
+        can't use a rollup and must be aggregated over the table. That's the case if
+        its rows are filtered, or if it uses aggregations, group bys or sorts that
+        can't be maintained or reproduced incrementally.
+
+        :param service: The service to get the definition for.
+        :param model: The model of the table of the service.
+        :param dispatch_context: If provided, the rollup is only used if the context
+            doesn't filter the rows.
+        :return: The definition or None.
+        """
+
+        if (
+            not service.rollup_enabled
+            or settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS <= 0
+            or service.table_id is None
+            or service.view_id is not None
+            or service.service_filters.all()
+        ):
+            return None
+
+        if (
+            dispatch_context is not None
+            and dispatch_context.filters() is not None
+            and dispatch_context.is_publicly_filterable
+        ):
+            return None
+
+        group_bys = service.service_aggregation_group_bys.all()
+        if len(group_bys) > 1 or any(group_by.field is None for group_by in group_bys):
+            return None
+        group_by_field = group_bys[0].field if group_bys else None
+        if group_by_field is not None and not self._can_roll_up_field(
+            group_by_field, model
+        ):
+            return None
+
+        aggregations = {ROLLUP_ROW_COUNT_KEY: Count("id")}
+        state_kinds = {ROLLUP_ROW_COUNT_KEY: "count"}
+        sum_not_null_keys = {}
+        defined_agg_series = service.service_aggregation_series.all()
+        if not defined_agg_series:
+            return None
+
+        for agg_series in defined_agg_series:
+            if agg_series.field is None or not self._can_roll_up_field(
+                agg_series.field, model
+            ):
+                return None
+            try:
+                agg_type = grouped_aggregation_registry.get(agg_series.aggregation_type)
+            except AggregationTypeDoesNotExist:
+                return None
+            kind = ROLLUP_STATE_KIND_PER_RAW_AGGREGATION_TYPE.get(
+                agg_type.raw_type.type
+            )
+            if kind is None:
+                return None
+
+            model_field = model._meta.get_field(agg_series.field.db_column)
+            agg_dict = agg_type._get_aggregation_dict(
+                model.objects.all(),
+                model_field,
+                agg_series.field,
+                include_agg_type=True,
+            )
+            for key, aggregation in agg_dict.items():
+                if isinstance(aggregation, AnnotatedAggregation):
+                    return None
+                aggregations[key] = aggregation
+                # The total is the number of rows, whatever the aggregation type is.
+                state_kinds[key] = "count" if key == "total" else kind
+                if state_kinds[key] == "sum":
+                    not_null_key = f"{key}_not_null"
+                    aggregations[not_null_key] = Count(agg_series.field.db_column)
+                    state_kinds[not_null_key] = "count"
+                    sum_not_null_keys[key] = not_null_key
+
+        for sort_by in service.service_aggregation_sorts.all():
+            if sort_by.sort_on == SortOn.SERIES:
+                continue
+            if (
+                group_by_field is None
+                or sort_by.reference != group_by_field.db_column
+                or group_by_field.get_type().type
+                not in ROLLUP_SORTABLE_GROUP_BY_FIELD_TYPES
+            ):
+                return None
+
+        return GroupedAggregateRollupDefinition(
+            group_by_db_column=group_by_field.db_column if group_by_field else None,
+            aggregations=aggregations,
+            state_kinds=state_kinds,
+            sum_not_null_keys=sum_not_null_keys,
+        )
+
+    def _can_roll_up_field(
+        self, field: Field, model: Type[GeneratedTableModel]
+    ) -> bool:
+        # The values of formula fields can change because of changes in other
+        # tables, which don't send the row signals of this table.
+        return (
+            not field.trashed
+            and not isinstance(field.get_type(), FormulaFieldType)
+            and not isinstance(model._meta.get_field(field.db_column), ManyToManyField)
+        )
+
+    def get_groups(
+        self,
+        service: LocalBaserowGroupedAggregateRows,
+        model: Type[GeneratedTableModel],
+        definition: GroupedAggregateRollupDefinition,
+    ) -> List[GroupedAggregateRollupGroup]:
+        """
+        Returns the aggregation states of all the groups of the service. If the
+        rollup is up to date, it's read without aggregating any rows. Otherwise,
+        pending deltas are merged and the rollup is rebuilt if needed.
+
+        :param service: The service to get the groups for.
+        :param model: The model of the table of the service.
+        :param definition: The rollup definition of the service.
+        :return: The groups, ordered by their key.
+        """
+
+        if service.rollup_built_at is not None and not self._is_expired(
+            service.rollup_built_at
+        ):
+            entries = list(service.rollup_entries.all())
+            if not any(entry.is_delta for entry in entries):
+                return sorted(
+                    (
+                        GroupedAggregateRollupGroup(
+                            key=entry.group_key,
+                            value=decode_rollup_value(entry.group_value),
+                            states=self._decode_states(entry.states),
+                        )
+                        for entry in entries
+                    ),
+                    key=lambda group: group.key,
+                )
+
+        with transaction.atomic():
+            groups = self._refresh_rollup(service, model, definition)
+        return sorted(groups.values(), key=lambda group: group.key)
+
+    def _is_expired(self, built_at: datetime) -> bool:
+        max_age = settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_AGE_SECONDS
+        return max_age > 0 and built_at < timezone.now() - timedelta(seconds=max_age)
+
+    def _refresh_rollup(
+        self,
+        service: LocalBaserowGroupedAggregateRows,
+        model: Type[GeneratedTableModel],
+        definition: GroupedAggregateRollupDefinition,
+        rebuild: bool = True,
+    ) -> Dict[str, GroupedAggregateRollupGroup]:
+        """
+        Merges the pending deltas of the rollup into its base entries, or rebuilds
+        the rollup if it was never built, invalidated or expired. Must be called in
+        a transaction.
+
+        :param rebuild: If False, an outdated rollup is only emptied instead of
+            rebuilt, because there is nothing the deltas could be merged into.
+        """
+
+        locked_service = (
+            LocalBaserowGroupedAggregateRows.objects.select_for_update(of=("self",))
+            .only("id", "rollup_built_at")
+            .get(id=service.id)
+        )
+        built_at = locked_service.rollup_built_at
+
+        if (built_at is None or self._is_expired(built_at)) and not rebuild:
+            locked_service.rollup_entries.all().delete()
+            return {}
+        elif built_at is None or self._is_expired(built_at):
+            groups = self._aggregate_groups(definition, model.objects.all())
+            built_at = timezone.now()
+            # Makes sure that the changes made from now on are recorded, even if the
+            # service was enabled without invalidating the cached service ids.
+            self.invalidate_rollup_services_cache(service.table_id)
+        else:
+            groups, stale_keys = self._merge_entries(
+                definition, locked_service.rollup_entries.all()
+            )
+            if stale_keys:
+                groups.update(
+                    self._aggregate_groups(
+                        definition,
+                        self._filter_groups(
+                            definition,
+                            model.objects.all(),
+                            [groups.pop(key).value for key in stale_keys],
+                        ),
+                    )
+                )
+
+        if len(groups) > settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS:
+            # Too many groups to be worth storing. They're only used to answer this
+            # dispatch and the rollup is built again the next time.
+            built_at = None
+
+        locked_service.rollup_entries.all().delete()
+        if built_at is not None:
+            LocalBaserowGroupedAggregateRollupEntry.objects.bulk_create(
+                [
+                    LocalBaserowGroupedAggregateRollupEntry(
+                        service_id=service.id,
+                        group_key=group.key,
+                        group_value=encode_rollup_value(group.value),
+                        states=self._encode_states(group.states),
+                    )
+                    for group in groups.values()
+                ]
+            )
+        if built_at != locked_service.rollup_built_at:
+            LocalBaserowGroupedAggregateRows.objects.filter(id=service.id).update(
+                rollup_built_at=built_at
+            )
+        service.rollup_built_at = built_at
+
+        return groups
+
+    def _filter_groups(
+        self,
+        definition: GroupedAggregateRollupDefinition,
+        queryset: QuerySet,
+        values: List[Any],
+    ) -> QuerySet:
+        column = definition.group_by_db_column
+        if column is None:
+            return queryset
+
+        q = Q(**{f"{column}__in": [value for value in values if value is not None]})
+        if None in values:
+            q |= Q(**{f"{column}__isnull": True})
+        return queryset.filter(q)
+
+    def _aggregate_groups(
+        self, definition: GroupedAggregateRollupDefinition, queryset: QuerySet
+    ) -> Dict[str, GroupedAggregateRollupGroup]:
+        """
+        Aggregates the rows of the queryset per group.
+        """
+
+        column = definition.group_by_db_column
+        if column is None:
+            states = queryset.aggregate(**definition.aggregations)
+            if not states[ROLLUP_ROW_COUNT_KEY]:
+                return {}
+            return {"": GroupedAggregateRollupGroup(key="", value=None, states=states)}
+
+        groups = {}
+        for states in (
+            queryset.order_by().values(column).annotate(**definition.aggregations)
+        ):
+            value = states.pop(column)
+            key = self._get_group_key(value)
+            groups[key] = GroupedAggregateRollupGroup(
+                key=key, value=value, states=states
+            )
+        return groups
+
+    def _get_group_key(self, value: Any) -> str:
+        return json.dumps(encode_rollup_value(value), sort_keys=True)
+
+    def _encode_states(self, states: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: encode_rollup_value(value) for key, value in states.items()}
+
+    def _decode_states(self, states: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: decode_rollup_value(value) for key, value in states.items()}
+
+    def _merge_entries(
+        self,
+        definition: GroupedAggregateRollupDefinition,
+        entries: Iterable[LocalBaserowGroupedAggregateRollupEntry],
+    ) -> Tuple[Dict[str, GroupedAggregateRollupGroup], Set[str]]:
+        """
+        Merges the base and delta entries per group. Additions are merged before
+        removals, so that removing a value that was added by a delta can be
+        detected.
+
+        :return: The merged groups and the keys of the groups that must be
+            aggregated again because their minimum or maximum was removed.
+        """
+
+        groups = {}
+        removals = []
+        for entry in entries:
+            if entry.is_removal:
+                removals.append(entry)
+                continue
+            states = self._decode_states(entry.states)
+            group = groups.get(entry.group_key)
+            if group is None:
+                groups[entry.group_key] = GroupedAggregateRollupGroup(
+                    key=entry.group_key,
+                    value=decode_rollup_value(entry.group_value),
+                    states=states,
+                )
+            else:
+                group.states = self.combine_states(definition, [group.states, states])
+
+        stale_keys = set()
+        for entry in removals:
+            group = groups.get(entry.group_key)
+            if group is None:
+                # The rows were removed from a group that doesn't exist in the
+                # rollup, which can only happen if it's out of sync.
+                groups[entry.group_key] = GroupedAggregateRollupGroup(
+                    key=entry.group_key,
+                    value=decode_rollup_value(entry.group_value),
+                    states=definition.get_empty_states(),
+                )
+                stale_keys.add(entry.group_key)
+            elif entry.group_key not in stale_keys:
+                states = self._subtract_states(
+                    definition, group.states, self._decode_states(entry.states)
+                )
+                if states is None:
+                    stale_keys.add(entry.group_key)
+                else:
+                    group.states = states
+
+        for key, group in list(groups.items()):
+            if key not in stale_keys and not group.states[ROLLUP_ROW_COUNT_KEY]:
+                del groups[key]
+
+        return groups, stale_keys
+
+    def combine_states(
+        self,
+        definition: GroupedAggregateRollupDefinition,
+        states_list: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Combines the aggregation states of multiple sets of rows into the states of
+        all these rows.
+        """
+
+        combined = definition.get_empty_states()
+        for states in states_list:
+            for key, kind in definition.state_kinds.items():
+                current, value = combined[key], states.get(key)
+                if value is None:
+                    continue
+                elif current is None:
+                    combined[key] = value
+                elif kind in ("count", "sum"):
+                    combined[key] = current + value
+                elif kind == "min":
+                    combined[key] = min(current, value)
+                else:
+                    combined[key] = max(current, value)
+        return combined
+
+    def _subtract_states(
+        self,
+        definition: GroupedAggregateRollupDefinition,
+        states: Dict[str, Any],
+        removed: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Removes the states of a set of rows from the states of a group.
+
+        :return: The new states, or None if they can't be computed without
+            aggregating the rows of the group again.
+        """
+
+        result = dict(states)
+        for key, kind in definition.state_kinds.items():
+            current, value = states.get(key), removed.get(key)
+            if value is None:
+                continue
+            elif current is None:
+                return None
+            elif kind in ("count", "sum"):
+                result[key] = current - value
+            elif (kind == "min" and value <= current) or (
+                kind == "max" and value >= current
+            ):
+                return None
+
+        for sum_key, not_null_key in definition.sum_not_null_keys.items():
+            if not result[not_null_key]:
+                result[sum_key] = None
+        return result
+
+    def get_rollup_services(
+        self, table_id: int
+    ) -> List[LocalBaserowGroupedAggregateRows]:
+        """
+        Returns the services of the table that have the rollup enabled. The ids of
+        these services are cached, so that changing rows of tables without rollups
+        doesn't cost any query.
+        """
+
+        service_ids = self._get_rollup_service_ids(table_id)
+        if not service_ids:
+            return []
+
+        return list(
+            LocalBaserowGroupedAggregateRows.objects.filter(
+                id__in=service_ids, table_id=table_id, rollup_enabled=True
+            )
+            .select_related("table", "view")
+            .prefetch_related(
+                "service_filters",
+                "service_aggregation_series__field",
+                "service_aggregation_group_bys__field",
+                "service_aggregation_sorts",
+            )
+        )
+
+    def _get_rollup_service_ids(self, table_id: int) -> List[int]:
+        if settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS <= 0:
+            return []
+
+        return global_cache.get(
+            get_rollup_service_ids_cache_key(table_id),
+            lambda: list(
+                LocalBaserowGroupedAggregateRows.objects.filter(
+                    table_id=table_id, rollup_enabled=True
+                ).values_list("id", flat=True)
+            ),
+            timeout=ROLLUP_SERVICE_IDS_CACHE_TIMEOUT,
+        )
+
+    def invalidate_rollup_services_cache(self, table_id: int):
+        def invalidate():
+            global_cache.invalidate(get_rollup_service_ids_cache_key(table_id))
+
+        invalidate()
+        # Also invalidate on commit, in case the services were read again before
+        # the change was committed.
+        transaction.on_commit(invalidate)
+
+    def invalidate_rollups(self, table_id: int):
+        """
+        Marks the rollups of all the services of the table as outdated, so that
+        they're rebuilt on their next dispatch.
+        """
+
+        service_ids = self._get_rollup_service_ids(table_id)
+        if service_ids:
+            LocalBaserowGroupedAggregateRows.objects.filter(
+                id__in=service_ids, rollup_built_at__isnull=False
+            ).update(rollup_built_at=None)
+
+    def record_rows_change(self, table: Table, row_ids: List[int], removal: bool):
+        """
+        Appends the aggregation states of the rows to the rollups of the services
+        of the table. Must be called with the rows in their state before they're
+        updated or deleted (removal), or after they've been created or updated.
+
+        :param table: The table the rows belong to.
+        :param row_ids: The ids of the changed rows.
+        :param removal: Whether the states must be removed from the rollups.
+        """
+
+        services = self.get_rollup_services(table.id) if row_ids else []
+        if not services:
+            return
+
+        # The model given with the row signals can be limited to some fields.
+        model = table.get_model()
+        entries = []
+        for service in services:
+            definition = self.get_rollup_definition(service, model)
+            if definition is None:
+                continue
+            # The deltas are recorded even if the rollup isn't built yet, because
+            # a concurrent build might not see the change.
+            groups = self._aggregate_groups(
+                definition, model.objects.filter(id__in=row_ids)
+            )
+            entries += [
+                LocalBaserowGroupedAggregateRollupEntry(
+                    service_id=service.id,
+                    group_key=group.key,
+                    group_value=encode_rollup_value(group.value),
+                    states=self._encode_states(group.states),
+                    is_delta=True,
+                    is_removal=removal,
+                )
+                for group in groups.values()
+            ]
+
+        if entries:
+            LocalBaserowGroupedAggregateRollupEntry.objects.bulk_create(entries)
+
+    def compact_rollups(self):
+        """
+        Merges the pending deltas of all the rollups, so that they don't keep
+        growing for services that are rarely dispatched.
+        """
+
+        from baserow_premium.integrations.local_baserow.service_types import (
+            LocalBaserowGroupedAggregateRowsUserServiceType,
+        )
+
+        service_type = LocalBaserowGroupedAggregateRowsUserServiceType()
+        service_ids = (
+            LocalBaserowGroupedAggregateRollupEntry.objects.filter(is_delta=True)
+            .order_by()
+            .values_list("service_id", flat=True)
+            .distinct()
+        )
+        for service in service_type.enhance_queryset(
+            LocalBaserowGroupedAggregateRows.objects.filter(id__in=service_ids)
+        ).select_related("table"):
+            definition = None
+            if service.table is not None:
+                model = service_type.get_table_model(service)
+                definition = self.get_rollup_definition(service, model)
+
+            with transaction.atomic():
+                if definition is None:
+                    LocalBaserowGroupedAggregateRollupEntry.objects.filter(
+                        service_id=service.id
+                    ).delete()
+                else:
+                    self._refresh_rollup(service, model, definition, rebuild=False)
@@ -4,6 +4,7 @@ from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowFilterableServiceMixin,
     LocalBaserowViewService,
 )
+from baserow.core.mixins import BigAutoFieldMixin
 from baserow.core.services.models import Service
 
 
@@ -15,7 +16,52 @@ class LocalBaserowGroupedAggregateRows(
     service configuration data.
     """
 
-    ...
+    rollup_enabled = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the aggregations must be kept up to date in a "
+        "rollup instead of being computed over the whole table on every dispatch.",
+    )
+    rollup_built_at = models.DateTimeField(
+        null=True,
+        help_text="The date the rollup was fully computed, or null if it must be "
+        "(re)built on the next dispatch.",
+    )
+
+
+class LocalBaserowGroupedAggregateRollupEntry(BigAutoFieldMixin, models.Model):
+    """
+    Holds the raw aggregation states of one group of a grouped aggregate rows
+    service that has the rollup enabled. The full computation creates one base entry
+    per group, while every row change appends delta entries that are merged into the
+    base entries on the next dispatch.
+    """
+
+    service = models.ForeignKey(
+        LocalBaserowGroupedAggregateRows,
+        related_name="rollup_entries",
+        help_text="The service which this rollup entry belongs to.",
+        on_delete=models.CASCADE,
+    )
+    group_key = models.TextField(
+        help_text="The JSON encoded group value, used to match entries of the same "
+        "group."
+    )
+    group_value = models.JSONField(
+        null=True, help_text="The encoded value of the group by field."
+    )
+    states = models.JSONField(
+        default=dict, help_text="The encoded raw aggregation states of the group."
+    )
+    is_delta = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the entry is a change that has not yet been "
+        "merged into the base entry of the group.",
+    )
+    is_removal = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the delta states must be subtracted from the "
+        "group instead of added.",
+    )
 
 
 class LocalBaserowTableServiceAggregationSeries(models.Model):
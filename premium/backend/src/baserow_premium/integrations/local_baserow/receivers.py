@@ -0,0 +1,37 @@
+from django.dispatch import receiver
+
+from baserow.contrib.database.rows.signals import (
+    before_rows_delete,
+    before_rows_update,
+    rows_created,
+    rows_updated,
+)
+from baserow.contrib.database.table.signals import table_schema_changed, table_updated
+
+from .handler import GroupedAggregateRollupHandler
+
+
+@receiver([before_rows_update, before_rows_delete])
+def remove_rows_from_rollups(sender, rows, table, **kwargs):
+    GroupedAggregateRollupHandler().record_rows_change(
+        table, [row.id for row in rows], removal=True
+    )
+
+
+@receiver([rows_created, rows_updated])
+def add_rows_to_rollups(sender, rows, table, **kwargs):
+    GroupedAggregateRollupHandler().record_rows_change(
+        table, [row.id for row in rows], removal=False
+    )
+
+
+@receiver(table_updated)
+def invalidate_rollups_on_table_update(sender, table, **kwargs):
+    # `table_updated` is sent when rows are changed in bulk without the row signals,
+    # like when importing, or because of dependencies on another table.
+    GroupedAggregateRollupHandler().invalidate_rollups(table.id)
+
+
+@receiver(table_schema_changed)
+def invalidate_rollups_on_table_schema_change(sender, table_id, **kwargs):
+    GroupedAggregateRollupHandler().invalidate_rollups(table_id)
@@ -33,6 +33,10 @@ from baserow_premium.api.integrations.local_baserow.serializers import (
     LocalBaserowTableServiceAggregationSeriesSerializer,
     LocalBaserowTableServiceAggregationSortBySerializer,
 )
+from baserow_premium.integrations.local_baserow.handler import (
+    GroupedAggregateRollupDefinition,
+    GroupedAggregateRollupHandler,
+)
 from baserow_premium.integrations.local_baserow.models import (
     LocalBaserowGroupedAggregateRows,
     LocalBaserowTableServiceAggregationGroupBy,
@@ -89,6 +93,7 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
         return (
             super().allowed_fields
             + LocalBaserowTableServiceFilterableMixin.mixin_allowed_fields
+            + ["rollup_enabled"]
         )
 
     @property
@@ -96,7 +101,12 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
         return (
             super().serializer_field_names
             + LocalBaserowTableServiceFilterableMixin.mixin_serializer_field_names
-        ) + ["aggregation_series", "aggregation_group_bys", "aggregation_sorts"]
+        ) + [
+            "aggregation_series",
+            "aggregation_group_bys",
+            "aggregation_sorts",
+            "rollup_enabled",
+        ]
 
     @property
     def serializer_field_overrides(self):
@@ -121,6 +131,7 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
         service_aggregation_series: list[ServiceAggregationSeriesDict]
         service_aggregation_group_bys: list[ServiceAggregationGroupByDict]
         service_aggregation_sorts: list[ServiceAggregationSortByDict]
+        rollup_enabled: bool
 
     def _update_service_aggregation_series(
         self,
@@ -382,6 +393,11 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
                 instance, values.pop("service_aggregation_sorts")
             )
 
+        if instance.rollup_enabled and instance.table_id is not None:
+            GroupedAggregateRollupHandler().invalidate_rollup_services_cache(
+                instance.table_id
+            )
+
     def after_update(
         self,
         instance: LocalBaserowGroupedAggregateRows,
@@ -424,6 +440,22 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
         elif from_table and to_table:
             instance.service_aggregation_sorts.all().delete()
 
+        # Any change can change the aggregated rows or groups, so the rollup is
+        # built again on the next dispatch.
+        rollup_handler = GroupedAggregateRollupHandler()
+        if "rollup_enabled" in changes and not instance.rollup_enabled:
+            instance.rollup_entries.all().delete()
+        if instance.rollup_built_at is not None:
+            instance.rollup_built_at = None
+            LocalBaserowGroupedAggregateRows.objects.filter(id=instance.id).update(
+                rollup_built_at=None
+            )
+        table_ids = {table.id for table in (from_table, to_table) if table is not None}
+        if instance.table_id is not None:
+            table_ids.add(instance.table_id)
+        for table_id in table_ids:
+            rollup_handler.invalidate_rollup_services_cache(table_id)
+
     def export_prepared_values(self, instance: Service) -> dict[str, any]:
         values = super().export_prepared_values(instance)
 
@@ -526,6 +558,10 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
             self._update_service_sorts(
                 service, [sort for sort in sorts if sort["reference"] is not None]
             )
+            if service.rollup_enabled:
+                GroupedAggregateRollupHandler().invalidate_rollup_services_cache(
+                    service.table_id
+                )
 
         return service
 
@@ -714,7 +750,14 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
                 del result["total"]
             return result
 
-        if len(group_by_values) > 0:
+        rollup_definition = GroupedAggregateRollupHandler().get_rollup_definition(
+            service, model, dispatch_context
+        )
+        if rollup_definition is not None:
+            results = self._get_results_from_rollup(
+                service, model, rollup_definition, process_individual_result
+            )
+        elif len(group_by_values) > 0:
             queryset = queryset.annotate(**combined_agg_dict)
             queryset = queryset.order_by(*sorts)
             queryset = queryset[
@@ -753,13 +796,7 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
                         **other_bucket_results,
                     }
                 )
-                first_sort_by = service.service_aggregation_sorts.first()
-                if first_sort_by and first_sort_by.sort_on == "SERIES":
-                    results = sorted(
-                        results,
-                        key=lambda x: x[first_sort_by.reference],
-                        reverse=True if first_sort_by.direction == "DESC" else False,
-                    )
+                results = self._sort_results_with_other_bucket(service, results)
         else:
             results = queryset.aggregate(**combined_agg_dict)
             results = process_individual_result(results)
@@ -769,6 +806,79 @@ class LocalBaserowGroupedAggregateRowsUserServiceType(
             "baserow_table_model": model,
         }
 
+    def _sort_results_with_other_bucket(
+        self, service: LocalBaserowGroupedAggregateRows, results: list[dict]
+    ) -> list[dict]:
+        """
+        Sorts the results again after the bucket containing the other values has been
+        added at the end, if they're sorted by a series.
+        """
+
+        first_sort_by = service.service_aggregation_sorts.first()
+        if first_sort_by and first_sort_by.sort_on == "SERIES":
+            results = sorted(
+                results,
+                key=lambda x: x[first_sort_by.reference],
+                reverse=True if first_sort_by.direction == "DESC" else False,
+            )
+        return results
+
+    def _get_results_from_rollup(
+        self,
+        service: LocalBaserowGroupedAggregateRows,
+        model,
+        rollup_definition: GroupedAggregateRollupDefinition,
+        process_individual_result,
+    ) -> dict | list[dict]:
+        """
+        Computes the same results as `dispatch_data`, but from the groups kept up to
+        date in the rollup of the service instead of from the rows of the table.
+        """
+
+        rollup_handler = GroupedAggregateRollupHandler()
+        groups = rollup_handler.get_groups(service, model, rollup_definition)
+        bucket_db_column = rollup_definition.group_by_db_column
+
+        if bucket_db_column is None:
+            states = (
+                groups[0].states if groups else rollup_definition.get_empty_states()
+            )
+            return process_individual_result(rollup_definition.get_raw_result(states))
+
+        def get_result(value, states):
+            return {
+                bucket_db_column: value,
+                **process_individual_result(rollup_definition.get_raw_result(states)),
+            }
+
+        # Sorted the same way as the database sorts the groups, with the empty values
+        # first when ascending and last when descending.
+        for sort_by in list(service.service_aggregation_sorts.all())[::-1]:
+
+            def get_sort_key(group, sort_by=sort_by):
+                if sort_by.sort_on == "SERIES":
+                    value = group.states.get(f"{sort_by.reference}_raw")
+                else:
+                    value = group.value
+                return (0,) if value is None else (1, value)
+
+            groups.sort(key=get_sort_key, reverse=sort_by.direction == "DESC")
+
+        max_buckets = settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_SERVICE_MAX_AGG_BUCKETS
+        if len(groups) <= max_buckets:
+            return [get_result(group.value, group.states) for group in groups]
+
+        # The number of buckets don't fit in the limit so the states of all the other
+        # buckets are combined into one.
+        results = [
+            get_result(group.value, group.states) for group in groups[: max_buckets - 1]
+        ]
+        other_states = rollup_handler.combine_states(
+            rollup_definition, [group.states for group in groups[max_buckets - 1 :]]
+        )
+        results.append(get_result("OTHER_VALUES", other_states))
+        return self._sort_results_with_other_bucket(service, results)
+
     def dispatch_transform(
         self,
         data: any,
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from baserow.config.celery import app
+
+ROLLUP_COMPACTION_INTERVAL_MINUTES = 5
+
+
+@app.task(bind=True, queue="export")
+def compact_grouped_aggregate_rollups(self):
+    """
+    Periodically merges the pending deltas of the grouped aggregate rollups.
+    """
+
+    from .handler import GroupedAggregateRollupHandler
+
+    GroupedAggregateRollupHandler().compact_rollups()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(minutes=ROLLUP_COMPACTION_INTERVAL_MINUTES),
+        compact_grouped_aggregate_rollups.s(),
+    )
@@ -0,0 +1,84 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("baserow_premium", "0031_ai_field_scheduled_update"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="localbaserowgroupedaggregaterows",
+            name="rollup_built_at",
+            field=models.DateTimeField(
+                help_text="The date the rollup was fully computed, or null if it must be (re)built on the next dispatch.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="localbaserowgroupedaggregaterows",
+            name="rollup_enabled",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the aggregations must be kept up to date in a rollup instead of being computed over the whole table on every dispatch.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="LocalBaserowGroupedAggregateRollupEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "group_key",
+                    models.TextField(
+                        help_text="The JSON encoded group value, used to match entries of the same group."
+                    ),
+                ),
+                (
+                    "group_value",
+                    models.JSONField(
+                        help_text="The encoded value of the group by field.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "states",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The encoded raw aggregation states of the group.",
+                    ),
+                ),
+                (
+                    "is_delta",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Indicates whether the entry is a change that has not yet been merged into the base entry of the group.",
+                    ),
+                ),
+                (
+                    "is_removal",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Indicates whether the delta states must be subtracted from the group instead of added.",
+                    ),
+                ),
+                (
+                    "service",
+                    models.ForeignKey(
+                        help_text="The service which this rollup entry belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollup_entries",
+                        to="baserow_premium.localbaserowgroupedaggregaterows",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,6 +1,6 @@
 from django.dispatch import receiver
 
-from baserow.core.trash.signals import permanently_deleted
+from baserow.core.trash.signals import permanently_deleted, permanently_deleted_many
 from baserow_premium.row_comments.models import RowComment
 
 
@@ -9,3 +9,12 @@ def permanently_deleted(sender, **kwargs):
     table_id = kwargs["parent_id"]
     trash_item_id = kwargs["trash_item_id"]
     RowComment.objects.filter(table_id=table_id, row_id=trash_item_id).delete()
+
+
+@receiver(
+    permanently_deleted_many, sender="row", dispatch_uid="row_comment_bulk_cleanup"
+)
+def permanently_deleted_many_rows(sender, **kwargs):
+    table_id = kwargs["parent_id"]
+    trash_item_ids = kwargs["trash_item_ids"]
+    RowComment.objects.filter(table_id=table_id, row_id__in=trash_item_ids).delete()
@@ -1,5 +1,22 @@
 from django.contrib.auth import get_user_model
 from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from baserow.contrib.database.table.signals import table_updated
+from baserow.contrib.database.views.signals import (
+    view_field_options_updated,
+    view_filter_created,
+    view_filter_deleted,
+    view_filter_group_created,
+    view_filter_group_deleted,
+    view_filter_group_updated,
+    view_filter_updated,
+    view_sort_created,
+    view_sort_deleted,
+    view_sort_updated,
+    view_updated,
+)
+from baserow_premium.ical_utils import invalidate_ical_feeds
 
 from .handler import delete_personal_views
 
@@ -14,6 +31,35 @@ def connect_to_user_pre_delete_signal():
     pre_delete.connect(before_user_permanently_deleted, User)
 
 
+@receiver([view_updated, view_field_options_updated])
+def invalidate_ical_feeds_on_view_change(sender, view, **kwargs):
+    invalidate_ical_feeds([view.table_id])
+
+
+@receiver([view_filter_created, view_filter_updated, view_filter_deleted])
+def invalidate_ical_feeds_on_view_filter_change(sender, view_filter, **kwargs):
+    invalidate_ical_feeds([view_filter.view.table_id])
+
+
+@receiver(
+    [view_filter_group_created, view_filter_group_updated, view_filter_group_deleted]
+)
+def invalidate_ical_feeds_on_view_filter_group_change(
+    sender, view_filter_group, **kwargs
+):
+    invalidate_ical_feeds([view_filter_group.view.table_id])
+
+
+@receiver([view_sort_created, view_sort_updated, view_sort_deleted])
+def invalidate_ical_feeds_on_view_sort_change(sender, view_sort, **kwargs):
+    invalidate_ical_feeds([view_sort.view.table_id])
+
+
+@receiver(table_updated)
+def invalidate_ical_feeds_on_table_change(sender, table, **kwargs):
+    invalidate_ical_feeds([table.id])
+
+
 __all__ = [
     "connect_to_user_pre_delete_signal",
 ]
@@ -43,6 +43,7 @@ from baserow_premium.api.views.timeline.errors import (
 from baserow_premium.api.views.timeline.serializers import (
     TimelineViewFieldOptionsSerializer,
 )
+from baserow_premium.ical_utils import invalidate_ical_feeds
 
 from .exceptions import (
     KanbanViewFieldDoesNotBelongToSameTable,
@@ -551,6 +552,21 @@ class CalendarViewType(ViewType):
 
     def after_field_delete(self, field: Field) -> None:
         CalendarView.objects.filter(date_field_id=field.id).update(date_field_id=None)
+        invalidate_ical_feeds([field.table_id])
+
+    def after_field_value_update(self, updated_fields):
+        """
+        The ICal feeds of the tables containing the updated field values must be
+        rendered again, because they could contain the changed rows.
+        """
+
+        if not isinstance(updated_fields, list):
+            updated_fields = [updated_fields]
+
+        invalidate_ical_feeds(field.table_id for field in updated_fields)
+
+    def after_field_update(self, updated_fields):
+        self.after_field_value_update(updated_fields)
 
 
 class TimelineViewType(ViewType):
@@ -127,6 +127,7 @@ def test_grouped_aggregate_rows_get_dashboard_data_sources(
         "integration_id": AnyInt(),
         "name": "Name 1",
         "order": "1.00000000000000000000",
+        "rollup_enabled": False,
         "schema": AnyDict(),
         "table_id": table.id,
         "type": "local_baserow_grouped_aggregate_rows",
@@ -16,6 +16,7 @@ from icalendar import Calendar
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_402_PAYMENT_REQUIRED,
@@ -34,6 +35,7 @@ from baserow.test_utils.helpers import (
     is_dict_subset,
     setup_interesting_test_table,
 )
+from baserow_premium.ical_utils import build_calendar
 from baserow_premium.views.models import CalendarView, CalendarViewFieldOptions
 
 
@@ -2468,3 +2470,111 @@ def test_calendar_view_ical_feed_with_date_and_select_related_field_in_queryset(
         )
     )
     assert resp.status_code == HTTP_200_OK
+
+
+def _create_public_ical_calendar_view(premium_data_fixture, api_client):
+    user, token = premium_data_fixture.create_user_and_token(
+        has_active_premium_license=True
+    )
+    table = premium_data_fixture.create_database_table(user=user)
+    date_field = premium_data_fixture.create_date_field(table=table)
+    calendar_view: CalendarView = ViewHandler().create_view(
+        user=user,
+        table=table,
+        type_name="calendar",
+        date_field=date_field,
+    )
+    resp = api_client.patch(
+        reverse("api:database:views:item", kwargs={"view_id": calendar_view.id}),
+        {"ical_public": True},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert resp.status_code == HTTP_200_OK
+    calendar_view.refresh_from_db()
+    return user, table, date_field, calendar_view
+
+
+@pytest.mark.django_db
+@pytest.mark.view_calendar
+def test_calendar_view_ical_feed_conditional_requests(
+    premium_data_fixture, api_client, settings
+):
+    # With the cache enabled, Last-Modified is the time of the cached render instead
+    # of the time of every request.
+    settings.BASEROW_ICAL_VIEW_CACHE_TIMEOUT_SECONDS = 60
+    user, table, date_field, calendar_view = _create_public_ical_calendar_view(
+        premium_data_fixture, api_client
+    )
+    RowHandler().create_row(
+        user, table, values={f"field_{date_field.id}": "2024-01-01"}
+    )
+    url = reverse(
+        "api:database:views:calendar:calendar_ical_feed",
+        kwargs={"ical_slug": calendar_view.ical_slug},
+    )
+
+    resp = api_client.get(url)
+    assert resp.status_code == HTTP_200_OK
+    etag = resp.headers["ETag"]
+    last_modified = resp.headers["Last-Modified"]
+    assert etag
+    assert last_modified
+
+    resp = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == HTTP_304_NOT_MODIFIED
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+
+    resp = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert resp.status_code == HTTP_304_NOT_MODIFIED
+
+    resp = api_client.get(url, HTTP_IF_NONE_MATCH='"outdated"')
+    assert resp.status_code == HTTP_200_OK
+    assert len(list(Calendar.from_ical(resp.content).walk("VEVENT"))) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.view_calendar
+def test_calendar_view_ical_feed_is_cached_until_the_table_changes(
+    premium_data_fixture, api_client, settings
+):
+    settings.BASEROW_ICAL_VIEW_CACHE_TIMEOUT_SECONDS = 60
+    user, table, date_field, calendar_view = _create_public_ical_calendar_view(
+        premium_data_fixture, api_client
+    )
+    row = RowHandler().create_row(
+        user, table, values={f"field_{date_field.id}": "2024-01-01"}
+    )
+    url = reverse(
+        "api:database:views:calendar:calendar_ical_feed",
+        kwargs={"ical_slug": calendar_view.ical_slug},
+    )
+
+    with mock.patch(
+        "baserow_premium.api.views.calendar.views.build_calendar",
+        wraps=build_calendar,
+    ) as build_calendar_mock:
+        first = api_client.get(url)
+        second = api_client.get(url)
+        assert build_calendar_mock.call_count == 1
+        assert first.content == second.content
+        assert first.headers["ETag"] == second.headers["ETag"]
+
+        RowHandler().update_row_by_id(
+            user, table, row.id, values={f"field_{date_field.id}": "2024-02-01"}
+        )
+        third = api_client.get(url)
+        assert build_calendar_mock.call_count == 2
+        assert third.headers["ETag"] != first.headers["ETag"]
+
+        ViewHandler().create_filter(
+            user=user,
+            view=calendar_view,
+            field=date_field,
+            type_name="empty",
+            value="",
+        )
+        fourth = api_client.get(url)
+        assert build_calendar_mock.call_count == 3
+        assert len(list(Calendar.from_ical(fourth.content).walk("VEVENT"))) == 0
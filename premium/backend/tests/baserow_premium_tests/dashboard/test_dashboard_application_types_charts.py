@@ -99,6 +99,7 @@ def test_dashboard_export_serialized_with_chart_widget(premium_data_fixture):
                     "id": service.id,
                     "sample_data": None,
                     "integration_id": service.integration.id,
+                    "rollup_enabled": False,
                     "service_aggregation_group_bys": [
                         {"field_id": None},
                     ],
@@ -349,6 +350,7 @@ def test_dashboard_export_serialized_with_chart_widget_config(premium_data_fixtu
                     "id": service.id,
                     "sample_data": None,
                     "integration_id": service.integration.id,
+                    "rollup_enabled": False,
                     "service_aggregation_group_bys": [],
                     "service_aggregation_sorts": [],
                     "service_aggregation_series": [
@@ -581,6 +583,7 @@ def test_dashboard_export_serialized_with_default_chart_type(premium_data_fixtur
                     "id": service.id,
                     "sample_data": None,
                     "integration_id": service.integration.id,
+                    "rollup_enabled": False,
                     "service_aggregation_group_bys": [],
                     "service_aggregation_series": [],
                     "service_aggregation_sorts": [],
@@ -155,6 +155,7 @@ def test_dashboard_export_serialized_with_pie_chart_widget_config(premium_data_f
                     "id": service.id,
                     "sample_data": None,
                     "integration_id": service.integration.id,
+                    "rollup_enabled": False,
                     "service_aggregation_group_bys": [],
                     "service_aggregation_sorts": [],
                     "service_aggregation_series": [
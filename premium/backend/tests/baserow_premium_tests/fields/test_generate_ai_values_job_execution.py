@@ -8,6 +8,7 @@ import pytest
 
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.jobs.handler import JobHandler
+from baserow.test_utils.fixtures.generative_ai import TestGenerativeAIBatchModelType
 from baserow_premium.fields.models import GenerateAIValuesJob
 
 
@@ -351,3 +352,91 @@ def test_job_progress_tracking(premium_data_fixture):
     # After completion, should be at 100%
     assert job.progress_percentage == 100
     assert job.state == "finished"
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+def test_job_execution_generates_values_in_batches(
+    premium_data_fixture, mutable_generative_ai_model_type_registry, settings
+):
+    settings.BASEROW_AI_FIELD_MAX_BATCH_SIZE = 2
+    model_type = TestGenerativeAIBatchModelType()
+    mutable_generative_ai_model_type_registry.register(model_type)
+    user = premium_data_fixture.create_user()
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    text_field = premium_data_fixture.create_text_field(table=table, name="text")
+    field = premium_data_fixture.create_ai_field(
+        table=table,
+        ai_generative_ai_type=model_type.type,
+        ai_prompt=f"concat('Describe ', get('fields.field_{text_field.id}'))",
+    )
+    RowHandler().create_rows(
+        user,
+        table,
+        rows_values=[{text_field.db_column: f"row {i}"} for i in range(5)],
+    )
+
+    job = JobHandler().create_and_start_job(
+        user, "generate_ai_values", sync=True, field_id=field.id
+    )
+
+    assert job.state == "finished"
+    assert sorted(len(prompts) for prompts in model_type.requests) == [1, 2, 2]
+    assert sorted(p for prompts in model_type.requests for p in prompts) == [
+        f"Describe row {i}" for i in range(5)
+    ]
+    model = table.get_model()
+    assert [getattr(row, field.db_column) for row in model.objects.order_by("id")] == [
+        f"Generated in batch: Describe row {i}" for i in range(5)
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+def test_job_execution_falls_back_to_single_rows_if_batch_fails(
+    premium_data_fixture, settings
+):
+    settings.BASEROW_AI_FIELD_MAX_BATCH_SIZE = 3
+    # This model type doesn't support the structured output of a batch request.
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    field = premium_data_fixture.create_ai_field(table=table, ai_prompt="'Test'")
+    RowHandler().create_rows(user, table, rows_values=[{}, {}, {}, {}])
+
+    job = JobHandler().create_and_start_job(
+        user, "generate_ai_values", sync=True, field_id=field.id
+    )
+
+    assert job.state == "finished"
+    model = table.get_model()
+    for row in model.objects.all():
+        assert getattr(row, field.db_column) == "Generated with temperature None: Test"
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+def test_job_execution_respects_the_shared_request_budget(
+    premium_data_fixture, mutable_generative_ai_model_type_registry, settings
+):
+    settings.BASEROW_AI_FIELD_MAX_CONCURRENT_GENERATIONS = 4
+    settings.BASEROW_GENERATIVE_AI_MAX_CONCURRENT_REQUESTS = 1
+    model_type = TestGenerativeAIBatchModelType(latency=0.02)
+    mutable_generative_ai_model_type_registry.register(model_type)
+    user = premium_data_fixture.create_user()
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    field = premium_data_fixture.create_ai_field(
+        table=table, ai_generative_ai_type=model_type.type, ai_prompt="'Test'"
+    )
+    RowHandler().create_rows(user, table, rows_values=[{}] * 4)
+
+    job = JobHandler().create_and_start_job(
+        user, "generate_ai_values", sync=True, field_id=field.id
+    )
+
+    assert job.state == "finished"
+    assert len(model_type.requests) == 4
+    assert model_type.max_concurrent_requests == 1
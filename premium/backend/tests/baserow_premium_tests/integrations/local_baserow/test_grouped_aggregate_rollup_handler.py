@@ -0,0 +1,226 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.services.handler import ServiceHandler
+from baserow.test_utils.pytest_conftest import FakeDispatchContext
+from baserow_premium.integrations.local_baserow.handler import (
+    GroupedAggregateRollupHandler,
+)
+from baserow_premium.integrations.local_baserow.models import (
+    LocalBaserowGroupedAggregateRollupEntry,
+    LocalBaserowGroupedAggregateRows,
+    LocalBaserowTableServiceAggregationGroupBy,
+    LocalBaserowTableServiceAggregationSeries,
+    LocalBaserowTableServiceAggregationSortBy,
+)
+
+
+@pytest.fixture(autouse=True)
+def enable_rollups(settings):
+    settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS = 1000
+
+
+def _create_rollup_service(data_fixture, aggregation_types=None, sort=None):
+    user = data_fixture.create_user()
+    dashboard = data_fixture.create_dashboard_application(user=user)
+    table = data_fixture.create_database_table(user=user)
+    group_field = data_fixture.create_number_field(table=table)
+    value_field = data_fixture.create_number_field(table=table, number_decimal_places=1)
+    integration = data_fixture.create_local_baserow_integration(
+        application=dashboard, user=user
+    )
+    service = data_fixture.create_service(
+        LocalBaserowGroupedAggregateRows,
+        integration=integration,
+        table=table,
+        rollup_enabled=True,
+    )
+    for index, aggregation_type in enumerate(
+        aggregation_types or ["sum", "min", "max", "not_empty_count"]
+    ):
+        LocalBaserowTableServiceAggregationSeries.objects.create(
+            service=service,
+            field=value_field,
+            aggregation_type=aggregation_type,
+            order=index,
+        )
+    LocalBaserowTableServiceAggregationGroupBy.objects.create(
+        service=service, field=group_field, order=1
+    )
+    LocalBaserowTableServiceAggregationSortBy.objects.create(
+        service=service,
+        sort_on="GROUP_BY",
+        reference=f"field_{group_field.id}",
+        direction="ASC",
+        order=1,
+        **(sort or {}),
+    )
+    GroupedAggregateRollupHandler().invalidate_rollup_services_cache(table.id)
+    return user, table, group_field, value_field, service
+
+
+def _create_rows(user, table, group_field, value_field, values):
+    return (
+        RowHandler()
+        .create_rows(
+            user,
+            table,
+            rows_values=[
+                {f"field_{group_field.id}": group, f"field_{value_field.id}": value}
+                for group, value in values
+            ],
+        )
+        .created_rows
+    )
+
+
+def _dispatch(service):
+    return ServiceHandler().dispatch_service(service, FakeDispatchContext()).data
+
+
+def _dispatch_without_rollup(service, settings):
+    settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS = 0
+    try:
+        return _dispatch(service)
+    finally:
+        settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_ROLLUP_MAX_GROUPS = 1000
+
+
+@pytest.mark.django_db
+def test_rollup_is_kept_up_to_date_with_row_changes(data_fixture, settings):
+    user, table, group_field, value_field, service = _create_rollup_service(
+        data_fixture
+    )
+    rows = _create_rows(
+        user,
+        table,
+        group_field,
+        value_field,
+        [(1, "1.5"), (1, "3.0"), (2, "4.0"), (2, None), (None, "2.0")],
+    )
+
+    assert _dispatch(service) == _dispatch_without_rollup(service, settings)
+    assert service.rollup_built_at is not None
+    assert not LocalBaserowGroupedAggregateRollupEntry.objects.filter(
+        service=service, is_delta=True
+    ).exists()
+
+    _create_rows(user, table, group_field, value_field, [(3, "5.0"), (1, "0.5")])
+    RowHandler().update_rows(
+        user,
+        table,
+        [
+            {"id": rows[1].id, f"field_{value_field.id}": "2.0"},
+            {"id": rows[2].id, f"field_{group_field.id}": 3},
+        ],
+    )
+    # Removes the minimum and the maximum of the first group.
+    RowHandler().delete_rows(user, table, [rows[0].id])
+    RowHandler().delete_rows(user, table, [rows[3].id])
+
+    assert LocalBaserowGroupedAggregateRollupEntry.objects.filter(
+        service=service, is_delta=True
+    ).exists()
+    assert _dispatch(service) == _dispatch_without_rollup(service, settings)
+    assert not LocalBaserowGroupedAggregateRollupEntry.objects.filter(
+        service=service, is_delta=True
+    ).exists()
+
+    with patch.object(
+        GroupedAggregateRollupHandler, "_refresh_rollup"
+    ) as refresh_rollup:
+        assert _dispatch(service) == _dispatch_without_rollup(service, settings)
+    refresh_rollup.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_rollup_combines_the_groups_that_dont_fit_in_the_buckets(
+    data_fixture, settings
+):
+    settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_SERVICE_MAX_AGG_BUCKETS = 3
+    user, table, group_field, value_field, service = _create_rollup_service(
+        data_fixture,
+        aggregation_types=["sum", "min"],
+        sort={"direction": "DESC"},
+    )
+    _create_rows(
+        user,
+        table,
+        group_field,
+        value_field,
+        [(1, "1.0"), (2, "2.0"), (3, "3.0"), (4, "4.0"), (4, "1.0"), (None, "6.0")],
+    )
+
+    result = _dispatch(service)
+
+    assert result == _dispatch_without_rollup(service, settings)
+    assert len(result["result"]) == 3
+    assert result["result"][-1][f"field_{group_field.id}"] == "OTHER_VALUES"
+
+
+@pytest.mark.django_db
+def test_rollup_is_rebuilt_when_the_table_schema_changes(data_fixture, settings):
+    user, table, group_field, value_field, service = _create_rollup_service(
+        data_fixture
+    )
+    _create_rows(user, table, group_field, value_field, [(1, "1.5"), (2, "3.0")])
+    _dispatch(service)
+
+    data_fixture.create_text_field(table=table)
+    service.refresh_from_db()
+    assert service.rollup_built_at is None
+
+    # Rows changed without the row signals are taken into account by the rebuild.
+    table.get_model().objects.update(**{f"field_{value_field.id}": "2.0"})
+    assert _dispatch(service) == _dispatch_without_rollup(service, settings)
+
+
+@pytest.mark.django_db
+def test_rollup_is_not_used_for_filtered_rows(data_fixture):
+    user, table, group_field, value_field, service = _create_rollup_service(
+        data_fixture
+    )
+    model = table.get_model()
+    handler = GroupedAggregateRollupHandler()
+
+    assert handler.get_rollup_definition(service, model) is not None
+
+    data_fixture.create_local_baserow_table_service_filter(
+        service=service, field=value_field, value="1", order=0
+    )
+    service.refresh_from_db()
+    assert handler.get_rollup_definition(service, model) is None
+
+
+@pytest.mark.django_db
+def test_rollup_is_not_used_for_aggregations_that_cant_be_maintained(data_fixture):
+    user, table, group_field, value_field, service = _create_rollup_service(
+        data_fixture, aggregation_types=["sum", "average"]
+    )
+
+    assert (
+        GroupedAggregateRollupHandler().get_rollup_definition(
+            service, table.get_model()
+        )
+        is None
+    )
+
+
+@pytest.mark.django_db
+def test_compact_rollups_merges_the_pending_deltas(data_fixture, settings):
+    user, table, group_field, value_field, service = _create_rollup_service(
+        data_fixture
+    )
+    _create_rows(user, table, group_field, value_field, [(1, "1.5"), (2, "3.0")])
+    expected = _dispatch(service)
+    _create_rows(user, table, group_field, value_field, [(1, "1.0")])
+
+    GroupedAggregateRollupHandler().compact_rollups()
+
+    entries = LocalBaserowGroupedAggregateRollupEntry.objects.filter(service=service)
+    assert not entries.filter(is_delta=True).exists()
+    assert entries.count() == 2
+    assert _dispatch(service) != expected
+    assert _dispatch(service) == _dispatch_without_rollup(service, settings)